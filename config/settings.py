@@ -83,6 +83,16 @@ class Settings(BaseSettings):
     max_concurrent_discoveries: int = Field(default=10)
     max_concurrent_applications: int = Field(default=5)
 
+    # ===========================================
+    # Embeddings
+    # ===========================================
+    embedding_backend: Literal["google", "hashed"] = Field(
+        default="google", description="Embedding provider (hashed = local, deterministic, offline)"
+    )
+    embedding_concurrency: int = Field(default=4, ge=1, description="Embedding requests in flight at once")
+    embedding_max_retries: int = Field(default=5, ge=0, description="Retries per request on quota errors")
+    embedding_cache_size: int = Field(default=20_000, ge=0, description="Embeddings kept in RAM by the on-disk cache")
+
     # ===========================================
     # Analytics (Optional)
     # ===========================================
@@ -11,26 +11,34 @@ Provides endpoints for:
 """
 
 import asyncio
+import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Body, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
 # Import caching
-from .cache import opportunity_cache, get_cache
+from .cache import opportunity_cache, get_cache, normalize_search_query, normalize_search_filters
 
 # Import intelligence services
 from .intelligence.nlp_processor import global_processor, process_opportunity_text
 from .intelligence.data_enrichment import global_enrichment_service
-from .intelligence.user_profiles import global_profile_engine, track_user_interaction, InteractionType
+from .intelligence.enrichment_store import get_enrichment_store
+from .search_index import get_search_index, get_searchable_index
+from .pagination import InvalidCursor, decode_cursor, encode_cursor
+from .hashing import opportunity_key
+from .scrapers.dedup import get_dedup_index
+from .scan_jobs import get_scan_jobs
+from .intelligence.user_profiles import global_profile_engine, track_user_interaction, InteractionType, PreferenceType
 from .intelligence.recommendations import global_recommendation_engine
 from .intelligence.analytics import global_analytics_engine
 from .intelligence.success_prediction import global_success_predictor
+from .intelligence.ml_model import get_ml_model
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -86,6 +94,7 @@ async def health_check():
             },
             "cache": {
                 "status": "active",
+                "backend": cache_stats["backend"],
                 "total_entries": cache_stats["total_entries"],
                 "active_entries": cache_stats["active_entries"],
                 "hit_rate": f"{cache_stats['hit_rate']:.2%}",
@@ -239,7 +248,8 @@ async def get_scraper_health():
     try:
         from src.scrapers.base_scraper import get_all_scraper_health, ScraperStatus
         
-        health = get_all_scraper_health()
+        health = get_all_scraper_health(include_pool_stats=True)
+        pool_stats = health.pop("connection_pool")
         
         # Calculate overall status
         statuses = [h.get("status", "healthy") for h in health.values()]
@@ -260,6 +270,7 @@ async def get_scraper_health():
             "healthy_count": sum(1 for s in statuses if s == ScraperStatus.HEALTHY.value),
             "degraded_count": sum(1 for s in statuses if s in [ScraperStatus.DEGRADED.value, ScraperStatus.CIRCUIT_OPEN.value]),
             "unhealthy_count": sum(1 for s in statuses if s == ScraperStatus.UNHEALTHY.value),
+            "connection_pool": pool_stats,
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
@@ -270,15 +281,14 @@ async def get_scraper_health():
 async def reset_scraper_metrics(scraper_name: Optional[str] = None):
     """Reset scraper metrics and circuit breakers. Optionally specify a single scraper."""
     try:
-        from src.scrapers.base_scraper import _scraper_metrics, ScraperMetrics
+        from src.scrapers.metrics_store import reset_scraper_metrics as reset_metrics
         
+        reset = await reset_metrics(scraper_name)
         if scraper_name:
-            if scraper_name in _scraper_metrics:
-                _scraper_metrics[scraper_name] = ScraperMetrics()
+            if reset:
                 return {"success": True, "message": f"Reset metrics for {scraper_name}"}
             return {"success": False, "error": f"Scraper '{scraper_name}' not found"}
         else:
-            _scraper_metrics.clear()
             return {"success": True, "message": "Reset all scraper metrics"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -331,7 +341,8 @@ async def search_opportunities(
     type: Optional[str] = Query(None, description="Filter by opportunity type"),
     location: Optional[str] = Query(None, description="Filter by location"),
     limit: int = Query(50, description="Maximum number of results to return"),
-    offset: int = Query(0, description="Number of results to skip")
+    offset: int = Query(0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces offset)")
 ):
     """
     Search opportunities across all sources with advanced filtering.
@@ -340,77 +351,81 @@ async def search_opportunities(
     - Title, company, or description keywords
     - Opportunity type (job, scholarship, grant, etc.)
     - Location
+    
+    Page through results by passing back ``pagination.next_cursor``;
+    unlike ``offset`` its cost doesn't grow with the page number.
     """
+    after = None
+    if cursor:
+        try:
+            score, doc_id = decode_cursor(cursor, 2)
+            after = (float(score), str(doc_id))
+        except (InvalidCursor, TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    
     try:
         # Create filters dict for caching
         filters = {
             "type": type,
             "location": location,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "cursor": cursor
         }
-        
-        # Check cache first
-        cached_results = opportunity_cache.get_search_results(q, filters)
-        if cached_results:
-            cached_results["from_cache"] = True
-            return cached_results
-        
-        from .scrapers.live_scrapers import search_cached_opportunities
-        from .filters import global_filter, create_sample_opportunities
-        
-        # Get sample opportunities (in production, this would query the database)
-        opportunities = create_sample_opportunities()
-        
-        # Enrich opportunities with intelligence
-        enriched_opportunities = global_enrichment_service.enrich_batch(opportunities)
-        
-        # Process through NLP pipeline for better classification
-        for i, opp in enumerate(enriched_opportunities):
-            intelligence_result = process_opportunity_text(opp)
-            enriched_opportunities[i]['intelligence'] = intelligence_result
-        
-        # Apply advanced filtering
-        search_filters = {
+        query = normalize_search_query(q)
+        search_filters = normalize_search_filters({
             "type": type,
             "location": location
-        }
-        
-        # Use smart search with multiple criteria
-        filtered_results = global_filter.smart_search(enriched_opportunities, q, search_filters)
-        
-        # Apply pagination
-        total_results = len(filtered_results)
-        paginated_results = filtered_results[offset:offset + limit]
-        
-        search_results = {
-            "query": q,
-            "filters": filters,
-            "results": paginated_results,
-            "total": total_results,
-            "pagination": {
-                "limit": limit,
-                "offset": offset,
-                "has_more": offset + limit < total_results
-            },
-            "suggestions": [
-                f"Found {total_results} results for '{q}'",
-                "Try different keywords or adjust filters",
-                "Use location and type filters to narrow results"
-            ] if total_results > 0 else [
-                f"No results found for '{q}'",
-                "Try broader search terms",
-                "Check spelling and try different keywords",
-                "Remove filters to see more results"
-            ],
-            "from_cache": False,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Cache the results
-        opportunity_cache.set_search_results(q, filters, search_results)
+        })
+        
+        def run_search() -> Dict[str, Any]:
+            # BM25-ranked matches from the inverted index (sample data until scans populate it)
+            # One extra result tells whether another page exists
+            page, total_results = get_searchable_index().search(
+                query, search_filters, limit=limit + 1,
+                offset=0 if after else offset, after=after
+            )
+            has_more = len(page) > limit
+            page = page[:limit]
+            next_cursor = None
+            if has_more:
+                last_opp, last_score = page[-1]
+                next_cursor = encode_cursor(last_score, opportunity_key(last_opp))
+            
+            # Precomputed enrichment + NLP for the returned page only
+            paginated_results = get_enrichment_store().ensure([opp for opp, _ in page])
+            for result, (_, score) in zip(paginated_results, page):
+                result["relevance_score"] = round(score, 4)
+            
+            return {
+                "query": q,
+                "filters": filters,
+                "results": paginated_results,
+                "total": total_results,
+                "pagination": {
+                    "limit": limit,
+                    "offset": offset,
+                    "has_more": has_more,
+                    "next_cursor": next_cursor
+                },
+                "suggestions": [
+                    f"Found {total_results} results for '{q}'",
+                    "Try different keywords or adjust filters",
+                    "Use location and type filters to narrow results"
+                ] if total_results > 0 else [
+                    f"No results found for '{q}'",
+                    "Try broader search terms",
+                    "Check spelling and try different keywords",
+                    "Remove filters to see more results"
+                ],
+                "timestamp": datetime.utcnow().isoformat()
+            }
         
-        return search_results
+        # Cached or coalesced with identical in-flight searches; the work
+        # itself runs in a thread so the event loop stays responsive
+        return await opportunity_cache.get_or_compute_search(
+            q, filters, lambda: asyncio.to_thread(run_search)
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -426,13 +441,26 @@ async def get_cache_stats():
         return {
             "status": "success",
             "cache": {
+                "backend": stats["backend"],
                 "total_entries": stats["total_entries"],
                 "active_entries": stats["active_entries"],
                 "expired_entries": stats["expired_entries"],
+                "hits": stats["hits"],
+                "misses": stats["misses"],
                 "hit_rate": f"{stats['hit_rate']:.2%}",
+                "evictions": stats["evictions"],
+                "expirations": stats["expirations"],
+                "bytes": stats["bytes"],
                 "memory_usage_mb": f"{stats['memory_usage_mb']:.2f}",
-                "keys": cache.keys()[:10] if len(cache.keys()) > 10 else cache.keys()  # Sample of keys
+                "limits": {
+                    "max_entries": stats["max_entries"],
+                    "max_bytes": stats["max_bytes"]
+                },
+                "keys": cache.keys(limit=10)  # Sample of keys
             },
+            "enrichment": get_enrichment_store().get_stats(),
+            "search_index": get_search_index().stats(),
+            "dedup": get_dedup_index().stats(),
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
@@ -488,71 +516,100 @@ async def get_filter_categories():
         raise HTTPException(status_code=500, detail=f"Failed to get categories: {str(e)}")
 
 
+# Index page size while the text criteria of /api/v1/filters/advanced thin out results
+ADVANCED_FILTER_CHUNK = 200
+
+
 @app.post("/api/v1/filters/advanced", tags=["Discovery"])
 async def advanced_filter_search(
     query: Optional[str] = None,
-    filters: Dict[str, Any] = None
+    filters: Dict[str, Any] = None,
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of results to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
-    """Advanced filtering with custom criteria and operations."""
+    """
+    Advanced filtering with custom criteria and operations.
+    
+    Salary and remote criteria are answered by the search index's filter
+    postings; the text criteria (title, company, tags) are checked on the
+    index's ranked pages until ``limit`` results are found. ``total`` is
+    only exact when no text criteria are given (None otherwise).
+    """
+    after = None
+    if cursor:
+        try:
+            score, doc_id = decode_cursor(cursor, 2)
+            after = (float(score), str(doc_id))
+        except (InvalidCursor, TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    
     try:
-        from .filters import global_filter, create_sample_opportunities, FilterOperation
+        from .filters import global_filter, FilterOperation
         
         if filters is None:
             filters = {}
         
-        # Get opportunities (sample for now)
-        opportunities = create_sample_opportunities()
+        # Criteria the index answers from its filter postings
+        index_filters = {}
+        if filters.get("min_salary"):
+            index_filters["min_salary"] = filters["min_salary"]
+        if filters.get("max_salary"):
+            index_filters["max_salary"] = filters["max_salary"]
+        if filters.get("remote_only") is not None:
+            index_filters["remote"] = filters["remote_only"]
         
         # Clear previous criteria
         global_filter.clear()
         
-        # Build advanced criteria from filters
+        # Build the remaining text criteria from filters
         if filters.get("title_contains"):
             global_filter.add_criterion("title", FilterOperation.CONTAINS, filters["title_contains"])
         
         if filters.get("company_equals"):
             global_filter.add_criterion("company", FilterOperation.EQUALS, filters["company_equals"])
         
-        if filters.get("min_salary"):
-            global_filter.add_criterion("salary", FilterOperation.GREATER_EQUAL, filters["min_salary"])
-        
-        if filters.get("max_salary"):
-            global_filter.add_criterion("salary", FilterOperation.LESS_EQUAL, filters["max_salary"])
-        
         if filters.get("tags_contains"):
             global_filter.add_criterion("tags", FilterOperation.CONTAINS, filters["tags_contains"])
         
-        if filters.get("remote_only") is not None:
-            global_filter.add_criterion("remote", FilterOperation.EQUALS, filters["remote_only"])
-        
-        # Apply filters
-        filtered_opportunities = global_filter.apply_filters(opportunities)
-        
-        # Apply text search if provided
-        if query:
-            text_filtered = []
-            query_lower = query.lower()
-            
-            for opp in filtered_opportunities:
-                searchable_text = " ".join([
-                    opp.get("title", ""),
-                    opp.get("description", ""),
-                    opp.get("company", ""),
-                    " ".join(opp.get("tags", [])),
-                    opp.get("location", "")
-                ]).lower()
-                
-                if query_lower in searchable_text:
-                    text_filtered.append(opp)
-            
-            filtered_opportunities = text_filtered
+        # Ranked text matches, or every document when there is no query
+        # (sample data until scans populate the index)
+        index = get_searchable_index()
+        text_criteria = bool(global_filter.criteria)
+        page: List[Tuple[Dict[str, Any], float]] = []
+        total: Optional[int] = None
+        while len(page) <= limit:
+            chunk, matched = index.search(
+                query or "", index_filters,
+                limit=ADVANCED_FILTER_CHUNK if text_criteria else limit + 1 - len(page), after=after,
+            )
+            if not text_criteria:
+                total = matched
+            if not chunk:
+                break
+            kept = {id(opp) for opp in global_filter.apply_filters([opp for opp, _ in chunk])}
+            for opp, score in chunk:
+                if id(opp) in kept and len(page) <= limit:
+                    page.append((opp, score))
+            last_opp, last_score = chunk[-1]
+            after = (last_score, opportunity_key(last_opp))
+            if not text_criteria:
+                break
+        
+        has_more = len(page) > limit
+        page = page[:limit]
+        next_cursor = None
+        if has_more:
+            last_opp, last_score = page[-1]
+            next_cursor = encode_cursor(last_score, opportunity_key(last_opp))
+        filtered_opportunities = [opp for opp, _ in page]
         
         return {
             "status": "success",
             "query": query,
             "filters_applied": filters,
             "results": filtered_opportunities,
-            "total": len(filtered_opportunities),
+            "total": total,
+            "pagination": {"limit": limit, "has_more": has_more, "next_cursor": next_cursor},
             "timestamp": datetime.utcnow().isoformat()
         }
         
@@ -1079,41 +1136,94 @@ async def generate_comprehensive_prediction(
         raise HTTPException(status_code=500, detail=f"Failed to generate comprehensive prediction: {str(e)}")
 
 
+def _current_profile_data() -> Dict[str, Any]:
+    """The current profile as a dict for ML scoring ({} if none is set up)"""
+    from src.services.profile_service import get_current_profile
+
+    profile = get_current_profile()
+    return profile.model_dump(mode="json") if profile else {}
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _user_profile_data(user_id: Optional[str]) -> Dict[str, Any]:
+    """
+    A v2 user's profile as a dict for ML scoring.
+    
+    Built from the skills and industries in the user's profile-engine
+    preferences; falls back to the current profile for unknown users.
+    """
+    profile = global_profile_engine.get_user_profile(user_id) if user_id else None
+    if profile is None:
+        return _current_profile_data()
+    preferences = {key: pref.value for key, pref in profile.preferences.items()}
+    return {
+        "skills": _as_list(preferences.get(PreferenceType.SKILLS.value)),
+        "preferences": {"industries": _as_list(preferences.get(PreferenceType.INDUSTRY.value))},
+    }
+
+
 @app.post("/api/v2/predict/batch", tags=["Success Prediction"])
 async def predict_batch_opportunities(
     user_id: str,
     opportunities: List[Dict[str, Any]],
-    prediction_type: str = Query("application_success", description="Type of prediction to generate")
+    prediction_type: str = Query("application_success", description="Type of prediction to generate"),
+    explain_top_k: int = Query(10, ge=0, le=100, description="Fit explanations for the k best fits only"),
 ):
     """
     Generate predictions for multiple opportunities at once.
     
     Efficiently analyzes multiple opportunities for a user and returns
-    ranked predictions with success probabilities.
+    ranked predictions with success probabilities. ML fit scores for the
+    whole batch come from one model call; only the ``explain_top_k`` best
+    fits get a fit explanation. A failed prediction leaves that item's
+    ``prediction`` null (see ``prediction_error``) instead of failing the batch.
     """
     try:
+        scored = await get_ml_model().score_batch(
+            opportunities, _user_profile_data(user_id), explain_top_k=explain_top_k
+        )
         predictions = []
         
-        for opportunity in opportunities:
-            if prediction_type == "application_success":
-                pred = global_success_predictor.predict_application_success(user_id, opportunity)
-            elif prediction_type == "overall_fit":
-                pred = global_success_predictor.predict_overall_fit(user_id, opportunity)
-            else:
-                comprehensive = global_success_predictor.generate_comprehensive_prediction(user_id, opportunity)
-                pred = comprehensive.predictions[0]  # Use first prediction for ranking
+        for result in scored:
+            opportunity = opportunities[result["index"]]
+            pred = None
+            prediction_error = None
+            try:
+                if prediction_type == "application_success":
+                    pred = global_success_predictor.predict_application_success(user_id, opportunity)
+                elif prediction_type == "overall_fit":
+                    pred = global_success_predictor.predict_overall_fit(user_id, opportunity)
+                else:
+                    comprehensive = global_success_predictor.generate_comprehensive_prediction(user_id, opportunity)
+                    pred = comprehensive.predictions[0]  # Use first prediction for ranking
+            except Exception as e:
+                prediction_error = str(e)
             
             predictions.append({
                 "opportunity_id": opportunity.get('id', ''),
                 "opportunity_title": opportunity.get('title', 'Unknown'),
-                "prediction": pred.to_dict()
+                "prediction": pred.to_dict() if pred else None,
+                "prediction_error": prediction_error,
+                "fit_score": result["fit_score"],
+                "tier": result["tier"],
+                "confidence": result["confidence"],
+                "explanation": result["explanation"],
             })
         
-        # Sort by success probability
-        predictions.sort(key=lambda x: x['prediction']['success_probability'], reverse=True)
+        # Sort by success probability; failed predictions last, in fit order
+        predictions.sort(
+            key=lambda x: x['prediction']['success_probability'] if x['prediction'] else -1.0,
+            reverse=True,
+        )
         
         # Calculate batch statistics
-        success_probs = [p['prediction']['success_probability'] for p in predictions]
+        success_probs = [p['prediction']['success_probability'] for p in predictions if p['prediction']]
+        fit_scores = [p['fit_score'] for p in predictions]
         
         return {
             "status": "success",
@@ -1124,6 +1234,7 @@ async def predict_batch_opportunities(
                 "high_probability_count": len([p for p in success_probs if p > 0.7]),
                 "moderate_probability_count": len([p for p in success_probs if 0.5 < p <= 0.7]),
                 "low_probability_count": len([p for p in success_probs if p <= 0.5]),
+                "average_fit_score": sum(fit_scores) / len(fit_scores) if fit_scores else 0,
                 "top_recommendation": predictions[0] if predictions else None
             },
             "generated_at": datetime.utcnow().isoformat()
@@ -1151,26 +1262,122 @@ async def get_status():
         }
 
 
+# ==================== Scan Jobs ====================
+
+class ScanJobRequest(BaseModel):
+    """Request model for submitting a background scan"""
+    kind: str = Field(..., pattern="^(mega_scan|batch|batch_range|browse)$", description="Scan to run")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Scan parameters (same names and limits as the inline scan endpoints)")
+
+
+def _scan_job_accepted(job, deduplicated: bool) -> JSONResponse:
+    """202 response pointing the client at a job's status URL"""
+    return JSONResponse(status_code=202, content={
+        "success": True,
+        "job_id": job.job_id,
+        "kind": job.kind,
+        "status": job.status,
+        "deduplicated": deduplicated,
+        "status_url": f"/api/v1/scan/jobs/{job.job_id}",
+        "timestamp": datetime.utcnow().isoformat(),
+    })
+
+
+async def _run_scan_job(kind: str, params: Dict[str, Any], background: bool):
+    """
+    Run a scan through the background job manager.
+    
+    Identical concurrent requests share one scan and recently completed
+    results are reused. Returns (result, None), or (None, 202 response)
+    when background=True.
+    """
+    manager = get_scan_jobs()
+    job, deduplicated = await manager.submit(kind, params)
+    if background:
+        return None, _scan_job_accepted(job, deduplicated)
+    return await manager.wait(job), None
+
+
+@app.post("/api/v1/scan/jobs", tags=["Discovery"], status_code=202)
+async def submit_scan_job(request: ScanJobRequest):
+    """
+    Submit a scan to run in the background and get a job id back at once.
+    
+    Kinds and their parameters:
+    - mega_scan: include_jobs, include_scholarships, include_grants, include_vc,
+      include_hackathons, include_web_browsing
+    - batch: batch_number, max_concurrent, mode
+    - batch_range: start, end, max_concurrent, mode
+    - browse: queries (list), limit
+    
+    An identical scan that is already running is joined instead of started
+    again (deduplicated=true). Poll the status_url for progress and results.
+    """
+    try:
+        job, deduplicated = await get_scan_jobs().submit(request.kind, request.params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _scan_job_accepted(job, deduplicated)
+
+
+@app.get("/api/v1/scan/jobs", tags=["Discovery"])
+async def list_scan_jobs():
+    """List scan jobs known to this worker, newest first."""
+    manager = get_scan_jobs()
+    return {
+        "success": True,
+        "jobs": manager.list_jobs(),
+        "stats": manager.get_stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@app.get("/api/v1/scan/jobs/{job_id}", tags=["Discovery"])
+async def get_scan_job(
+    job_id: str,
+    offset: int = Query(0, ge=0, description="Offset into the opportunities found so far"),
+    limit: int = Query(100, ge=0, le=1000, description="Opportunities to return"),
+):
+    """
+    Get a scan job's status, progress and results.
+    
+    While the job runs, opportunities holds what the finished sources have
+    found so far; once completed it holds the final (deduplicated) results.
+    """
+    job = await get_scan_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Scan job {job_id} not found")
+    return {
+        "success": True,
+        **job.to_dict(include_result=True, offset=offset, limit=limit),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@app.delete("/api/v1/scan/jobs/{job_id}", tags=["Discovery"])
+async def cancel_scan_job(job_id: str):
+    """Cancel a queued or running scan job."""
+    if not get_scan_jobs().cancel(job_id):
+        raise HTTPException(status_code=404, detail=f"No running scan job {job_id}")
+    return {"success": True, "job_id": job_id, "status": "cancelling"}
+
+
 @app.get("/api/v1/browse", tags=["Discovery"])
 async def web_browse_opportunities(
     queries: str = Query("remote software engineer,tech startup jobs,machine learning remote", description="Comma-separated search queries"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results"),
+    background: bool = Query(False, description="Return a scan job id at once instead of waiting for the results"),
 ):
     """
     Discover opportunities via web browsing and search engines.
     This performs dynamic web scraping across multiple sources.
     """
     try:
-        from src.scrapers.web_browser_scraper import browse_and_scrape
-        
         query_list = [q.strip() for q in queries.split(",") if q.strip()]
         
-        result = await browse_and_scrape(
-            include_search=True,
-            include_dynamic=True,
-            search_queries=query_list,
-            limit=limit,
-        )
+        result, accepted = await _run_scan_job("browse", {"queries": query_list, "limit": limit}, background)
+        if accepted:
+            return accepted
         
         return {
             "success": True,
@@ -1194,22 +1401,23 @@ async def mega_scan_opportunities(
     include_vc: bool = Query(True, description="Include VC/startup opportunities"),
     include_hackathons: bool = Query(True, description="Include hackathons"),
     include_web_browsing: bool = Query(False, description="Include web browsing (slower but more comprehensive)"),
+    background: bool = Query(False, description="Return a scan job id at once instead of waiting for the results"),
 ):
     """
     Execute a comprehensive mega scan across all sources.
     With web browsing enabled, this can find 500+ opportunities.
     """
     try:
-        from src.scrapers.live_scrapers import live_mega_scan
-        
-        result = await live_mega_scan(
-            include_jobs=include_jobs,
-            include_scholarships=include_scholarships,
-            include_grants=include_grants,
-            include_vc=include_vc,
-            include_hackathons=include_hackathons,
-            include_web_browsing=include_web_browsing,
-        )
+        result, accepted = await _run_scan_job("mega_scan", {
+            "include_jobs": include_jobs,
+            "include_scholarships": include_scholarships,
+            "include_grants": include_grants,
+            "include_vc": include_vc,
+            "include_hackathons": include_hackathons,
+            "include_web_browsing": include_web_browsing,
+        }, background)
+        if accepted:
+            return accepted
         
         return {
             "success": True,
@@ -1261,6 +1469,9 @@ async def get_scan_batches():
 async def scan_single_batch(
     batch_number: int,
     max_concurrent: int = Query(5, ge=1, le=10, description="Max concurrent scrapers"),
+    mode: str = Query("full", pattern="^(full|delta)$", description="full: every opportunity; delta: only new/changed since the previous scan"),
+    since: Optional[datetime] = Query(None, description="Return only changes recorded after this UTC timestamp"),
+    background: bool = Query(False, description="Return a scan job id at once instead of waiting for the results"),
 ):
     """
     Execute a single batch of scrapers (~100 sources).
@@ -1273,15 +1484,26 @@ async def scan_single_batch(
     - 5: Grants & Funding (Grants.gov, Open Grants)
     - 6: VC & Accelerators (Y Combinator, ProductHunt, Crunchbase)
     - 7: Hackathons & Competitions (Devpost, MLH)
+    
+    With since=, the response carries the net changes (new/changed
+    opportunities and tombstones for removed ones) recorded for this
+    batch's sources after that time, so clients can poll for updates.
     """
     try:
-        from src.scrapers.live_scrapers import scan_batch
+        from src.scrapers.live_scrapers import get_batch_changes_since
         
-        result = await scan_batch(batch_number, max_concurrent)
+        result, accepted = await _run_scan_job(
+            "batch", {"batch_number": batch_number, "max_concurrent": max_concurrent, "mode": mode}, background
+        )
+        if accepted:
+            return accepted
         
         if not result.get("success", False):
             return {"success": False, "error": result.get("error", "Unknown error")}
         
+        if since is not None:
+            result = {**result, **get_batch_changes_since([batch_number], since)}
+        
         return {
             "success": True,
             "batch_number": result["batch_number"],
@@ -1293,7 +1515,11 @@ async def scan_single_batch(
             "by_source": result["stats"]["by_source"],
             "sources_successful": result["stats"]["sources_successful"],
             "sources_failed": result["stats"]["sources_failed"],
+            "mode": result["mode"],
+            "since": since.isoformat() if since else None,
+            "delta": result["stats"]["delta"],
             "opportunities": result["opportunities"],
+            "removed": result["removed"],
             "duration_seconds": result["duration_seconds"],
             "has_more": result["has_more"],
             "next_batch": result["next_batch"],
@@ -1309,24 +1535,31 @@ async def scan_single_batch(
 async def scan_batch_range(
     start: int = Query(1, ge=1, le=7, description="Start batch number"),
     end: int = Query(7, ge=1, le=7, description="End batch number"),
-    max_concurrent: int = Query(5, ge=1, le=10, description="Max concurrent scrapers per batch"),
+    max_concurrent: int = Query(10, ge=1, le=25, description="Max concurrent scrapers across the whole range"),
+    mode: str = Query("full", pattern="^(full|delta)$", description="full: every opportunity; delta: only new/changed since the previous scan"),
+    since: Optional[datetime] = Query(None, description="Return only changes recorded after this UTC timestamp"),
+    background: bool = Query(False, description="Return a scan job id at once instead of waiting for the results"),
 ):
     """
-    Execute a range of batches incrementally.
-    Each batch contains ~100 sources.
+    Execute a range of batches as one pipelined scan.
+    All scrapers in the range share one work queue, so a slow source
+    only delays its own batch.
     
     Examples:
     - start=1&end=3: Run first 3 batches (~300 sources)
     - start=1&end=7: Run all batches (~700 sources)
     """
     try:
-        from src.scrapers.live_scrapers import scan_all_batches_incremental
+        from src.scrapers.live_scrapers import get_batch_changes_since
         
-        result = await scan_all_batches_incremental(
-            start_batch=start,
-            end_batch=end,
-            max_concurrent=max_concurrent
+        result, accepted = await _run_scan_job(
+            "batch_range", {"start": start, "end": end, "max_concurrent": max_concurrent, "mode": mode}, background
         )
+        if accepted:
+            return accepted
+        
+        if since is not None:
+            result = {**result, **get_batch_changes_since(list(range(start, end + 1)), since)}
         
         return {
             "success": True,
@@ -1337,7 +1570,10 @@ async def scan_batch_range(
             "by_batch": result["stats"]["by_batch"],
             "by_source": result["stats"]["by_source"],
             "by_category": result["stats"]["by_category"],
+            "mode": result["mode"],
+            "since": since.isoformat() if since else None,
             "opportunities": result["opportunities"],
+            "removed": result["removed"],
             "duration_seconds": result["duration_seconds"],
             "errors": result["stats"]["errors"],
             "is_live_data": True,
@@ -1347,6 +1583,129 @@ async def scan_batch_range(
         return {"success": False, "error": str(e), "timestamp": datetime.utcnow().isoformat()}
 
 
+# ==================== Streaming Scans ====================
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+STREAM_QUEUE_SIZE = 8  # frames buffered before a slow client holds the scan back
+
+
+def _encode_frame(frame: Dict[str, Any], fmt: str) -> str:
+    """Encode one stream frame as an NDJSON line or a Server-Sent Event"""
+    data = json.dumps(frame, default=str)
+    if fmt == "sse":
+        return f"event: {frame['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def _stream_scan(run_scan, fmt: str):
+    """
+    Run a scan in the background and yield its frames as they arrive.
+    
+    run_scan(emit) receives an async emit(frame) callback and returns the
+    final stats frame. The queue is bounded, so emit waits while the
+    client falls behind instead of buffering the whole scan. If the client
+    disconnects, the scan is cancelled.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    
+    async def runner():
+        try:
+            final = await run_scan(queue.put)
+            last = {"type": "stats", **final}
+        except Exception as e:
+            last = {"type": "error", "error": str(e)}
+        # Not in a finally: once cancelled nobody reads the queue, and a
+        # put into a full queue would never return
+        await queue.put(last)
+        await queue.put(None)
+    
+    task = asyncio.create_task(runner())
+    try:
+        while (frame := await queue.get()) is not None:
+            yield _encode_frame(frame, fmt)
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+@app.get("/api/v1/scan/batch/range/stream", tags=["Discovery"])
+async def stream_batch_range(
+    start: int = Query(1, ge=1, description="Start batch number"),
+    end: Optional[int] = Query(None, ge=1, description="End batch number (default: last batch)"),
+    max_concurrent: int = Query(10, ge=1, le=25, description="Max concurrent scrapers across the whole range"),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="ndjson or sse"),
+):
+    """
+    Stream a batch-range scan as NDJSON or Server-Sent Events.
+    
+    Frames:
+    - source: one scraper's opportunities, sent the moment it finishes
+    - batch: a batch's stats, sent when its last scraper finishes
+    - stats: final combined stats
+    """
+    from src.scrapers.live_scrapers import scan_all_batches_incremental
+    
+    async def run_scan(emit):
+        async def on_source(source_result):
+            await emit({"type": "source", **source_result})
+        
+        async def on_batch(batch_result):
+            await emit({
+                "type": "batch",
+                "batch_number": batch_result["batch_number"],
+                "duration_seconds": batch_result["duration_seconds"],
+                "stats": batch_result["stats"],
+            })
+        
+        result = await scan_all_batches_incremental(
+            start_batch=start,
+            end_batch=end,
+            max_concurrent=max_concurrent,
+            callback=on_batch,
+            on_source=on_source,
+            collect=False,
+        )
+        return {"stats": result["stats"], "duration_seconds": result["duration_seconds"]}
+    
+    return StreamingResponse(_stream_scan(run_scan, format), media_type=STREAM_MEDIA_TYPES[format])
+
+
+@app.get("/api/v1/mega-scan/live/stream", tags=["Mega Scraping"])
+async def stream_mega_scan_live(
+    include_web_browsing: bool = Query(False, description="Include web browsing"),
+    max_concurrent: int = Query(5, ge=1, le=20, description="Max concurrent scrapers"),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="ndjson or sse"),
+):
+    """
+    Stream a live mega scan as NDJSON or Server-Sent Events.
+    
+    Each source's opportunities are sent as a "source" frame the moment
+    that scraper completes, followed by a final "stats" frame.
+    """
+    from src.scrapers.live_scrapers import live_mega_scan
+    
+    async def run_scan(emit):
+        async def on_source(source_result):
+            await emit({"type": "source", **source_result})
+        
+        result = await live_mega_scan(
+            include_web_browsing=include_web_browsing,
+            max_concurrent=max_concurrent,
+            on_source=on_source,
+            collect=False,
+        )
+        return {
+            "stats": result["stats"],
+            "duration_seconds": result["duration_seconds"],
+            "success_rate": result["success_rate"],
+        }
+    
+    return StreamingResponse(_stream_scan(run_scan, format), media_type=STREAM_MEDIA_TYPES[format])
+
+
 @app.get("/api/v1/stats", tags=["Analytics"])
 async def get_stats():
     """Get comprehensive statistics for analytics dashboard - uses LIVE data."""
@@ -1463,18 +1822,39 @@ async def run_daily_discovery(
 @app.get("/api/v1/opportunities/top", tags=["Discovery"])
 async def get_top_opportunities(
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
-    """Get top-scored opportunities."""
+    """Get top-scored opportunities, best fit first, one keyset page at a time."""
     try:
-        from src.orchestrator.engine import growth_engine
+        from src.data import OpportunityRepository, get_session
         
-        result = await growth_engine.get_top_opportunities(limit=limit)
+        async with get_session() as session:
+            rows, next_cursor = await OpportunityRepository(session).list_page(
+                limit=limit, cursor=cursor, sort="fit_score"
+            )
         
         return APIResponse(
             success=True,
-            data={"opportunities": result},
+            data={
+                "opportunities": [
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "organization": row.organization,
+                        "opportunity_type": row.opportunity_type,
+                        "tier": row.tier,
+                        "fit_score": row.fit_score,
+                        "deadline": row.deadline.isoformat() if row.deadline else None,
+                        "url": row.url,
+                    }
+                    for row in rows
+                ],
+                "next_cursor": next_cursor,
+            },
         )
         
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1689,6 +2069,7 @@ class MegaScanRequest(BaseModel):
 async def mega_scan_all(
     request: MegaScanRequest,
     background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Return a scan job id at once instead of waiting for the results"),
 ):
     """
     🚀 MEGA SCAN - Live scan from real opportunity sources.
@@ -1705,15 +2086,15 @@ async def mega_scan_all(
     """
     try:
         # Use LIVE scrapers only - no demo data
-        from src.scrapers.live_scrapers import live_mega_scan
-        
-        result = await live_mega_scan(
-            include_jobs=request.include_jobs,
-            include_scholarships=request.include_scholarships or request.include_fellowships,
-            include_grants=request.include_grants,
-            include_vc=request.include_vc,
-            include_hackathons=request.include_conferences,
-        )
+        result, accepted = await _run_scan_job("mega_scan", {
+            "include_jobs": request.include_jobs,
+            "include_scholarships": request.include_scholarships or request.include_fellowships,
+            "include_grants": request.include_grants,
+            "include_vc": request.include_vc,
+            "include_hackathons": request.include_conferences,
+        }, background)
+        if accepted:
+            return accepted
         
         return APIResponse(
             success=True,
@@ -1739,7 +2120,9 @@ async def mega_scan_all(
 
 
 @app.post("/api/v1/mega-scan/live", tags=["Mega Scraping"])
-async def mega_scan_live():
+async def mega_scan_live(
+    background: bool = Query(False, description="Return a scan job id at once instead of waiting for the results"),
+):
     """
     🌐 LIVE SCAN - Fetch REAL opportunities from actual websites.
     
@@ -1754,15 +2137,9 @@ async def mega_scan_live():
     Returns actual current opportunities from the internet!
     """
     try:
-        from src.scrapers.live_scrapers import live_mega_scan
-        
-        result = await live_mega_scan(
-            include_jobs=True,
-            include_scholarships=True,
-            include_grants=True,
-            include_vc=True,
-            include_hackathons=True,
-        )
+        result, accepted = await _run_scan_job("mega_scan", {}, background)
+        if accepted:
+            return accepted
         
         return APIResponse(
             success=True,
@@ -3040,33 +3417,23 @@ async def get_smart_recommendations(
 
 @app.post("/api/v1/intelligence/score", tags=["Intelligence"])
 async def ml_score_opportunity(
-    opportunity_data: dict,
+    opportunity_data: dict = Body(...),
+    user_id: Optional[str] = Query(None, description="Score for this user instead of the current profile"),
 ):
     """
     Score a single opportunity using ML model with confidence intervals.
     
     Returns detailed scoring breakdown with prediction confidence.
+    Scores against the current profile unless a user_id is given.
     """
     try:
-        import random
-        
-        # Extract features for scoring
-        title = opportunity_data.get("title", "")
-        description = opportunity_data.get("description", "")
-        opp_type = opportunity_data.get("type", "job")
-        
-        # Calculate component scores (will be ML-powered in production)
-        skill_score = random.uniform(0.6, 0.95)
-        experience_score = random.uniform(0.5, 0.9)
-        culture_score = random.uniform(0.6, 0.85)
-        growth_score = random.uniform(0.5, 0.9)
-        
-        # Calculate overall fit with confidence
-        overall_fit = (skill_score * 0.35 + experience_score * 0.25 + 
-                      culture_score * 0.2 + growth_score * 0.2)
+        [result] = await get_ml_model().score_batch([opportunity_data], _user_profile_data(user_id))
+        features = result["features"]
+        explanation = result["explanation"]
+        overall_fit = result["fit_score"]
+        confidence = result["confidence"]
         
         # Confidence interval (narrower = more certain)
-        confidence = random.uniform(0.7, 0.95)
         margin = (1 - confidence) * 0.15
         
         return {
@@ -3078,23 +3445,17 @@ async def ml_score_opportunity(
                     "lower": round(max(0, overall_fit - margin), 3),
                     "upper": round(min(1, overall_fit + margin), 3),
                 },
-                "tier": "tier_1" if overall_fit >= 0.8 else "tier_2" if overall_fit >= 0.6 else "tier_3",
+                "tier": result["tier"].lower(),
                 "component_scores": {
-                    "skill_match": round(skill_score, 3),
-                    "experience_fit": round(experience_score, 3),
-                    "culture_alignment": round(culture_score, 3),
-                    "growth_potential": round(growth_score, 3),
+                    "skill_match": round(features["skill_match_ratio"], 3),
+                    "experience_fit": round(min(1.0, features["experience_ratio"]), 3),
+                    "semantic_match": round(features["semantic_score"], 3),
+                    "prestige": round(features["prestige_score"], 3),
                 },
-                "success_probability": round(overall_fit * 0.7 + random.uniform(0, 0.2), 3),
+                "success_probability": round(overall_fit, 3),
+                "model_version": result["model_version"],
             },
-            "insights": [
-                "Your Python/ML skills are a strong match",
-                "Experience level aligns well with requirements",
-                "Company culture indicators are positive",
-            ] if overall_fit > 0.7 else [
-                "Consider highlighting transferable skills",
-                "May benefit from additional preparation",
-            ],
+            "insights": explanation["strengths"] + explanation["weaknesses"] + [explanation["recommendation"]],
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
@@ -3364,10 +3725,21 @@ async def startup_event():
     import logging
     logging.basicConfig(level=logging.INFO)
     logging.info("Growth Engine API starting...")
+    from .scrapers.metrics_store import ensure_metrics_sync
+    await ensure_metrics_sync()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     import logging
+    from .scrapers.http_pool import close_shared_client
+    from .scrapers.parsing import close_parse_pool
+    from .scrapers.metrics_store import get_metrics_sync
     logging.info("Growth Engine API shutting down...")
+    await get_scan_jobs().shutdown()
+    await close_shared_client()
+    await close_parse_pool()
+    metrics_sync = get_metrics_sync()
+    if metrics_sync is not None:
+        await metrics_sync.stop()
@@ -355,7 +355,7 @@ async def get_mobile_dashboard(
 
 @mobile_router.get("/opportunities")
 async def list_mobile_opportunities(
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = None,
     limit: int = Query(20, ge=1, le=50),
     status: Optional[str] = None,
     min_fit_score: Optional[float] = None,
@@ -366,18 +366,40 @@ async def list_mobile_opportunities(
     List opportunities optimized for mobile.
     
     - Lightweight payload with preview text
-    - Pagination for infinite scroll
+    - Cursor pagination for infinite scroll (pass back next_cursor)
     - Filter support
     """
-    # In production, query database with filters
-    opportunities: list[MobileOpportunity] = []
+    from src.data import OpportunityRepository, get_session
+    from src.pagination import InvalidCursor
+    
+    # Status and bookmarks aren't stored server-side yet
+    try:
+        async with get_session() as session:
+            rows, next_cursor = await OpportunityRepository(session).list_page(
+                limit=limit, cursor=cursor, min_fit_score=min_fit_score
+            )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")  # `status` is the filter here
+    
+    opportunities = [
+        MobileOpportunity(
+            id=row.id,
+            title=row.title,
+            organization=row.organization,
+            deadline=row.deadline,
+            fit_score=row.fit_score or 0.0,
+            description_preview=row.description[:200],
+            created_at=row.discovered_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows
+    ]
     
     return {
         "opportunities": opportunities,
-        "page": page,
         "limit": limit,
-        "total": 0,
-        "has_more": False,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
 
 
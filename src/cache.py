@@ -1,139 +1,781 @@
 """
-Simple Caching Layer for Growth Engine
+Caching Layer for Growth Engine
 
-Provides in-memory caching with TTL for opportunity data.
-In production, this would be replaced with Redis or similar.
+Provides the cache used for opportunity data behind ``get_cache()``:
+
+- ``BoundedCache``: in-process cache with TTL and LRU eviction (default)
+- ``RedisCache``: shared cache for multi-worker deployments, selected by
+  setting ``REDIS_URL`` (or ``CACHE_BACKEND=redis``)
 """
 
-import time
+import asyncio
+import hashlib
+import heapq
 import json
-from typing import Any, Dict, Optional
-from datetime import datetime, timedelta
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
+# Optional Redis support - provides the shared backend
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
 
-class SimpleCache:
-    """Simple in-memory cache with TTL support"""
-    
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._default_ttl = 3600  # 1 hour
-    
+# Optional msgpack import - compact serializer for the Redis backend
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TTL = 3600  # 1 hour
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024  # 128 MB
+DEFAULT_SWEEP_INTERVAL = 60.0  # seconds
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes"""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class CacheBackend(ABC):
+    """Interface shared by the in-process and Redis caches"""
+
+    name = "base"
+
+    @abstractmethod
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        if key not in self._cache:
-            return None
-        
-        entry = self._cache[key]
-        if time.time() > entry['expires_at']:
-            # Expired, remove it
-            del self._cache[key]
-            return None
-        
-        entry['last_accessed'] = time.time()
-        return entry['data']
-    
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache with TTL"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete key from cache"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Clear all cache entries"""
+
+    @abstractmethod
+    def keys(self, limit: Optional[int] = None) -> list:
+        """Get cache keys"""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Get number of cached items"""
+
+    @abstractmethod
+    def cleanup_expired(self) -> int:
+        """Remove expired entries and return count removed"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values at once; missing keys are left out"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values with the same TTL"""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def close(self) -> None:
+        """Release background resources"""
+
+    # Async variants for request handlers. The in-process cache never
+    # blocks, so these call straight through; network backends override
+    # them to keep round trips off the event loop.
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.set(key, value, ttl)
+
+    async def adelete(self, key: str) -> bool:
+        return self.delete(key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        return self.get_many(keys)
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        self.set_many(items, ttl)
+
+
+@dataclass
+class _Entry:
+    data: Any
+    created_at: float
+    expires_at: float
+    last_accessed: float
+    size: int
+
+
+class BoundedCache(CacheBackend):
+    """
+    In-memory cache with TTL, LRU eviction and size limits.
+
+    - Entries are evicted least-recently-used first once max_entries or
+      max_bytes is exceeded.
+    - Expired entries are dropped on read and by a background sweeper
+      that pops them off an expiry heap, so sweeps never scan the cache.
+    - Hits, misses, evictions and byte usage are tracked incrementally,
+      which keeps stats() O(1).
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: int = DEFAULT_TTL,
+        sweep_interval: Optional[float] = DEFAULT_SWEEP_INTERVAL,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.RLock()
+
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._sweep_interval = sweep_interval
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+        if sweep_interval:
+            self.start_sweeper()
+
+    # ---- core operations ----
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache if not expired"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            now = time.time()
+            if now > entry.expires_at:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            entry.last_accessed = now
+            self._hits += 1
+            return entry.data
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache with TTL"""
         if ttl is None:
             ttl = self._default_ttl
-        
-        self._cache[key] = {
-            'data': value,
-            'created_at': time.time(),
-            'expires_at': time.time() + ttl,
-            'last_accessed': time.time()
-        }
-    
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            # Would evict everything else and still not fit
+            self.delete(key)
+            return
+
+        now = time.time()
+        entry = _Entry(data=value, created_at=now, expires_at=now + ttl, last_accessed=now, size=size)
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+            self._cache[key] = entry
+            self._bytes += size
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+            self._enforce_limits()
+
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
-    
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                return True
+            return False
+
     def clear(self) -> None:
         """Clear all cache entries"""
-        self._cache.clear()
-    
-    def keys(self) -> list:
-        """Get all cache keys"""
-        return list(self._cache.keys())
-    
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
+
+    def keys(self, limit: Optional[int] = None) -> list:
+        """Get cache keys, most recently used last"""
+        with self._lock:
+            if limit is None:
+                return list(self._cache.keys())
+            keys = []
+            for key in self._cache:
+                if len(keys) >= limit:
+                    break
+                keys.append(key)
+            return keys
+
     def size(self) -> int:
         """Get number of cached items"""
         return len(self._cache)
-    
+
+    # ---- eviction ----
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+
+    def _enforce_limits(self) -> None:
+        while self._cache and (len(self._cache) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self._evictions += 1
+        # Overwritten/evicted keys leave stale heap items behind
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(entry.expires_at, key) for key, entry in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count removed"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if current_time > entry['expires_at']
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-        
-        return len(expired_keys)
-    
+        removed = 0
+        now = time.time()
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._cache.get(key)
+                # Skip heap items left behind by overwrites or evictions
+                if entry is not None and entry.expires_at == expires_at:
+                    self._remove(key)
+                    removed += 1
+            self._expirations += removed
+        return removed
+
+    # ---- background sweeper ----
+
+    def start_sweeper(self) -> None:
+        """Start the background thread that drops expired entries"""
+        if self._sweeper and self._sweeper.is_alive():
+            return
+        self._stop_sweeper.clear()
+        self._sweeper = threading.Thread(target=self._sweep_loop, name="cache-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self._stop_sweeper.set()
+
+    def close(self) -> None:
+        self.stop_sweeper()
+
+    def _sweep_loop(self) -> None:
+        while not self._stop_sweeper.wait(self._sweep_interval):
+            self.cleanup_expired()
+
+    # ---- statistics ----
+
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        current_time = time.time()
-        active_entries = sum(1 for entry in self._cache.values() 
-                           if current_time <= entry['expires_at'])
-        expired_entries = len(self._cache) - active_entries
-        
+        self.cleanup_expired()
+        requests = self._hits + self._misses
         return {
+            'backend': self.name,
             'total_entries': len(self._cache),
-            'active_entries': active_entries,
-            'expired_entries': expired_entries,
-            'hit_rate': getattr(self, '_hits', 0) / max(getattr(self, '_requests', 1), 1),
-            'memory_usage_mb': len(json.dumps(self._cache, default=str)) / 1024 / 1024
+            'active_entries': len(self._cache),
+            'expired_entries': 0,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / requests if requests else 0.0,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'max_entries': self.max_entries,
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'memory_usage_mb': self._bytes / 1024 / 1024
         }
 
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+class CacheSerializer:
+    """msgpack serializer for cached values, falling back to JSON"""
+
+    def __init__(self, use_msgpack: bool = MSGPACK_AVAILABLE):
+        self.use_msgpack = use_msgpack and MSGPACK_AVAILABLE
+        self.name = "msgpack" if self.use_msgpack else "json"
+
+    def dumps(self, value: Any) -> bytes:
+        if self.use_msgpack:
+            return msgpack.packb(value, default=_encode_default, use_bin_type=True)
+        return json.dumps(value, default=_encode_default).encode()
+
+    def loads(self, payload: bytes) -> Any:
+        if self.use_msgpack:
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        return json.loads(payload)
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache shared by every worker through a Redis-protocol server.
+
+    - Values are serialized with msgpack and expire through Redis TTLs.
+    - get_many/set_many use a single pipelined round trip.
+    - Each worker keeps a small, short-lived near cache of hot keys. Writes,
+      deletes and clears are published on a pub/sub channel so the other
+      workers drop their near-cache copies straight away.
+    - Hit/miss counters are per worker; entry, memory, eviction and
+      expiry figures come from the server.
+    - The a* methods run the blocking client in a worker thread (near
+      cache hits are answered inline), so async handlers don't stall the
+      event loop on a round trip.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Any = None,
+        namespace: str = "growth-engine:cache",
+        default_ttl: int = DEFAULT_TTL,
+        serializer: Optional[CacheSerializer] = None,
+        local_max_entries: int = 1000,
+        local_ttl: int = 5,
+    ):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis package is not installed")
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self._redis = client
+        self._prefix = f"{namespace}:"
+        self._channel = f"{namespace}:invalidate"
+        self._default_ttl = default_ttl
+        self._serializer = serializer or CacheSerializer()
+        self._origin = uuid.uuid4().hex
+
+        self._hits = 0
+        self._misses = 0
+
+        self._local_ttl = local_ttl
+        self._local = BoundedCache(max_entries=local_max_entries, default_ttl=local_ttl, sweep_interval=None) if local_ttl > 0 else None
+        self._stop_listener = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+        if self._local is not None:
+            self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(self._channel)
+            self._listener = threading.Thread(target=self._listen, name="cache-invalidation", daemon=True)
+            self._listener.start()
+
+    # ---- invalidation ----
+
+    def _publish(self, key: str) -> None:
+        """Tell other workers to drop a key ('*' for everything)"""
+        if self._local is not None:
+            self._redis.publish(self._channel, f"{self._origin}\n{key}")
+
+    def _listen(self) -> None:
+        while not self._stop_listener.is_set():
+            try:
+                message = self._pubsub.get_message(timeout=1.0)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}")
+                self._local.clear()
+                self._stop_listener.wait(1.0)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            data = message["data"]
+            origin, _, key = (data.decode() if isinstance(data, bytes) else data).partition("\n")
+            if origin == self._origin:
+                continue
+            if key == "*":
+                self._local.clear()
+            else:
+                self._local.delete(key)
+
+    # ---- core operations ----
+
+    def get(self, key: str) -> Optional[Any]:
+        if self._local is not None:
+            value = self._local.get(key)
+            if value is not None:
+                self._hits += 1
+                return value
+
+        payload = self._redis.get(self._prefix + key)
+        if payload is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        value = self._serializer.loads(payload)
+        if self._local is not None:
+            self._local.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        if ttl is None:
+            ttl = self._default_ttl
+        self._redis.set(self._prefix + key, self._serializer.dumps(value), ex=max(1, int(ttl)))
+        if self._local is not None:
+            self._local.set(key, value, min(ttl, self._local_ttl))
+        self._publish(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        remote = []
+        for key in keys:
+            value = self._local.get(key) if self._local is not None else None
+            if value is not None:
+                found[key] = value
+            else:
+                remote.append(key)
+
+        if remote:
+            pipe = self._redis.pipeline(transaction=False)
+            for key in remote:
+                pipe.get(self._prefix + key)
+            for key, payload in zip(remote, pipe.execute()):
+                if payload is None:
+                    continue
+                value = self._serializer.loads(payload)
+                found[key] = value
+                if self._local is not None:
+                    self._local.set(key, value)
+
+        self._hits += len(found)
+        self._misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        if ttl is None:
+            ttl = self._default_ttl
+        pipe = self._redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._prefix + key, self._serializer.dumps(value), ex=max(1, int(ttl)))
+            if self._local is not None:
+                self._local.set(key, value, min(ttl, self._local_ttl))
+                pipe.publish(self._channel, f"{self._origin}\n{key}")
+        pipe.execute()
+
+    def delete(self, key: str) -> bool:
+        if self._local is not None:
+            self._local.delete(key)
+        removed = self._redis.delete(self._prefix + key)
+        self._publish(key)
+        return bool(removed)
+
+    def _scan_keys(self):
+        return self._redis.scan_iter(match=f"{self._prefix}*", count=500)
+
+    def clear(self) -> None:
+        batch = []
+        for raw in self._scan_keys():
+            batch.append(raw)
+            if len(batch) >= 500:
+                self._redis.delete(*batch)
+                batch = []
+        if batch:
+            self._redis.delete(*batch)
+        if self._local is not None:
+            self._local.clear()
+        self._publish("*")
+
+    def keys(self, limit: Optional[int] = None) -> list:
+        keys = []
+        for raw in self._scan_keys():
+            if limit is not None and len(keys) >= limit:
+                break
+            name = raw.decode() if isinstance(raw, bytes) else raw
+            keys.append(name[len(self._prefix):])
+        return keys
+
+    def size(self) -> int:
+        """
+        Approximate entry count: DBSIZE is O(1) but also counts keys of
+        other namespaces sharing the database. Use ``keys()`` for an exact
+        (O(keyspace)) listing.
+        """
+        return int(self._redis.dbsize())
+
+    # ---- async variants ----
+
+    async def aget(self, key: str) -> Optional[Any]:
+        if self._local is not None:
+            value = self._local.get(key)
+            if value is not None:
+                self._hits += 1
+                return value
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    async def adelete(self, key: str) -> bool:
+        return await asyncio.to_thread(self.delete, key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.get_many, list(keys))
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        await asyncio.to_thread(self.set_many, dict(items), ttl)
+
+    def cleanup_expired(self) -> int:
+        # Redis expires keys itself; only the near cache needs sweeping
+        return self._local.cleanup_expired() if self._local is not None else 0
+
+    def stats(self) -> Dict[str, Any]:
+        info: Dict[str, Any] = {}
+        try:
+            info.update(self._redis.info("memory"))
+            info.update(self._redis.info("stats"))
+        except Exception as e:
+            logger.debug(f"Redis INFO unavailable: {e}")
+        entries = self.size()
+        requests = self._hits + self._misses
+        used = int(info.get("used_memory", 0))
+        return {
+            'backend': self.name,
+            'serializer': self._serializer.name,
+            'total_entries': entries,
+            'active_entries': entries,
+            'expired_entries': 0,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / requests if requests else 0.0,
+            'evictions': int(info.get("evicted_keys", 0)),
+            'expirations': int(info.get("expired_keys", 0)),
+            'max_entries': None,
+            'bytes': used,
+            'max_bytes': int(info.get("maxmemory", 0)) or None,
+            'memory_usage_mb': used / 1024 / 1024,
+            'local_entries': self._local.size() if self._local is not None else 0
+        }
+
+    def close(self) -> None:
+        self._stop_listener.set()
+        if self._listener is not None:
+            self._listener.join(timeout=2)
+            self._pubsub.close()
+        if self._local is not None:
+            self._local.close()
+
+
+def create_cache_backend(backend: Optional[str] = None, redis_url: Optional[str] = None) -> CacheBackend:
+    """
+    Build the configured cache backend.
+
+    ``CACHE_BACKEND`` picks "memory" or "redis"; Redis is used by default
+    when ``REDIS_URL`` is set. If Redis is unreachable the in-process cache
+    is used instead.
+    """
+    redis_url = redis_url or os.getenv("REDIS_URL")
+    backend = (backend or os.getenv("CACHE_BACKEND") or ("redis" if redis_url else "memory")).lower()
+    if backend == "redis":
+        try:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis package is not installed")
+            client = redis.Redis.from_url(redis_url or "redis://localhost:6379/0")
+            client.ping()
+            return RedisCache(client=client)
+        except Exception as e:
+            logger.warning(f"Redis cache unavailable ({e}), using in-process cache")
+    return BoundedCache()
+
 
 # Global cache instance
-_global_cache = SimpleCache()
+_global_cache: Optional[CacheBackend] = None
+_global_cache_lock = threading.Lock()
 
 
-def get_cache() -> SimpleCache:
+def get_cache() -> CacheBackend:
     """Get the global cache instance"""
+    global _global_cache
+    if _global_cache is None:
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = create_cache_backend()
     return _global_cache
 
 
+def set_cache(cache: CacheBackend) -> None:
+    """Replace the global cache instance (e.g. in tests)"""
+    global _global_cache
+    previous, _global_cache = _global_cache, cache
+    if previous is not None and previous is not cache:
+        previous.close()
+
+
+def normalize_search_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query"""
+    return " ".join(query.casefold().split())
+
+
+def normalize_search_filters(filters: Mapping[str, Any]) -> Dict[str, Any]:
+    """Drop unset filters and trim string values"""
+    normalized = {}
+    for name, value in filters.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            continue
+        normalized[name] = value
+    return normalized
+
+
+def search_cache_key(query: str, filters: Mapping[str, Any]) -> str:
+    """
+    Deterministic cache key for a search.
+
+    Unlike the built-in ``hash()``, the digest is the same in every worker
+    and across restarts, so a shared cache backend can serve it.
+    """
+    payload = json.dumps(
+        {"q": normalize_search_query(query), "filters": normalize_search_filters(filters)},
+        sort_keys=True, default=str, separators=(",", ":"),
+    )
+    return f"search:{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one computation.
+
+    The first caller starts the work as a task; callers arriving while it
+    is running await the same task. The task is shielded, so a caller
+    that disconnects doesn't cancel the work for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Run fn once per key at a time; returns (result, was_coalesced)"""
+        task = self._inflight.get(key)
+        coalesced = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task), coalesced
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved when every caller went away
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+
 class CachedOpportunityManager:
     """Manages cached opportunities with smart invalidation"""
-    
+
     def __init__(self):
-        self.cache = get_cache()
         self.batch_cache_ttl = 1800  # 30 minutes for batch results
         self.search_cache_ttl = 300   # 5 minutes for search results
-    
+        self._search_flight = SingleFlight()
+
+    @property
+    def cache(self) -> CacheBackend:
+        return get_cache()
+
     def get_batch_opportunities(self, batch_id: str) -> Optional[Dict]:
         """Get cached opportunities for a batch"""
         cache_key = f"batch:{batch_id}"
         return self.cache.get(cache_key)
-    
+
     def set_batch_opportunities(self, batch_id: str, opportunities: Dict) -> None:
         """Cache opportunities for a batch"""
         cache_key = f"batch:{batch_id}"
         self.cache.set(cache_key, opportunities, self.batch_cache_ttl)
-    
+
     def get_search_results(self, query: str, filters: Dict) -> Optional[Dict]:
         """Get cached search results"""
-        cache_key = f"search:{hash(f'{query}:{json.dumps(filters, sort_keys=True)}'.encode())}"
-        return self.cache.get(cache_key)
-    
+        return self.cache.get(search_cache_key(query, filters))
+
     def set_search_results(self, query: str, filters: Dict, results: Dict) -> None:
         """Cache search results"""
-        cache_key = f"search:{hash(f'{query}:{json.dumps(filters, sort_keys=True)}'.encode())}"
-        self.cache.set(cache_key, results, self.search_cache_ttl)
-    
+        self.cache.set(search_cache_key(query, filters), results, self.search_cache_ttl)
+
+    async def get_or_compute_search(
+        self,
+        query: str,
+        filters: Dict,
+        compute: Callable[[], Awaitable[Dict]],
+    ) -> Dict:
+        """
+        Get cached search results, computing them at most once at a time.
+
+        Concurrent identical searches share a single call to compute.
+        """
+        cache_key = search_cache_key(query, filters)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return {**cached, "from_cache": True, "coalesced": False}
+
+        async def run() -> Dict:
+            results = await compute()
+            await self.cache.aset(cache_key, results, self.search_cache_ttl)
+            return results
+
+        results, coalesced = await self._search_flight.do(cache_key, run)
+        return {**results, "from_cache": False, "coalesced": coalesced}
+
     def invalidate_batch(self, batch_id: str) -> bool:
         """Invalidate cached batch data"""
         cache_key = f"batch:{batch_id}"
         return self.cache.delete(cache_key)
-    
+
     def clear_search_cache(self) -> None:
         """Clear all search result caches"""
         search_keys = [key for key in self.cache.keys() if key.startswith('search:')]
@@ -142,4 +784,4 @@ class CachedOpportunityManager:
 
 
 # Global opportunity cache manager
-opportunity_cache = CachedOpportunityManager()
\ No newline at end of file
+opportunity_cache = CachedOpportunityManager()
@@ -20,7 +20,7 @@ from src.data.models import (
     ProfileORM,
     ScoringWeightsORM,
 )
-from src.data.repositories import OpportunityRepository
+from src.data.repositories import BulkUpsertResult, OpportunityRepository
 
 __all__ = [
     # Database
@@ -38,4 +38,5 @@ __all__ = [
     "ScoringWeightsORM",
     # Repositories
     "OpportunityRepository",
+    "BulkUpsertResult",
 ]
@@ -80,9 +80,36 @@ async def init_db() -> None:
     
     Creates all tables defined in SQLAlchemy models.
     Run this once on startup or use Alembic for migrations.
+    
+    ``create_all`` skips tables that already exist, so columns and indexes
+    added to ``opportunities`` later are added here idempotently as well.
     """
+    from sqlalchemy import text
+    
     async with engine.begin() as conn:
+        # Trigram indexes on opportunities need pg_trgm
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_opportunities)
+
+
+# Columns added to opportunities after its first release
+OPPORTUNITY_UPGRADE_COLUMNS = ("content_hash", "search_vector")
+
+
+def _upgrade_opportunities(conn) -> None:
+    """Add missing opportunities columns and indexes to an existing table"""
+    from sqlalchemy import text
+    from sqlalchemy.schema import CreateColumn, CreateIndex
+    
+    from src.data.models import OpportunityORM
+    
+    table = OpportunityORM.__table__
+    for name in OPPORTUNITY_UPGRADE_COLUMNS:
+        column_ddl = CreateColumn(table.c[name]).compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column_ddl}"))
+    for index in table.indexes:
+        conn.execute(CreateIndex(index, if_not_exists=True))
 
 
 async def close_db() -> None:
@@ -11,15 +11,17 @@ from uuid import uuid4
 from sqlalchemy import (
     JSON,
     Boolean,
+    Computed,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.data.database import Base
@@ -33,10 +35,35 @@ from src.models.enums import (
 )
 
 
+# Full-text document for opportunity search; title matches weigh most
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(organization, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+)
+
+
 class OpportunityORM(Base):
     """SQLAlchemy model for opportunities."""
     
     __tablename__ = "opportunities"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY <column> DESC, id DESC walks these
+        Index("ix_opportunities_discovered_at_id", "discovered_at", "id"),
+        Index("ix_opportunities_fit_score_id", "fit_score", "id"),
+        Index("ix_opportunities_tier_discovered_at_id", "tier", "discovered_at", "id"),
+        # Search: ranked full-text plus fuzzy (pg_trgm) title/organization
+        Index("ix_opportunities_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_opportunities_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_opportunities_organization_trgm", "organization",
+            postgresql_using="gin", postgresql_ops={"organization": "gin_trgm_ops"},
+        ),
+    )
     
     # Primary key
     id: Mapped[str] = mapped_column(
@@ -100,6 +127,16 @@ class OpportunityORM(Base):
     # Raw data backup
     raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     
+    # Hash of the ingested fields; bulk upserts skip rows that haven't changed
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    
+    # Generated full-text vector (deferred: only search queries need it)
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
+    
     # Timestamps
     discovered_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
@@ -4,14 +4,98 @@ Repository for Opportunity database operations.
 Provides async CRUD operations for opportunities using SQLAlchemy.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, literal, literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.data.models import OpportunityORM
+from src.data.models import SEARCH_CONFIG, OpportunityORM
 from src.models import Opportunity, OpportunityCreate, OpportunityTier, OpportunityUpdate
+from src.pagination import InvalidCursor, decode_cursor, encode_cursor
+from src.hashing import VOLATILE_FIELDS, content_hash
+
+
+# Rows per bulk INSERT; ~20 columns keeps a chunk well under the
+# 32,767 bind-parameter limit of the Postgres wire protocol
+BULK_CHUNK_SIZE = 500
+
+# Columns refreshed when a re-ingested opportunity has changed; scores,
+# tiers and discovered_at belong to the stored row
+UPSERT_COLUMNS = (
+    "title", "organization", "description", "opportunity_type", "source",
+    "summary", "location", "is_remote", "application_url", "posted_date",
+    "deadline", "requirements", "compensation", "tags", "source_query",
+    "raw_data", "content_hash",
+)
+
+
+# Share of the search score taken by fit_score (the rest is text relevance)
+SEARCH_FIT_WEIGHT = 0.3
+# Fuzzy organization matches count a bit less than title matches
+ORGANIZATION_MATCH_WEIGHT = 0.8
+
+# Keyset orderings for list_page; each is paired with id as a tie-breaker
+SORT_COLUMNS = {
+    "recent": "discovered_at",
+    "fit_score": "fit_score",
+}
+
+
+@dataclass
+class BulkUpsertResult:
+    """Outcome of OpportunityRepository.bulk_upsert."""
+    
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+
+def _to_row(opportunity: OpportunityCreate) -> dict[str, Any]:
+    """Column values for an opportunity, including its content hash."""
+    row = {
+        "title": opportunity.title,
+        "organization": opportunity.organization,
+        "description": opportunity.description,
+        "opportunity_type": opportunity.opportunity_type.value,
+        "url": str(opportunity.url),
+        "source": opportunity.source.value,
+        "summary": opportunity.summary,
+        "location": opportunity.location,
+        "is_remote": opportunity.is_remote,
+        "application_url": str(opportunity.application_url) if opportunity.application_url else None,
+        "posted_date": opportunity.posted_date,
+        "deadline": opportunity.deadline,
+        "requirements": opportunity.requirements.model_dump() if opportunity.requirements else {},
+        "compensation": opportunity.compensation.model_dump() if opportunity.compensation else {},
+        "tags": opportunity.tags,
+        "source_query": opportunity.source_query,
+        "raw_data": opportunity.raw_data,
+    }
+    raw = {k: v for k, v in (opportunity.raw_data or {}).items() if k not in VOLATILE_FIELDS}
+    row["content_hash"] = content_hash({**row, "raw_data": raw})
+    return row
+
+
+def _unique_rows(opportunities: list[OpportunityCreate], keep: str = "first") -> list[dict[str, Any]]:
+    """Rows with one entry per URL (a statement can't touch a row twice)."""
+    rows: dict[str, dict[str, Any]] = {}
+    for opportunity in opportunities:
+        row = _to_row(opportunity)
+        if keep == "last" or row["url"] not in rows:
+            rows[row["url"]] = row
+    return list(rows.values())
+
+
+def _chunks(rows: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
 
 
 class OpportunityRepository:
@@ -31,25 +115,7 @@ class OpportunityRepository:
         Returns:
             Created opportunity ORM object
         """
-        db_opp = OpportunityORM(
-            title=opportunity.title,
-            organization=opportunity.organization,
-            description=opportunity.description,
-            opportunity_type=opportunity.opportunity_type.value,
-            url=str(opportunity.url),
-            source=opportunity.source.value,
-            summary=opportunity.summary,
-            location=opportunity.location,
-            is_remote=opportunity.is_remote,
-            application_url=str(opportunity.application_url) if opportunity.application_url else None,
-            posted_date=opportunity.posted_date,
-            deadline=opportunity.deadline,
-            requirements=opportunity.requirements.model_dump() if opportunity.requirements else {},
-            compensation=opportunity.compensation.model_dump() if opportunity.compensation else {},
-            tags=opportunity.tags,
-            source_query=opportunity.source_query,
-            raw_data=opportunity.raw_data,
-        )
+        db_opp = OpportunityORM(**_to_row(opportunity))
         
         self.session.add(db_opp)
         await self.session.flush()
@@ -78,6 +144,9 @@ class OpportunityRepository:
         """
         List opportunities with optional filtering.
         
+        OFFSET still reads every skipped row; use ``list_page`` for deep
+        pagination.
+        
         Args:
             limit: Maximum number to return
             offset: Number to skip
@@ -86,7 +155,9 @@ class OpportunityRepository:
         Returns:
             List of opportunities
         """
-        query = select(OpportunityORM).order_by(OpportunityORM.discovered_at.desc())
+        query = select(OpportunityORM).order_by(
+            OpportunityORM.discovered_at.desc(), OpportunityORM.id.desc()
+        )
         
         if tier:
             query = query.where(OpportunityORM.tier == tier.value)
@@ -95,9 +166,66 @@ class OpportunityRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
     
+    async def list_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        sort: str = "recent",
+        tier: OpportunityTier | None = None,
+        min_fit_score: float | None = None,
+    ) -> tuple[list[OpportunityORM], str | None]:
+        """
+        List one page of opportunities using keyset pagination.
+        
+        Rows are ordered by (sort column, id) descending and each page
+        starts right after the previous page's last row, so deep pages are
+        as cheap as the first. Unscored opportunities are left out of the
+        ``fit_score`` order.
+        
+        Args:
+            limit: Maximum number to return
+            cursor: ``next_cursor`` from the previous page
+            sort: "recent" (discovered_at) or "fit_score"
+            tier: Optional tier filter
+            min_fit_score: Optional minimum fit score
+            
+        Returns:
+            Tuple of (opportunities, cursor for the next page or None)
+        
+        Raises:
+            InvalidCursor: If the cursor is malformed
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort {sort!r}; expected one of {sorted(SORT_COLUMNS)}")
+        column = getattr(OpportunityORM, SORT_COLUMNS[sort])
+        
+        query = select(OpportunityORM).order_by(column.desc(), OpportunityORM.id.desc())
+        if sort == "fit_score":
+            query = query.where(column.is_not(None))
+        if tier:
+            query = query.where(OpportunityORM.tier == tier.value)
+        if min_fit_score is not None:
+            query = query.where(OpportunityORM.fit_score >= min_fit_score)
+        if cursor:
+            value, last_id = decode_cursor(cursor, 2)
+            try:
+                value = datetime.fromisoformat(value) if sort == "recent" else float(value)
+            except (TypeError, ValueError) as e:
+                raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+            query = query.where(tuple_(column, OpportunityORM.id) < tuple_(value, str(last_id)))
+        
+        # One extra row tells whether another page exists
+        result = await self.session.execute(query.limit(limit + 1))
+        rows = list(result.scalars().all())
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(getattr(rows[-1], SORT_COLUMNS[sort]), rows[-1].id)
+    
     async def list_tier_1(self, limit: int = 50) -> list[OpportunityORM]:
         """Get top-tier opportunities."""
-        return await self.list_all(limit=limit, tier=OpportunityTier.TIER_1)
+        rows, _ = await self.list_page(limit=limit, tier=OpportunityTier.TIER_1)
+        return rows
     
     async def list_upcoming_deadlines(self, days: int = 7) -> list[OpportunityORM]:
         """Get opportunities with deadlines in the next N days."""
@@ -160,34 +288,80 @@ class OpportunityRepository:
         self,
         opportunities: list[OpportunityCreate],
         skip_duplicates: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
     ) -> list[OpportunityORM]:
         """
         Create multiple opportunities.
         
+        One multi-row INSERT per chunk instead of a lookup and an insert
+        per opportunity.
+        
         Args:
             opportunities: List of opportunities to create
             skip_duplicates: Skip opportunities with duplicate URLs
+            chunk_size: Rows per INSERT statement
             
         Returns:
             List of created opportunities
         """
+        rows = _unique_rows(opportunities) if skip_duplicates else [_to_row(opp) for opp in opportunities]
         created = []
         
-        for opp in opportunities:
+        for chunk in _chunks(rows, chunk_size):
+            stmt = pg_insert(OpportunityORM).values(chunk)
             if skip_duplicates:
-                existing = await self.get_by_url(str(opp.url))
-                if existing:
-                    continue
-            
-            db_opp = await self.create(opp)
-            created.append(db_opp)
+                stmt = stmt.on_conflict_do_nothing(index_elements=[OpportunityORM.url])
+            result = await self.session.scalars(stmt.returning(OpportunityORM))
+            created.extend(result.all())
         
         return created
     
+    async def bulk_upsert(
+        self,
+        opportunities: list[OpportunityCreate],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> BulkUpsertResult:
+        """
+        Insert new opportunities and refresh changed ones by URL.
+        
+        Each chunk is a single ``INSERT ... ON CONFLICT (url) DO UPDATE``.
+        Rows whose content hash matches the stored one are left alone, so
+        re-ingesting a scan doesn't touch ``updated_at`` or scores. When an
+        input repeats a URL the last occurrence wins.
+        
+        Args:
+            opportunities: Opportunities to ingest
+            chunk_size: Rows per INSERT statement
+            
+        Returns:
+            Counts of inserted, updated and unchanged opportunities
+        """
+        rows = _unique_rows(opportunities, keep="last")
+        result = BulkUpsertResult()
+        
+        for chunk in _chunks(rows, chunk_size):
+            stmt = pg_insert(OpportunityORM).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[OpportunityORM.url],
+                set_={
+                    **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                    "updated_at": datetime.utcnow(),
+                },
+                where=OpportunityORM.content_hash.is_distinct_from(stmt.excluded.content_hash),
+            )
+            # xmax is 0 only for rows this statement inserted
+            stmt = stmt.returning(literal_column("xmax = 0").label("inserted"))
+            written = (await self.session.execute(stmt)).scalars().all()
+            
+            inserted = sum(1 for was_inserted in written if was_inserted)
+            result.inserted += inserted
+            result.updated += len(written) - inserted
+            result.unchanged += len(chunk) - len(written)
+        
+        return result
+    
     async def count_by_tier(self) -> dict[str, int]:
         """Get count of opportunities by tier."""
-        from sqlalchemy import func
-        
         result = await self.session.execute(
             select(
                 OpportunityORM.tier,
@@ -201,28 +375,75 @@ class OpportunityRepository:
         self,
         query: str,
         limit: int = 50,
+        fuzzy: bool = True,
     ) -> list[OpportunityORM]:
         """
-        Search opportunities by title or organization.
+        Search opportunities by title, organization or description.
         
         Args:
             query: Search query
             limit: Maximum results
+            fuzzy: Also match misspelled titles and organizations
             
         Returns:
-            Matching opportunities
+            Matching opportunities, best first
         """
-        search_pattern = f"%{query}%"
+        return [opp for opp, _ in await self.search_ranked(query, limit=limit, fuzzy=fuzzy)]
+    
+    async def search_ranked(
+        self,
+        query: str,
+        limit: int = 50,
+        fuzzy: bool = True,
+    ) -> list[tuple[OpportunityORM, float]]:
+        """
+        Ranked search with the score of each match.
         
-        result = await self.session.execute(
-            select(OpportunityORM)
-            .where(
-                (OpportunityORM.title.ilike(search_pattern)) |
-                (OpportunityORM.organization.ilike(search_pattern)) |
-                (OpportunityORM.description.ilike(search_pattern))
+        Full-text matches use the generated ``search_vector`` column (GIN
+        index) and are ranked with ``ts_rank``; with ``fuzzy`` the pg_trgm
+        indexes on title and organization also catch typos. The text score
+        is blended with ``fit_score`` so well-fitting matches rise.
+        
+        Args:
+            query: Search query (web-search syntax: quotes, OR, -word)
+            limit: Maximum results
+            fuzzy: Also match misspelled titles and organizations
+            
+        Returns:
+            (opportunity, score) pairs, best first
+        """
+        query = query.strip()
+        if not query:
+            return []
+        
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        # Normalisation 32 maps rank into [0, 1) like the similarities
+        text_score = func.ts_rank(OpportunityORM.search_vector, tsquery, 32)
+        matches = OpportunityORM.search_vector.op("@@")(tsquery)
+        
+        if fuzzy:
+            term = literal(query)
+            matches = (
+                matches
+                | term.op("<%")(OpportunityORM.title)
+                | term.op("<%")(OpportunityORM.organization)
+            )
+            text_score = func.greatest(
+                text_score,
+                func.word_similarity(term, OpportunityORM.title),
+                func.word_similarity(term, OpportunityORM.organization) * ORGANIZATION_MATCH_WEIGHT,
             )
-            .order_by(OpportunityORM.fit_score.desc().nulls_last())
+        
+        score = (
+            text_score * (1 - SEARCH_FIT_WEIGHT)
+            + func.coalesce(OpportunityORM.fit_score, 0.0) * SEARCH_FIT_WEIGHT
+        ).label("score")
+        
+        result = await self.session.execute(
+            select(OpportunityORM, score)
+            .where(matches)
+            .order_by(score.desc(), OpportunityORM.id.desc())
             .limit(limit)
         )
         
-        return list(result.scalars().all())
+        return [(opp, float(rank)) for opp, rank in result.all()]
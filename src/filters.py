@@ -291,7 +291,12 @@ class OpportunityFilter:
             
             results = text_filtered
         
-        # Apply additional filters
+        return self.apply_search_filters(results, filters)
+    
+    def apply_search_filters(self, opportunities: List[Dict], filters: Optional[Dict] = None) -> List[Dict]:
+        """Apply the quick type/location/remote/salary filters used by search"""
+        results = opportunities
+        
         if filters:
             if filters.get("type"):
                 results = self.quick_category_filter(results, filters["type"])
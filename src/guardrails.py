@@ -21,7 +21,6 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import Any, Callable, Optional, Awaitable
-from collections import defaultdict
 
 from pydantic import BaseModel, Field
 from rich.console import Console
@@ -30,6 +29,9 @@ from rich.prompt import Confirm, Prompt
 from rich.table import Table
 from rich.syntax import Syntax
 
+from . import rate_limit
+from .rate_limit import Rate
+
 console = Console()
 
 
@@ -306,16 +308,17 @@ class RateLimitConfig:
     burst_window_seconds: int = 60
 
 
-class RateLimiter:
+class RateLimiter(rate_limit.RateLimiter):
     """
-    Rate limiter with sliding window and burst protection.
+    Rate limiter with a windowed limit and burst protection.
     """
     
     def __init__(self, config: Optional[RateLimitConfig] = None):
         """Initialize rate limiter."""
         self.config = config or RateLimitConfig()
-        self.requests: dict[str, list[datetime]] = defaultdict(list)
-        self.lock = asyncio.Lock()
+        self.window_rate = Rate(self.config.max_requests, self.config.window_seconds)
+        self.burst_rate = Rate(self.config.burst_limit, self.config.burst_window_seconds)
+        super().__init__([self.window_rate, self.burst_rate])
     
     async def check_limit(self, key: str) -> tuple[bool, str]:
         """
@@ -324,49 +327,22 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, reason)
         """
-        async with self.lock:
-            now = datetime.utcnow()
-            
-            # Clean old requests
-            self._clean_old_requests(key, now)
-            
-            requests = self.requests[key]
-            
-            # Check burst limit
-            burst_cutoff = now - timedelta(seconds=self.config.burst_window_seconds)
-            burst_count = sum(1 for r in requests if r > burst_cutoff)
-            
-            if burst_count >= self.config.burst_limit:
-                return False, f"Burst limit exceeded ({burst_count}/{self.config.burst_limit})"
-            
-            # Check window limit
-            if len(requests) >= self.config.max_requests:
-                return False, f"Rate limit exceeded ({len(requests)}/{self.config.max_requests})"
-            
-            # Record request
-            requests.append(now)
-            
+        result = self.try_acquire(key)
+        if result.allowed:
             return True, "Request allowed"
-    
-    def _clean_old_requests(self, key: str, now: datetime) -> None:
-        """Remove requests outside the window."""
-        cutoff = now - timedelta(seconds=self.config.window_seconds)
-        self.requests[key] = [r for r in self.requests[key] if r > cutoff]
+        if result.limit == self.burst_rate:
+            return False, f"Burst limit exceeded ({self.burst_rate}), retry in {result.retry_after:.0f}s"
+        return False, f"Rate limit exceeded ({self.window_rate}), retry in {result.retry_after:.0f}s"
     
     def get_status(self, key: str) -> dict[str, Any]:
         """Get rate limit status for a key."""
-        now = datetime.utcnow()
-        self._clean_old_requests(key, now)
-        
-        requests = self.requests[key]
-        burst_cutoff = now - timedelta(seconds=self.config.burst_window_seconds)
-        burst_count = sum(1 for r in requests if r > burst_cutoff)
+        window_left, burst_left = self.store.remaining(self._cells(key))
         
         return {
             "key": key,
-            "requests_in_window": len(requests),
+            "requests_in_window": self.window_rate.capacity - window_left,
             "max_requests": self.config.max_requests,
-            "burst_count": burst_count,
+            "burst_count": self.burst_rate.capacity - burst_left,
             "burst_limit": self.config.burst_limit,
             "window_seconds": self.config.window_seconds,
         }
@@ -0,0 +1,28 @@
+"""
+Content Hashing for Growth Engine
+
+Stable hashes of opportunity dicts, shared by the scan trackers, the
+search and enrichment stores and the database layer. A hash only changes
+when an opportunity's content does, so it can be compared across scans
+and processes to skip work on unchanged listings.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+
+# Fields that differ on every scan without the listing itself changing
+VOLATILE_FIELDS = frozenset({"scraped_at"})
+
+
+def content_hash(opportunity: Dict[str, Any]) -> str:
+    """Stable hash of an opportunity's content, ignoring volatile fields"""
+    stable = {k: v for k, v in opportunity.items() if k not in VOLATILE_FIELDS}
+    payload = json.dumps(stable, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def opportunity_key(opportunity: Dict[str, Any]) -> str:
+    """Id used for tracking; falls back to the content hash"""
+    return str(opportunity.get("id") or content_hash(opportunity))
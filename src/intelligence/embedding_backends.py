@@ -0,0 +1,145 @@
+"""
+Embedding Backends
+==================
+Providers that turn a batch of texts into vectors for ``EmbeddingPipeline``.
+
+- ``GoogleEmbeddingBackend``: Google's text-embedding-004 (the default)
+- ``HashedEmbeddingBackend``: local, deterministic hashed n-gram vectors
+  for offline runs, tests and benchmarks; texts sharing words and
+  character n-grams get similar vectors, but there is no semantics beyond
+  that
+
+Backends are synchronous; the pipeline runs them in worker threads so
+provider round-trips never block the event loop.
+"""
+
+import hashlib
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+GOOGLE_EMBEDDING_MODEL = "models/text-embedding-004"
+DEFAULT_DIMENSIONS = 768
+
+# Provider errors worth retrying after a pause: quota, throttling, overload
+RETRYABLE_ERRORS = {"ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "DeadlineExceeded"}
+RETRYABLE_MESSAGES = ("429", "quota", "rate limit", "resource exhausted")
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a provider error is a quota/throttling error worth retrying"""
+    if type(error).__name__ in RETRYABLE_ERRORS:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in RETRYABLE_MESSAGES)
+
+
+class EmbeddingBackend(ABC):
+    """Something that embeds a batch of texts in one call"""
+
+    name = "base"
+    model = "base"
+
+    @abstractmethod
+    def embed(self, texts: List[str], task_type: str = "RETRIEVAL_DOCUMENT") -> List[List[float]]:
+        """One embedding per text, in order (blocking)"""
+
+
+class GoogleEmbeddingBackend(EmbeddingBackend):
+    """Google Generative AI embeddings"""
+
+    name = "google"
+
+    def __init__(self, api_key: Optional[str] = None, model: str = GOOGLE_EMBEDDING_MODEL):
+        self.model = model
+        self._api_key = api_key
+        self._client = None
+
+    @property
+    def client(self):
+        """Lazy-load the Google GenAI client."""
+        if self._client is None:
+            import google.generativeai as genai
+
+            if self._api_key is None:
+                from config.settings import settings
+
+                self._api_key = settings.google_api_key.get_secret_value()
+            genai.configure(api_key=self._api_key)
+            self._client = genai
+        return self._client
+
+    def embed(self, texts: List[str], task_type: str = "RETRIEVAL_DOCUMENT") -> List[List[float]]:
+        result = self.client.embed_content(model=self.model, content=texts, task_type=task_type)
+        return result["embedding"]
+
+
+class HashedEmbeddingBackend(EmbeddingBackend):
+    """
+    Feature-hashed bag of words and character n-grams.
+
+    Each feature is hashed to a bucket and a sign (so collisions cancel
+    out rather than pile up), counts are log-scaled and the vector is
+    unit-normalised. The same text always gives the same vector.
+    """
+
+    name = "hashed"
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS, ngram_range: tuple = (3, 5)):
+        self.dimensions = dimensions
+        self.ngram_range = ngram_range
+        self.model = f"hashed-ngram-{dimensions}"
+
+    def _features(self, text: str) -> List[str]:
+        words = re.findall(r"\w+", text.lower())
+        features = [f"w:{word}" for word in words]
+        low, high = self.ngram_range
+        for word in words:
+            padded = f" {word} "
+            for n in range(low, high + 1):
+                features.extend(f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1))
+        return features
+
+    def embed_one(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        features = self._features(text)
+        if not features:
+            return vector
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "little") for f in features],
+            dtype=np.uint64,
+        )
+        buckets = (hashes % np.uint64(self.dimensions)).astype(np.intp)
+        signs = np.where((hashes >> np.uint64(63)) == 1, -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, buckets, signs)
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed(self, texts: List[str], task_type: str = "RETRIEVAL_DOCUMENT") -> List[List[float]]:
+        return [self.embed_one(text).tolist() for text in texts]
+
+
+def create_embedding_backend(name: Optional[str] = None) -> EmbeddingBackend:
+    """
+    Build the configured embedding backend.
+
+    ``name`` defaults to the ``embedding_backend`` setting ("google" or
+    "hashed").
+    """
+    if name is None:
+        from config.settings import settings
+
+        name = settings.embedding_backend
+    name = name.lower()
+    if name == "hashed":
+        return HashedEmbeddingBackend()
+    if name != "google":
+        logger.warning(f"Unknown embedding backend {name!r}, using google")
+    return GoogleEmbeddingBackend()
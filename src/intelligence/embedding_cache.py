@@ -0,0 +1,232 @@
+"""
+Embedding Cache
+===============
+Persistent store of computed embeddings, so restarts and deploys don't
+re-embed (and re-bill) text we have already seen.
+
+Entries are keyed by (model, task_type, text hash): a RETRIEVAL_QUERY
+vector never answers for a RETRIEVAL_DOCUMENT lookup, and switching
+models starts a fresh keyspace.
+
+- vectors are float32 rows in a memory-mapped file per dimension
+  (``data/embedding_cache/vectors-<dim>.f32``), with the key index in
+  SQLite next to it
+- recently used vectors stay resident in an LRU bounded by
+  ``max_resident`` entries; older ones are re-read from the map
+- ``get_many`` / ``put_many`` look up and write whole batches at once
+- hit/miss counters via ``get_stats()``
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "embedding_cache"
+DEFAULT_MAX_RESIDENT = 20_000  # ~60 MB of 768-d vectors
+INITIAL_CAPACITY = 1024
+LOOKUP_CHUNK = 500  # keys per SQLite IN (...) lookup
+
+
+def text_hash(text: str) -> str:
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Disk-backed (model, task_type, text) -> embedding store with an LRU in RAM"""
+
+    def __init__(self, path: Optional[Path] = None, max_resident: int = DEFAULT_MAX_RESIDENT):
+        """
+        Args:
+            path: Directory for the cache files; None keeps it in memory
+            max_resident: Vectors kept in RAM (least recently used are dropped)
+        """
+        self.path = Path(path) if path else None
+        self.max_resident = max_resident
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._matrices: Dict[int, np.ndarray] = {}  # dim -> vectors
+        self._sizes: Dict[int, int] = {}  # dim -> rows in use
+        self._resident: "OrderedDict[Tuple[str, str, str], np.ndarray]" = OrderedDict()
+        self.hits = 0  # served from RAM
+        self.disk_hits = 0  # served from the map
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        for dim, max_row in self._conn.execute("SELECT dim, MAX(row) FROM embeddings GROUP BY dim"):
+            self._open_matrix(dim, max(INITIAL_CAPACITY, max_row + 1))
+            self._sizes[dim] = max_row + 1
+
+    # ---- storage ----
+
+    def _connect(self) -> sqlite3.Connection:
+        target = ":memory:"
+        if self.path is not None:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                target = str(self.path / "embeddings.db")
+            except OSError as e:
+                logger.warning(f"Embedding cache at {self.path} unavailable ({e}), using in-memory cache")
+                self.path = None
+        conn = sqlite3.connect(target, check_same_thread=False)
+        if target != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                task_type TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                row INTEGER NOT NULL,
+                PRIMARY KEY (model, task_type, text_hash)
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def _open_matrix(self, dim: int, capacity: int) -> None:
+        """(Re)map the vector file for ``dim`` with room for ``capacity`` rows"""
+        current = self._matrices.get(dim)
+        if self.path is None:
+            grown = np.zeros((capacity, dim), dtype=np.float32)
+            if current is not None:
+                grown[:len(current)] = current
+            self._matrices[dim] = grown
+            return
+        if isinstance(current, np.memmap):
+            current.flush()
+        vector_file = self.path / f"vectors-{dim}.f32"
+        with open(vector_file, "ab") as f:
+            size = max(f.tell(), capacity * dim * 4)
+            f.truncate(size)
+        capacity = size // (dim * 4)
+        self._matrices[dim] = np.memmap(vector_file, dtype=np.float32, mode="r+", shape=(capacity, dim))
+
+    def _touch(self, key: Tuple[str, str, str], embedding: np.ndarray) -> None:
+        self._resident[key] = embedding
+        self._resident.move_to_end(key)
+        while len(self._resident) > self.max_resident:
+            self._resident.popitem(last=False)
+            self.evictions += 1
+
+    def _lookup(self, model: str, task_type: str, hashes: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """(dim, row) of each stored hash"""
+        found = {}
+        for start in range(0, len(hashes), LOOKUP_CHUNK):
+            chunk = hashes[start:start + LOOKUP_CHUNK]
+            found.update(
+                (h, (dim, row)) for h, dim, row in self._conn.execute(
+                    f"SELECT text_hash, dim, row FROM embeddings WHERE model = ? AND task_type = ? "
+                    f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                    (model, task_type, *chunk),
+                )
+            )
+        return found
+
+    # ---- bulk access ----
+
+    def get_many(self, model: str, task_type: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Cached embedding for each text, or None where there is none"""
+        hashes = [text_hash(text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            missing = []
+            for h in dict.fromkeys(hashes):
+                key = (model, task_type, h)
+                if key in self._resident:
+                    self._resident.move_to_end(key)
+                    found[h] = self._resident[key]
+                else:
+                    missing.append(h)
+            for h, (dim, row) in self._lookup(model, task_type, missing).items():
+                embedding = np.array(self._matrices[dim][row])
+                found[h] = embedding
+                self._touch((model, task_type, h), embedding)
+            from_disk = set(missing)
+            resident_hits = sum(1 for h in hashes if h not in from_disk)
+            disk_hits = sum(1 for h in hashes if h in from_disk and h in found)
+            self.hits += resident_hits
+            self.disk_hits += disk_hits
+            self.misses += len(hashes) - resident_hits - disk_hits
+        return [found[h].tolist() if h in found else None for h in hashes]
+
+    def put_many(self, model: str, task_type: str, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """Store embeddings for texts (overwriting existing entries)"""
+        if not texts:
+            return
+        with self._lock:
+            entries = {text_hash(text): embedding for text, embedding in zip(texts, embeddings)}
+            existing = self._lookup(model, task_type, list(entries))
+            records = []
+            for h, embedding in entries.items():
+                vector = np.array(embedding, dtype=np.float32)
+                dim = len(vector)
+                if h in existing and existing[h][0] == dim:
+                    row = existing[h][1]
+                else:
+                    row = self._sizes.get(dim, 0)
+                    matrix = self._matrices.get(dim)
+                    if matrix is None or row >= len(matrix):
+                        self._open_matrix(dim, max(INITIAL_CAPACITY, 2 * row))
+                    self._sizes[dim] = row + 1
+                self._matrices[dim][row] = vector
+                records.append((model, task_type, h, dim, row))
+                self._touch((model, task_type, h), vector)
+            # Vectors reach the file before the index points at them
+            for matrix in self._matrices.values():
+                if isinstance(matrix, np.memmap):
+                    matrix.flush()
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)", records)
+            self._conn.commit()
+            self.writes += len(records)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self),
+                "resident": len(self._resident),
+                "max_resident": self.max_resident,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "path": str(self.path) if self.path else None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            for matrix in self._matrices.values():
+                if isinstance(matrix, np.memmap):
+                    matrix.flush()
+            self._conn.close()
+
+
+# Global cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache"""
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            from config.settings import settings
+
+            _embedding_cache = EmbeddingCache(DEFAULT_CACHE_DIR, max_resident=settings.embedding_cache_size)
+        return _embedding_cache
@@ -6,25 +6,46 @@ Generates and manages embeddings for:
 - User profiles (for personalized scoring)
 - Application content (for quality assessment)
 
-Uses Google's text-embedding-004 model for high-quality embeddings.
-Stores vectors in Pinecone for fast similarity search.
+Uses Google's text-embedding-004 model for high-quality embeddings, or a
+local hashed n-gram backend (``EMBEDDING_BACKEND=hashed``) for offline
+runs, tests and benchmarks.
+Stores vectors in Pinecone for fast similarity search, or in a local
+memory-mapped ANN index (``vector_index``) when Pinecone isn't available
+or ``VECTOR_BACKEND=local``.
 """
 
 import asyncio
-import hashlib
+import logging
+import os
+import random
 from typing import Any, List, Optional
 from dataclasses import dataclass
 
 import numpy as np
 
 from config.settings import settings
+from src.intelligence.embedding_backends import (
+    EmbeddingBackend,
+    create_embedding_backend,
+    is_retryable,
+)
+from src.intelligence.embedding_cache import EmbeddingCache, get_embedding_cache
+from src.intelligence.vector_index import get_vector_index
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class EmbeddingConfig:
     """Configuration for embedding generation."""
     model: str = "text-embedding-004"
     dimensions: int = 768
-    batch_size: int = 100
+    batch_size: int = 100  # texts per provider request
+    max_chars: int = 25000  # model limit ~8k tokens
+    max_concurrency: int = 4  # provider requests in flight at once
+    max_retries: int = 5  # retries per request on quota errors
+    backoff_base: float = 1.0  # seconds; doubles on each retry
+    backoff_max: float = 30.0
 
 @dataclass
 class EmbeddingResult:
@@ -46,29 +67,55 @@ class EmbeddingPipeline:
     """
     Service for generating and managing text embeddings.
     
-    Uses Google's text-embedding-004 for embeddings and
-    optionally Pinecone for vector storage.
+    Uses Google's text-embedding-004 for embeddings (or the local hashed
+    backend, see ``embedding_backends``) and optionally Pinecone for
+    vector storage.
+    
+    Provider calls run in worker threads so they never block the event
+    loop; a batch is split into ``batch_size`` chunks that are embedded
+    concurrently, at most ``max_concurrency`` at a time across all
+    callers, retrying with exponential backoff on quota errors.
     """
     
-    def __init__(self):
-        """Initialize the embedding service."""
-        self._client = None
+    def __init__(
+        self,
+        config: EmbeddingConfig | None = None,
+        backend: EmbeddingBackend | None = None,
+        cache: EmbeddingCache | None = None,
+    ):
+        """
+        Initialize the embedding service.
+        
+        Args:
+            config: Batching, concurrency and retry settings
+            backend: Embedding provider (default: the configured one)
+            cache: Embedding store (default: the persistent global cache)
+        """
+        self.config = config or EmbeddingConfig(
+            max_concurrency=settings.embedding_concurrency,
+            max_retries=settings.embedding_max_retries,
+        )
+        self._backend = backend
         self._pinecone = None
-        self._cache: dict[str, list[float]] = {}
+        self._pinecone_checked = False
+        self._cache = cache
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop = None
+        self.requests = 0
+        self.retries = 0
     
     @property
-    def client(self):
-        """Lazy-load the Google GenAI client."""
-        if self._client is None:
-            import google.generativeai as genai
-            genai.configure(api_key=settings.google_api_key.get_secret_value())
-            self._client = genai
-        return self._client
+    def backend(self) -> EmbeddingBackend:
+        """Lazy-load the configured embedding backend."""
+        if self._backend is None:
+            self._backend = create_embedding_backend()
+        return self._backend
     
     @property
     def pinecone_index(self):
         """Lazy-load the Pinecone index."""
-        if self._pinecone is None and settings.pinecone_api_key:
+        if self._pinecone is None and not self._pinecone_checked and settings.pinecone_api_key:
+            self._pinecone_checked = True
             try:
                 from pinecone import Pinecone
                 pc = Pinecone(api_key=settings.pinecone_api_key.get_secret_value())
@@ -78,9 +125,47 @@ class EmbeddingPipeline:
                 self._pinecone = None
         return self._pinecone
     
-    def _cache_key(self, text: str) -> str:
-        """Generate a cache key for text."""
-        return hashlib.md5(text.encode()).hexdigest()
+    @property
+    def vector_backend(self) -> str:
+        """"pinecone" or "local", where embeddings are stored and searched."""
+        if os.getenv("VECTOR_BACKEND", "auto").lower() == "local":
+            return "local"
+        return "pinecone" if self.pinecone_index is not None else "local"
+    
+    @property
+    def cache(self) -> EmbeddingCache:
+        """Lazy-load the persistent embedding cache."""
+        if self._cache is None:
+            self._cache = get_embedding_cache()
+        return self._cache
+    
+    def _request_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding provider requests in flight (one per event loop)."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def _embed_chunk(self, texts: list[str], task_type: str) -> list[list[float]]:
+        """Embed one provider-sized chunk off the event loop, retrying on quota errors."""
+        attempt = 0
+        while True:
+            async with self._request_slots():
+                try:
+                    self.requests += 1
+                    return await asyncio.to_thread(self.backend.embed, texts, task_type)
+                except Exception as e:
+                    if attempt >= self.config.max_retries or not is_retryable(e):
+                        raise
+                    error = e
+            # Back off outside the semaphore so other chunks can use the slot
+            delay = min(self.config.backoff_max, self.config.backoff_base * 2 ** attempt)
+            delay *= random.uniform(0.5, 1.0)
+            attempt += 1
+            self.retries += 1
+            logger.warning(f"Embedding quota error ({error}), retry {attempt} in {delay:.1f}s")
+            await asyncio.sleep(delay)
     
     async def embed_text(
         self,
@@ -101,28 +186,8 @@ class EmbeddingPipeline:
         Returns:
             List of floats representing the embedding vector
         """
-        # Check cache
-        cache_key = self._cache_key(text)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        # Truncate if too long (model limit ~8k tokens)
-        if len(text) > 25000:
-            text = text[:25000]
-        
-        # Generate embedding
-        result = self.client.embed_content(
-            model="models/text-embedding-004",
-            content=text,
-            task_type=task_type,
-        )
-        
-        embedding = result['embedding']
-        
-        # Cache the result
-        self._cache[cache_key] = embedding
-        
-        return embedding
+        embeddings = await self.embed_batch([text], task_type=task_type)
+        return embeddings[0]
     
     async def embed_batch(
         self,
@@ -132,6 +197,10 @@ class EmbeddingPipeline:
         """
         Generate embeddings for multiple texts.
         
+        Embeddings are cached on disk per (model, task type, text);
+        uncached texts are embedded once each (duplicates share a
+        request) in concurrent chunks of ``batch_size``.
+        
         Args:
             texts: List of texts to embed
             task_type: Embedding task type
@@ -139,43 +208,28 @@ class EmbeddingPipeline:
         Returns:
             List of embedding vectors
         """
-        # Check cache for existing embeddings
-        results = []
-        texts_to_embed = []
-        indices_to_embed = []
+        if not texts:
+            return []
+        model = self.backend.model
         
-        for i, text in enumerate(texts):
-            cache_key = self._cache_key(text)
-            if cache_key in self._cache:
-                results.append((i, self._cache[cache_key]))
-            else:
-                texts_to_embed.append(text[:25000] if len(text) > 25000 else text)
-                indices_to_embed.append(i)
+        # Check cache for existing embeddings
+        embeddings = await asyncio.to_thread(self.cache.get_many, model, task_type, texts)
+        pending = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
         
         # Generate embeddings for uncached texts
-        if texts_to_embed:
-            # Batch embed (up to 100 at a time)
-            batch_size = 100
-            for batch_start in range(0, len(texts_to_embed), batch_size):
-                batch = texts_to_embed[batch_start:batch_start + batch_size]
-                batch_indices = indices_to_embed[batch_start:batch_start + batch_size]
-                
-                result = self.client.embed_content(
-                    model="models/text-embedding-004",
-                    content=batch,
-                    task_type=task_type,
-                )
-                
-                for j, embedding in enumerate(result['embedding']):
-                    idx = batch_indices[j]
-                    results.append((idx, embedding))
-                    # Cache the result
-                    cache_key = self._cache_key(texts[idx])
-                    self._cache[cache_key] = embedding
+        if pending:
+            size = self.config.batch_size
+            chunks = [pending[start:start + size] for start in range(0, len(pending), size)]
+            results = await asyncio.gather(*(
+                self._embed_chunk([text[:self.config.max_chars] for text in chunk], task_type)
+                for chunk in chunks
+            ))
+            generated = [embedding for chunk_result in results for embedding in chunk_result]
+            await asyncio.to_thread(self.cache.put_many, model, task_type, pending, generated)
+            new = dict(zip(pending, generated))
+            embeddings = [new[text] if embedding is None else embedding for text, embedding in zip(texts, embeddings)]
         
-        # Sort by original index and return just embeddings
-        results.sort(key=lambda x: x[0])
-        return [r[1] for r in results]
+        return embeddings
     
     def cosine_similarity(
         self,
@@ -196,6 +250,33 @@ class EmbeddingPipeline:
         b = np.array(embedding2)
         return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
     
+    def cosine_similarities(
+        self,
+        embedding: list[float],
+        embeddings: list[list[float]] | np.ndarray,
+    ) -> np.ndarray:
+        """
+        Cosine similarity of one embedding against many.
+        
+        The rows are stacked into one contiguous float32 matrix and scored
+        with a single normalised matrix-vector product.
+        
+        Args:
+            embedding: Query vector
+            embeddings: Vectors to compare against (one per row)
+            
+        Returns:
+            float32 array of similarities between -1 and 1, one per row
+        """
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if matrix.size == 0:
+            return np.zeros(0, dtype=np.float32)
+        query = np.asarray(embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        row_norms = np.linalg.norm(matrix, axis=1)
+        row_norms[row_norms == 0] = 1.0
+        return (matrix @ query) / (row_norms * (query_norm or 1.0))
+    
     async def similarity_score(
         self,
         text1: str,
@@ -227,27 +308,41 @@ class EmbeddingPipeline:
         namespace: str = "opportunities",
     ) -> bool:
         """
-        Store an embedding in Pinecone.
+        Store an embedding in the vector store.
         
         Args:
             id: Unique identifier for the vector
             embedding: The embedding vector
             metadata: Metadata to store with the vector
-            namespace: Pinecone namespace
+            namespace: Vector namespace
             
         Returns:
             True if successful
         """
-        if self.pinecone_index is None:
-            return False
+        return await self.store_embeddings([(id, embedding, metadata)], namespace=namespace)
+    
+    async def store_embeddings(
+        self,
+        items: list[tuple[str, list[float], dict[str, Any]]],
+        namespace: str = "opportunities",
+    ) -> bool:
+        """
+        Store several (id, embedding, metadata) items at once.
         
+        Returns:
+            True if successful
+        """
         try:
+            if self.vector_backend == "local":
+                index = get_vector_index(namespace)
+                await asyncio.to_thread(index.upsert, items)
+                return True
+            
             self.pinecone_index.upsert(
-                vectors=[{
-                    "id": id,
-                    "values": embedding,
-                    "metadata": metadata,
-                }],
+                vectors=[
+                    {"id": id, "values": embedding, "metadata": metadata}
+                    for id, embedding, metadata in items
+                ],
                 namespace=namespace,
             )
             return True
@@ -255,6 +350,22 @@ class EmbeddingPipeline:
             print(f"Failed to store embedding: {e}")
             return False
     
+    async def delete_embeddings(
+        self,
+        ids: list[str],
+        namespace: str = "opportunities",
+    ) -> bool:
+        """Remove embeddings by id."""
+        try:
+            if self.vector_backend == "local":
+                await asyncio.to_thread(get_vector_index(namespace).delete, ids)
+            else:
+                self.pinecone_index.delete(ids=ids, namespace=namespace)
+            return True
+        except Exception as e:
+            print(f"Failed to delete embeddings: {e}")
+            return False
+    
     async def search_similar(
         self,
         query_embedding: list[float],
@@ -263,40 +374,66 @@ class EmbeddingPipeline:
         filter: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Search for similar vectors in Pinecone.
+        Search for similar vectors.
         
         Args:
             query_embedding: Query vector
             top_k: Number of results to return
-            namespace: Pinecone namespace
-            filter: Optional metadata filter
+            namespace: Vector namespace
+            filter: Optional metadata filter (Pinecone syntax)
             
         Returns:
             List of matches with id, score, and metadata
         """
-        if self.pinecone_index is None:
-            return []
+        results = await self.search_similar_batch([query_embedding], top_k, namespace, filter)
+        return results[0]
+    
+    async def search_similar_batch(
+        self,
+        query_embeddings: list[list[float]],
+        top_k: int = 10,
+        namespace: str = "opportunities",
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search for several query vectors at once.
+        
+        The local index scores the whole batch with one matrix product;
+        Pinecone gets one query per vector.
         
+        Returns:
+            Matches (id, score, metadata) for each query, in order
+        """
         try:
-            results = self.pinecone_index.query(
-                vector=query_embedding,
-                top_k=top_k,
-                namespace=namespace,
-                filter=filter,
-                include_metadata=True,
-            )
+            if self.vector_backend == "local":
+                index = get_vector_index(namespace)
+                batches = await asyncio.to_thread(index.search, query_embeddings, top_k, filter)
+                return [
+                    [{"id": id, "score": score, "metadata": metadata} for id, score, metadata in matches]
+                    for matches in batches
+                ]
             
-            return [
-                {
-                    "id": match.id,
-                    "score": match.score,
-                    "metadata": match.metadata,
-                }
-                for match in results.matches
-            ]
+            results = []
+            for query_embedding in query_embeddings:
+                response = self.pinecone_index.query(
+                    vector=query_embedding,
+                    top_k=top_k,
+                    namespace=namespace,
+                    filter=filter,
+                    include_metadata=True,
+                )
+                results.append([
+                    {
+                        "id": match.id,
+                        "score": match.score,
+                        "metadata": match.metadata,
+                    }
+                    for match in response.matches
+                ])
+            return results
         except Exception as e:
             print(f"Search failed: {e}")
-            return []
+            return [[] for _ in query_embeddings]
 
 
 # Global embedding service instance
@@ -315,20 +452,8 @@ def get_embedding_service() -> EmbeddingPipeline:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
-async def embed_opportunity(opportunity: dict[str, Any]) -> list[float]:
-    """
-    Generate embedding for an opportunity.
-    
-    Combines title, organization, description, and requirements
-    into a comprehensive text representation.
-    
-    Args:
-        opportunity: Opportunity dictionary
-        
-    Returns:
-        Embedding vector
-    """
-    # Build comprehensive text from opportunity
+def _opportunity_text(opportunity: dict[str, Any]) -> str:
+    """Text embedded for an opportunity: title, organization, description and requirements."""
     parts = [
         f"Title: {opportunity.get('title', '')}",
         f"Organization: {opportunity.get('organization', '')}",
@@ -347,25 +472,11 @@ async def embed_opportunity(opportunity: dict[str, Any]) -> list[float]:
     if opportunity.get('tags'):
         parts.append(f"Tags: {', '.join(opportunity['tags'])}")
     
-    text = "\n".join(parts)
-    
-    service = get_embedding_service()
-    return await service.embed_text(text, task_type="RETRIEVAL_DOCUMENT")
+    return "\n".join(parts)
 
 
-async def embed_profile(profile: dict[str, Any]) -> list[float]:
-    """
-    Generate embedding for a user profile.
-    
-    Combines summary, skills, experience, and preferences
-    into a comprehensive text representation.
-    
-    Args:
-        profile: Profile dictionary
-        
-    Returns:
-        Embedding vector
-    """
+def _profile_text(profile: dict[str, Any]) -> str:
+    """Text embedded for a profile: summary, skills, experience and preferences."""
     parts = [
         f"Name: {profile.get('name', '')}",
         f"Role: {profile.get('current_role', '')}",
@@ -375,7 +486,8 @@ async def embed_profile(profile: dict[str, Any]) -> list[float]:
     if profile.get('skills'):
         skills = profile['skills']
         if isinstance(skills, list):
-            parts.append(f"Skills: {', '.join(skills[:20])}")
+            names = [s.get("name", "") if isinstance(s, dict) else str(s) for s in skills[:20]]
+            parts.append(f"Skills: {', '.join(names)}")
     
     if profile.get('experience'):
         exp_parts = []
@@ -393,10 +505,88 @@ async def embed_profile(profile: dict[str, Any]) -> list[float]:
             if prefs.get('industries'):
                 parts.append(f"Industries: {', '.join(prefs['industries'])}")
     
-    text = "\n".join(parts)
+    return "\n".join(parts)
+
+
+async def embed_opportunity(opportunity: dict[str, Any]) -> list[float]:
+    """
+    Generate embedding for an opportunity.
+    
+    Combines title, organization, description, and requirements
+    into a comprehensive text representation.
     
+    Args:
+        opportunity: Opportunity dictionary
+        
+    Returns:
+        Embedding vector
+    """
     service = get_embedding_service()
-    return await service.embed_text(text, task_type="RETRIEVAL_DOCUMENT")
+    return await service.embed_text(_opportunity_text(opportunity), task_type="RETRIEVAL_DOCUMENT")
+
+
+async def embed_opportunities(opportunities: list[dict[str, Any]]) -> np.ndarray:
+    """
+    Generate embeddings for many opportunities at once.
+    
+    Args:
+        opportunities: Opportunity dictionaries
+        
+    Returns:
+        Contiguous float32 matrix with one embedding per row
+    """
+    service = get_embedding_service()
+    embeddings = await service.embed_batch(
+        [_opportunity_text(opp) for opp in opportunities],
+        task_type="RETRIEVAL_DOCUMENT",
+    )
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+async def embed_profile(profile: dict[str, Any]) -> list[float]:
+    """
+    Generate embedding for a user profile.
+    
+    Combines summary, skills, experience, and preferences
+    into a comprehensive text representation.
+    
+    Args:
+        profile: Profile dictionary
+        
+    Returns:
+        Embedding vector
+    """
+    service = get_embedding_service()
+    return await service.embed_text(_profile_text(profile), task_type="RETRIEVAL_DOCUMENT")
+
+
+async def calculate_profile_opportunity_matches(
+    profile: dict[str, Any],
+    opportunities: list[dict[str, Any]],
+) -> np.ndarray:
+    """
+    Calculate semantic match scores between a profile and many opportunities.
+    
+    The profile is embedded once, the opportunities in one batch, and all
+    similarities come from a single matrix-vector product.
+    
+    Args:
+        profile: User profile dictionary
+        opportunities: Opportunity dictionaries
+        
+    Returns:
+        float32 array of semantic scores (0-1), one per opportunity
+    """
+    if not opportunities:
+        return np.zeros(0, dtype=np.float32)
+    profile_embedding = await embed_profile(profile)
+    opportunity_embeddings = await embed_opportunities(opportunities)
+    
+    service = get_embedding_service()
+    similarities = service.cosine_similarities(profile_embedding, opportunity_embeddings)
+    
+    # Normalize to 0-1 range
+    return (similarities + 1) / 2
 
 
 async def calculate_profile_opportunity_match(
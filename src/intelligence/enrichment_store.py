@@ -0,0 +1,204 @@
+"""
+Precomputed Enrichment Store
+============================
+Enrichment and NLP results computed once per opportunity version.
+
+``DataEnrichmentService.enrich_opportunity`` and ``process_opportunity_text``
+run dozens of regexes per record. Instead of repeating that on every search,
+their outputs are computed when opportunities are ingested, keyed by the
+opportunity's content hash and persisted (SQLite). Reads merge the stored
+fields back onto the record and only reprocess records whose content hash
+changed since they were last enriched.
+
+Scans hand new and changed opportunities to ``schedule()``, which enriches
+them on a background thread so the event loop never runs the regexes.
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.hashing import content_hash, opportunity_key
+from src.intelligence.data_enrichment import global_enrichment_service
+from src.intelligence.nlp_processor import process_opportunity_text
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent.parent / "data" / "enrichment.db"
+MEMORY_CACHE_SIZE = 10_000
+
+# Bump when enrichment or NLP output changes so stored results are recomputed
+PRECOMPUTE_VERSION = 1
+
+# Fields added by enrichment/NLP; everything else is the source record
+DERIVED_FIELDS = ("location_data", "salary_data", "company_data", "enrichment_metadata", "intelligence")
+
+
+def compute_derived(opportunity: Dict[str, Any]) -> Dict[str, Any]:
+    """Run enrichment and NLP over one opportunity and return the derived fields"""
+    enriched = global_enrichment_service.enrich_opportunity(opportunity)
+    enriched["intelligence"] = process_opportunity_text(opportunity)
+    return {name: enriched[name] for name in DERIVED_FIELDS if name in enriched}
+
+
+def source_hash(opportunity: Dict[str, Any]) -> str:
+    """Content hash of an opportunity, ignoring previously derived fields"""
+    return content_hash({k: v for k, v in opportunity.items() if k not in DERIVED_FIELDS})
+
+
+class EnrichmentStore:
+    """SQLite-backed enrichment results keyed by opportunity content hash"""
+
+    def __init__(self, path: Optional[Path] = None, memory_size: int = MEMORY_CACHE_SIZE):
+        self.path = Path(path) if path else DEFAULT_STORE_PATH
+        self._conn = self._connect()
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._memory_size = memory_size
+        self._queue: "queue.Queue[List[Dict[str, Any]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self.stats = {"computed": 0, "reused": 0, "scheduled": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Enrichment store at {self.path} unavailable ({e}), using in-memory store")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS enrichment (
+                opp_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                derived TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        return conn
+
+    def _remember(self, key: str, digest: str, derived: Dict[str, Any]) -> None:
+        self._memory[key] = (digest, derived)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def _load(self, keys: List[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Fetch current-version rows for keys not held in memory"""
+        rows: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            cursor = self._conn.execute(
+                f"SELECT opp_key, content_hash, derived FROM enrichment "
+                f"WHERE version = ? AND opp_key IN ({','.join('?' * len(chunk))})",
+                [PRECOMPUTE_VERSION, *chunk],
+            )
+            for key, digest, derived in cursor:
+                rows[key] = (digest, json.loads(derived))
+        return rows
+
+    def ensure(self, opportunities: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return enriched copies of opportunities.
+
+        Stored results are reused when the content hash matches; only new or
+        changed records are run through enrichment and NLP, and those results
+        are persisted for the next caller.
+        """
+        items = [(opportunity_key(opp), source_hash(opp), opp) for opp in opportunities]
+        derived_by_index: Dict[int, Dict[str, Any]] = {}
+
+        with self._lock:
+            missing = [key for key, _, _ in items if key not in self._memory]
+            stored = self._load(missing) if missing else {}
+            for i, (key, digest, _) in enumerate(items):
+                known = self._memory.get(key) or stored.get(key)
+                if known and known[0] == digest:
+                    self._remember(key, digest, known[1])
+                    derived_by_index[i] = known[1]
+            self.stats["reused"] += len(derived_by_index)
+
+        # The regexes run without the lock, so readers aren't queued behind
+        # a background precompute batch
+        fresh: List[Tuple[str, str, Dict[str, Any]]] = []
+        for i, (key, digest, opp) in enumerate(items):
+            if i not in derived_by_index:
+                derived_by_index[i] = compute_derived(opp)
+                fresh.append((key, digest, derived_by_index[i]))
+
+        if fresh:
+            now = time.time()
+            with self._lock:
+                for key, digest, derived in fresh:
+                    self._remember(key, digest, derived)
+                self.stats["computed"] += len(fresh)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO enrichment (opp_key, content_hash, version, derived, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(key, digest, PRECOMPUTE_VERSION, json.dumps(derived, default=str), now)
+                     for key, digest, derived in fresh],
+                )
+                self._conn.commit()
+        return [{**opp, **derived_by_index[i]} for i, (_, _, opp) in enumerate(items)]
+
+    # ---- ingest-time precomputation ----
+
+    def schedule(self, opportunities: List[Dict[str, Any]]) -> None:
+        """Queue opportunities for enrichment on the background worker"""
+        if not opportunities:
+            return
+        self.stats["scheduled"] += len(opportunities)
+        self._queue.put(list(opportunities))
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._work, name="enrichment-precompute", daemon=True)
+            self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            try:
+                batch = self._queue.get(timeout=30)
+            except queue.Empty:
+                return
+            try:
+                self.ensure(batch)
+            except Exception as e:
+                logger.warning(f"Enrichment precompute failed for {len(batch)} opportunities: {e}")
+            finally:
+                self._queue.task_done()
+
+    def wait(self) -> None:
+        """Block until every scheduled batch has been processed"""
+        self._queue.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stored = self._conn.execute("SELECT COUNT(*) FROM enrichment").fetchone()[0]
+        return {
+            **self.stats,
+            "stored": stored,
+            "in_memory": len(self._memory),
+            "pending_batches": self._queue.qsize(),
+            "version": PRECOMPUTE_VERSION,
+        }
+
+
+_enrichment_store: Optional[EnrichmentStore] = None
+
+
+def get_enrichment_store() -> EnrichmentStore:
+    """Get the process-wide enrichment store"""
+    global _enrichment_store
+    if _enrichment_store is None:
+        _enrichment_store = EnrichmentStore()
+    return _enrichment_store
@@ -326,6 +326,14 @@ class FeatureExtractor:
     def features_to_array(self, features: dict[str, float]) -> np.ndarray:
         """Convert feature dict to numpy array in consistent order."""
         return np.array([features.get(name, 0.0) for name in self.get_feature_names()])
+    
+    def features_to_matrix(self, features_list: list[dict[str, float]]) -> np.ndarray:
+        """Convert many feature dicts to one matrix (a row per dict, columns in consistent order)."""
+        names = self.get_feature_names()
+        return np.array(
+            [[features.get(name, 0.0) for name in names] for features in features_list],
+            dtype=np.float64,
+        ).reshape(len(features_list), len(names))
 
 
 # Global feature extractor instance
@@ -13,6 +13,7 @@ Features:
 """
 
 import json
+import logging
 import pickle
 from datetime import datetime
 from pathlib import Path
@@ -23,9 +24,11 @@ import numpy as np
 from src.intelligence.features import FeatureExtractor, get_feature_extractor
 from src.intelligence.embeddings import (
     get_embedding_service,
-    calculate_profile_opportunity_match,
+    calculate_profile_opportunity_matches,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class MLScoringModel:
     """
@@ -169,6 +172,7 @@ class MLScoringModel:
         self,
         opportunity: dict[str, Any],
         profile: dict[str, Any],
+        semantic_score: float | None = None,
     ) -> dict[str, Any]:
         """
         Score an opportunity against a profile.
@@ -176,69 +180,58 @@ class MLScoringModel:
         Args:
             opportunity: Opportunity dictionary
             profile: Profile dictionary
+            semantic_score: Pre-computed semantic similarity (optional)
             
         Returns:
             Scoring result with fit_score, tier, confidence, and explanation
         """
-        # Ensure model is ready
-        self._ensure_model()
-        
-        # Get semantic similarity
-        semantic_result = await calculate_profile_opportunity_match(profile, opportunity)
-        semantic_score = semantic_result["semantic_score"]
-        
-        # Extract features
-        features = self.feature_extractor.extract_features(
-            opportunity=opportunity,
-            profile=profile,
-            semantic_score=semantic_score,
-        )
+        # Without a semantic score, score_batch computes it (neutral if unavailable)
+        semantic_scores = None if semantic_score is None else [semantic_score]
+        [result] = await self.score_batch([opportunity], profile, semantic_scores=semantic_scores)
+        del result["opportunity_id"], result["opportunity_title"], result["index"]
+        return result
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit probabilities for a feature matrix in one call.
         
-        # Get prediction
+        Uses the booster's in-place prediction when available, which skips
+        the DMatrix construction ``predict_proba`` does on every call.
+        """
+        self._ensure_model()
         if self.model == "heuristic":
-            fit_score = self._heuristic_score(features)
-            confidence = 0.5  # Low confidence for heuristic
-        else:
-            X = self.feature_extractor.features_to_array(features).reshape(1, -1)
-            fit_score = float(self.model.predict_proba(X)[0, 1])
-            confidence = self._calculate_confidence(X)
-        
-        # Determine tier
-        tier = self._assign_tier(fit_score)
-        
-        # Generate explanation
-        explanation = self._generate_explanation(features, fit_score, tier)
-        
-        return {
-            "fit_score": round(fit_score, 4),
-            "tier": tier,
-            "confidence": round(confidence, 4),
-            "semantic_score": round(semantic_score, 4),
-            "features": {k: round(v, 4) if isinstance(v, float) else v for k, v in features.items()},
-            "explanation": explanation,
-            "model_version": self.model_version,
-        }
+            return self._heuristic_scores(X)
+        try:
+            booster = self.model.get_booster()
+            return np.asarray(booster.inplace_predict(X), dtype=np.float64).reshape(-1)
+        except (AttributeError, TypeError, ValueError):
+            return self.model.predict_proba(X)[:, 1]
     
     def _heuristic_score(self, features: dict[str, float]) -> float:
         """Calculate fit score using heuristic when XGBoost unavailable."""
-        score = (
-            0.30 * features.get("semantic_score", 0.5) +
-            0.25 * features.get("skill_match_ratio", 0.5) +
-            0.15 * min(1.0, features.get("experience_ratio", 1.0)) +
-            0.10 * features.get("prestige_score", 0.5) +
-            0.10 * features.get("deadline_urgency", 0.5) +
-            0.10 * features.get("compensation_normalized", 0.5)
+        X = self.feature_extractor.features_to_matrix([features])
+        return float(self._heuristic_scores(X)[0])
+    
+    def _heuristic_scores(self, X: np.ndarray) -> np.ndarray:
+        """Heuristic fit scores for a feature matrix (one row per opportunity)."""
+        column = {name: i for i, name in enumerate(self.feature_extractor.get_feature_names())}
+        scores = (
+            0.30 * X[:, column["semantic_score"]] +
+            0.25 * X[:, column["skill_match_ratio"]] +
+            0.15 * np.minimum(1.0, X[:, column["experience_ratio"]]) +
+            0.10 * X[:, column["prestige_score"]] +
+            0.10 * X[:, column["deadline_urgency"]] +
+            0.10 * X[:, column["compensation_normalized"]]
         )
-        return min(1.0, max(0.0, score))
+        return np.clip(scores, 0.0, 1.0)
     
-    def _calculate_confidence(self, X: np.ndarray) -> float:
-        """Calculate confidence in the prediction."""
+    def _confidences(self, fit_scores: np.ndarray) -> np.ndarray:
+        """Confidence in each prediction."""
         if self.model == "heuristic" or self.model is None:
-            return 0.5
+            return np.full(len(fit_scores), 0.5)  # Low confidence for heuristic
         
         # Use prediction probability distance from 0.5 as confidence
-        prob = self.model.predict_proba(X)[0, 1]
-        confidence = abs(prob - 0.5) * 2  # Scale to 0-1
+        confidence = np.abs(fit_scores - 0.5) * 2  # Scale to 0-1
         
         # Adjust based on training samples
         sample_factor = min(1.0, self.training_samples / 1000)
@@ -247,14 +240,19 @@ class MLScoringModel:
     
     def _assign_tier(self, fit_score: float) -> str:
         """Assign tier based on fit score."""
-        if fit_score >= self.TIER_THRESHOLDS["tier_1"]:
-            return "TIER_1"
-        elif fit_score >= self.TIER_THRESHOLDS["tier_2"]:
-            return "TIER_2"
-        elif fit_score >= self.TIER_THRESHOLDS["tier_3"]:
-            return "TIER_3"
-        else:
-            return "UNSCORED"
+        return str(self._assign_tiers(np.array([fit_score]))[0])
+    
+    def _assign_tiers(self, fit_scores: np.ndarray) -> np.ndarray:
+        """Assign tiers to an array of fit scores."""
+        return np.select(
+            [
+                fit_scores >= self.TIER_THRESHOLDS["tier_1"],
+                fit_scores >= self.TIER_THRESHOLDS["tier_2"],
+                fit_scores >= self.TIER_THRESHOLDS["tier_3"],
+            ],
+            ["TIER_1", "TIER_2", "TIER_3"],
+            default="UNSCORED",
+        )
     
     def _generate_explanation(
         self,
@@ -309,26 +307,78 @@ class MLScoringModel:
         self,
         opportunities: list[dict[str, Any]],
         profile: dict[str, Any],
+        semantic_scores: list[float] | np.ndarray | None = None,
+        explain_top_k: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Score multiple opportunities against a profile.
         
+        Features for the whole batch go into one matrix and are scored by
+        a single model call; confidences and tiers are computed on the
+        resulting arrays. Semantic scores are computed up front (the
+        profile is embedded once), falling back to neutral if embeddings
+        are unavailable.
+        
         Args:
             opportunities: List of opportunity dictionaries
             profile: Profile dictionary
+            semantic_scores: Pre-computed semantic similarity per opportunity
+            explain_top_k: Only the k best results get ``features`` and an
+                ``explanation`` (None for the rest); None explains all
             
         Returns:
-            List of scoring results
+            List of scoring results, best first; ``index`` is the
+            opportunity's position in ``opportunities``
         """
-        results = []
-        for opp in opportunities:
-            result = await self.score(opp, profile)
-            result["opportunity_id"] = opp.get("id")
-            result["opportunity_title"] = opp.get("title")
-            results.append(result)
+        if not opportunities:
+            return []
+        self._ensure_model()
+        
+        if semantic_scores is None:
+            try:
+                semantic_scores = await calculate_profile_opportunity_matches(profile, opportunities)
+            except Exception as e:
+                logger.warning(f"Semantic scoring unavailable ({e}), using neutral semantic scores")
+                semantic_scores = [None] * len(opportunities)
+        
+        features = [
+            self.feature_extractor.extract_features(
+                opportunity=opp,
+                profile=profile,
+                semantic_score=None if semantic_score is None else float(semantic_score),
+            )
+            for opp, semantic_score in zip(opportunities, semantic_scores)
+        ]
+        X = self.feature_extractor.features_to_matrix(features)
+        
+        fit_scores = self.predict(X)
+        confidences = self._confidences(fit_scores)
+        tiers = self._assign_tiers(fit_scores)
+        semantic = X[:, self.feature_extractor.get_feature_names().index("semantic_score")]
         
         # Sort by fit score descending
-        results.sort(key=lambda x: x["fit_score"], reverse=True)
+        order = np.argsort(-fit_scores, kind="stable")
+        explained = len(order) if explain_top_k is None else explain_top_k
+        
+        results = []
+        for rank, i in enumerate(order):
+            fit_score, tier = float(fit_scores[i]), str(tiers[i])
+            explain = rank < explained
+            results.append({
+                "fit_score": round(fit_score, 4),
+                "tier": tier,
+                "confidence": round(float(confidences[i]), 4),
+                "semantic_score": round(float(semantic[i]), 4),
+                "features": (
+                    {k: round(v, 4) if isinstance(v, float) else v for k, v in features[i].items()}
+                    if explain else None
+                ),
+                "explanation": self._generate_explanation(features[i], fit_score, tier) if explain else None,
+                "model_version": self.model_version,
+                "opportunity_id": opportunities[i].get("id"),
+                "opportunity_title": opportunities[i].get("title"),
+                "index": int(i),
+            })
         
         return results
     
@@ -0,0 +1,461 @@
+"""
+Local Vector Index
+==================
+Approximate nearest-neighbour search over opportunity embeddings without
+Pinecone, for offline and self-hosted deployments.
+
+Vectors are unit-normalised float32 rows in a memory-mapped file
+(``data/vectors/<namespace>/vectors.f32``); ids and metadata live in
+SQLite next to it. Search is exact while the index is small and switches
+to an IVF (inverted file) index once it grows: a spherical k-means coarse
+quantizer assigns every vector to a list, and queries only score the
+vectors in the ``nprobe`` closest lists.
+
+- upsert and delete by id (deleted rows are reused by later inserts)
+- metadata pre-filters on type, remote and a deadline window, evaluated
+  as numpy masks before any vector is scored
+- batched top-k queries: one matrix product per batch
+
+Scores are cosine similarities, as with the Pinecone cosine metric.
+"""
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent.parent / "data" / "vectors"
+INITIAL_CAPACITY = 1024
+IVF_MIN_VECTORS = 4096  # below this every query is exact
+IVF_RETRAIN_GROWTH = 2.0  # retrain when the index has grown this much since training
+MIN_LISTS, MAX_LISTS = 16, 1024
+TRAINING_SAMPLES_PER_LIST = 32
+KMEANS_ITERATIONS = 8
+DEFAULT_NPROBE = 8
+SCORE_CHUNK_ROWS = 65_536  # rows scored per matrix product in exact search
+
+# Metadata keys indexed for pre-filtering, by filter name
+TYPE_KEYS = ("opportunity_type", "type")
+REMOTE_KEYS = ("is_remote", "remote")
+DEADLINE_KEY = "deadline"
+
+Match = Tuple[str, float, Dict[str, Any]]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _timestamp(value: Any) -> float:
+    """Epoch seconds for a deadline (number, ISO string, date); NaN if unknown"""
+    if value is None or value == "":
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return math.nan
+
+
+def _first(metadata: Dict[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        if key in metadata:
+            return metadata[key]
+    return None
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first"""
+    if k >= len(scores):
+        return np.argsort(-scores)
+    best = np.argpartition(-scores, k - 1)[:k]
+    return best[np.argsort(-scores[best])]
+
+
+def _matches(value: Any, condition: Any) -> bool:
+    """Pinecone-style condition ($eq, $ne, $in, $nin, $gt(e), $lt(e)) on one value"""
+    if not isinstance(condition, dict):
+        return value == condition
+    for op, operand in condition.items():
+        if op == "$eq" and value != operand:
+            return False
+        if op == "$ne" and value == operand:
+            return False
+        if op == "$in" and value not in operand:
+            return False
+        if op == "$nin" and value in operand:
+            return False
+        if op in ("$gt", "$gte", "$lt", "$lte"):
+            if value is None:
+                return False
+            if op == "$gt" and not value > operand:
+                return False
+            if op == "$gte" and not value >= operand:
+                return False
+            if op == "$lt" and not value < operand:
+                return False
+            if op == "$lte" and not value <= operand:
+                return False
+    return True
+
+
+class VectorIndex:
+    """IVF index over unit-normalised float32 vectors, memory-mapped from disk"""
+
+    def __init__(self, path: Optional[Path] = None, nprobe: int = DEFAULT_NPROBE):
+        """
+        Args:
+            path: Directory for the index files; None keeps it in memory
+            nprobe: IVF lists scanned per query (more = better recall, slower)
+        """
+        self.path = Path(path) if path else None
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self.dim: Optional[int] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._capacity = 0
+        self._size = 0  # rows in use or freed (high-water mark)
+        self._ids: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._metadata: List[Optional[Dict[str, Any]]] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._type = np.zeros(0, dtype=np.int32)
+        self._type_codes: Dict[str, int] = {}
+        self._remote = np.zeros(0, dtype=np.int8)  # -1 unknown, 0 no, 1 yes
+        self._deadline = np.zeros(0, dtype=np.float64)
+        self._lists = np.zeros(0, dtype=np.int32)
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._load()
+
+    # ---- storage ----
+
+    def _connect(self) -> sqlite3.Connection:
+        target = ":memory:"
+        if self.path is not None:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                target = str(self.path / "vectors.db")
+            except OSError as e:
+                logger.warning(f"Vector index at {self.path} unavailable ({e}), using in-memory index")
+                self.path = None
+        conn = sqlite3.connect(target, check_same_thread=False)
+        if target != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors (row INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, metadata TEXT NOT NULL)"
+        )
+        conn.commit()
+        return conn
+
+    @property
+    def _vector_file(self) -> Optional[Path]:
+        return self.path / "vectors.f32" if self.path is not None else None
+
+    @property
+    def _centroid_file(self) -> Optional[Path]:
+        return self.path / "centroids.npy" if self.path is not None else None
+
+    def _open_vectors(self, capacity: int) -> None:
+        """(Re)map the vector file with room for ``capacity`` rows"""
+        if self._vector_file is None:
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            if self._vectors is not None:
+                grown[:len(self._vectors)] = self._vectors
+            self._vectors = grown
+        else:
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            self._vectors = None
+            with open(self._vector_file, "ab") as f:
+                f.truncate(max(f.tell(), capacity * self.dim * 4))
+            self._vectors = np.memmap(self._vector_file, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self._capacity = capacity
+        pad = capacity - len(self._alive)
+        self._alive = np.concatenate([self._alive, np.zeros(pad, dtype=bool)])
+        self._type = np.concatenate([self._type, np.full(pad, -1, dtype=np.int32)])
+        self._remote = np.concatenate([self._remote, np.full(pad, -1, dtype=np.int8)])
+        self._deadline = np.concatenate([self._deadline, np.full(pad, math.nan)])
+        self._lists = np.concatenate([self._lists, np.full(pad, -1, dtype=np.int32)])
+        self._ids.extend([None] * pad)
+        self._metadata.extend([None] * pad)
+
+    def _load(self) -> None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        if row is None:
+            return
+        self.dim = int(row[0])
+        rows = self._conn.execute("SELECT row, id, metadata FROM vectors").fetchall()
+        size = max((r for r, _, _ in rows), default=-1) + 1
+        on_disk = self._vector_file.stat().st_size // (self.dim * 4) if self._vector_file and self._vector_file.exists() else 0
+        self._open_vectors(max(INITIAL_CAPACITY, size, on_disk))
+        for r, opp_id, metadata in rows:
+            self._set_row(r, opp_id, json.loads(metadata))
+        self._size = size
+        self._free = [r for r in range(size) if not self._alive[r]]
+        if self._centroid_file is not None and self._centroid_file.exists():
+            centroids = np.load(self._centroid_file)
+            if centroids.shape[1] == self.dim:
+                self._centroids = centroids
+                self._trained_size = int(self._alive.sum())
+                self._assign(np.flatnonzero(self._alive))
+
+    def _set_row(self, row: int, opp_id: str, metadata: Dict[str, Any]) -> None:
+        self._ids[row] = opp_id
+        self._row_of[opp_id] = row
+        self._metadata[row] = metadata
+        self._alive[row] = True
+        kind = _first(metadata, TYPE_KEYS)
+        self._type[row] = -1 if kind is None else self._type_codes.setdefault(str(kind), len(self._type_codes))
+        remote = _first(metadata, REMOTE_KEYS)
+        self._remote[row] = -1 if remote is None else int(bool(remote))
+        self._deadline[row] = _timestamp(metadata.get(DEADLINE_KEY))
+
+    # ---- updates ----
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, opp_id: str) -> bool:
+        return opp_id in self._row_of
+
+    def upsert(self, items: Iterable[Tuple[str, Sequence[float], Dict[str, Any]]]) -> int:
+        """Insert or replace (id, vector, metadata) items; returns how many"""
+        items = list(items)
+        if not items:
+            return 0
+        vectors = _normalize([vector for _, vector, _ in items])
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('dim', ?)", (str(self.dim),))
+                self._open_vectors(INITIAL_CAPACITY)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+
+            rows = []
+            for (opp_id, _, metadata), vector in zip(items, vectors):
+                row = self._row_of.get(opp_id)
+                if row is None:
+                    row = self._free.pop() if self._free else self._size
+                    if row == self._size:
+                        self._size += 1
+                    if row >= self._capacity:
+                        self._open_vectors(max(self._capacity * 2, row + 1))
+                self._vectors[row] = vector
+                self._set_row(row, opp_id, metadata or {})
+                rows.append(row)
+
+            self._conn.executemany(
+                "INSERT INTO vectors (row, id, metadata) VALUES (?, ?, ?) "
+                "ON CONFLICT (row) DO UPDATE SET id = excluded.id, metadata = excluded.metadata",
+                [(row, self._ids[row], json.dumps(self._metadata[row], default=str)) for row in rows],
+            )
+            self._conn.commit()
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+
+            if self._centroids is not None:
+                self._assign(np.array(rows))
+            if len(self) >= IVF_MIN_VECTORS and len(self) >= self._trained_size * IVF_RETRAIN_GROWTH:
+                self.train()
+        return len(rows)
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove vectors by id; returns how many existed"""
+        with self._lock:
+            rows = [self._row_of.pop(opp_id) for opp_id in ids if opp_id in self._row_of]
+            for row in rows:
+                self._alive[row] = False
+                self._lists[row] = -1
+                self._ids[row] = None
+                self._metadata[row] = None
+            self._free.extend(rows)
+            if rows:
+                self._conn.executemany("DELETE FROM vectors WHERE row = ?", [(row,) for row in rows])
+                self._conn.commit()
+        return len(rows)
+
+    # ---- IVF ----
+
+    def train(self) -> None:
+        """(Re)build the coarse quantizer with spherical k-means"""
+        with self._lock:
+            alive = np.flatnonzero(self._alive)
+            if len(alive) < MIN_LISTS:
+                return
+            n_lists = int(min(MAX_LISTS, max(MIN_LISTS, math.sqrt(len(alive)))))
+            rng = np.random.default_rng(0)
+            sample = self._vectors[rng.choice(alive, min(len(alive), n_lists * TRAINING_SAMPLES_PER_LIST), replace=False)]
+            centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+            for _ in range(KMEANS_ITERATIONS):
+                nearest = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, nearest, sample)
+                empty = np.bincount(nearest, minlength=n_lists) == 0
+                sums[empty] = centroids[empty]  # Keep the old centroid for empty lists
+                centroids = _normalize(sums)
+            self._centroids = centroids
+            self._trained_size = len(alive)
+            self._assign(alive)
+            if self._centroid_file is not None:
+                np.save(self._centroid_file, centroids)
+            logger.info(f"Vector index trained: {len(alive)} vectors in {n_lists} lists")
+
+    def _assign(self, rows: np.ndarray) -> None:
+        for start in range(0, len(rows), SCORE_CHUNK_ROWS):
+            chunk = rows[start:start + SCORE_CHUNK_ROWS]
+            self._lists[chunk] = np.argmax(self._vectors[chunk] @ self._centroids.T, axis=1)
+
+    # ---- queries ----
+
+    def _mask(self, filter: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Rows passing the filter, as a boolean mask (pre-filtering)"""
+        mask = self._alive[:self._size].copy()
+        for key, condition in (filter or {}).items():
+            if key in TYPE_KEYS:
+                # Unknown type names get a code no row has
+                encode = lambda v: self._type_codes.get(str(v), -2)
+                self._column_mask(mask, self._type[:self._size], condition, encode, TYPE_KEYS)
+            elif key in REMOTE_KEYS:
+                encode = lambda v: int(bool(v))
+                self._column_mask(mask, self._remote[:self._size], condition, encode, REMOTE_KEYS)
+            elif key == DEADLINE_KEY and isinstance(condition, dict):
+                deadlines = self._deadline[:self._size]
+                with np.errstate(invalid="ignore"):
+                    if "$gte" in condition:
+                        mask &= deadlines >= _timestamp(condition["$gte"])
+                    if "$gt" in condition:
+                        mask &= deadlines > _timestamp(condition["$gt"])
+                    if "$lte" in condition:
+                        mask &= deadlines <= _timestamp(condition["$lte"])
+                    if "$lt" in condition:
+                        mask &= deadlines < _timestamp(condition["$lt"])
+            else:
+                # Unindexed metadata key: checked row by row
+                for row in np.flatnonzero(mask):
+                    if not _matches(self._metadata[row].get(key), condition):
+                        mask[row] = False
+        return mask
+
+    def _column_mask(self, mask: np.ndarray, column: np.ndarray, condition: Any, encode, keys: Sequence[str]) -> None:
+        """
+        Narrow mask by a condition on an encoded metadata column (-1 where
+        the key is missing). $eq/$ne/$in/$nin are vectorised; any other
+        operator is checked row by row like unindexed keys.
+        """
+        ops = condition if isinstance(condition, dict) else {"$eq": condition}
+        for op, operand in ops.items():
+            if op == "$eq":
+                mask &= column == encode(operand)
+            elif op == "$ne":
+                mask &= column != encode(operand)
+            elif op == "$in":
+                mask &= np.isin(column, [encode(v) for v in operand])
+            elif op == "$nin":
+                mask &= ~np.isin(column, [encode(v) for v in operand])
+            else:
+                for row in np.flatnonzero(mask):
+                    if not _matches(_first(self._metadata[row], keys), {op: operand}):
+                        mask[row] = False
+
+    def _results(self, rows: np.ndarray, scores: np.ndarray, top_k: int) -> List[Match]:
+        best = _top_k(scores, top_k)
+        return [(self._ids[rows[i]], float(scores[i]), self._metadata[rows[i]]) for i in best]
+
+    def search(
+        self,
+        queries: Sequence[Sequence[float]],
+        top_k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Match]]:
+        """
+        Top-k (id, score, metadata) matches for each query vector.
+
+        ``filter`` follows Pinecone's syntax: type / opportunity_type
+        and remote / is_remote (value, $eq, $ne, $in or $nin), deadline ($gte/$gt/$lte/
+        $lt with epoch seconds, ISO strings or datetimes), and equality or
+        $in/$nin/$ne/range conditions on any other metadata key.
+        """
+        with self._lock:
+            if self.dim is None or not self._row_of:
+                return [[] for _ in queries]
+            q = _normalize(queries)
+            mask = self._mask(filter)
+            allowed = np.flatnonzero(mask)
+            if len(allowed) == 0:
+                return [[] for _ in range(len(q))]
+
+            if self._centroids is None or len(allowed) <= top_k * self.nprobe:
+                # Exact: score the whole batch against contiguous slices of the
+                # map (no row gathering), then drop filtered-out rows
+                scores = np.concatenate([
+                    q @ self._vectors[start:min(start + SCORE_CHUNK_ROWS, self._size)].T
+                    for start in range(0, self._size, SCORE_CHUNK_ROWS)
+                ], axis=1)
+                scores[:, ~mask] = -np.inf
+                rows = np.arange(self._size)
+                k = min(top_k, len(allowed))
+                return [self._results(rows, row_scores, k) for row_scores in scores]
+
+            nprobe = min(self.nprobe, len(self._centroids))
+            probes = np.argpartition(-(q @ self._centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+            allowed_lists = self._lists[allowed]
+            results = []
+            for query, probe in zip(q, probes):
+                candidates = allowed[np.isin(allowed_lists, probe)]
+                if len(candidates) < top_k:
+                    candidates = allowed  # Selective filter: scan everything it allows
+                results.append(self._results(candidates, self._vectors[candidates] @ query, top_k))
+            return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "vectors": len(self),
+                "dimensions": self.dim,
+                "capacity": self._capacity,
+                "ivf_lists": 0 if self._centroids is None else len(self._centroids),
+                "nprobe": self.nprobe,
+                "path": str(self.path) if self.path else None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            self._conn.close()
+
+
+_vector_indexes: Dict[str, VectorIndex] = {}
+_vector_indexes_lock = threading.Lock()
+
+
+def get_vector_index(namespace: str = "opportunities") -> VectorIndex:
+    """Get the process-wide local index for a namespace"""
+    with _vector_indexes_lock:
+        if namespace not in _vector_indexes:
+            _vector_indexes[namespace] = VectorIndex(DEFAULT_INDEX_DIR / namespace)
+        return _vector_indexes[namespace]
@@ -0,0 +1,42 @@
+"""
+Cursor Pagination for Growth Engine
+
+Keyset pagination helpers. A page is fetched as "the next N rows after
+this sort key" instead of "skip M rows", so deep pages cost the same as
+the first one. The sort key of a page's last row is handed to clients as
+an opaque cursor, which they pass back to get the following page.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any, List
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we didn't issue"""
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque, URL-safe cursor for a sort key (datetimes become ISO strings)"""
+    payload = json.dumps(values, separators=(",", ":"), default=_encode_default)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort key values from a cursor; raises InvalidCursor if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+    return values
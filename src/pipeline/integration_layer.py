@@ -12,9 +12,11 @@ import json
 from typing import Dict, List, Optional, Any, Callable, Type
 from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 
+from ..rate_limit import Rate, RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,43 +99,6 @@ class IntegrationConfig:
         }
 
 
-class RateLimiter:
-    """Rate limiting for API calls"""
-    
-    def __init__(self, requests_per_period: int, period_seconds: int):
-        self.requests_per_period = requests_per_period
-        self.period_seconds = period_seconds
-        self.requests = []
-        self.lock = asyncio.Lock()
-    
-    async def acquire(self) -> bool:
-        """Acquire rate limit slot"""
-        async with self.lock:
-            now = datetime.utcnow()
-            
-            # Remove old requests outside the period
-            cutoff = now - timedelta(seconds=self.period_seconds)
-            self.requests = [req_time for req_time in self.requests if req_time > cutoff]
-            
-            # Check if we can make a new request
-            if len(self.requests) < self.requests_per_period:
-                self.requests.append(now)
-                return True
-            
-            return False
-    
-    def time_until_next_slot(self) -> Optional[int]:
-        """Get seconds until next rate limit slot is available"""
-        if not self.requests:
-            return 0
-        
-        oldest_request = min(self.requests)
-        next_slot = oldest_request + timedelta(seconds=self.period_seconds)
-        wait_time = (next_slot - datetime.utcnow()).total_seconds()
-        
-        return max(0, int(wait_time))
-
-
 class BaseIntegrationAdapter:
     """Base class for external service integrations"""
     
@@ -142,8 +107,8 @@ class BaseIntegrationAdapter:
         self.credentials = credentials
         self.status = IntegrationStatus.DISCONNECTED
         self.rate_limiter = RateLimiter(
-            config.rate_limit_requests,
-            config.rate_limit_period
+            Rate(config.rate_limit_requests, config.rate_limit_period),
+            name=f"integration:{config.service_name}"
         )
         self.session: Optional[aiohttp.ClientSession] = None
         self.last_error: Optional[str] = None
@@ -205,10 +170,7 @@ class BaseIntegrationAdapter:
         """Make authenticated API request with rate limiting"""
         
         # Wait for rate limit
-        while not await self.rate_limiter.acquire():
-            wait_time = self.rate_limiter.time_until_next_slot()
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        await self.rate_limiter.acquire()
         
         # Prepare request
         url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
@@ -284,6 +246,7 @@ class BaseIntegrationAdapter:
             'status': self.status.value,
             'connected_at': self.connection_time.isoformat() if self.connection_time else None,
             'last_error': self.last_error,
+            'rate_limit': self.rate_limiter.get_stats(),
             'credentials_valid': not self.credentials.is_expired() if self.credentials.expires_at else True
         }
 
@@ -0,0 +1,364 @@
+"""
+Rate Limiting for Growth Engine
+
+One limiter for scrapers, the scheduler, guardrails and integrations,
+using GCRA (the generic cell rate algorithm, a token bucket that keeps a
+single timestamp per key):
+
+- ``Rate``: requests per period plus how many may go back to back
+- ``RateLimiter``: ``try_acquire`` decides in O(1) without waiting;
+  ``acquire`` sleeps until allowed without holding any lock, and runs
+  shared-store round trips in a worker thread (``aupdate``)
+- ``MemoryRateLimitStore``: in-process state, idle keys are evicted
+- ``RedisRateLimitStore``: shared state for multi-worker deployments,
+  selected by setting ``REDIS_URL`` (or ``RATE_LIMIT_BACKEND=redis``)
+
+Named limiters use the global store from ``get_rate_limit_store()``, so
+they are shared across workers when Redis is configured; unnamed ones
+keep private in-process state.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Optional Redis support - provides the shared backend
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_KEYS = 100_000
+DEFAULT_SWEEP_INTERVAL = 60.0  # seconds
+
+
+@dataclass(frozen=True)
+class Rate:
+    """``requests`` per ``period`` seconds, with up to ``burst`` back to back"""
+    requests: float
+    period: float = 1.0
+    burst: Optional[int] = None  # default: a whole period's worth
+
+    @property
+    def interval(self) -> float:
+        """Seconds each request uses up"""
+        return self.period / self.requests
+
+    @property
+    def capacity(self) -> int:
+        return self.burst if self.burst is not None else max(1, int(self.requests))
+
+    @property
+    def tolerance(self) -> float:
+        return self.interval * self.capacity
+
+    def __str__(self) -> str:
+        return f"{self.requests:g}/{self.period:g}s"
+
+
+# A cell is one rate applied to one key: the unit of stored state
+Cell = Tuple[str, Rate]
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of one acquire attempt"""
+    allowed: bool
+    retry_after: float = 0.0  # seconds until the attempt would succeed
+    limit: Optional[Rate] = None  # the rate that refused it
+
+
+def _gcra(tat: Optional[float], rate: Rate, now: float, cost: int) -> Tuple[float, float]:
+    """New theoretical arrival time and how long until it is allowed"""
+    new_tat = max(tat if tat is not None else now, now) + rate.interval * cost
+    return new_tat, new_tat - rate.tolerance - now
+
+
+def _remaining(tat: Optional[float], rate: Rate, now: float) -> int:
+    if tat is None or tat <= now:
+        return rate.capacity
+    return max(0, min(rate.capacity, int((now + rate.tolerance - tat) / rate.interval)))
+
+
+class RateLimitStore(ABC):
+    """Where per-key limiter state (one timestamp per cell) is kept"""
+
+    name = "base"
+
+    @abstractmethod
+    def update(self, cells: Sequence[Cell], cost: int = 1) -> RateLimitResult:
+        """Take ``cost`` from every cell, or from none if any would exceed its rate"""
+
+    @abstractmethod
+    def remaining(self, cells: Sequence[Cell]) -> List[int]:
+        """Requests each cell would allow right now"""
+
+    async def aupdate(self, cells: Sequence[Cell], cost: int = 1) -> RateLimitResult:
+        """``update`` for async callers; in-process stores never block"""
+        return self.update(cells, cost)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    In-process limiter state.
+
+    A key whose timestamps are all in the past is indistinguishable from
+    a fresh one, so sweeps drop it; ``max_keys`` caps memory by evicting
+    the least recently used keys.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS, sweep_interval: float = DEFAULT_SWEEP_INTERVAL):
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval
+        self.evictions = 0
+
+    def update(self, cells: Sequence[Cell], cost: int = 1) -> RateLimitResult:
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            new_tats = []
+            for key, rate in cells:
+                new_tat, wait = _gcra(self._tats.get(key), rate, now, cost)
+                if wait > 0:
+                    return RateLimitResult(False, wait, rate)
+                new_tats.append(new_tat)
+            for (key, _), new_tat in zip(cells, new_tats):
+                self._tats[key] = new_tat
+                self._tats.move_to_end(key)
+            while len(self._tats) > self.max_keys:
+                self._tats.popitem(last=False)
+                self.evictions += 1
+        return RateLimitResult(True)
+
+    def remaining(self, cells: Sequence[Cell]) -> List[int]:
+        now = time.monotonic()
+        with self._lock:
+            return [_remaining(self._tats.get(key), rate, now) for key, rate in cells]
+
+    def _sweep(self, now: float) -> None:
+        idle = [key for key, tat in self._tats.items() if tat <= now]
+        for key in idle:
+            del self._tats[key]
+        self.evictions += len(idle)
+        self._next_sweep = now + self.sweep_interval
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "keys": len(self._tats), "max_keys": self.max_keys, "evictions": self.evictions}
+
+
+# Checks every cell against the server clock and only writes if all pass;
+# keys expire once idle, which is the shared store's eviction
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local new_tats = {}
+for i = 1, #KEYS do
+    local interval = tonumber(ARGV[2 * i])
+    local tolerance = tonumber(ARGV[2 * i + 1])
+    local stored = redis.call('GET', KEYS[i])
+    local tat = now
+    if stored then tat = math.max(tonumber(stored), now) end
+    local new_tat = tat + interval * cost
+    local wait = new_tat - tolerance - now
+    if wait > 0 then
+        return {0, tostring(wait), i}
+    end
+    new_tats[i] = new_tat
+end
+for i = 1, #KEYS do
+    redis.call('SET', KEYS[i], tostring(new_tats[i]), 'PX', math.ceil((new_tats[i] - now) * 1000))
+end
+return {1, '0', 0}
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Limiter state in Redis, shared by every worker"""
+
+    name = "redis"
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "growth:ratelimit:"):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis package is not installed")
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self._redis = client
+        self._prefix = prefix
+        self._script = client.register_script(GCRA_SCRIPT)
+
+    def update(self, cells: Sequence[Cell], cost: int = 1) -> RateLimitResult:
+        args: List[Any] = [cost]
+        for _, rate in cells:
+            args.extend((repr(rate.interval), repr(rate.tolerance)))
+        allowed, wait, index = self._script(keys=[self._prefix + key for key, _ in cells], args=args)
+        if allowed:
+            return RateLimitResult(True)
+        return RateLimitResult(False, float(wait), cells[int(index) - 1][1])
+
+    async def aupdate(self, cells: Sequence[Cell], cost: int = 1) -> RateLimitResult:
+        """The script round trip in a worker thread, off the event loop"""
+        return await asyncio.to_thread(self.update, cells, cost)
+
+    def remaining(self, cells: Sequence[Cell]) -> List[int]:
+        seconds, micros = self._redis.time()
+        now = seconds + micros / 1_000_000
+        stored = self._redis.mget([self._prefix + key for key, _ in cells])
+        return [
+            _remaining(float(tat) if tat is not None else None, rate, now)
+            for (_, rate), tat in zip(cells, stored)
+        ]
+
+
+class RateLimiter:
+    """
+    GCRA rate limiter applying one or more rates to every key.
+
+    Usage:
+        limiter = RateLimiter(Rate(1.0))  # 1 request per second
+        await limiter.acquire()
+        # make request
+
+        hourly = RateLimiter([Rate(100, 3600), Rate(10, 60)], name="api")
+        if not hourly.try_acquire(user_id).allowed: ...
+    """
+
+    def __init__(
+        self,
+        rates: Union[Rate, Sequence[Rate]],
+        name: Optional[str] = None,
+        store: Optional[RateLimitStore] = None,
+    ):
+        """
+        Args:
+            rates: Rate(s) every request must fit within
+            name: Namespace for keys; named limiters share the global store
+            store: Explicit state store (overrides the default)
+        """
+        self.rates: Tuple[Rate, ...] = (rates,) if isinstance(rates, Rate) else tuple(rates)
+        if not self.rates:
+            raise ValueError("RateLimiter needs at least one rate")
+        self.name = name or f"local-{uuid.uuid4().hex[:8]}"
+        if store is None and not name:
+            store = MemoryRateLimitStore()
+        self._store = store  # Named limiters resolve the global store on first use
+        self.allowed = 0
+        self.limited = 0
+        self.waited = 0.0
+
+    @property
+    def store(self) -> RateLimitStore:
+        if self._store is None:
+            self._store = get_rate_limit_store()
+        return self._store
+
+    def _cells(self, key: str) -> List[Cell]:
+        """State cells a request for ``key`` is checked against"""
+        return [(f"{self.name}:{key}:{i}", rate) for i, rate in enumerate(self.rates)]
+
+    def try_acquire(self, key: str = "default", cost: int = 1) -> RateLimitResult:
+        """Take a slot now if one is free; never waits"""
+        return self._count(self.store.update(self._cells(key), cost))
+
+    def _count(self, result: RateLimitResult) -> RateLimitResult:
+        if result.allowed:
+            self.allowed += 1
+        else:
+            self.limited += 1
+        return result
+
+    async def acquire(self, key: str = "default", cost: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a request can be made.
+
+        Returns False if that would take longer than ``timeout`` seconds.
+        """
+        if any(cost > rate.capacity for _, rate in self._cells(key)):
+            raise ValueError(f"cost {cost} exceeds the burst of {self.name}")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        cells = self._cells(key)
+        while True:
+            result = self._count(await self.store.aupdate(cells, cost))
+            if result.allowed:
+                return True
+            if deadline is not None and time.monotonic() + result.retry_after > deadline:
+                return False
+            self.waited += result.retry_after
+            await asyncio.sleep(result.retry_after)
+
+    def remaining(self, key: str = "default") -> Dict[str, int]:
+        """Requests each rate would allow for ``key`` right now"""
+        cells = self._cells(key)
+        return {str(rate): left for (_, rate), left in zip(cells, self.store.remaining(cells))}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rates": [str(rate) for rate in self.rates],
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "waited_seconds": round(self.waited, 2),
+            "store": self.store.name,
+        }
+
+
+def create_rate_limit_store(backend: Optional[str] = None, redis_url: Optional[str] = None) -> RateLimitStore:
+    """
+    Build the configured limiter store.
+
+    ``RATE_LIMIT_BACKEND`` picks "memory" or "redis"; Redis is used by
+    default when ``REDIS_URL`` is set. If Redis is unreachable limits are
+    kept in process instead.
+    """
+    redis_url = redis_url or os.getenv("REDIS_URL")
+    backend = (backend or os.getenv("RATE_LIMIT_BACKEND") or ("redis" if redis_url else "memory")).lower()
+    if backend == "redis":
+        try:
+            store = RedisRateLimitStore(url=redis_url)
+            store._redis.ping()
+            return store
+        except Exception as e:
+            logger.warning(f"Redis rate limits unavailable ({e}), using in-process limits")
+    return MemoryRateLimitStore()
+
+
+# Global store instance
+_global_store: Optional[RateLimitStore] = None
+_global_store_lock = threading.Lock()
+
+
+def get_rate_limit_store() -> RateLimitStore:
+    """Get the global limiter store"""
+    global _global_store
+    if _global_store is None:
+        with _global_store_lock:
+            if _global_store is None:
+                _global_store = create_rate_limit_store()
+    return _global_store
+
+
+def set_rate_limit_store(store: RateLimitStore) -> None:
+    """Replace the global limiter store (e.g. in tests)"""
+    global _global_store
+    _global_store = store
@@ -0,0 +1,398 @@
+"""
+Background Scan Jobs for Growth Engine
+
+Scans take minutes, far longer than a request should hold a worker or a
+proxy will keep a connection open. Instead a scan is submitted as a job:
+
+- it runs as a background task, at most ``MAX_CONCURRENT_JOBS`` at a time
+- an identical scan that is already queued or running is joined rather
+  than started again, and a recently completed one is reused
+- progress and the opportunities of every finished source are readable
+  while it runs
+- completed jobs are stored in the shared cache, so repeated reads (from
+  any worker) return at once
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+
+MAX_CONCURRENT_JOBS = int(os.getenv("SCAN_JOB_CONCURRENCY", "2"))
+RESULT_TTL = 600  # seconds a completed scan is reused for identical requests
+MAX_TRACKED_JOBS = 200  # finished jobs kept in memory before the oldest are dropped
+
+FINISHED_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+@dataclass
+class ScanJob:
+    """One submitted scan and everything known about it so far"""
+    job_id: str
+    kind: str
+    params: Dict[str, Any]
+    key: str
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    sources_completed: int = 0
+    sources_failed: int = 0
+    partial: List[Dict[str, Any]] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    async def record_source(self, source_result: Dict[str, Any]) -> None:
+        """``on_source`` callback: fold one scraper's outcome into the progress"""
+        if source_result.get("error"):
+            self.sources_failed += 1
+        else:
+            self.sources_completed += 1
+        self.partial.extend(source_result.get("opportunities") or [])
+
+    def opportunities(self) -> List[Dict[str, Any]]:
+        """Final opportunities once completed, otherwise those found so far"""
+        if self.result is not None:
+            return self.result.get("opportunities", [])
+        return self.partial
+
+    def to_dict(self, include_result: bool = False, offset: int = 0, limit: Optional[int] = 100) -> Dict[str, Any]:
+        opportunities = self.opportunities()
+        end = None if limit is None else offset + limit
+        data = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": round((self.finished_at or time.time()) - self.started_at, 2) if self.started_at else None,
+            "progress": {
+                "sources_completed": self.sources_completed,
+                "sources_failed": self.sources_failed,
+                "opportunities_found": len(opportunities),
+            },
+            "error": self.error,
+            "offset": offset,
+            "opportunities": opportunities[offset:end],
+            "has_more": end is not None and end < len(opportunities),
+        }
+        if include_result and self.result is not None:
+            data["result"] = {k: v for k, v in self.result.items() if k != "opportunities"}
+        return data
+
+    def to_record(self) -> Dict[str, Any]:
+        """Serializable form stored in the cache"""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "params": self.params,
+            "key": self.key,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "sources_completed": self.sources_completed,
+            "sources_failed": self.sources_failed,
+            "result": self.result,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "ScanJob":
+        return cls(**record)
+
+
+ScanRunner = Callable[[Dict[str, Any], ScanJob], Awaitable[Dict[str, Any]]]
+
+
+# =============================================================================
+# Scan kinds
+# =============================================================================
+
+async def _run_mega_scan(params: Dict[str, Any], job: ScanJob) -> Dict[str, Any]:
+    from .scrapers.live_scrapers import live_mega_scan
+    return await live_mega_scan(**params, on_source=job.record_source)
+
+
+async def _run_batch(params: Dict[str, Any], job: ScanJob) -> Dict[str, Any]:
+    from .scrapers.live_scrapers import scan_batch
+    return await scan_batch(
+        params["batch_number"], params["max_concurrent"], delta=params["mode"] == "delta", on_source=job.record_source
+    )
+
+
+async def _run_batch_range(params: Dict[str, Any], job: ScanJob) -> Dict[str, Any]:
+    from .scrapers.live_scrapers import scan_all_batches_incremental
+    return await scan_all_batches_incremental(
+        start_batch=params["start"],
+        end_batch=params["end"],
+        max_concurrent=params["max_concurrent"],
+        delta=params["mode"] == "delta",
+        on_source=job.record_source,
+    )
+
+
+async def _run_browse(params: Dict[str, Any], job: ScanJob) -> Dict[str, Any]:
+    from .scrapers.web_browser_scraper import browse_and_scrape
+    return await browse_and_scrape(
+        include_search=True,
+        include_dynamic=True,
+        search_queries=params["queries"],
+        limit=params["limit"],
+    )
+
+
+class _ScanParams(BaseModel):
+    """Parameters of one scan kind; unknown names are rejected"""
+    model_config = ConfigDict(extra="forbid")
+
+
+class MegaScanParams(_ScanParams):
+    include_jobs: bool = True
+    include_scholarships: bool = True
+    include_grants: bool = True
+    include_vc: bool = True
+    include_hackathons: bool = True
+    include_web_browsing: bool = False
+
+
+class BatchParams(_ScanParams):
+    batch_number: int = Field(1, ge=1)
+    max_concurrent: int = Field(5, ge=1, le=10)
+    mode: Literal["full", "delta"] = "full"
+
+
+class BatchRangeParams(_ScanParams):
+    start: int = Field(1, ge=1, le=7)
+    end: int = Field(7, ge=1, le=7)
+    max_concurrent: int = Field(10, ge=1, le=25)
+    mode: Literal["full", "delta"] = "full"
+
+
+class BrowseParams(_ScanParams):
+    queries: List[str] = Field(
+        default_factory=lambda: ["remote software engineer", "tech startup jobs", "machine learning remote"],
+        min_length=1,
+    )
+    limit: int = Field(100, ge=1, le=500)
+
+
+# kind -> (runner, params model). Submitted params are validated with the
+# same bounds as the inline scan endpoints and filled in with defaults, so
+# equivalent requests get the same dedup key.
+SCAN_KINDS: Dict[str, Tuple[ScanRunner, Type[_ScanParams]]] = {
+    "mega_scan": (_run_mega_scan, MegaScanParams),
+    "batch": (_run_batch, BatchParams),
+    "batch_range": (_run_batch_range, BatchRangeParams),
+    "browse": (_run_browse, BrowseParams),
+}
+
+
+def job_key(kind: str, params: Dict[str, Any]) -> str:
+    """Stable identity of a scan request, used to deduplicate jobs"""
+    payload = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+# =============================================================================
+# Job manager
+# =============================================================================
+
+class ScanJobManager:
+    """Runs scan jobs in the background and answers status queries"""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_JOBS, result_ttl: int = RESULT_TTL):
+        self.max_concurrent = max_concurrent
+        self.result_ttl = result_ttl
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._jobs: Dict[str, ScanJob] = {}
+        self._by_key: Dict[str, str] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.stats = {"submitted": 0, "started": 0, "deduplicated": 0, "reused": 0}
+
+    @property
+    def cache(self):
+        return get_cache()
+
+    async def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Tuple[ScanJob, bool]:
+        """
+        Submit a scan, returning (job, deduplicated).
+
+        deduplicated is True when an identical queued/running job was
+        joined or a completed one from the last ``result_ttl`` seconds was
+        reused. Raises ValueError for unknown kinds, unknown parameters or
+        out-of-range values.
+        """
+        if kind not in SCAN_KINDS:
+            raise ValueError(f"Unknown scan kind {kind!r}; expected one of {sorted(SCAN_KINDS)}")
+        runner, params_model = SCAN_KINDS[kind]
+        submitted = {k: v for k, v in (params or {}).items() if v is not None}
+        # pydantic's ValidationError is a ValueError
+        params = params_model.model_validate(submitted).model_dump()
+        key = job_key(kind, params)
+        self.stats["submitted"] += 1
+
+        existing = self._find_local(key)
+        if existing is None:
+            existing = await self._find_shared(key)
+            # Another request may have started the same scan meanwhile
+            existing = self._find_local(key) or existing
+        if existing is not None:
+            if existing.finished:
+                self.stats["reused"] += 1
+            else:
+                self.stats["deduplicated"] += 1
+            return existing, True
+
+        job = ScanJob(job_id=uuid.uuid4().hex, kind=kind, params=params, key=key)
+        self._jobs[job.job_id] = job
+        self._by_key[key] = job.job_id
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, runner))
+        self._prune()
+        return job, False
+
+    def _find_local(self, key: str) -> Optional[ScanJob]:
+        """A usable job for a key from this worker"""
+        job_id = self._by_key.get(key)
+        return self._usable(self._jobs.get(job_id)) if job_id else None
+
+    async def _find_shared(self, key: str) -> Optional[ScanJob]:
+        """A recently completed job for a key from the shared cache"""
+        job_id = await self.cache.aget(f"scanjob:key:{key}")
+        return self._usable(await self.get(job_id)) if job_id else None
+
+    def _usable(self, job: Optional[ScanJob]) -> Optional[ScanJob]:
+        """The job if it is in flight or completed recently"""
+        if job is None:
+            return None
+        if not job.finished:
+            return job
+        if job.status == "completed" and time.time() - job.finished_at < self.result_ttl:
+            return job
+        return None
+
+    async def _run(self, job: ScanJob, runner: ScanRunner) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        try:
+            async with self._semaphore:
+                job.status = "running"
+                job.started_at = time.time()
+                self.stats["started"] += 1
+                logger.info(f"Scan job {job.job_id} ({job.kind}) started")
+                job.result = await runner(job.params, job)
+                job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            logger.warning(f"Scan job {job.job_id} ({job.kind}) failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            if job.status == "completed":
+                job.partial = []
+            self._tasks.pop(job.job_id, None)
+            await self._store(job)
+            if job.status == "completed":
+                logger.info(f"Scan job {job.job_id} completed in {job.finished_at - job.started_at:.1f}s")
+
+    async def _store(self, job: ScanJob) -> None:
+        """Keep a finished job in the shared cache so any worker can serve it"""
+        try:
+            await self.cache.aset(f"scanjob:{job.job_id}", job.to_record(), ttl=self.result_ttl)
+            if job.status == "completed":
+                await self.cache.aset(f"scanjob:key:{job.key}", job.job_id, ttl=self.result_ttl)
+        except Exception as e:
+            logger.warning(f"Could not store scan job {job.job_id}: {e}")
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in sorted(finished, key=lambda job: job.finished_at)[:max(0, len(self._jobs) - MAX_TRACKED_JOBS)]:
+            del self._jobs[job.job_id]
+            if self._by_key.get(job.key) == job.job_id:
+                del self._by_key[job.key]
+
+    async def get(self, job_id: str) -> Optional[ScanJob]:
+        """A job by id, from this worker or the shared cache"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        record = await self.cache.aget(f"scanjob:{job_id}")
+        return ScanJob.from_record(record) if record else None
+
+    async def wait(self, job: ScanJob) -> Dict[str, Any]:
+        """
+        Wait for a job and return its result.
+
+        The job keeps running if the waiting request goes away, so other
+        callers joined to it still get their result.
+        """
+        task = self._tasks.get(job.job_id)
+        if task is not None:
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.done():
+                    raise  # This request was cancelled, not the job
+        if job.status == "failed":
+            raise RuntimeError(job.error)
+        if job.status != "completed":
+            raise RuntimeError(f"Scan job {job.job_id} {job.status}")
+        return job.result
+
+    def cancel(self, job_id: str) -> bool:
+        task = self._tasks.get(job_id)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        jobs = sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+        return [job.to_dict(limit=0) for job in jobs]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": sum(1 for job in self._jobs.values() if job.status == "queued"),
+            "running": sum(1 for job in self._jobs.values() if job.status == "running"),
+            "max_concurrent": self.max_concurrent,
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel running jobs (e.g. on application shutdown)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_scan_jobs: Optional[ScanJobManager] = None
+
+
+def get_scan_jobs() -> ScanJobManager:
+    """Get the process-wide scan job manager"""
+    global _scan_jobs
+    if _scan_jobs is None:
+        _scan_jobs = ScanJobManager()
+    return _scan_jobs
@@ -14,7 +14,7 @@ Features:
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
@@ -36,6 +36,7 @@ from tenacity import (
 )
 
 from config.settings import settings
+from src.rate_limit import Rate, RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -97,111 +98,38 @@ class SchedulerConfig:
     rate_limits: RateLimitConfig = field(default_factory=RateLimitConfig)
 
 
-class RateLimiter:
+class ProviderRateLimiter(RateLimiter):
     """
-    Token bucket rate limiter for API calls.
+    Per-provider requests-per-minute limits under a global hourly limit.
     """
     
     def __init__(self, config: RateLimitConfig):
+        super().__init__(Rate(config.requests_per_hour, 3600), name="scheduler")
         self.config = config
-        self._request_times: dict[str, list[datetime]] = {
-            "gemini": [],
-            "anthropic": [],
-            "openai": [],
-            "global": [],
-        }
         self._semaphore = asyncio.Semaphore(config.concurrent_requests)
-        self._lock = asyncio.Lock()
+        self._providers: set[str] = set()
     
-    async def acquire(self, provider: str = "global") -> bool:
-        """
-        Acquire permission to make an API request.
-        
-        Args:
-            provider: API provider name
-            
-        Returns:
-            True if request is allowed, False if rate limited
-        """
-        async with self._lock:
-            now = datetime.utcnow()
-            minute_ago = now - timedelta(minutes=1)
-            hour_ago = now - timedelta(hours=1)
-            
-            # Clean old entries
-            self._request_times[provider] = [
-                t for t in self._request_times.get(provider, [])
-                if t > hour_ago
-            ]
-            self._request_times["global"] = [
-                t for t in self._request_times["global"]
-                if t > hour_ago
-            ]
-            
-            # Check per-minute limit
-            recent_requests = sum(
-                1 for t in self._request_times.get(provider, [])
-                if t > minute_ago
-            )
-            
-            provider_rpm = getattr(
-                self.config, 
-                f"{provider}_rpm", 
-                self.config.requests_per_minute
-            )
-            
-            if recent_requests >= provider_rpm:
-                logger.warning(f"Rate limited: {provider} ({recent_requests}/{provider_rpm} rpm)")
-                return False
-            
-            # Check global hourly limit
-            global_requests = sum(
-                1 for t in self._request_times["global"]
-                if t > hour_ago
-            )
-            
-            if global_requests >= self.config.requests_per_hour:
-                logger.warning(f"Rate limited: global ({global_requests}/{self.config.requests_per_hour} rph)")
-                return False
-            
-            # Record request
-            self._request_times[provider].append(now)
-            self._request_times["global"].append(now)
-            
-            return True
+    def _provider_rate(self, provider: str) -> Rate:
+        rpm = getattr(self.config, f"{provider}_rpm", self.config.requests_per_minute)
+        return Rate(rpm, 60)
     
-    async def wait_and_acquire(self, provider: str = "global", timeout: float = 60.0) -> bool:
-        """
-        Wait for rate limit to clear, then acquire.
-        
-        Args:
-            provider: API provider name
-            timeout: Maximum time to wait
-            
-        Returns:
-            True if acquired within timeout
-        """
-        start = datetime.utcnow()
-        
-        while (datetime.utcnow() - start).total_seconds() < timeout:
-            if await self.acquire(provider):
-                return True
-            await asyncio.sleep(1.0)
-        
-        return False
+    def _cells(self, provider: str):
+        # A request counts against its provider and the global hourly budget
+        self._providers.add(provider)
+        return [
+            (f"{self.name}:{provider}", self._provider_rate(provider)),
+            (f"{self.name}:global", self.rates[0]),
+        ]
     
     def get_stats(self) -> dict[str, Any]:
-        """Get current rate limiter statistics."""
-        now = datetime.utcnow()
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
-        
-        stats = {}
-        for provider, times in self._request_times.items():
-            rpm = sum(1 for t in times if t > minute_ago)
-            rph = sum(1 for t in times if t > hour_ago)
-            stats[provider] = {"rpm": rpm, "rph": rph}
-        
+        """Requests used per provider (rpm) and globally (rph)."""
+        stats: dict[str, Any] = {}
+        global_cell = (f"{self.name}:global", self.rates[0])
+        for provider in sorted(self._providers):
+            rate = self._provider_rate(provider)
+            left = self.store.remaining([(f"{self.name}:{provider}", rate)])[0]
+            stats[provider] = {"rpm": rate.capacity - left}
+        stats["global"] = {"rph": self.rates[0].capacity - self.store.remaining([global_cell])[0]}
         return stats
 
 
@@ -291,7 +219,7 @@ class GrowthEngineScheduler:
     def __init__(self, config: Optional[SchedulerConfig] = None):
         self.config = config or SchedulerConfig()
         self.scheduler = AsyncIOScheduler()
-        self.rate_limiter = RateLimiter(self.config.rate_limits)
+        self.rate_limiter = ProviderRateLimiter(self.config.rate_limits)
         self.health_monitor = HealthMonitor()
         
         # Job tracking
@@ -404,7 +332,7 @@ class GrowthEngineScheduler:
             logger.info(f"Starting daily discovery: {job_id}")
             
             # Check rate limits
-            if not await self.rate_limiter.wait_and_acquire("gemini"):
+            if not await self.rate_limiter.acquire("gemini", timeout=60.0):
                 raise Exception("Rate limited - cannot start daily discovery")
             
             # Run the discovery pipeline
@@ -5,7 +5,7 @@ Calculates fit scores based on profile matching and configurable weights.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Sequence
 
 from src.models import (
     Opportunity,
@@ -134,6 +134,7 @@ class ScoringEngine:
         profile_interests: list[str],
         career_goals: str | None = None,
         opportunity_description: str = "",
+        semantic_score: float | None = None,
     ) -> float:
         """
         Calculate interest/goal alignment score.
@@ -143,11 +144,14 @@ class ScoringEngine:
             profile_interests: User's stated interests
             career_goals: User's career goals text
             opportunity_description: Full opportunity description
+            semantic_score: Embedding similarity of profile and opportunity (0-1),
+                rescaled between the semantic goal floor and ceiling and
+                used for goal alignment instead of keyword matching
             
         Returns:
             Interest match score (0-1)
         """
-        if not opportunity_tags and not profile_interests:
+        if not opportunity_tags and not profile_interests and semantic_score is None:
             return 0.5  # Neutral score if no data
         
         # Tag matching
@@ -158,10 +162,13 @@ class ScoringEngine:
             matches = sum(1 for t in opp_lower if any(i in t or t in i for i in int_lower))
             tag_score = min(1.0, matches / max(len(opportunity_tags), 1))
         
-        # Goal alignment (simple keyword matching for now)
-        # In production, use embeddings for semantic matching
+        # Goal alignment: embedding similarity when available, else keywords
         goal_score = 0.5
-        if career_goals and opportunity_description:
+        if semantic_score is not None:
+            floor = self.weights.semantic_goal_floor
+            span = self.weights.semantic_goal_ceiling - floor
+            goal_score = min(1.0, max(0.0, (float(semantic_score) - floor) / span))
+        elif career_goals and opportunity_description:
             goal_keywords = career_goals.lower().split()
             desc_lower = opportunity_description.lower()
             matches = sum(1 for kw in goal_keywords if len(kw) > 4 and kw in desc_lower)
@@ -275,6 +282,7 @@ class ScoringEngine:
         self,
         opportunity: Opportunity | dict[str, Any],
         profile: Profile | dict[str, Any],
+        semantic_score: float | None = None,
     ) -> OpportunityScore:
         """
         Calculate comprehensive fit score for an opportunity.
@@ -282,6 +290,7 @@ class ScoringEngine:
         Args:
             opportunity: Opportunity to score
             profile: User profile to match against
+            semantic_score: Pre-computed semantic similarity (optional)
             
         Returns:
             OpportunityScore with detailed breakdown
@@ -326,6 +335,7 @@ class ScoringEngine:
             profile_interests,
             career_goals,
             opp.get("description", ""),
+            semantic_score=semantic_score,
         )
         
         prestige_score = self.calculate_prestige_score(
@@ -401,6 +411,7 @@ class ScoringEngine:
         self,
         opportunities: list[Opportunity | dict[str, Any]],
         profile: Profile | dict[str, Any],
+        semantic_scores: Sequence[float] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Score a batch of opportunities.
@@ -408,14 +419,18 @@ class ScoringEngine:
         Args:
             opportunities: List of opportunities to score
             profile: User profile
+            semantic_scores: Semantic similarity per opportunity, as returned
+                by ``calculate_profile_opportunity_matches`` (optional)
             
         Returns:
             List of opportunities with scores and tiers added
         """
         results = []
+        if semantic_scores is None:
+            semantic_scores = [None] * len(opportunities)
         
-        for opp in opportunities:
-            score = self.score_opportunity(opp, profile)
+        for opp, semantic_score in zip(opportunities, semantic_scores):
+            score = self.score_opportunity(opp, profile, semantic_score=semantic_score)
             tier = self.assign_tier(score)
             
             # Add score and tier to opportunity
@@ -30,6 +30,11 @@ class ScoringWeights(BaseModel):
     experience_years_importance: float = Field(default=0.7, description="Importance of years of experience")
     role_similarity_importance: float = Field(default=0.3, description="Importance of similar role titles")
     
+    # Semantic goal alignment: (cos + 1) / 2 similarities bunch in a narrow
+    # band, so they are rescaled from [floor, ceiling] to [0, 1]
+    semantic_goal_floor: float = Field(default=0.60, description="Similarity treated as no goal alignment")
+    semantic_goal_ceiling: float = Field(default=0.90, description="Similarity treated as full goal alignment")
+    
     # Tier thresholds
     tier_1_threshold: float = Field(default=0.80, description="Minimum score for Tier 1")
     tier_2_threshold: float = Field(default=0.60, description="Minimum score for Tier 2")
@@ -81,9 +81,13 @@ from .utils import (
     safe_request,
     safe_json_request,
     retry_on_failure,
+    Rate,
     RateLimiter,
     run_scrapers_safely,
 )
+from .http_pool import pooled_client, get_pool_stats, close_shared_client
+from .parsing import parse_items, close_parse_pool
+from .dedup import merge_duplicates, get_dedup_index
 from .base_scraper import (
     get_scraper_metrics,
     get_all_scraper_health,
@@ -169,8 +173,16 @@ __all__ = [
     "safe_request",
     "safe_json_request",
     "retry_on_failure",
+    "Rate",
     "RateLimiter",
     "run_scrapers_safely",
+    "pooled_client",
+    "get_pool_stats",
+    "close_shared_client",
+    "parse_items",
+    "close_parse_pool",
+    "merge_duplicates",
+    "get_dedup_index",
     "get_scraper_metrics",
     "get_all_scraper_health",
     "ScraperStatus",
@@ -0,0 +1,178 @@
+"""
+Adaptive Scan Control
+=====================
+Per-source timeouts and scan-wide concurrency driven by ScraperMetrics.
+
+Scans used to give every source the same fixed timeout and run a fixed
+number of scrapers at once. The controller instead:
+
+- gives each source a timeout from its observed latency (p99 x margin),
+  capped by the scan's ceiling, so a stuck fast source is abandoned early
+  while a slow-but-healthy one keeps its budget
+- adjusts concurrency AIMD-style: +1 slot per window of successes, halved
+  when sources are rate limited (HTTP 429), time out or mostly fail
+- skips sources whose circuit breaker is open without spending a slot,
+  including circuits persisted by earlier runs or other workers
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .base_scraper import ScraperMetrics, get_scraper_metrics
+from .http_pool import RequestTally, request_tally
+from .metrics_store import ensure_metrics_sync
+
+logger = logging.getLogger(__name__)
+
+
+MIN_TIMEOUT = 10.0  # seconds; floor for sources with very fast history
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_MARGIN = 2.0
+MIN_LATENCY_SAMPLES = 5  # below this the scan's ceiling is used
+
+ERROR_WINDOW = 20  # recent outcomes the error rate is measured over
+ERROR_RATE_THRESHOLD = 0.5
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN = 5.0  # seconds; one overload burst halves the limit once
+
+
+def adaptive_timeout(metrics: ScraperMetrics, ceiling: float) -> float:
+    """Timeout for a source from its latency history, within [MIN_TIMEOUT, ceiling]"""
+    if len(metrics.response_times) < MIN_LATENCY_SAMPLES:
+        return ceiling
+    observed = metrics.latency_percentile(TIMEOUT_PERCENTILE) * TIMEOUT_MARGIN
+    return min(ceiling, max(MIN_TIMEOUT, observed))
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit with additive increase / multiplicative decrease"""
+
+    def __init__(self, maximum: int, minimum: int = 1, initial: Optional[int] = None):
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self._limit = float(initial or self.maximum)
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._outcomes: deque = deque(maxlen=ERROR_WINDOW)
+        self._last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.minimum, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the currently allowed slots"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self, success: bool, overloaded: bool = False) -> None:
+        """Feed one source outcome into the limit"""
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        error_rate = failures / len(self._outcomes)
+        mostly_failing = len(self._outcomes) >= ERROR_WINDOW // 2 and error_rate > ERROR_RATE_THRESHOLD
+
+        if overloaded or mostly_failing:
+            now = time.monotonic()
+            if now - self._last_decrease >= DECREASE_COOLDOWN and self._limit > self.minimum:
+                self._limit = max(self.minimum, self._limit * DECREASE_FACTOR)
+                self._last_decrease = now
+                self._outcomes.clear()
+                self.decreases += 1
+                logger.info(f"Scan concurrency lowered to {self.limit} ({'overloaded' if overloaded else f'{error_rate:.0%} errors'})")
+        elif success and self._limit < self.maximum:
+            before = self.limit
+            self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            if self.limit > before:
+                self.increases += 1
+
+
+class AdaptiveScanController:
+    """Runs scraper entries for one scan with adaptive timeouts and concurrency"""
+
+    def __init__(self, max_concurrent: int, timeout_ceiling: float):
+        self.concurrency = AdaptiveConcurrency(max_concurrent)
+        self.timeout_ceiling = timeout_ceiling
+        self.skipped: List[str] = []
+
+    async def run(
+        self,
+        name: str,
+        scraper_fn: Callable[[], Awaitable[Any]],
+        metrics_name: Optional[str] = None,
+    ) -> Tuple[str, Any, Optional[str]]:
+        """
+        Run one scraper entry, returning (name, result, error).
+
+        metrics_name selects the ScraperMetrics entry (default: name), for
+        scans whose source names map to different scrapers.
+        """
+        # Load persisted metrics first so circuits opened before a restart
+        # (or by another worker) are honoured
+        await ensure_metrics_sync()
+        metrics = get_scraper_metrics(metrics_name or name)
+        if metrics.circuit_open:
+            self.skipped.append(name)
+            return name, [], f"Skipped: circuit open until {metrics.circuit_open_until.isoformat()}"
+
+        async with self.concurrency.slot():
+            timeout = adaptive_timeout(metrics, self.timeout_ceiling)
+            tally = RequestTally()
+            token = request_tally.set(tally)
+            recorded = metrics.total_requests
+            start = time.monotonic()
+            result, error, timed_out = [], None, False
+            try:
+                result = await asyncio.wait_for(scraper_fn(), timeout=timeout)
+            except asyncio.TimeoutError:
+                error, timed_out = f"Timeout after {timeout:.0f}s", True
+            except Exception as e:
+                error = str(e)
+            finally:
+                request_tally.reset(token)
+            duration = time.monotonic() - start
+
+        rate_limited = tally.rate_limited > 0
+        # Scrapers swallow most errors; an empty result after failed
+        # requests is a failure, not a quiet listing
+        failed = error is not None or (not result and (rate_limited or tally.failed > 0))
+        if metrics.total_requests == recorded:  # The scraper didn't record this run itself
+            if failed:
+                metrics.record_failure(error or ("HTTP 429" if rate_limited else "Requests failed"), rate_limited=rate_limited)
+            else:
+                metrics.record_success(duration, len(result) if isinstance(result, list) else 0)
+        self.concurrency.record(success=not failed, overloaded=rate_limited or timed_out)
+        if error:
+            logger.debug(f"{name} failed after {duration:.1f}s: {error}")
+        else:
+            logger.debug(f"{name} completed in {duration:.1f}s with {len(result) if isinstance(result, list) else 'N/A'} items")
+        return name, result, error
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency_limit": self.concurrency.limit,
+            "concurrency_max": self.concurrency.maximum,
+            "concurrency_increases": self.concurrency.increases,
+            "concurrency_decreases": self.concurrency.decreases,
+            "skipped_open_circuit": list(self.skipped),
+        }
@@ -6,7 +6,6 @@ and other African-focused platforms.
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -15,6 +14,7 @@ import re
 import json
 
 from .base_scraper import BaseScraper, Opportunity
+from .http_pool import pooled_client, PooledClient
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +56,7 @@ class OpportunitiesForAfricansScraper(BaseScraper):
         """Scrape opportunities from all categories"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             for category in self.categories:
                 try:
                     cat_opps = await self._scrape_category(client, category, max_pages // len(self.categories) + 1)
@@ -68,7 +68,7 @@ class OpportunitiesForAfricansScraper(BaseScraper):
         
         return opportunities
     
-    async def _scrape_category(self, client: httpx.AsyncClient, category: str, max_pages: int) -> List[Opportunity]:
+    async def _scrape_category(self, client: PooledClient, category: str, max_pages: int) -> List[Opportunity]:
         """Scrape a specific category"""
         opportunities = []
         
@@ -155,7 +155,7 @@ class OpportunitiesForAfricansScraper(BaseScraper):
         """Search for opportunities"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             await self._wait_for_rate_limit()
             url = f"{self.base_url}/?s={query.replace(' ', '+')}"
             response = await client.get(url)
@@ -187,7 +187,7 @@ class VC4AfricaScraper(BaseScraper):
         """Scrape funding opportunities and programs"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             # Scrape funding opportunities
             try:
                 opps = await self._scrape_funding(client, max_pages)
@@ -204,7 +204,7 @@ class VC4AfricaScraper(BaseScraper):
         
         return opportunities
     
-    async def _scrape_funding(self, client: httpx.AsyncClient, max_pages: int) -> List[Opportunity]:
+    async def _scrape_funding(self, client: PooledClient, max_pages: int) -> List[Opportunity]:
         """Scrape funding opportunities"""
         opportunities = []
         
@@ -234,7 +234,7 @@ class VC4AfricaScraper(BaseScraper):
                 
         return opportunities
     
-    async def _scrape_programs(self, client: httpx.AsyncClient) -> List[Opportunity]:
+    async def _scrape_programs(self, client: PooledClient) -> List[Opportunity]:
         """Scrape accelerator and incubator programs"""
         opportunities = []
         
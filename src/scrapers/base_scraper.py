@@ -16,17 +16,22 @@ import asyncio
 import httpx
 import logging
 import random
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import hashlib
 from collections import deque
 
+from .http_pool import PooledClient, pooled_client, get_pool_stats
+
 logger = logging.getLogger(__name__)
 
+LATENCY_SAMPLES = 100  # recent response times kept per scraper for percentiles
+
 
 class ScraperStatus(Enum):
     """Scraper health status"""
@@ -49,6 +54,10 @@ class ScraperMetrics:
     last_error: Optional[str] = None
     consecutive_failures: int = 0
     circuit_open_until: Optional[datetime] = None
+    rate_limited_requests: int = 0
+    response_times: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    name: str = ""
+    updated_at: float = 0.0  # epoch seconds of the last recorded outcome
     
     @property
     def success_rate(self) -> float:
@@ -68,6 +77,17 @@ class ScraperMetrics:
             return ScraperStatus.DEGRADED
         return ScraperStatus.HEALTHY
     
+    @property
+    def circuit_open(self) -> bool:
+        return bool(self.circuit_open_until and datetime.now() < self.circuit_open_until)
+    
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Response time at a percentile (0-1) of recent successes, in seconds"""
+        if not self.response_times:
+            return None
+        ordered = sorted(self.response_times)
+        return ordered[min(len(ordered) - 1, int(percentile * len(ordered)))]
+    
     def record_success(self, response_time: float, opportunities_count: int = 0):
         self.total_requests += 1
         self.successful_requests += 1
@@ -75,6 +95,8 @@ class ScraperMetrics:
         self.last_success = datetime.now()
         self.consecutive_failures = 0
         self.circuit_open_until = None
+        self.response_times.append(response_time)
+        self._touch()
         
         # Update rolling average response time
         if self.avg_response_time == 0:
@@ -82,9 +104,11 @@ class ScraperMetrics:
         else:
             self.avg_response_time = (self.avg_response_time * 0.9) + (response_time * 0.1)
     
-    def record_failure(self, error: str):
+    def record_failure(self, error: str, rate_limited: bool = False):
         self.total_requests += 1
         self.failed_requests += 1
+        if rate_limited:
+            self.rate_limited_requests += 1
         self.last_failure = datetime.now()
         self.last_error = error
         self.consecutive_failures += 1
@@ -95,6 +119,13 @@ class ScraperMetrics:
             backoff_minutes = min(2 ** (self.consecutive_failures - 5), 60)
             self.circuit_open_until = datetime.now() + timedelta(minutes=backoff_minutes)
             logger.warning(f"Circuit breaker opened for {backoff_minutes} minutes")
+        self._touch()
+    
+    def _touch(self):
+        """Mark these metrics changed so the metrics store persists them"""
+        self.updated_at = time.time()
+        if self.name:
+            _dirty_metrics.add(self.name)
     
     def to_dict(self) -> Dict:
         return {
@@ -104,31 +135,81 @@ class ScraperMetrics:
             "success_rate": round(self.success_rate * 100, 1),
             "total_opportunities": self.total_opportunities,
             "avg_response_time_ms": round(self.avg_response_time * 1000, 1),
+            "p99_response_time_ms": round(self.latency_percentile(0.99) * 1000, 1) if self.response_times else None,
+            "rate_limited_requests": self.rate_limited_requests,
             "status": self.status.value,
             "consecutive_failures": self.consecutive_failures,
             "last_success": self.last_success.isoformat() if self.last_success else None,
             "last_failure": self.last_failure.isoformat() if self.last_failure else None,
             "last_error": self.last_error,
         }
+    
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot for the metrics store"""
+        return {
+            "total_requests": self.total_requests,
+            "successful_requests": self.successful_requests,
+            "failed_requests": self.failed_requests,
+            "total_opportunities": self.total_opportunities,
+            "avg_response_time": self.avg_response_time,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_failure": self.last_failure.isoformat() if self.last_failure else None,
+            "last_error": self.last_error,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_open_until": self.circuit_open_until.isoformat() if self.circuit_open_until else None,
+            "rate_limited_requests": self.rate_limited_requests,
+            "response_times": list(self.response_times),
+            "updated_at": self.updated_at,
+        }
+    
+    @classmethod
+    def from_record(cls, name: str, record: Dict[str, Any]) -> "ScraperMetrics":
+        """Rebuild metrics from a metrics store snapshot"""
+        parse = lambda value: datetime.fromisoformat(value) if value else None
+        return cls(
+            total_requests=record.get("total_requests", 0),
+            successful_requests=record.get("successful_requests", 0),
+            failed_requests=record.get("failed_requests", 0),
+            total_opportunities=record.get("total_opportunities", 0),
+            avg_response_time=record.get("avg_response_time", 0.0),
+            last_success=parse(record.get("last_success")),
+            last_failure=parse(record.get("last_failure")),
+            last_error=record.get("last_error"),
+            consecutive_failures=record.get("consecutive_failures", 0),
+            circuit_open_until=parse(record.get("circuit_open_until")),
+            rate_limited_requests=record.get("rate_limited_requests", 0),
+            response_times=deque(record.get("response_times", []), maxlen=LATENCY_SAMPLES),
+            name=name,
+            updated_at=record.get("updated_at", 0.0),
+        )
 
 
-# Global metrics registry
+# Global metrics registry; persisted and shared across workers by metrics_store
 _scraper_metrics: Dict[str, ScraperMetrics] = {}
+_dirty_metrics: Set[str] = set()
 
 
 def get_scraper_metrics(name: str) -> ScraperMetrics:
     """Get or create metrics for a scraper"""
     if name not in _scraper_metrics:
-        _scraper_metrics[name] = ScraperMetrics()
+        _scraper_metrics[name] = ScraperMetrics(name=name)
     return _scraper_metrics[name]
 
 
-def get_all_scraper_health() -> Dict[str, Any]:
-    """Get health status of all scrapers"""
-    return {
+def get_all_scraper_health(include_pool_stats: bool = False) -> Dict[str, Any]:
+    """
+    Get health status of all scrapers.
+    
+    With include_pool_stats, the shared HTTP connection pool statistics
+    are added under the "connection_pool" key.
+    """
+    health = {
         name: metrics.to_dict() 
         for name, metrics in _scraper_metrics.items()
     }
+    if include_pool_stats:
+        health["connection_pool"] = get_pool_stats()
+    return health
 
 
 @dataclass
@@ -226,7 +307,7 @@ class BaseScraper(ABC):
         if headers:
             self.default_headers.update(headers)
         
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[PooledClient] = None
         self._cache: Dict[str, Any] = {}
         self._cache_ttl = timedelta(minutes=15)
         self._recent_response_times: deque = deque(maxlen=100)
@@ -244,7 +325,7 @@ class BaseScraper(ABC):
         return random.choice(user_agents)
     
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(
+        self._client = pooled_client(
             timeout=self.timeout,
             headers=self.default_headers,
             follow_redirects=True
@@ -386,7 +467,7 @@ class BaseScraper(ABC):
         
         # Try a simple request to verify connectivity
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.head(self.base_url)
                 health["reachable"] = response.status_code < 500
                 health["response_code"] = response.status_code
@@ -6,7 +6,6 @@ from tech, business, and academic platforms.
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -15,6 +14,7 @@ import re
 import json
 
 from .base_scraper import BaseScraper, Opportunity
+from .http_pool import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -335,7 +335,7 @@ class ConferenceScraper(BaseScraper):
             ))
         
         # Scrape confs.tech for more
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             tech_categories = ["javascript", "python", "data", "devops", "ux", "ruby", "ios", "android", "security"]
             
             for category in tech_categories:
@@ -412,7 +412,7 @@ class MeetupScraper(BaseScraper):
             "blockchain", "fintech", "entrepreneurship", "venture-capital"
         ]
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             for category in categories:
                 try:
                     await self._wait_for_rate_limit()
@@ -488,7 +488,7 @@ class EventbriteScraper(BaseScraper):
             "fintech+conference", "developer+conference"
         ]
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             for term in search_terms:
                 try:
                     await self._wait_for_rate_limit()
@@ -557,7 +557,7 @@ class HackathonScraper(BaseScraper):
         """Scrape hackathons"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             try:
                 # Devpost hackathons
                 await self._wait_for_rate_limit()
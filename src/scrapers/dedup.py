@@ -0,0 +1,346 @@
+"""
+Cross-Source Deduplication
+==========================
+Collapse the same opportunity scraped from several sources into one.
+
+Every source builds its own id (``generate_id(source, title, url)``), so
+a job listed on RemoteOK, Himalayas and the company's ATS board arrives
+three times. After a scan, records are clustered by:
+
+- an exact key of normalised company + title, and
+- MinHash signatures of the description, bucketed with LSH so each
+  record is only compared against the few records sharing a band
+  (near-linear in the number of records).
+
+Each cluster keeps a stable canonical id (the first record seen), and
+``merge_duplicates`` folds a cluster into one opportunity listing all of
+its sources. Signatures are persisted, so duplicates are recognised
+across batches and scans.
+"""
+
+import functools
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..hashing import content_hash, opportunity_key
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DEDUP_PATH = Path(__file__).parent.parent.parent / "data" / "dedup.db"
+SIGNATURE_RETENTION = 30 * 24 * 3600  # seconds
+
+NUM_PERM = 64
+LSH_BANDS = 16  # 16 bands x 4 rows: pairs above ~0.6 similarity almost always share a bucket
+ROWS_PER_BAND = NUM_PERM // LSH_BANDS
+MIN_SHINGLES = 8  # shorter descriptions are matched by key only
+MAX_DESCRIPTION_WORDS = 1500
+DESCRIPTION_SIMILARITY = 0.8  # estimated Jaccard needed to merge
+TOKEN_HASH_CACHE_SIZE = 65536  # words; covers a scan's vocabulary without growing forever
+
+_rng = np.random.RandomState(0x5EED)
+_PERM_A = (_rng.randint(1, 2**31, NUM_PERM, dtype=np.int64).astype(np.uint64) << np.uint64(32)) | np.uint64(1)
+_PERM_B = _rng.randint(0, 2**31, NUM_PERM, dtype=np.int64).astype(np.uint64) << np.uint64(16)
+_SHINGLE_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F], dtype=np.uint64)
+_BAND_MULTIPLIERS = _rng.randint(1, 2**31, ROWS_PER_BAND, dtype=np.int64).astype(np.uint64) * np.uint64(2**32 + 1)
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:[+#]+)?")
+_PARENTHETICAL_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_TITLE_SUFFIX_RE = re.compile(r"\s+[-|@]\s+.*$")
+COMPANY_SUFFIXES = frozenset({
+    "inc", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "plc", "sa", "ag", "bv", "the",
+})
+
+# Added by merge_duplicates; ignored when hashing so merged records re-merge cheaply
+MERGE_FIELDS = frozenset({"canonical_id", "sources", "duplicate_ids"})
+
+def normalize_company(company: Any) -> str:
+    """Casefolded company name without punctuation or legal suffixes"""
+    words = _WORD_RE.findall(str(company or "").casefold())
+    return " ".join(word for word in words if word not in COMPANY_SUFFIXES)
+
+
+def normalize_title(title: Any) -> str:
+    """
+    Casefolded title without bracketed notes or trailing "- Remote"-style
+    qualifiers that sources append differently.
+    """
+    text = _PARENTHETICAL_RE.sub(" ", str(title or "").casefold())
+    text = _TITLE_SUFFIX_RE.sub("", text)
+    return " ".join(_WORD_RE.findall(text))
+
+
+def dedup_key(opportunity: Dict[str, Any]) -> Optional[str]:
+    """Exact-match key, or None when company or title is missing"""
+    company = normalize_company(opportunity.get("company"))
+    title = normalize_title(opportunity.get("title"))
+    if not company or not title:
+        return None
+    return f"{company}|{title}"
+
+
+@functools.lru_cache(maxsize=TOKEN_HASH_CACHE_SIZE)
+def _token_hash(token: str) -> int:
+    return zlib.crc32(token.encode())
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    MinHash signature over word shingles of a text.
+
+    Returns None when the text is too short to compare reliably.
+    """
+    words = _WORD_RE.findall(str(text or "").casefold())[:MAX_DESCRIPTION_WORDS]
+    if len(words) < MIN_SHINGLES + 2:
+        return None
+    tokens = np.array([_token_hash(word) for word in words], dtype=np.uint64)
+    # Word 3-gram hashes; repeated shingles don't change the minimum
+    shingles = tokens[:-2] * _SHINGLE_MULTIPLIERS[0] + tokens[1:-1] * _SHINGLE_MULTIPLIERS[1] + tokens[2:]
+    # Multiply-shift hashing: one row per permutation, keep the top 32 bits
+    hashed = (_PERM_A[:, None] * shingles[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def _bands(signature: np.ndarray) -> List[Tuple[int, int]]:
+    """LSH bucket of each band: a hash of its rows"""
+    rows = signature.reshape(LSH_BANDS, ROWS_PER_BAND).astype(np.uint64)
+    return list(enumerate((rows * _BAND_MULTIPLIERS).sum(axis=1).tolist()))
+
+
+def _similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class DedupIndex:
+    """Persistent MinHash/LSH index assigning opportunities to clusters"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_DEDUP_PATH
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        # opp_id -> (content_hash, canonical_id, key, company, signature)
+        self._records: Dict[str, Tuple[str, str, Optional[str], str, Optional[np.ndarray]]] = {}
+        self._keys: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[int, int], List[str]] = {}
+        self._load()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Dedup index at {self.path} unavailable ({e}), using in-memory index")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (
+                opp_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                canonical_id TEXT NOT NULL,
+                dedup_key TEXT,
+                company TEXT NOT NULL,
+                signature BLOB,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_signatures_last_seen ON signatures (last_seen);
+            """
+        )
+        conn.commit()
+        return conn
+
+    def _load(self) -> None:
+        self._conn.execute("DELETE FROM signatures WHERE last_seen < ?", (time.time() - SIGNATURE_RETENTION,))
+        self._conn.commit()
+        rows = self._conn.execute(
+            "SELECT opp_id, content_hash, canonical_id, dedup_key, company, signature FROM signatures"
+        ).fetchall()
+        for opp_id, digest, canonical, key, company, blob in rows:
+            signature = np.frombuffer(blob, dtype=np.uint32) if blob is not None else None
+            self._index(opp_id, digest, canonical, key, company, signature)
+
+    def _index(self, opp_id, digest, canonical, key, company, signature, bands=None) -> None:
+        self._records[opp_id] = (digest, canonical, key, company, signature)
+        if key is not None:
+            self._keys.setdefault(key, canonical)
+        if signature is not None:
+            for bucket in bands or _bands(signature):
+                self._buckets.setdefault(bucket, []).append(opp_id)
+
+    def _unindex(self, opp_id: str) -> None:
+        _, _, _, _, signature = self._records.pop(opp_id)
+        if signature is not None:
+            for bucket in _bands(signature):
+                members = self._buckets.get(bucket)
+                if members is not None and opp_id in members:
+                    members.remove(opp_id)
+                    if not members:
+                        del self._buckets[bucket]
+
+    def _match(self, opp_id: str, key: Optional[str], company: str, signature: Optional[np.ndarray], bands) -> Optional[str]:
+        """Canonical id of the cluster a record belongs to, if any"""
+        if key is not None and key in self._keys:
+            return self._keys[key]
+        if signature is None:
+            return None
+
+        best, best_similarity = None, DESCRIPTION_SIMILARITY
+        seen = set()
+        for bucket in bands:
+            for candidate in self._buckets.get(bucket, ()):
+                if candidate == opp_id or candidate in seen:
+                    continue
+                seen.add(candidate)
+                _, canonical, _, candidate_company, candidate_signature = self._records[candidate]
+                # Shared boilerplate from different employers is not a duplicate
+                if company and candidate_company and company != candidate_company:
+                    continue
+                similarity = _similarity(signature, candidate_signature)
+                if similarity >= best_similarity:
+                    best, best_similarity = canonical, similarity
+        return best
+
+    def assign(self, opportunities: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Cluster opportunities and return {opportunity id: canonical id}.
+
+        Records already indexed with the same content are looked up
+        without recomputing their signature.
+        """
+        now = time.time()
+        assignments: Dict[str, str] = {}
+        rows, touched = [], []
+        with self._lock:
+            for opp in opportunities:
+                opp_id = opportunity_key(opp)
+                digest = _source_hash(opp)
+                existing = self._records.get(opp_id)
+                if existing is not None and existing[0] == digest:
+                    assignments[opp_id] = existing[1]
+                    touched.append((now, opp_id))
+                    continue
+
+                key = dedup_key(opp)
+                company = normalize_company(opp.get("company"))
+                signature = minhash_signature(opp.get("description", ""))
+                bands = _bands(signature) if signature is not None else []
+                if existing is not None:
+                    self._unindex(opp_id)
+                # A record other clusters point at stays canonical when it changes
+                if existing is not None and existing[1] == opp_id:
+                    canonical = opp_id
+                else:
+                    canonical = self._match(opp_id, key, company, signature, bands) or opp_id
+                self._index(opp_id, digest, canonical, key, company, signature, bands)
+                assignments[opp_id] = canonical
+                rows.append((opp_id, digest, canonical, key, company, _blob(signature), now))
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO signatures "
+                "(opp_id, content_hash, canonical_id, dedup_key, company, signature, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany("UPDATE signatures SET last_seen = ? WHERE opp_id = ?", touched)
+            self._conn.commit()
+        return assignments
+
+    def canonical_id(self, opp_id: str) -> Optional[str]:
+        record = self._records.get(opp_id)
+        return record[1] if record else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            canonicals = {record[1] for record in self._records.values()}
+            return {
+                "records": len(self._records),
+                "clusters": len(canonicals),
+                "duplicates": len(self._records) - len(canonicals),
+                "lsh_buckets": len(self._buckets),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._keys.clear()
+            self._buckets.clear()
+            self._conn.execute("DELETE FROM signatures")
+            self._conn.commit()
+
+
+def _source_hash(opportunity: Dict[str, Any]) -> str:
+    if MERGE_FIELDS.isdisjoint(opportunity):
+        return content_hash(opportunity)
+    return content_hash({k: v for k, v in opportunity.items() if k not in MERGE_FIELDS})
+
+
+def _blob(signature: Optional[np.ndarray]) -> Optional[bytes]:
+    return signature.tobytes() if signature is not None else None
+
+
+def merge_duplicates(
+    opportunities: List[Dict[str, Any]],
+    index: Optional["DedupIndex"] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fold near-duplicate opportunities into one canonical record each.
+
+    The merged record is the richest copy (longest description) under the
+    cluster's canonical id, so its id is stable between scans, with
+    ``canonical_id``, the list of ``sources`` it was found on and the
+    ``duplicate_ids`` it replaced. Order follows first appearance.
+    """
+    if not opportunities:
+        return []
+    index = index or get_dedup_index()
+    assignments = index.assign(opportunities)
+
+    clusters: Dict[str, List[Dict[str, Any]]] = {}
+    for opp in opportunities:
+        clusters.setdefault(assignments[opportunity_key(opp)], []).append(opp)
+
+    merged = []
+    for canonical, members in clusters.items():
+        primary = max(members, key=lambda opp: len(str(opp.get("description") or "")))
+        record = dict(primary)
+        sources, duplicate_ids = [], []
+        for opp in members:
+            for source in opp.get("sources") or [opp.get("source")]:
+                if source and source not in sources:
+                    sources.append(source)
+            for opp_id in [opportunity_key(opp), *opp.get("duplicate_ids", [])]:
+                if opp_id != canonical and opp_id not in duplicate_ids:
+                    duplicate_ids.append(opp_id)
+        record["id"] = canonical
+        record["canonical_id"] = canonical
+        record["sources"] = sources
+        record["duplicate_ids"] = duplicate_ids
+        scores = [opp["match_score"] for opp in members if opp.get("match_score") is not None]
+        if scores:
+            record["match_score"] = max(scores)
+        merged.append(record)
+    return merged
+
+
+_dedup_index: Optional[DedupIndex] = None
+_dedup_index_lock = threading.Lock()
+
+
+def get_dedup_index() -> DedupIndex:
+    """Get the process-wide dedup index"""
+    global _dedup_index
+    if _dedup_index is None:
+        with _dedup_index_lock:
+            if _dedup_index is None:
+                _dedup_index = DedupIndex()
+    return _dedup_index
@@ -0,0 +1,274 @@
+"""
+Incremental Delta Scanning
+==========================
+Per-source high-water marks so repeated scans only emit what changed.
+
+For every source the tracker persists the set of opportunity ids it last
+returned together with a content hash of each one, a hash of the whole
+listing and the newest ``posted_date`` seen. Each scan is diffed against
+that state:
+
+- added: ids not seen before
+- changed: known ids whose content hash differs
+- removed: ids that dropped out of a successful, non-empty listing
+  (tombstones)
+
+Every change is also appended to a change log, so API clients can pull
+only what changed since their last poll (``since=``) regardless of who
+triggered the scans in between.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..hashing import content_hash, opportunity_key
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_STATE_PATH = Path(__file__).parent.parent.parent / "data" / "scan_state.db"
+CHANGE_LOG_RETENTION = 7 * 24 * 3600  # seconds
+
+
+@dataclass
+class SourceDelta:
+    """Result of diffing one source's scan against its high-water mark"""
+    source: str
+    added: List[Dict] = field(default_factory=list)
+    changed: List[Dict] = field(default_factory=list)
+    removed: List[Dict] = field(default_factory=list)
+    unchanged: int = 0
+    listing_unchanged: bool = False
+
+    @property
+    def emitted(self) -> List[Dict]:
+        """New and changed opportunities"""
+        return self.added + self.changed
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": self.unchanged,
+        }
+
+
+def _to_epoch(value: datetime) -> float:
+    """Epoch seconds, treating naive datetimes as UTC like the rest of the scrapers"""
+    if value.tzinfo is not None:
+        return value.timestamp()
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+class ScanDeltaTracker:
+    """SQLite-backed high-water marks and change log for scan sources"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_STATE_PATH
+        self._conn = self._connect()
+        # Scans apply source results from worker threads
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Scan state at {self.path} unavailable ({e}), using in-memory state")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS source_items (
+                source TEXT NOT NULL,
+                opp_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                payload TEXT,
+                PRIMARY KEY (source, opp_id)
+            );
+            CREATE TABLE IF NOT EXISTS source_marks (
+                source TEXT PRIMARY KEY,
+                listing_hash TEXT NOT NULL,
+                last_posted TEXT,
+                item_count INTEGER NOT NULL,
+                last_scan REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS change_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                opp_id TEXT NOT NULL,
+                change TEXT NOT NULL,
+                changed_at REAL NOT NULL,
+                payload TEXT
+            );
+            CREATE INDEX IF NOT EXISTS ix_change_log_changed_at ON change_log (changed_at);
+            """
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(source_items)")}
+        if "payload" not in columns:
+            # State files from before payloads were kept; filled in on the next scan
+            conn.execute("ALTER TABLE source_items ADD COLUMN payload TEXT")
+        conn.commit()
+        return conn
+
+    def get_mark(self, source: str) -> Optional[Dict[str, Any]]:
+        """Get the high-water mark recorded for a source"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT listing_hash, last_posted, item_count, last_scan FROM source_marks WHERE source = ?",
+                (source,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "source": source,
+            "listing_hash": row[0],
+            "last_posted": row[1],
+            "item_count": row[2],
+            "last_scan": datetime.utcfromtimestamp(row[3]).isoformat(),
+        }
+
+    def apply(self, source: str, opportunities: List[Dict]) -> SourceDelta:
+        """Diff a source's scan against its stored state and record the changes"""
+        with self._lock:
+            return self._apply(source, opportunities)
+
+    def _apply(self, source: str, opportunities: List[Dict]) -> SourceDelta:
+        now = time.time()
+        delta = SourceDelta(source=source)
+        hashes = {opportunity_key(opp): (opp, content_hash(opp)) for opp in opportunities}
+        listing_hash = hashlib.sha1("".join(sorted(h for _, h in hashes.values())).encode()).hexdigest()
+
+        mark = self.get_mark(source)
+        if mark and mark["listing_hash"] == listing_hash:
+            # Fast path: identical listing, nothing to diff
+            delta.unchanged = len(hashes)
+            delta.listing_unchanged = True
+            self._conn.execute("UPDATE source_marks SET last_scan = ? WHERE source = ?", (now, source))
+            self._conn.executemany(
+                "UPDATE source_items SET payload = ? WHERE source = ? AND opp_id = ? AND payload IS NULL",
+                [(json.dumps(opp, default=str), source, opp_id) for opp_id, (opp, _) in hashes.items()],
+            )
+            self._conn.commit()
+            return delta
+
+        known = dict(self._conn.execute(
+            "SELECT opp_id, content_hash FROM source_items WHERE source = ?", (source,)
+        ).fetchall())
+
+        log_rows = []
+        for opp_id, (opp, digest) in hashes.items():
+            previous = known.get(opp_id)
+            if previous is None:
+                delta.added.append(opp)
+                log_rows.append((source, opp_id, "added", now, json.dumps(opp, default=str)))
+            elif previous != digest:
+                delta.changed.append(opp)
+                log_rows.append((source, opp_id, "changed", now, json.dumps(opp, default=str)))
+            else:
+                delta.unchanged += 1
+
+        # An empty result usually means the scraper failed quietly, so it
+        # never tombstones the previous listing.
+        removed_ids = [opp_id for opp_id in known if opp_id not in hashes] if hashes else []
+        for opp_id in removed_ids:
+            delta.removed.append({"id": opp_id, "source": source, "removed_at": datetime.utcfromtimestamp(now).isoformat()})
+            log_rows.append((source, opp_id, "removed", now, None))
+
+        if hashes:
+            self._conn.executemany(
+                "INSERT INTO source_items (source, opp_id, content_hash, first_seen, last_seen, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, opp_id) DO UPDATE SET content_hash = excluded.content_hash, "
+                "last_seen = excluded.last_seen, payload = excluded.payload",
+                [(source, opp_id, digest, now, now, json.dumps(opp, default=str)) for opp_id, (opp, digest) in hashes.items()],
+            )
+            self._conn.executemany(
+                "DELETE FROM source_items WHERE source = ? AND opp_id = ?",
+                [(source, opp_id) for opp_id in removed_ids],
+            )
+            posted = [str(opp.get("posted_date")) for opp, _ in hashes.values() if opp.get("posted_date")]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO source_marks (source, listing_hash, last_posted, item_count, last_scan) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source, listing_hash, max(posted) if posted else None, len(hashes), now),
+            )
+        self._conn.executemany(
+            "INSERT INTO change_log (source, opp_id, change, changed_at, payload) VALUES (?, ?, ?, ?, ?)",
+            log_rows,
+        )
+        self._conn.execute("DELETE FROM change_log WHERE changed_at < ?", (now - CHANGE_LOG_RETENTION,))
+        self._conn.commit()
+        return delta
+
+    def changes_since(
+        self,
+        since: datetime,
+        sources: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the net changes recorded after a point in time.
+
+        Returns the latest version of every added/changed opportunity and a
+        tombstone for every id whose last change was a removal.
+        """
+        query = "SELECT source, opp_id, change, changed_at, payload FROM change_log WHERE changed_at > ?"
+        params: List[Any] = [_to_epoch(since)]
+        source_list = list(sources) if sources is not None else None
+        if source_list is not None:
+            if not source_list:
+                return {"opportunities": [], "removed": []}
+            query += f" AND source IN ({','.join('?' * len(source_list))})"
+            params.extend(source_list)
+        query += " ORDER BY seq"
+
+        latest: Dict[tuple, tuple] = {}
+        with self._lock:
+            for source, opp_id, change, changed_at, payload in self._conn.execute(query, params).fetchall():
+                latest[(source, opp_id)] = (change, changed_at, payload)
+
+        opportunities, removed = [], []
+        for (source, opp_id), (change, changed_at, payload) in latest.items():
+            if change == "removed":
+                removed.append({"id": opp_id, "source": source, "removed_at": datetime.utcfromtimestamp(changed_at).isoformat()})
+            else:
+                opportunities.append(json.loads(payload))
+        return {"opportunities": opportunities, "removed": removed}
+
+    def current_items(self) -> List[Dict]:
+        """The latest version of every opportunity each source currently lists"""
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM source_items WHERE payload IS NOT NULL").fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def reset(self, source: Optional[str] = None) -> None:
+        """Forget the high-water marks for one source, or all of them"""
+        with self._lock:
+            for table in ("source_items", "source_marks", "change_log"):
+                if source:
+                    self._conn.execute(f"DELETE FROM {table} WHERE source = ?", (source,))
+                else:
+                    self._conn.execute(f"DELETE FROM {table}")
+            self._conn.commit()
+
+
+_delta_tracker: Optional[ScanDeltaTracker] = None
+
+
+def get_delta_tracker() -> ScanDeltaTracker:
+    """Get the process-wide delta tracker"""
+    global _delta_tracker
+    if _delta_tracker is None:
+        _delta_tracker = ScanDeltaTracker()
+    return _delta_tracker
@@ -5,12 +5,13 @@ Scrapes federal grant opportunities from Grants.gov API.
 """
 
 import asyncio
-import httpx
 import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import hashlib
 
+from .http_pool import pooled_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,7 +96,7 @@ class GrantsGovScraper:
             search_params["agency"] = agency
         
         try:
-            async with httpx.AsyncClient(headers=self.headers, timeout=60) as client:
+            async with pooled_client(headers=self.headers, timeout=60) as client:
                 # Grants.gov uses POST for search
                 response = await client.post(
                     self.SEARCH_API,
@@ -195,7 +196,7 @@ class GrantsGovScraper:
     async def get_grant_details(self, opportunity_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific grant"""
         try:
-            async with httpx.AsyncClient(headers=self.headers, timeout=30) as client:
+            async with pooled_client(headers=self.headers, timeout=30) as client:
                 response = await client.get(
                     f"{self.DETAIL_API}/{opportunity_id}"
                 )
@@ -0,0 +1,238 @@
+"""
+Conditional-GET Response Cache
+==============================
+Persistent ETag / Last-Modified cache for scraper GET requests.
+
+Responses that carry a validator are stored on disk (SQLite). The next
+request for the same URL sends ``If-None-Match`` / ``If-Modified-Since``;
+on ``304 Not Modified`` the stored body is replayed as a normal 200
+response. Hits and misses are counted per source host so the bandwidth
+saved by each scan can be reported.
+
+The SQLite reads and writes run in worker threads (``alookup`` /
+``astore``) so cached GETs don't block the event loop.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "http_cache.db"
+MAX_BODY_BYTES = 5 * 1024 * 1024  # Don't persist bodies larger than this
+MAX_ENTRIES = 2000
+
+# Only these headers are replayed; encoding/length no longer apply to the
+# already-decoded stored body.
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CacheEntry:
+    """A stored response and its validators"""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float
+
+
+@dataclass
+class SourceCacheStats:
+    """Conditional-GET counters for one source host"""
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate * 100, 1),
+            "stored": self.stored,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+class CachedResponse(httpx.Response):
+    """A 200 response replayed from the cache after a 304 revalidation"""
+
+    @property
+    def from_cache(self) -> bool:
+        return True
+
+
+class HTTPCache:
+    """SQLite-backed store of validated GET responses"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._stats: Dict[str, SourceCacheStats] = {}
+        self._stores_since_prune = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error) as e:
+            # Read-only filesystems (serverless) still get a per-process cache
+            logger.warning(f"HTTP cache at {self.path} unavailable ({e}), using in-memory cache")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        return conn
+
+    def _source_stats(self, url: str) -> SourceCacheStats:
+        host = urlsplit(url).hostname or "unknown"
+        if host not in self._stats:
+            self._stats[host] = SourceCacheStats()
+        return self._stats[host]
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Get the stored entry for a URL, if any"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, headers, body, stored_at FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, headers, body, stored_at = row
+        return CacheEntry(url, etag, last_modified, json.loads(headers), body, stored_at)
+
+    async def alookup(self, url: str) -> Optional[CacheEntry]:
+        """``lookup`` in a worker thread"""
+        return await asyncio.to_thread(self.lookup, url)
+
+    def conditional_headers(self, entry: CacheEntry) -> Dict[str, str]:
+        """Validators to send when revalidating an entry"""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _entry_row(self, url: str, response: httpx.Response) -> Optional[tuple]:
+        """Count a miss and return the row to store, or None if not cacheable"""
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        self._source_stats(url).misses += 1
+        if not (etag or last_modified) or len(response.content) > MAX_BODY_BYTES:
+            return None
+        headers = {k: response.headers[k] for k in _STORED_HEADERS if k in response.headers}
+        return (url, etag, last_modified, json.dumps(headers), response.content, time.time())
+
+    def _write(self, row: tuple) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, headers, body, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._conn.commit()
+            self._stores_since_prune += 1
+            prune_due = self._stores_since_prune >= 100
+        if prune_due:
+            self.prune()
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """Store a 200 response if it carries a validator"""
+        row = self._entry_row(url, response)
+        if row is not None:
+            self._write(row)
+            self._source_stats(url).stored += 1
+
+    async def astore(self, url: str, response: httpx.Response) -> None:
+        """``store`` with the disk write in a worker thread"""
+        row = self._entry_row(url, response)
+        if row is not None:
+            await asyncio.to_thread(self._write, row)
+            self._source_stats(url).stored += 1
+
+    def replay(self, entry: CacheEntry, response: httpx.Response) -> CachedResponse:
+        """Build a 200 response from a stored entry after a 304"""
+        stats = self._source_stats(entry.url)
+        stats.hits += 1
+        stats.bytes_saved += len(entry.body)
+        return CachedResponse(
+            200,
+            headers=entry.headers,
+            content=entry.body,
+            request=response.request,
+        )
+
+    def prune(self, max_entries: int = MAX_ENTRIES) -> int:
+        """Keep only the most recently stored entries"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM http_cache WHERE url NOT IN "
+                "(SELECT url FROM http_cache ORDER BY stored_at DESC LIMIT ?)",
+                (max_entries,),
+            )
+            self._conn.commit()
+            self._stores_since_prune = 0
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+        self._stats.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        hits = sum(s.hits for s in self._stats.values())
+        misses = sum(s.misses for s in self._stats.values())
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses) * 100, 1) if hits + misses else 0.0,
+            "bytes_saved": sum(s.bytes_saved for s in self._stats.values()),
+            "by_source": {host: s.to_dict() for host, s in self._stats.items()},
+        }
+
+
+_http_cache: Optional[HTTPCache] = None
+
+
+def get_http_cache() -> HTTPCache:
+    """Get the process-wide conditional-GET cache"""
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = HTTPCache()
+    return _http_cache
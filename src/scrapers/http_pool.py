@@ -0,0 +1,344 @@
+"""
+Shared HTTP Connection Pool
+===========================
+One process-wide pooled httpx client used by every scraper.
+
+Opening a fresh ``httpx.AsyncClient`` per call means a new TLS handshake
+and a new connection pool for every request. Instead, scrapers use
+``pooled_client(...)`` as a drop-in for ``httpx.AsyncClient(...)``:
+
+    async with pooled_client(timeout=15) as client:
+        resp = await client.get(url)
+
+The handle carries per-call defaults (timeout, headers, redirects) and
+forwards requests to the shared client, which keeps connections alive
+between scrapers, speaks HTTP/2 when the ``h2`` package is installed,
+caches DNS lookups, caps concurrent connections per host and revalidates
+GETs through the conditional-GET cache in ``http_cache``.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import socket
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpcore
+import httpx
+
+from .http_cache import get_http_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Pool configuration
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 40
+KEEPALIVE_EXPIRY = 30.0  # seconds an idle connection is kept open
+MAX_CONNECTIONS_PER_HOST = 6
+# API hosts built for many small concurrent requests (detail fan-out)
+HOST_CONNECTION_LIMITS = {
+    "hacker-news.firebaseio.com": 50,
+}
+DNS_CACHE_TTL = 300.0  # seconds
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class PoolStats:
+    """Counters for the shared connection pool"""
+    requests: int = 0
+    failed_requests: int = 0
+    new_connections: int = 0
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0
+    rate_limited: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests served on an already-open connection"""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.new_connections / self.requests)
+
+
+_stats = PoolStats()
+
+
+@dataclass
+class RequestTally:
+    """Outcomes of the requests made while one scraper runs"""
+    requests: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+
+
+# Set by the scan controller around each scraper so its 429s and
+# transport errors can be told apart from a quiet, empty listing
+request_tally: ContextVar[Optional[RequestTally]] = ContextVar("request_tally", default=None)
+
+
+class _CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that caches DNS results and counts new connections.
+
+    TLS still uses the original hostname for SNI and certificate checks,
+    since httpcore passes it separately to ``start_tls``.
+    """
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL):
+        self._backend = httpcore.AnyIOBackend()
+        self._ttl = ttl
+        self._dns_cache: Dict[Tuple[str, int], Tuple[str, float]] = {}
+
+    async def _resolve(self, host: str, port: int) -> str:
+        key = (host, port)
+        cached = self._dns_cache.get(key)
+        if cached and cached[1] > time.monotonic():
+            _stats.dns_cache_hits += 1
+            return cached[0]
+
+        _stats.dns_lookups += 1
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        self._dns_cache[key] = (address, time.monotonic() + self._ttl)
+        return address
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            address = await self._resolve(host, port)
+        except OSError:
+            # Let the underlying backend raise its usual ConnectError
+            address = host
+        _stats.new_connections += 1
+        try:
+            return await self._backend.connect_tcp(
+                address, port, timeout=timeout,
+                local_address=local_address, socket_options=socket_options,
+            )
+        except httpcore.ConnectError:
+            # Stale cache entry - drop it so the next attempt re-resolves
+            self._dns_cache.pop((host, port), None)
+            raise
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+    def clear(self) -> None:
+        self._dns_cache.clear()
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport whose connection pool uses the caching network backend"""
+
+    def __init__(self, limits: httpx.Limits, http2: bool):
+        # Not calling super().__init__: it would build a second pool we'd
+        # only throw away. httpx's request handling just needs self._pool.
+        self.network_backend = _CachingNetworkBackend()
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=self.network_backend,
+        )
+
+    @property
+    def connections(self) -> list:
+        return self._pool.connections
+
+
+# The shared client is bound to the event loop it was created on, so a new
+# one is built if a later ``asyncio.run`` starts a different loop.
+_client: Optional[httpx.AsyncClient] = None
+_transport: Optional[_PooledTransport] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the process-wide pooled client"""
+    global _client, _transport, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        _transport = _PooledTransport(limits=limits, http2=HTTP2_AVAILABLE)
+        _client = httpx.AsyncClient(transport=_transport, limits=limits)
+        _client_loop = loop
+        _host_semaphores.clear()
+        logger.debug(f"Created shared HTTP pool (http2={HTTP2_AVAILABLE})")
+    return _client
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    host = urlsplit(str(url)).hostname or ""
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(_host_limit(host))
+    return _host_semaphores[host]
+
+
+def _host_limit(host: str) -> int:
+    return HOST_CONNECTION_LIMITS.get(host, MAX_CONNECTIONS_PER_HOST)
+
+
+class PooledClient:
+    """
+    Lightweight handle onto the shared client.
+
+    Accepts the same constructor arguments scrapers passed to
+    ``httpx.AsyncClient`` and applies them per request. GET requests are
+    revalidated against the conditional-GET cache. Closing the handle
+    leaves the shared pool open.
+    """
+
+    def __init__(
+        self,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+        headers: Optional[Dict[str, str]] = None,
+        follow_redirects: bool = False,
+        use_cache: bool = True,
+    ):
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.follow_redirects = follow_redirects
+        self.use_cache = use_cache
+
+    async def __aenter__(self) -> "PooledClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def aclose(self) -> None:
+        """No-op: the shared pool outlives individual handles"""
+        return None
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self.headers:
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("follow_redirects", self.follow_redirects)
+
+        client = get_shared_client()
+        cache = get_http_cache() if self.use_cache and method.upper() == "GET" else None
+        entry = None
+        if cache is not None:
+            cache_url = str(client.build_request(method, url, params=kwargs.get("params")).url)
+            entry = await cache.alookup(cache_url)
+            if entry is not None:
+                kwargs["headers"] = {**cache.conditional_headers(entry), **(kwargs.get("headers") or {})}
+
+        tally = request_tally.get()
+        async with _host_semaphore(url):
+            _stats.requests += 1
+            if tally is not None:
+                tally.requests += 1
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                _stats.failed_requests += 1
+                if tally is not None:
+                    tally.failed += 1
+                raise
+        if response.status_code == 429:
+            _stats.rate_limited += 1
+            if tally is not None:
+                tally.rate_limited += 1
+
+        if cache is not None:
+            if response.status_code == 304 and entry is not None:
+                return cache.replay(entry, response)
+            if response.status_code == 200:
+                await cache.astore(cache_url, response)
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+
+def pooled_client(
+    timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    headers: Optional[Dict[str, str]] = None,
+    follow_redirects: bool = False,
+    use_cache: bool = True,
+) -> PooledClient:
+    """
+    Drop-in replacement for ``httpx.AsyncClient(...)`` backed by the shared pool.
+    
+    GET requests go through the conditional-GET cache unless use_cache is False.
+    """
+    return PooledClient(
+        timeout=timeout, headers=headers,
+        follow_redirects=follow_redirects, use_cache=use_cache,
+    )
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Get connection pool statistics"""
+    connections = _transport.connections if _transport and _client and not _client.is_closed else []
+    idle = sum(1 for conn in connections if conn.is_idle())
+    busy_hosts = {
+        name: _host_limit(name) - sem._value
+        for name, sem in _host_semaphores.items()
+        if sem._value < _host_limit(name)
+    }
+    return {
+        "requests": _stats.requests,
+        "failed_requests": _stats.failed_requests,
+        "rate_limited": _stats.rate_limited,
+        "new_connections": _stats.new_connections,
+        "reuse_ratio": round(_stats.reuse_ratio, 3),
+        "open_connections": len(connections),
+        "idle_connections": idle,
+        "active_connections": len(connections) - idle,
+        "busy_hosts": busy_hosts,
+        "dns_lookups": _stats.dns_lookups,
+        "dns_cache_hits": _stats.dns_cache_hits,
+        "http2_enabled": HTTP2_AVAILABLE,
+        "conditional_cache": get_http_cache().stats(),
+        "limits": {
+            "max_connections": MAX_CONNECTIONS,
+            "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+            "max_connections_per_host": MAX_CONNECTIONS_PER_HOST,
+            "keepalive_expiry_seconds": KEEPALIVE_EXPIRY,
+        },
+    }
+
+
+async def close_shared_client() -> None:
+    """Close the shared pool (e.g. on application shutdown)"""
+    global _client, _transport, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _transport = None
+    _client_loop = None
+    _host_semaphores.clear()
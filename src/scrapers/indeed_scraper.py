@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 import hashlib
 import json
 
+from .http_pool import pooled_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,7 +137,7 @@ class IndeedScraper:
         jobs = []
         
         try:
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30) as client:
+            async with pooled_client(headers=self.headers, follow_redirects=True, timeout=30) as client:
                 response = await client.get(self.SEARCH_URL, params=params)
                 response.raise_for_status()
                 
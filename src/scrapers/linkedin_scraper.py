@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 import hashlib
 import json
 
+from .http_pool import pooled_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,7 +151,7 @@ class LinkedInScraper:
         jobs = []
         
         try:
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30) as client:
+            async with pooled_client(headers=self.headers, follow_redirects=True, timeout=30) as client:
                 response = await client.get(self.JOBS_API, params=params)
                 response.raise_for_status()
                 
@@ -241,7 +243,7 @@ class LinkedInScraper:
         try:
             url = self.JOB_DETAIL_URL.format(job_id=job_id)
             
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30) as client:
+            async with pooled_client(headers=self.headers, follow_redirects=True, timeout=30) as client:
                 response = await client.get(url)
                 response.raise_for_status()
                 
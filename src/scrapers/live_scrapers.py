@@ -12,7 +12,6 @@ Phase 1 Improvements:
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -22,8 +21,13 @@ import json
 import hashlib
 from dataclasses import dataclass
 
-from .utils import safe_request, safe_json_request, retry_on_failure, RateLimiter
+from .utils import safe_request, safe_json_request, retry_on_failure, Rate, RateLimiter, fan_out
+from .adaptive import AdaptiveScanController
 from .base_scraper import get_scraper_metrics
+from .dedup import get_dedup_index, merge_duplicates
+from .delta_scan import get_delta_tracker, opportunity_key
+from .http_pool import pooled_client
+from .parsing import ParsedItem, parse_items
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +37,7 @@ _rate_limiters: Dict[str, RateLimiter] = {}
 def get_rate_limiter(source: str, rate: float = 1.0) -> RateLimiter:
     """Get or create a rate limiter for a source"""
     if source not in _rate_limiters:
-        _rate_limiters[source] = RateLimiter(rate=rate)
+        _rate_limiters[source] = RateLimiter(Rate(rate), name=f"scraper:{source}")
     return _rate_limiters[source]
 
 # Common headers to avoid blocks (removed Accept-Encoding to avoid compression issues)
@@ -53,6 +57,27 @@ def generate_id(source: str, title: str, url: str) -> str:
     return hashlib.md5(content.encode()).hexdigest()[:16]
 
 
+async def find_links(markup: str, href_pattern: str, limit: Optional[int] = None, flags: int = 0) -> List[ParsedItem]:
+    """Anchors whose href matches a regex, parsed off the event loop"""
+    pattern = re.compile(href_pattern, flags)
+    links = await parse_items(markup, "a[href]")
+    return [link for link in links if pattern.search(link.get("href", ""))][:limit]
+
+
+async def find_cards(
+    markup: str,
+    class_pattern: str,
+    children: List[str],
+    limit: Optional[int] = None,
+    tags: tuple = ("div", "article"),
+) -> List[ParsedItem]:
+    """Elements whose class matches a regex (case-insensitive), parsed off the event loop"""
+    pattern = re.compile(class_pattern, re.I)
+    selector = ", ".join(f"{tag}[class]" for tag in tags)
+    cards = await parse_items(markup, selector, children)
+    return [card for card in cards if pattern.search(card.get("class", ""))][:limit]
+
+
 # =============================================================================
 # REMOTEOK.COM - Working Public API
 # =============================================================================
@@ -74,7 +99,7 @@ async def scrape_remoteok_live(limit: int = 100) -> List[Dict]:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "application/json",
         }
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
+        async with pooled_client(timeout=30.0, headers=headers) as client:
             # RemoteOK has a public JSON endpoint
             response = await client.get("https://remoteok.com/api")
             
@@ -140,7 +165,7 @@ async def scrape_github_jobs_awesome_list(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS) as client:
             # Get the awesome-remote-job README
             response = await client.get(
                 "https://raw.githubusercontent.com/lukasz-madon/awesome-remote-job/master/README.md"
@@ -190,7 +215,7 @@ async def scrape_hackernews_hiring(limit: int = 100) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS) as client:
             # Search for "Who is hiring" posts
             search_url = "https://hn.algolia.com/api/v1/search_by_date"
             params = {
@@ -217,12 +242,15 @@ async def scrape_hackernews_hiring(limit: int = 100) -> List[Dict]:
                             story = item_response.json()
                             kids = story.get("kids", [])[:limit]
                             
-                            # Fetch each comment (job posting)
-                            for kid_id in kids[:50]:  # Limit to avoid too many requests
-                                comment_url = f"https://hacker-news.firebaseio.com/v0/item/{kid_id}.json"
-                                comment_response = await client.get(comment_url)
-                                
-                                if comment_response.status_code == 200:
+                            # Fetch the comments (job postings) concurrently
+                            kids = kids[:50]  # Limit to avoid too many requests
+                            comment_responses = await fan_out(
+                                kids,
+                                lambda kid_id: client.get(f"https://hacker-news.firebaseio.com/v0/item/{kid_id}.json"),
+                                max_concurrent=50,
+                            )
+                            for kid_id, comment_response in zip(kids, comment_responses):
+                                if comment_response is not None and comment_response.status_code == 200:
                                     comment = comment_response.json()
                                     text = comment.get("text", "")
                                     
@@ -253,8 +281,6 @@ async def scrape_hackernews_hiring(limit: int = 100) -> List[Dict]:
                                             "scraped_at": datetime.utcnow().isoformat(),
                                         }
                                         opportunities.append(opp)
-                                        
-                                await asyncio.sleep(0.1)  # Rate limit
                         break  # Only process most recent thread
                         
                 logger.info(f"✅ HackerNews: Scraped {len(opportunities)} live jobs")
@@ -275,7 +301,7 @@ async def scrape_scholarships_live(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Bold.org uses a GraphQL/API - try fetching featured scholarships
             # First try their scholarship listing pages
             pages_to_try = [
@@ -294,10 +320,8 @@ async def scrape_scholarships_live(limit: int = 50) -> List[Dict]:
                     response = await client.get(page_url)
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        
                         # Find individual scholarship links (not category links)
-                        for link in soup.find_all('a', href=True):
+                        for link in await parse_items(response.text, 'a[href]'):
                             href = link.get('href', '')
                             text = link.get_text(strip=True)
                             
@@ -394,7 +418,7 @@ async def scrape_yc_companies(limit: int = 100) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS) as client:
             # YC has a public API for their company directory
             response = await client.get(
                 "https://api.ycombinator.com/v0.1/companies",
@@ -449,7 +473,7 @@ async def scrape_grants_gov_live(limit: int = 50) -> List[Dict]:
         import warnings
         warnings.filterwarnings("ignore")
         
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Use the search endpoint which returns JSON
             try:
                 search_response = await client.post(
@@ -563,7 +587,7 @@ async def scrape_devpost_hackathons(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Try the API endpoint WITHOUT the status filter (it returns empty with status filter)
             response = await client.get("https://devpost.com/api/hackathons", params={
                 "page": 1
@@ -612,13 +636,12 @@ async def scrape_devpost_hackathons(limit: int = 50) -> List[Dict]:
             if len(opportunities) == 0:
                 response = await client.get("https://devpost.com/hackathons")
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
                     # Find hackathon cards
-                    cards = soup.find_all('a', class_='hackathon-tile')[:limit]
+                    cards = await parse_items(response.text, 'a.hackathon-tile', ['h2', 'h3'], limit=limit)
                     
                     for card in cards:
                         try:
-                            title = card.find('h2') or card.find('h3')
+                            title = card.select_one('h2') or card.select_one('h3')
                             title_text = title.get_text(strip=True) if title else "Hackathon"
                             url = card.get('href', '')
                             if url and not url.startswith('http'):
@@ -660,15 +683,17 @@ async def scrape_producthunt_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS) as client:
             # Use the public timeline
             response = await client.get("https://www.producthunt.com/feed", params={"kind": "tech"})
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
                 # Parse RSS/Atom feed
-                entries = soup.find_all('entry')[:limit] or soup.find_all('item')[:limit]
+                fields = ['title', 'link', 'summary']
+                entries = (
+                    await parse_items(response.text, 'entry', fields, limit=limit, mode='xml')
+                    or await parse_items(response.text, 'item', fields, limit=limit, mode='xml')
+                )
                 
                 for entry in entries:
                     try:
@@ -714,7 +739,7 @@ async def scrape_arbeitnow_jobs(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS) as client:
             response = await client.get("https://www.arbeitnow.com/api/job-board-api")
             
             if response.status_code == 200:
@@ -759,7 +784,7 @@ async def scrape_findwork_dev(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Use JoBoard (open source job board) or similar
             # Try Awesome Remote Job API from GitHub
             try:
@@ -845,7 +870,7 @@ async def scrape_jobicy_remote(limit: int = 50) -> List[Dict]:
         import warnings
         warnings.filterwarnings("ignore")
         
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Use Himalayas API - it works!
             response = await client.get("https://himalayas.app/jobs/api")
             
@@ -883,8 +908,10 @@ async def scrape_jobicy_remote(limit: int = 50) -> List[Dict]:
                 try:
                     wwr_response = await client.get("https://weworkremotely.com/remote-jobs.rss")
                     if wwr_response.status_code == 200:
-                        soup = BeautifulSoup(wwr_response.text, 'xml')
-                        items = soup.find_all('item')[:limit - len(opportunities)]
+                        items = await parse_items(
+                            wwr_response.text, 'item', ['title', 'link', 'description'],
+                            limit=limit - len(opportunities), mode='xml',
+                        )
                         
                         for item in items:
                             try:
@@ -892,7 +919,7 @@ async def scrape_jobicy_remote(limit: int = 50) -> List[Dict]:
                                 link = item.find('link')
                                 link_text = ""
                                 if link:
-                                    link_text = link.get_text(strip=True) if link.string else str(link.next_sibling).strip() if link.next_sibling else ""
+                                    link_text = link.get_text(strip=True)
                                 desc = item.find('description').get_text(strip=True) if item.find('description') else ""
                                 
                                 opp = {
@@ -932,15 +959,13 @@ async def scrape_otta_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Otta doesn't have public API, scrape their job listings
             response = await client.get("https://otta.com/jobs")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
                 # Look for job cards/links
-                job_links = soup.find_all('a', href=re.compile(r'/jobs/'))[:limit]
+                job_links = await find_links(response.text, r'/jobs/', limit=limit)
                 
                 for link in job_links:
                     try:
@@ -982,23 +1007,21 @@ async def scrape_startup_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://startup.jobs/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
                 # Find job listings
-                job_cards = soup.find_all(['article', 'div'], class_=re.compile(r'job|listing|card', re.I))[:limit]
+                job_cards = await find_cards(response.text, r'job|listing|card', ['h2, h3, a', 'a[href]'], limit=limit)
                 
                 for card in job_cards:
                     try:
-                        title_elem = card.find(['h2', 'h3', 'a'])
+                        title_elem = card.select_one('h2, h3, a')
                         if title_elem:
                             title = title_elem.get_text(strip=True)
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
+                            link = title_elem.get('href', '')
                             if not link:
-                                link_elem = card.find('a', href=True)
+                                link_elem = card.select_one('a[href]')
                                 link = link_elem['href'] if link_elem else ''
                             
                             if title and len(title) > 5:
@@ -1036,7 +1059,7 @@ async def scrape_trueup_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # TrueUp has an API
             response = await client.get("https://www.trueup.io/api/jobs", params={"limit": limit})
             
@@ -1069,8 +1092,7 @@ async def scrape_trueup_jobs(limit: int = 30) -> List[Dict]:
             if not opportunities:
                 response = await client.get("https://www.trueup.io/jobs")
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    job_links = soup.find_all('a', href=re.compile(r'/job/'))[:limit]
+                    job_links = await find_links(response.text, r'/job/', limit=limit)
                     
                     for link in job_links:
                         title = link.get_text(strip=True)
@@ -1110,23 +1132,21 @@ async def scrape_scholarships360(limit: int = 20) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://scholarships360.org/scholarships/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
                 # Find scholarship listings
-                cards = soup.find_all(['article', 'div'], class_=re.compile(r'scholarship|listing', re.I))[:limit]
+                cards = await find_cards(response.text, r'scholarship|listing', ['h2, h3, a', 'a[href]'], limit=limit)
                 
                 for card in cards:
                     try:
-                        title_elem = card.find(['h2', 'h3', 'a'])
+                        title_elem = card.select_one('h2, h3, a')
                         if title_elem:
                             title = title_elem.get_text(strip=True)
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
+                            link = title_elem.get('href', '')
                             if not link:
-                                link_elem = card.find('a', href=True)
+                                link_elem = card.select_one('a[href]')
                                 link = link_elem['href'] if link_elem else ''
                             
                             # Extract amount if present
@@ -1174,7 +1194,7 @@ async def scrape_open_grants(limit: int = 20) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Try various grant aggregators
             sources = [
                 ("https://www.instrumentl.com/grants", "Instrumentl"),
@@ -1188,10 +1208,8 @@ async def scrape_open_grants(limit: int = 20) -> List[Dict]:
                 try:
                     response = await client.get(url)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        
                         # Find grant listings
-                        grant_links = soup.find_all('a', href=re.compile(r'grant|funding', re.I))[:limit // 2]
+                        grant_links = await find_links(response.text, r'grant|funding', limit=limit // 2, flags=re.I)
                         
                         for link in grant_links:
                             title = link.get_text(strip=True)
@@ -1234,13 +1252,12 @@ async def scrape_crunchbase_funding(limit: int = 20) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Crunchbase news RSS
             response = await client.get("https://news.crunchbase.com/feed/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'xml')
-                items = soup.find_all('item')[:limit]
+                items = await parse_items(response.text, 'item', ['title', 'link', 'description'], limit=limit, mode='xml')
                 
                 for item in items:
                     try:
@@ -1286,30 +1303,29 @@ async def scrape_mlh_hackathons(limit: int = 20) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://mlh.io/seasons/2025/events")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
                 # Find event cards
-                events = soup.find_all(['div', 'article'], class_=re.compile(r'event|hackathon', re.I))[:limit]
+                date_selector = '[class*=date i], [class*=when i]'
+                events = await find_cards(response.text, r'event|hackathon', ['h3, h2, a', 'a[href]', date_selector], limit=limit)
                 
                 for event in events:
                     try:
-                        title_elem = event.find(['h3', 'h2', 'a'])
+                        title_elem = event.select_one('h3, h2, a')
                         if title_elem:
                             title = title_elem.get_text(strip=True)
-                            link = title_elem.get('href', '') if title_elem.name == 'a' else ''
+                            link = title_elem.get('href', '')
                             if not link:
-                                link_elem = event.find('a', href=True)
+                                link_elem = event.select_one('a[href]')
                                 link = link_elem['href'] if link_elem else ''
                             
                             if title and len(title) > 3:
                                 url = link if link.startswith('http') else f"https://mlh.io{link}"
                                 
                                 # Extract date if present
-                                date_elem = event.find(class_=re.compile(r'date|when', re.I))
+                                date_elem = event.select_one(date_selector)
                                 date = date_elem.get_text(strip=True) if date_elem else ""
                                 
                                 opp = {
@@ -1335,8 +1351,7 @@ async def scrape_mlh_hackathons(limit: int = 20) -> List[Dict]:
             if not opportunities:
                 response = await client.get("https://mlh.io/events")
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    links = soup.find_all('a', href=re.compile(r'hackathon|event', re.I))[:limit]
+                    links = await find_links(response.text, r'hackathon|event', limit=limit, flags=re.I)
                     
                     for link in links:
                         title = link.get_text(strip=True)
@@ -1369,6 +1384,29 @@ async def scrape_mlh_hackathons(limit: int = 20) -> List[Dict]:
 # =============================================================================
 # AFRICAN OPPORTUNITIES - OpportunitiesForAfricans.com
 # =============================================================================
+def _extract_ofa_articles(markup: str) -> List[Dict[str, str]]:
+    """Title, link, text and summary of each OFA article post (run on a thread)"""
+    soup = BeautifulSoup(markup, 'lxml')
+    articles = []
+    for article in soup.find_all('article')[:15]:
+        # Try multiple title selectors (OFA uses penci-entry-title)
+        title_elem = article.find('h2', class_=re.compile(r'entry-title|title', re.I))
+        if not title_elem:
+            title_elem = article.find(['h2', 'h3'])
+        if not title_elem:
+            continue
+        
+        link_elem = title_elem.find('a') or article.find('a', href=True)
+        desc_elem = article.find('div', class_='entry-content') or article.find('p')
+        articles.append({
+            "title": title_elem.get_text(strip=True),
+            "link": link_elem.get('href', '') if link_elem else '',
+            "content": article.get_text(),
+            "description": desc_elem.get_text(strip=True)[:500] if desc_elem else "",
+        })
+    return articles
+
+
 @retry_on_failure(retries=2, delay=3.0)
 async def scrape_ofa_live(limit: int = 50) -> List[Dict]:
     """
@@ -1378,7 +1416,7 @@ async def scrape_ofa_live(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=45.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=45.0, headers=HEADERS, follow_redirects=True) as client:
             # Categories to scrape
             categories = [
                 ("scholarships", "scholarship"),
@@ -1390,63 +1428,55 @@ async def scrape_ofa_live(limit: int = 50) -> List[Dict]:
                 ("entrepreneurship", "accelerator"),
             ]
             
-            for category_slug, opp_type in categories:
+            # Fetch every category page at once, then parse in order
+            responses = await fan_out(
+                categories,
+                lambda category: client.get(f"https://www.opportunitiesforafricans.com/category/{category[0]}/"),
+                timeout=30.0,
+            )
+            
+            for (category_slug, opp_type), response in zip(categories, responses):
                 if len(opportunities) >= limit:
                     break
                     
                 try:
-                    url = f"https://www.opportunitiesforafricans.com/category/{category_slug}/"
-                    response = await client.get(url)
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        
+                    if response is not None and response.status_code == 200:
                         # Find article posts
-                        articles = soup.find_all('article')[:15]
+                        articles = await asyncio.to_thread(_extract_ofa_articles, response.text)
                         
                         for article in articles:
                             try:
-                                # Try multiple title selectors (OFA uses penci-entry-title)
-                                title_elem = article.find('h2', class_=re.compile(r'entry-title|title', re.I))
-                                if not title_elem:
-                                    title_elem = article.find(['h2', 'h3'])
+                                title = article["title"]
+                                link = article["link"]
                                 
-                                if title_elem:
-                                    link_elem = title_elem.find('a') or article.find('a', href=True)
-                                    title = title_elem.get_text(strip=True)
-                                    link = link_elem.get('href', '') if link_elem else ''
+                                if title and len(title) > 10 and link:
+                                    # Extract deadline if mentioned
+                                    deadline = ""
+                                    deadline_match = re.search(r'deadline[:\s]*(\w+\s+\d{1,2},?\s+\d{4})', article["content"], re.I)
+                                    if deadline_match:
+                                        deadline = deadline_match.group(1)
                                     
-                                    if title and len(title) > 10 and link:
-                                        # Extract deadline if mentioned
-                                        content = article.get_text()
-                                        deadline = ""
-                                        deadline_match = re.search(r'deadline[:\s]*(\w+\s+\d{1,2},?\s+\d{4})', content, re.I)
-                                        if deadline_match:
-                                            deadline = deadline_match.group(1)
-                                        
-                                        # Extract description
-                                        desc_elem = article.find('div', class_='entry-content') or article.find('p')
-                                        description = desc_elem.get_text(strip=True)[:500] if desc_elem else ""
-                                        
-                                        opp = {
-                                            "id": generate_id("ofa", title, link),
-                                            "title": title[:200],
-                                            "company": "Various Organizations",
-                                            "location": "Africa / Global",
-                                            "description": description or f"{opp_type.title()} opportunity for Africans",
-                                            "apply_url": link,
-                                            "source": "OpportunitiesForAfricans",
-                                            "opportunity_type": opp_type,
-                                            "remote": True,
-                                            "deadline": deadline,
-                                            "tags": ["africa", category_slug, opp_type, "international"],
-                                            "match_score": 85,
-                                            "scraped_at": datetime.utcnow().isoformat(),
-                                        }
-                                        opportunities.append(opp)
-                                        
-                                        if len(opportunities) >= limit:
-                                            break
+                                    description = article["description"]
+                                    
+                                    opp = {
+                                        "id": generate_id("ofa", title, link),
+                                        "title": title[:200],
+                                        "company": "Various Organizations",
+                                        "location": "Africa / Global",
+                                        "description": description or f"{opp_type.title()} opportunity for Africans",
+                                        "apply_url": link,
+                                        "source": "OpportunitiesForAfricans",
+                                        "opportunity_type": opp_type,
+                                        "remote": True,
+                                        "deadline": deadline,
+                                        "tags": ["africa", category_slug, opp_type, "international"],
+                                        "match_score": 85,
+                                        "scraped_at": datetime.utcnow().isoformat(),
+                                    }
+                                    opportunities.append(opp)
+                                    
+                                    if len(opportunities) >= limit:
+                                        break
                             except Exception as e:
                                 logger.debug(f"Error parsing OFA article: {e}")
                                 continue
@@ -1454,17 +1484,13 @@ async def scrape_ofa_live(limit: int = 50) -> List[Dict]:
                 except Exception as e:
                     logger.debug(f"Error fetching OFA category {category_slug}: {e}")
                     continue
-                
-                await asyncio.sleep(0.5)  # Rate limit between categories
             
             # Fallback: If no results, try the homepage
             if not opportunities:
                 try:
                     response = await client.get("https://www.opportunitiesforafricans.com/")
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        
-                        for link in soup.find_all('a', href=re.compile(r'opportunitiesforafricans.com/\d{4}/')):
+                        for link in await find_links(response.text, r'opportunitiesforafricans.com/\d{4}/'):
                             title = link.get_text(strip=True)
                             href = link.get('href', '')
                             
@@ -1510,23 +1536,21 @@ async def scrape_vc4africa_live(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=45.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=45.0, headers=HEADERS, follow_redirects=True) as client:
             # Try funding page
             try:
                 response = await client.get("https://vc4a.com/funding/")
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    
                     # Find funding opportunities
-                    items = soup.find_all(['div', 'article'], class_=re.compile(r'funding|opportunity|program|card', re.I))
+                    items = await find_cards(response.text, r'funding|opportunity|program|card', ['h2, h3, h4, a', 'a[href]'])
                     
                     for item in items[:limit]:
                         try:
-                            title_elem = item.find(['h2', 'h3', 'h4', 'a'])
+                            title_elem = item.select_one('h2, h3, h4, a')
                             if title_elem:
                                 title = title_elem.get_text(strip=True)
-                                link_elem = title_elem if title_elem.name == 'a' else item.find('a', href=True)
+                                link_elem = title_elem if 'href' in title_elem.attrs else item.select_one('a[href]')
                                 link = link_elem.get('href', '') if link_elem else ''
                                 
                                 if title and len(title) > 5:
@@ -1566,17 +1590,15 @@ async def scrape_vc4africa_live(limit: int = 30) -> List[Dict]:
                 response = await client.get("https://vc4a.com/programs/")
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    
                     # Find program listings
-                    programs = soup.find_all(['div', 'article'], class_=re.compile(r'program|accelerator|incubator|card', re.I))
+                    programs = await find_cards(response.text, r'program|accelerator|incubator|card', ['h2, h3, h4, a', 'a[href]'])
                     
                     for prog in programs[:limit - len(opportunities)]:
                         try:
-                            title_elem = prog.find(['h2', 'h3', 'h4', 'a'])
+                            title_elem = prog.select_one('h2, h3, h4, a')
                             if title_elem:
                                 title = title_elem.get_text(strip=True)
-                                link_elem = title_elem if title_elem.name == 'a' else prog.find('a', href=True)
+                                link_elem = title_elem if 'href' in title_elem.attrs else prog.select_one('a[href]')
                                 link = link_elem.get('href', '') if link_elem else ''
                                 
                                 if title and len(title) > 5:
@@ -1608,17 +1630,15 @@ async def scrape_vc4africa_live(limit: int = 30) -> List[Dict]:
                 response = await client.get("https://vc4a.com/ventures/")
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    
                     # Find venture/startup listings (potential job opportunities)
-                    ventures = soup.find_all(['div', 'article'], class_=re.compile(r'venture|startup|company', re.I))[:10]
+                    ventures = await find_cards(response.text, r'venture|startup|company', ['h2, h3, h4, a', 'a[href]'], limit=10)
                     
                     for venture in ventures:
                         try:
-                            title_elem = venture.find(['h2', 'h3', 'h4', 'a'])
+                            title_elem = venture.select_one('h2, h3, h4, a')
                             if title_elem:
                                 title = title_elem.get_text(strip=True)
-                                link_elem = title_elem if title_elem.name == 'a' else venture.find('a', href=True)
+                                link_elem = title_elem if 'href' in title_elem.attrs else venture.select_one('a[href]')
                                 link = link_elem.get('href', '') if link_elem else ''
                                 
                                 if title and len(title) > 3:
@@ -1740,7 +1760,7 @@ async def scrape_jsearch_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Try multiple job RSS feeds
             feeds = [
                 ("https://stackoverflow.com/jobs/feed", "StackOverflow"),
@@ -1754,8 +1774,10 @@ async def scrape_jsearch_jobs(limit: int = 30) -> List[Dict]:
                 try:
                     resp = await client.get(feed_url, timeout=15.0)
                     if resp.status_code == 200:
-                        soup = BeautifulSoup(resp.text, 'xml')
-                        items = soup.find_all(['item', 'entry'])[:10]
+                        items = (
+                            await parse_items(resp.text, 'item', ['title', 'link'], limit=10, mode='xml')
+                            or await parse_items(resp.text, 'entry', ['title', 'link'], limit=10, mode='xml')
+                        )
                         for item in items:
                             title = item.find('title')
                             link = item.find('link')
@@ -1790,12 +1812,11 @@ async def scrape_landing_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://landing.jobs/jobs", params={"page": 1})
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_cards = soup.find_all('a', href=re.compile(r'/at/'))[:limit]
+                job_cards = await find_links(response.text, r'/at/', limit=limit)
                 
                 for card in job_cards:
                     title = card.get_text(strip=True)
@@ -1830,12 +1851,11 @@ async def scrape_nodesk_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://nodesk.co/remote-jobs/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/remote-jobs/'))[:limit]
+                job_links = await find_links(response.text, r'/remote-jobs/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -1870,12 +1890,11 @@ async def scrape_justremote(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://justremote.co/remote-jobs")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/remote-jobs/'))[:limit]
+                job_links = await find_links(response.text, r'/remote-jobs/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -1910,14 +1929,12 @@ async def scrape_flexjobs_preview(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://www.flexjobs.com/blog/post/best-remote-jobs/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                
                 # Find job mentions in their blog
-                paragraphs = soup.find_all('p')
+                paragraphs = await parse_items(response.text, 'p')
                 job_titles = set()
                 
                 for p in paragraphs:
@@ -1956,18 +1973,18 @@ async def scrape_builtin_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             cities = ["remote", "nyc", "austin", "boston", "chicago", "colorado", "la", "seattle", "sf"]
             
-            for city in cities[:3]:  # Limit to avoid too many requests
+            cities = cities[:3]  # Limit to avoid too many requests
+            responses = await fan_out(cities, lambda city: client.get(f"https://builtin.com/jobs/{city}"))
+            
+            for city, response in zip(cities, responses):
                 if len(opportunities) >= limit:
                     break
                     
-                response = await client.get(f"https://builtin.com/jobs/{city}")
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'lxml')
-                    job_cards = soup.find_all('a', href=re.compile(r'/job/'))[:10]
+                if response is not None and response.status_code == 200:
+                    job_cards = await find_links(response.text, r'/job/', limit=10)
                     
                     for card in job_cards:
                         title = card.get_text(strip=True)
@@ -1989,8 +2006,6 @@ async def scrape_builtin_jobs(limit: int = 30) -> List[Dict]:
                                 "scraped_at": datetime.utcnow().isoformat(),
                             }
                             opportunities.append(opp)
-                            
-                await asyncio.sleep(0.5)
                         
             logger.info(f"✅ BuiltIn: {len(opportunities)} jobs")
     except Exception as e:
@@ -2004,12 +2019,11 @@ async def scrape_dice_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://www.dice.com/jobs", params={"q": "developer", "countryCode": "US", "radius": "30", "radiusUnit": "mi", "page": 1, "pageSize": limit})
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/job-detail/'))[:limit]
+                job_links = await find_links(response.text, r'/job-detail/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -2044,13 +2058,12 @@ async def scrape_angel_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Try Wellfound (formerly AngelList Talent)
             response = await client.get("https://wellfound.com/jobs")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/jobs/'))[:limit]
+                job_links = await find_links(response.text, r'/jobs/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -2085,12 +2098,11 @@ async def scrape_crypto_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://cryptojobslist.com/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/jobs/'))[:limit]
+                job_links = await find_links(response.text, r'/jobs/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -2125,13 +2137,12 @@ async def scrape_ai_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # Try ai-jobs.net
             response = await client.get("https://ai-jobs.net/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/job/'))[:limit]
+                job_links = await find_links(response.text, r'/job/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -2166,12 +2177,11 @@ async def scrape_climate_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://climatebase.org/jobs")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_links = soup.find_all('a', href=re.compile(r'/jobs/'))[:limit]
+                job_links = await find_links(response.text, r'/jobs/', limit=limit)
                 
                 for link in job_links:
                     title = link.get_text(strip=True)
@@ -2206,13 +2216,12 @@ async def scrape_impact_jobs(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             # 80000 Hours job board
             response = await client.get("https://jobs.80000hours.org/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                job_cards = soup.find_all('a', href=re.compile(r'/job/'))[:limit]
+                job_cards = await find_links(response.text, r'/job/', limit=limit)
                 
                 for card in job_cards:
                     title = card.get_text(strip=True)
@@ -2247,12 +2256,11 @@ async def scrape_euro_scholarships(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://www.scholars4dev.com/category/europe-scholarships/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                links = soup.find_all('a', href=re.compile(r'/\d{4}/\d{2}/'))[:limit]
+                links = await find_links(response.text, r'/\d{4}/\d{2}/', limit=limit)
                 
                 for link in links:
                     title = link.get_text(strip=True)
@@ -2576,18 +2584,17 @@ async def scrape_mlh_hackathons(limit: int = 30) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://mlh.io/seasons/2025/events")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                event_cards = soup.find_all(['div', 'article'], class_=re.compile(r'event|card', re.I))[:limit]
+                event_cards = await find_cards(response.text, r'event|card', ['h3, h4, a', 'a[href]'], limit=limit)
                 
                 for card in event_cards:
-                    title_elem = card.find(['h3', 'h4', 'a'])
+                    title_elem = card.select_one('h3, h4, a')
                     if title_elem:
                         title = title_elem.get_text(strip=True)
-                        link = card.find('a', href=True)
+                        link = card.select_one('a[href]')
                         href = link['href'] if link else ''
                         
                         if title and len(title) > 3:
@@ -2686,12 +2693,11 @@ async def scrape_scholarships360(limit: int = 50) -> List[Dict]:
     opportunities = []
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=HEADERS, follow_redirects=True) as client:
             response = await client.get("https://scholarships360.org/scholarships/")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
-                links = soup.find_all('a', href=re.compile(r'/scholarships/'))[:limit]
+                links = await find_links(response.text, r'/scholarships/', limit=limit)
                 
                 seen = set()
                 for link in links:
@@ -2784,11 +2790,10 @@ async def scrape_stackoverflow_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Stack Overflow Jobs RSS feed."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://stackoverflow.com/jobs/feed")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link", "description"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     desc = item.find("description").text if item.find("description") else ""
@@ -2814,11 +2819,10 @@ async def scrape_indeed_rss(limit: int = 20) -> List[Dict]:
     """Scrape Indeed RSS feed for remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.indeed.com/rss?q=remote+developer&l=")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -2842,11 +2846,10 @@ async def scrape_dribbble_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Dribbble jobs for design opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://dribbble.com/jobs?location=Anywhere")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-board-job-card, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-board-job-card, .job", ["h3, .job-title, a", "a"], limit=limit):
                     title_el = job.select_one("h3, .job-title, a")
                     title = title_el.text.strip() if title_el else "Design Job"
                     link = job.select_one("a")
@@ -2873,11 +2876,10 @@ async def scrape_behance_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Behance job listings."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.behance.net/joblist")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".JobCard, .job-card")[:limit]:
+                for job in await parse_items(resp.text, ".JobCard, .job-card", ["h3, .JobCard-title"], limit=limit):
                     title_el = job.select_one("h3, .JobCard-title")
                     title = title_el.text.strip() if title_el else "Creative Job"
                     opportunities.append({
@@ -2902,11 +2904,10 @@ async def scrape_authenticjobs(limit: int = 15) -> List[Dict]:
     """Scrape Authentic Jobs RSS."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://authenticjobs.com/rss/custom.rss")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -2930,7 +2931,7 @@ async def scrape_whoishiring(limit: int = 25) -> List[Dict]:
     """Scrape whoishiring.io aggregator."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://whoishiring.io/api/jobs?page=1")
             if resp.status_code == 200:
                 data = resp.json()
@@ -2956,11 +2957,10 @@ async def scrape_techcrunch_jobs(limit: int = 15) -> List[Dict]:
     """Scrape TechCrunch job board."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://techcrunch.com/tag/jobs/feed/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -2982,11 +2982,10 @@ async def scrape_larajobs(limit: int = 15) -> List[Dict]:
     """Scrape LaraJobs for Laravel/PHP jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://larajobs.com/feed")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -3009,7 +3008,7 @@ async def scrape_vuejobs(limit: int = 15) -> List[Dict]:
     """Scrape VueJobs for Vue.js positions."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://vuejobs.com/api/jobs")
             if resp.status_code == 200:
                 data = resp.json()
@@ -3034,7 +3033,7 @@ async def scrape_reactjobs(limit: int = 15) -> List[Dict]:
     """Scrape React job board."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://reactjobsboard.com/api/jobs")
             if resp.status_code == 200:
                 data = resp.json()
@@ -3059,11 +3058,10 @@ async def scrape_pythonjobs(limit: int = 15) -> List[Dict]:
     """Scrape Python.org job board."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.python.org/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".list-recent-jobs li, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".list-recent-jobs li, .job-listing", ["a, h2"], limit=limit):
                     title_el = job.select_one("a, h2")
                     title = title_el.text.strip() if title_el else "Python Job"
                     link = title_el.get("href", "") if title_el else ""
@@ -3088,11 +3086,10 @@ async def scrape_golangcafe(limit: int = 15) -> List[Dict]:
     """Scrape Golang Cafe jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://golang.cafe/Golang+Remote+Jobs.rss")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -3116,7 +3113,7 @@ async def scrape_rustjobs(limit: int = 15) -> List[Dict]:
     """Scrape Rust jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://rustjobs.dev/api/jobs")
             if resp.status_code == 200:
                 data = resp.json()
@@ -3141,11 +3138,10 @@ async def scrape_nodesk_remote(limit: int = 20) -> List[Dict]:
     """Scrape Nodesk remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://nodesk.co/remote-jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article", ["h2, h3, .title"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Remote Job"
                     opportunities.append({
@@ -3168,11 +3164,10 @@ async def scrape_dailyremote(limit: int = 20) -> List[Dict]:
     """Scrape DailyRemote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://dailyremote.com/remote-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-item, .job-card")[:limit]:
+                for job in await parse_items(resp.text, ".job-item, .job-card", ["h2, h3, .job-title"], limit=limit):
                     title_el = job.select_one("h2, h3, .job-title")
                     title = title_el.text.strip() if title_el else "Remote Job"
                     opportunities.append({
@@ -3195,11 +3190,10 @@ async def scrape_remoteleaf(limit: int = 20) -> List[Dict]:
     """Scrape RemoteLeaf jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remoteleaf.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3"], limit=limit):
                     title_el = job.select_one("h2, h3")
                     title = title_el.text.strip() if title_el else "Remote Job"
                     opportunities.append({
@@ -3222,7 +3216,7 @@ async def scrape_workingnomads(limit: int = 20) -> List[Dict]:
     """Scrape Working Nomads API."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.workingnomads.com/api/exposed_jobs/")
             if resp.status_code == 200:
                 data = resp.json()
@@ -3248,11 +3242,10 @@ async def scrape_remoteco(limit: int = 20) -> List[Dict]:
     """Scrape Remote.co jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remote.co/remote-jobs/developer/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".card, .job_listing")[:limit]:
+                for job in await parse_items(resp.text, ".card, .job_listing", ["h2, .job-title, a"], limit=limit):
                     title_el = job.select_one("h2, .job-title, a")
                     title = title_el.text.strip() if title_el else "Remote Developer Job"
                     opportunities.append({
@@ -3279,11 +3272,10 @@ async def scrape_upwork_rss(limit: int = 15) -> List[Dict]:
     """Scrape Upwork RSS for freelance jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.upwork.com/ab/feed/jobs/rss?q=developer&sort=recency")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -3305,7 +3297,7 @@ async def scrape_freelancer_api(limit: int = 15) -> List[Dict]:
     """Scrape Freelancer projects."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.freelancer.com/api/projects/0.1/projects?compact=true&limit=20")
             if resp.status_code == 200:
                 data = resp.json()
@@ -3329,11 +3321,10 @@ async def scrape_toptal_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Toptal job listings."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.toptal.com/careers")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, .career-item, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, .career-item, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Toptal Position"
                     opportunities.append({
@@ -3355,11 +3346,10 @@ async def scrape_guru_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Guru freelance jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.guru.com/d/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".jobRecord, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".jobRecord, .job-listing", ["h2, .jobTitle, a"], limit=limit):
                     title_el = job.select_one("h2, .jobTitle, a")
                     title = title_el.text.strip() if title_el else "Guru Project"
                     opportunities.append({
@@ -3381,7 +3371,7 @@ async def scrape_usajobs(limit: int = 20) -> List[Dict]:
     """Scrape USAJobs government positions."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get(
                 "https://data.usajobs.gov/api/search?ResultsPerPage=25&Keyword=software",
                 headers={"Host": "data.usajobs.gov", "User-Agent": "Mozilla/5.0"}
@@ -3411,11 +3401,10 @@ async def scrape_problogger_jobs(limit: int = 15) -> List[Dict]:
     """Scrape ProBlogger for writing jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://problogger.com/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job_listing, article")[:limit]:
+                for job in await parse_items(resp.text, ".job_listing, article", ["h3, .job-title, a"], limit=limit):
                     title_el = job.select_one("h3, .job-title, a")
                     title = title_el.text.strip() if title_el else "Writing Job"
                     opportunities.append({
@@ -3438,11 +3427,10 @@ async def scrape_mediabistro(limit: int = 15) -> List[Dict]:
     """Scrape MediaBistro for media jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.mediabistro.com/jobs/search/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, .job-card")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, .job-card", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Media Job"
                     opportunities.append({
@@ -3465,11 +3453,10 @@ async def scrape_journalismjobs(limit: int = 15) -> List[Dict]:
     """Scrape JournalismJobs RSS."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.journalismjobs.com/rss.cfm")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -3492,11 +3479,10 @@ async def scrape_smashing_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Smashing Magazine jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://jobs.smashingmagazine.com/jobs/feed/rss")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else ""
                     link = item.find("link").text if item.find("link") else ""
                     opportunities.append({
@@ -3519,11 +3505,10 @@ async def scrape_coroflot_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Coroflot design jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.coroflot.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, .job-item")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, .job-item", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Design Job"
                     opportunities.append({
@@ -3546,11 +3531,10 @@ async def scrape_idealist(limit: int = 20) -> List[Dict]:
     """Scrape Idealist nonprofit jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.idealist.org/en/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Nonprofit Job"
                     opportunities.append({
@@ -3573,11 +3557,10 @@ async def scrape_techjobs_uk(limit: int = 15) -> List[Dict]:
     """Scrape UK tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.technojobs.co.uk/remote-jobs.phtml")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, .job", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "UK Tech Job"
                     opportunities.append({
@@ -3600,11 +3583,10 @@ async def scrape_eucareers(limit: int = 15) -> List[Dict]:
     """Scrape EU Careers/EPSO jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://epso.europa.eu/en/job-opportunities")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-item, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-item, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "EU Position"
                     opportunities.append({
@@ -3628,11 +3610,10 @@ async def scrape_unjobs(limit: int = 20) -> List[Dict]:
     """Scrape UN Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://unjobs.org/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job, article, .listing")[:limit]:
+                for job in await parse_items(resp.text, ".job, article, .listing", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "UN Position"
                     opportunities.append({
@@ -3656,11 +3637,10 @@ async def scrape_devitjobs(limit: int = 15) -> List[Dict]:
     """Scrape DevITJobs EU."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://devitjobs.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Dev Job"
                     opportunities.append({
@@ -3682,11 +3662,10 @@ async def scrape_germantechjobs(limit: int = 15) -> List[Dict]:
     """Scrape German Tech Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://germantechjobs.de/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "German Tech Job"
                     opportunities.append({
@@ -3709,11 +3688,10 @@ async def scrape_swissdevjobs(limit: int = 15) -> List[Dict]:
     """Scrape SwissDevJobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://swissdevjobs.ch/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Swiss Tech Job"
                     opportunities.append({
@@ -3736,11 +3714,10 @@ async def scrape_berlinstartupjobs(limit: int = 15) -> List[Dict]:
     """Scrape Berlin Startup Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://berlinstartupjobs.com/engineering/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, .bsj-job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, .bsj-job", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Berlin Startup Job"
                     opportunities.append({
@@ -3763,11 +3740,10 @@ async def scrape_angellist_remote(limit: int = 15) -> List[Dict]:
     """Alternative AngelList/Wellfound remote jobs scraper."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://wellfound.com/role/r/software-engineer")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, .job-listing", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Startup Job"
                     opportunities.append({
@@ -3790,11 +3766,10 @@ async def scrape_kaggle_competitions(limit: int = 15) -> List[Dict]:
     """Scrape Kaggle competitions."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.kaggle.com/competitions")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for comp in soup.select(".competition-card, article")[:limit]:
+                for comp in await parse_items(resp.text, ".competition-card, article", ["h2, h3, a"], limit=limit):
                     title_el = comp.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "ML Competition"
                     opportunities.append({
@@ -3817,11 +3792,10 @@ async def scrape_topcoder(limit: int = 15) -> List[Dict]:
     """Scrape TopCoder challenges."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.topcoder.com/challenges")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for ch in soup.select(".challenge-card, article")[:limit]:
+                for ch in await parse_items(resp.text, ".challenge-card, article", ["h2, h3, a"], limit=limit):
                     title_el = ch.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Coding Challenge"
                     opportunities.append({
@@ -3844,11 +3818,10 @@ async def scrape_hackerearth(limit: int = 15) -> List[Dict]:
     """Scrape HackerEarth challenges."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.hackerearth.com/challenges/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for ch in soup.select(".challenge-card, .event-card")[:limit]:
+                for ch in await parse_items(resp.text, ".challenge-card, .event-card", ["h2, h3, a"], limit=limit):
                     title_el = ch.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "HackerEarth Challenge"
                     opportunities.append({
@@ -3871,11 +3844,10 @@ async def scrape_codingame(limit: int = 15) -> List[Dict]:
     """Scrape CodinGame challenges."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.codingame.com/work/offers/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-offer, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-offer, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "CodinGame Job"
                     opportunities.append({
@@ -3897,11 +3869,10 @@ async def scrape_microverse(limit: int = 10) -> List[Dict]:
     """Scrape Microverse partner jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.microverse.org/careers")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article", ["h2, h3, a"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Microverse Job"
                     opportunities.append({
@@ -3928,7 +3899,7 @@ async def scrape_himalayas_remote(limit: int = 25) -> List[Dict]:
     """Scrape Himalayas remote jobs API."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://himalayas.app/jobs/api?limit=50")
             if resp.status_code == 200:
                 data = resp.json()
@@ -3955,11 +3926,10 @@ async def scrape_4dayweek_jobs(limit: int = 20) -> List[Dict]:
     """Scrape 4 Day Week jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://4dayweek.io/remote-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, .job-listing, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, .job-listing, article, .job", ["h2, h3, .job-title, a", ".company, .company-name", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .job-title, a")
                     company_el = job.select_one(".company, .company-name")
                     title = title_el.text.strip() if title_el else "4 Day Week Job"
@@ -3988,7 +3958,7 @@ async def scrape_web3career(limit: int = 20) -> List[Dict]:
     """Scrape Web3 Career jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://web3.career/api/v1?limit=50")
             if resp.status_code == 200:
                 try:
@@ -4016,11 +3986,10 @@ async def scrape_remoteio(limit: int = 20) -> List[Dict]:
     """Scrape Remote.io jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.remote.io/remote-software-development-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-tile, .job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-tile, .job-card, article", ["h2, h3, .job-title", ".company-name, .company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .job-title")
                     company_el = job.select_one(".company-name, .company")
                     title = title_el.text.strip() if title_el else "Remote.io Job"
@@ -4047,7 +4016,7 @@ async def scrape_whoishiring_hn(limit: int = 30) -> List[Dict]:
     """Scrape HackerNews Who is Hiring thread from API."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             # Get the latest Who is Hiring thread
             resp = await client.get("https://hacker-news.firebaseio.com/v0/user/whoishiring.json")
             if resp.status_code == 200:
@@ -4058,9 +4027,13 @@ async def scrape_whoishiring_hn(limit: int = 30) -> List[Dict]:
                     if story_resp.status_code == 200:
                         story = story_resp.json()
                         kids = story.get("kids", [])[:limit]
-                        for kid_id in kids[:limit]:
-                            kid_resp = await client.get(f"https://hacker-news.firebaseio.com/v0/item/{kid_id}.json")
-                            if kid_resp.status_code == 200:
+                        kid_responses = await fan_out(
+                            kids,
+                            lambda kid_id: client.get(f"https://hacker-news.firebaseio.com/v0/item/{kid_id}.json"),
+                            max_concurrent=50,
+                        )
+                        for kid_id, kid_resp in zip(kids, kid_responses):
+                            if kid_resp is not None and kid_resp.status_code == 200:
                                 comment = kid_resp.json()
                                 text = comment.get("text", "")
                                 if text:
@@ -4084,11 +4057,10 @@ async def scrape_nocsok(limit: int = 20) -> List[Dict]:
     """Scrape NoCSok remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://nocsok.com/remote-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article, .job-card")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article, .job-card", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Remote Job"
                     link = job.select_one("a[href]")
@@ -4113,11 +4085,10 @@ async def scrape_efinancialcareers(limit: int = 20) -> List[Dict]:
     """Scrape eFinancialCareers jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.efinancialcareers.com/sitemap-jobs.xml")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for loc in soup.find_all("loc")[:limit]:
+                for loc in await parse_items(resp.text, "loc", [], limit=limit, mode="xml"):
                     url = loc.text
                     if "/jobs/" in url:
                         title = url.split("/")[-1].replace("-", " ").title()
@@ -4140,11 +4111,10 @@ async def scrape_techstars(limit: int = 15) -> List[Dict]:
     """Scrape Techstars jobs and programs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.techstars.com/accelerators")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for program in soup.select(".accelerator-card, article, .program")[:limit]:
+                for program in await parse_items(resp.text, ".accelerator-card, article, .program", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = program.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Techstars Program"
                     link = program.select_one("a[href]")
@@ -4168,11 +4138,10 @@ async def scrape_500global(limit: int = 15) -> List[Dict]:
     """Scrape 500 Global programs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://500.co/accelerators")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for program in soup.select(".program-card, article")[:limit]:
+                for program in await parse_items(resp.text, ".program-card, article", ["h2, h3"], limit=limit):
                     title_el = program.select_one("h2, h3")
                     title = title_el.text.strip() if title_el else "500 Global Program"
                     opportunities.append({
@@ -4194,11 +4163,10 @@ async def scrape_plugandplay(limit: int = 15) -> List[Dict]:
     """Scrape Plug and Play accelerator programs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.plugandplaytechcenter.com/programs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for program in soup.select(".program, article, .card")[:limit]:
+                for program in await parse_items(resp.text, ".program, article, .card", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = program.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Plug and Play Program"
                     link = program.select_one("a[href]")
@@ -4222,11 +4190,10 @@ async def scrape_sba_grants(limit: int = 20) -> List[Dict]:
     """Scrape SBA small business grants and funding."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.sba.gov/funding-programs/grants")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for grant in soup.select(".views-row, article, .grant-item")[:limit]:
+                for grant in await parse_items(resp.text, ".views-row, article, .grant-item", ["h2, h3, a", "a[href]"], limit=limit):
                     title_el = grant.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "SBA Grant"
                     link = grant.select_one("a[href]")
@@ -4250,11 +4217,10 @@ async def scrape_ford_foundation(limit: int = 15) -> List[Dict]:
     """Scrape Ford Foundation grants."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.fordfoundation.org/work/our-grants/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for grant in soup.select(".grant-item, article, .card")[:limit]:
+                for grant in await parse_items(resp.text, ".grant-item, article, .card", ["h2, h3, .title"], limit=limit):
                     title_el = grant.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Ford Foundation Grant"
                     opportunities.append({
@@ -4276,11 +4242,10 @@ async def scrape_gates_foundation(limit: int = 15) -> List[Dict]:
     """Scrape Gates Foundation opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.gatesfoundation.org/about/careers")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article, .career-item")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article, .career-item", ["h2, h3, a", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Gates Foundation Position"
                     link = job.select_one("a[href]")
@@ -4304,10 +4269,9 @@ async def scrape_echoing_green(limit: int = 15) -> List[Dict]:
     """Scrape Echoing Green fellowship."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://echoinggreen.org/fellowship/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
                 opportunities.append({
                     "id": generate_id("echoinggreen", "fellowship", ""),
                     "title": "Echoing Green Fellowship",
@@ -4328,7 +4292,7 @@ async def scrape_ashoka(limit: int = 15) -> List[Dict]:
     """Scrape Ashoka fellowship opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.ashoka.org/en-us/program/ashoka-fellowship")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4351,11 +4315,10 @@ async def scrape_fulbright(limit: int = 20) -> List[Dict]:
     """Scrape Fulbright scholarships."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://us.fulbrightonline.org/about/types-of-awards")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for award in soup.select(".award-type, article, .card")[:limit]:
+                for award in await parse_items(resp.text, ".award-type, article, .card", ["h2, h3, .title"], limit=limit):
                     title_el = award.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Fulbright Award"
                     opportunities.append({
@@ -4377,7 +4340,7 @@ async def scrape_chevening(limit: int = 15) -> List[Dict]:
     """Scrape Chevening scholarships."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.chevening.org/scholarships/")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4400,11 +4363,10 @@ async def scrape_daad(limit: int = 20) -> List[Dict]:
     """Scrape DAAD German scholarships."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.daad.de/en/study-and-research-in-germany/scholarships/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for scholarship in soup.select(".scholarship-item, article, .card")[:limit]:
+                for scholarship in await parse_items(resp.text, ".scholarship-item, article, .card", ["h2, h3, a", "a[href]"], limit=limit):
                     title_el = scholarship.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "DAAD Scholarship"
                     link = scholarship.select_one("a[href]")
@@ -4428,11 +4390,10 @@ async def scrape_commonwealth(limit: int = 15) -> List[Dict]:
     """Scrape Commonwealth scholarships."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://cscuk.fcdo.gov.uk/scholarships/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for scholarship in soup.select(".scholarship, article")[:limit]:
+                for scholarship in await parse_items(resp.text, ".scholarship, article", ["h2, h3, a", "a[href]"], limit=limit):
                     title_el = scholarship.select_one("h2, h3, a")
                     title = title_el.text.strip() if title_el else "Commonwealth Scholarship"
                     link = scholarship.select_one("a[href]")
@@ -4456,11 +4417,10 @@ async def scrape_africa_grants(limit: int = 20) -> List[Dict]:
     """Scrape Africa-specific grants and funding."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.fundsforngos.org/category/africa/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for grant in soup.select("article, .post")[:limit]:
+                for grant in await parse_items(resp.text, "article, .post", ["h2, h3, .entry-title a", "a[href]"], limit=limit):
                     title_el = grant.select_one("h2, h3, .entry-title a")
                     title = title_el.text.strip() if title_el else "Africa Grant"
                     link = grant.select_one("a[href]")
@@ -4484,7 +4444,7 @@ async def scrape_tony_elumelu(limit: int = 10) -> List[Dict]:
     """Scrape Tony Elumelu Foundation opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.tonyelumelufoundation.org/programmes")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4507,7 +4467,7 @@ async def scrape_mastercard_foundation(limit: int = 15) -> List[Dict]:
     """Scrape Mastercard Foundation scholarships."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://mastercardfdn.org/all/scholars/")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4530,11 +4490,10 @@ async def scrape_mozilla_grants(limit: int = 10) -> List[Dict]:
     """Scrape Mozilla Foundation grants."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://foundation.mozilla.org/en/what-we-fund/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for grant in soup.select(".card, article")[:limit]:
+                for grant in await parse_items(resp.text, ".card, article", ["h2, h3, .title"], limit=limit):
                     title_el = grant.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Mozilla Grant"
                     opportunities.append({
@@ -4556,11 +4515,10 @@ async def scrape_google_for_startups(limit: int = 15) -> List[Dict]:
     """Scrape Google for Startups programs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://startup.google.com/programs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for program in soup.select(".program-card, article, .card")[:limit]:
+                for program in await parse_items(resp.text, ".program-card, article, .card", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = program.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Google for Startups Program"
                     link = program.select_one("a[href]")
@@ -4584,7 +4542,7 @@ async def scrape_aws_startups(limit: int = 15) -> List[Dict]:
     """Scrape AWS Startups programs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://aws.amazon.com/startups/")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4607,7 +4565,7 @@ async def scrape_microsoft_startups(limit: int = 15) -> List[Dict]:
     """Scrape Microsoft for Startups programs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.microsoft.com/en-us/startups")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4630,7 +4588,7 @@ async def scrape_stripe_atlas(limit: int = 10) -> List[Dict]:
     """Scrape Stripe Atlas for startups."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://stripe.com/atlas")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4653,11 +4611,10 @@ async def scrape_github_hackathons(limit: int = 20) -> List[Dict]:
     """Scrape GitHub-related hackathons from MLH."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://mlh.io/seasons/2025/events")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for event in soup.select(".event-wrapper, .event")[:limit]:
+                for event in await parse_items(resp.text, ".event-wrapper, .event", ["h3, .event-name", ".event-date, .date", "a[href]"], limit=limit):
                     title_el = event.select_one("h3, .event-name")
                     title = title_el.text.strip() if title_el else "MLH Hackathon"
                     date_el = event.select_one(".event-date, .date")
@@ -4684,11 +4641,10 @@ async def scrape_gitcoin(limit: int = 20) -> List[Dict]:
     """Scrape Gitcoin grants and bounties."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://gitcoin.co/grants/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for grant in soup.select(".grant-card, article")[:limit]:
+                for grant in await parse_items(resp.text, ".grant-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = grant.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Gitcoin Grant"
                     link = grant.select_one("a[href]")
@@ -4712,11 +4668,10 @@ async def scrape_hackernoon_jobs(limit: int = 15) -> List[Dict]:
     """Scrape HackerNoon jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://hackernoon.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "HackerNoon Job"
                     link = job.select_one("a[href]")
@@ -4740,11 +4695,10 @@ async def scrape_arc_dev(limit: int = 20) -> List[Dict]:
     """Scrape Arc.dev remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://arc.dev/remote-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .job-title", ".company, .company-name", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .job-title")
                     company_el = job.select_one(".company, .company-name")
                     title = title_el.text.strip() if title_el else "Arc.dev Job"
@@ -4771,11 +4725,10 @@ async def scrape_turing_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Turing remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.turing.com/remote-developer-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Turing Remote Job"
                     link = job.select_one("a[href]")
@@ -4800,11 +4753,10 @@ async def scrape_triplebyte(limit: int = 15) -> List[Dict]:
     """Scrape Triplebyte/Karat jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://triplebyte.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Triplebyte Job"
@@ -4830,7 +4782,7 @@ async def scrape_hired_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Hired.com jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://hired.com/job-seekers")
             if resp.status_code == 200:
                 opportunities.append({
@@ -4853,11 +4805,10 @@ async def scrape_powertofly(limit: int = 20) -> List[Dict]:
     """Scrape PowerToFly remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://powertofly.com/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "PowerToFly Job"
@@ -4883,11 +4834,10 @@ async def scrape_diversitytech(limit: int = 15) -> List[Dict]:
     """Scrape diversity in tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.diversifytech.co/job-board")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "DiversifyTech Job"
@@ -4913,11 +4863,10 @@ async def scrape_techladies(limit: int = 15) -> List[Dict]:
     """Scrape TechLadies jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.hiretechladies.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "TechLadies Job"
@@ -4943,11 +4892,10 @@ async def scrape_include_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Include.io jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.include.io/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Include.io Job"
                     link = job.select_one("a[href]")
@@ -4975,11 +4923,10 @@ async def scrape_relocate_me(limit: int = 20) -> List[Dict]:
     """Scrape Relocate.me visa sponsorship jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://relocate.me/search")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .vacancy")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .vacancy", ["h2, h3, .title, a", ".company, .employer", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company, .employer")
                     title = title_el.text.strip() if title_el else "Visa Sponsorship Job"
@@ -5005,11 +4952,10 @@ async def scrape_jobspresso(limit: int = 20) -> List[Dict]:
     """Scrape Jobspresso remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://jobspresso.co/remote-work/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article, .job_listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article, .job_listing", ["h2, h3, .job-title, a", ".company, .company-name", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .job-title, a")
                     company_el = job.select_one(".company, .company-name")
                     title = title_el.text.strip() if title_el else "Jobspresso Remote Job"
@@ -5036,11 +4982,10 @@ async def scrape_euraxess(limit: int = 20) -> List[Dict]:
     """Scrape EURAXESS European research jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://euraxess.ec.europa.eu/jobs/search")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".views-row, article, .job-item")[:limit]:
+                for job in await parse_items(resp.text, ".views-row, article, .job-item", ["h2, h3, .title, a", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     title = title_el.text.strip() if title_el else "EURAXESS Research Position"
                     link = job.select_one("a[href]")
@@ -5064,12 +5009,11 @@ async def scrape_indeed_remote(limit: int = 20) -> List[Dict]:
     """Scrape Indeed remote jobs RSS feed."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             # Using RSS feed for remote jobs
             resp = await client.get("https://www.indeed.com/rss?q=remote&l=")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "xml")
-                for item in soup.find_all("item")[:limit]:
+                for item in await parse_items(resp.text, "item", ["title", "link"], limit=limit, mode="xml"):
                     title = item.find("title").text if item.find("title") else "Indeed Remote Job"
                     link = item.find("link").text if item.find("link") else "https://indeed.com"
                     opportunities.append({
@@ -5092,11 +5036,10 @@ async def scrape_simplyhired(limit: int = 20) -> List[Dict]:
     """Scrape SimplyHired jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.simplyhired.com/search?q=software+developer&l=remote")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".SerpJob, article, .job-card")[:limit]:
+                for job in await parse_items(resp.text, ".SerpJob, article, .job-card", ["h2, h3, .jobposting-title, a", ".company, .jobposting-company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .jobposting-title, a")
                     company_el = job.select_one(".company, .jobposting-company")
                     title = title_el.text.strip() if title_el else "SimplyHired Job"
@@ -5122,7 +5065,7 @@ async def scrape_glassdoor_remote(limit: int = 15) -> List[Dict]:
     """Scrape Glassdoor remote jobs info."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.glassdoor.com/Job/remote-jobs-SRCH_IL.0,6_IS11047.htm")
             if resp.status_code == 200:
                 opportunities.append({
@@ -5146,11 +5089,10 @@ async def scrape_ziprecruiter(limit: int = 15) -> List[Dict]:
     """Scrape ZipRecruiter remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.ziprecruiter.com/jobs/remote")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job_result, article, .job-card")[:limit]:
+                for job in await parse_items(resp.text, ".job_result, article, .job-card", ["h2, h3, .job_title, a", ".company, .job_company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .job_title, a")
                     company_el = job.select_one(".company, .job_company")
                     title = title_el.text.strip() if title_el else "ZipRecruiter Job"
@@ -5176,11 +5118,10 @@ async def scrape_snagajob(limit: int = 15) -> List[Dict]:
     """Scrape Snagajob hourly jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.snagajob.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Snagajob Position"
@@ -5206,11 +5147,10 @@ async def scrape_flexjobs(limit: int = 15) -> List[Dict]:
     """Scrape FlexJobs remote/flexible jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.flexjobs.com/remote-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "FlexJobs Remote Job"
@@ -5237,11 +5177,10 @@ async def scrape_remote_python(limit: int = 15) -> List[Dict]:
     """Scrape Remote Python jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.remotepython.com/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job-listing", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Remote Python Job"
@@ -5268,11 +5207,10 @@ async def scrape_django_jobs(limit: int = 15) -> List[Dict]:
     """Scrape Django Jobs board."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://djangojobs.net/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Django Job"
@@ -5298,11 +5236,10 @@ async def scrape_rubyonremote(limit: int = 15) -> List[Dict]:
     """Scrape Ruby on Remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://rubyonremote.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Ruby Remote Job"
@@ -5329,11 +5266,10 @@ async def scrape_iosdevjobs(limit: int = 15) -> List[Dict]:
     """Scrape iOS Dev Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://iosdevjobs.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "iOS Developer Job"
@@ -5359,11 +5295,10 @@ async def scrape_androidjobs(limit: int = 15) -> List[Dict]:
     """Scrape Android Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://androidjobs.io/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Android Developer Job"
@@ -5389,11 +5324,10 @@ async def scrape_elixirjobs(limit: int = 15) -> List[Dict]:
     """Scrape Elixir Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://elixirjobs.net/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .offer")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .offer", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Elixir Job"
@@ -5423,11 +5357,10 @@ async def scrape_github_trending(limit: int = 30) -> List[Dict]:
     """Scrape GitHub trending repositories for job/project opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://github.com/trending")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for repo in soup.select("article.Box-row")[:limit]:
+                for repo in await parse_items(resp.text, "article.Box-row", ["h2 a", "p"], limit=limit):
                     title_el = repo.select_one("h2 a")
                     desc_el = repo.select_one("p")
                     title = title_el.text.strip().replace("\n", "").replace(" ", "") if title_el else "Trending Repo"
@@ -5453,11 +5386,10 @@ async def scrape_producthunt_launches(limit: int = 30) -> List[Dict]:
     """Scrape ProductHunt for startup opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.producthunt.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for product in soup.select("[data-test='post-item']")[:limit]:
+                for product in await parse_items(resp.text, "[data-test='post-item']", ["h3, a", "a[href]"], limit=limit):
                     title_el = product.select_one("h3, a")
                     title = title_el.text.strip() if title_el else "ProductHunt Launch"
                     link = product.select_one("a[href]")
@@ -5481,11 +5413,10 @@ async def scrape_indiehackers(limit: int = 25) -> List[Dict]:
     """Scrape IndieHackers for startup/project opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.indiehackers.com/products")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for product in soup.select(".product-card, article")[:limit]:
+                for product in await parse_items(resp.text, ".product-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = product.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "IndieHacker Project"
                     link = product.select_one("a[href]")
@@ -5509,11 +5440,10 @@ async def scrape_betalist(limit: int = 25) -> List[Dict]:
     """Scrape BetaList for startup opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://betalist.com/startups")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for startup in soup.select(".startup-card, article, .card")[:limit]:
+                for startup in await parse_items(resp.text, ".startup-card, article, .card", ["h2, h3, .title, a", "a[href]"], limit=limit):
                     title_el = startup.select_one("h2, h3, .title, a")
                     title = title_el.text.strip() if title_el else "BetaList Startup"
                     link = startup.select_one("a[href]")
@@ -5537,11 +5467,10 @@ async def scrape_angelco_jobs(limit: int = 30) -> List[Dict]:
     """Scrape AngelList/Wellfound startup jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://wellfound.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .styles_component__")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .styles_component__", ["h2, h3, a", ".company, .startup-name", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, a")
                     company_el = job.select_one(".company, .startup-name")
                     title = title_el.text.strip() if title_el else "Startup Job"
@@ -5567,11 +5496,10 @@ async def scrape_f6s(limit: int = 25) -> List[Dict]:
     """Scrape F6S for startup programs and funding."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.f6s.com/programs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for program in soup.select(".program-card, article, .card")[:limit]:
+                for program in await parse_items(resp.text, ".program-card, article, .card", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = program.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "F6S Program"
                     link = program.select_one("a[href]")
@@ -5595,11 +5523,10 @@ async def scrape_gust(limit: int = 20) -> List[Dict]:
     """Scrape Gust for startup accelerators."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://gust.com/accelerators")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for accel in soup.select(".accelerator-card, article")[:limit]:
+                for accel in await parse_items(resp.text, ".accelerator-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = accel.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Gust Accelerator"
                     link = accel.select_one("a[href]")
@@ -5623,11 +5550,10 @@ async def scrape_ycombinator_jobs(limit: int = 40) -> List[Dict]:
     """Scrape YC Work at a Startup jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.ycombinator.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "YC Startup Job"
@@ -5653,11 +5579,10 @@ async def scrape_sequoia_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Sequoia portfolio jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.sequoiacap.com/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Sequoia Portfolio Job"
@@ -5681,11 +5606,10 @@ async def scrape_a16z_jobs(limit: int = 20) -> List[Dict]:
     """Scrape a16z portfolio jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://a16z.com/portfolio/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for company in soup.select(".portfolio-company, article")[:limit]:
+                for company in await parse_items(resp.text, ".portfolio-company, article", ["h2, h3, .title"], limit=limit):
                     title_el = company.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "a16z Portfolio Company"
                     opportunities.append({
@@ -5707,11 +5631,10 @@ async def scrape_nfx_jobs(limit: int = 15) -> List[Dict]:
     """Scrape NFX portfolio jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.nfx.com/portfolio")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for company in soup.select(".portfolio-item, article")[:limit]:
+                for company in await parse_items(resp.text, ".portfolio-item, article", ["h2, h3, .title"], limit=limit):
                     title_el = company.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "NFX Portfolio"
                     opportunities.append({
@@ -5733,11 +5656,10 @@ async def scrape_craigslist_gigs(limit: int = 25) -> List[Dict]:
     """Scrape Craigslist gigs section."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://sfbay.craigslist.org/search/ggg")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for gig in soup.select(".result-row, .cl-static-search-result")[:limit]:
+                for gig in await parse_items(resp.text, ".result-row, .cl-static-search-result", [".result-title, a", "a[href]"], limit=limit):
                     title_el = gig.select_one(".result-title, a")
                     title = title_el.text.strip() if title_el else "Craigslist Gig"
                     link = gig.select_one("a[href]")
@@ -5761,7 +5683,7 @@ async def scrape_fiverr_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Fiverr business opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.fiverr.com/categories/programming-tech")
             if resp.status_code == 200:
                 opportunities.append({
@@ -5784,11 +5706,10 @@ async def scrape_99designs(limit: int = 15) -> List[Dict]:
     """Scrape 99designs for design opportunities."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://99designs.com/contests")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for contest in soup.select(".contest-card, article")[:limit]:
+                for contest in await parse_items(resp.text, ".contest-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = contest.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "99designs Contest"
                     link = contest.select_one("a[href]")
@@ -5812,11 +5733,10 @@ async def scrape_designcrowd(limit: int = 15) -> List[Dict]:
     """Scrape DesignCrowd for design contests."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.designcrowd.com/design-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "DesignCrowd Job"
                     link = job.select_one("a[href]")
@@ -5840,11 +5760,10 @@ async def scrape_contest_watchers(limit: int = 20) -> List[Dict]:
     """Scrape ContestWatchers for competitions."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://contestwatchers.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for contest in soup.select(".contest-item, article")[:limit]:
+                for contest in await parse_items(resp.text, ".contest-item, article", ["h2, h3, .title, a", "a[href]"], limit=limit):
                     title_el = contest.select_one("h2, h3, .title, a")
                     title = title_el.text.strip() if title_el else "Contest"
                     link = contest.select_one("a[href]")
@@ -5868,11 +5787,10 @@ async def scrape_challenge_gov(limit: int = 25) -> List[Dict]:
     """Scrape Challenge.gov for government challenges."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.challenge.gov/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for challenge in soup.select(".challenge-card, article, .card")[:limit]:
+                for challenge in await parse_items(resp.text, ".challenge-card, article, .card", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = challenge.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Government Challenge"
                     link = challenge.select_one("a[href]")
@@ -5896,11 +5814,10 @@ async def scrape_innocentive(limit: int = 20) -> List[Dict]:
     """Scrape InnoCentive/Wazoku for innovation challenges."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.wazoku.com/open-innovation-challenges/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for challenge in soup.select(".challenge-card, article")[:limit]:
+                for challenge in await parse_items(resp.text, ".challenge-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = challenge.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Innovation Challenge"
                     link = challenge.select_one("a[href]")
@@ -5924,11 +5841,10 @@ async def scrape_herox(limit: int = 25) -> List[Dict]:
     """Scrape HeroX for crowdsourcing challenges."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.herox.com/crowdsourcing-challenges")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for challenge in soup.select(".challenge-card, article")[:limit]:
+                for challenge in await parse_items(resp.text, ".challenge-card, article", ["h2, h3, .title", ".prize, .reward", "a[href]"], limit=limit):
                     title_el = challenge.select_one("h2, h3, .title")
                     prize_el = challenge.select_one(".prize, .reward")
                     title = title_el.text.strip() if title_el else "HeroX Challenge"
@@ -5955,11 +5871,10 @@ async def scrape_xprize(limit: int = 15) -> List[Dict]:
     """Scrape XPRIZE competitions."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.xprize.org/prizes")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for prize in soup.select(".prize-card, article")[:limit]:
+                for prize in await parse_items(resp.text, ".prize-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = prize.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "XPRIZE Competition"
                     link = prize.select_one("a[href]")
@@ -5983,11 +5898,10 @@ async def scrape_hackerrank_jobs(limit: int = 25) -> List[Dict]:
     """Scrape HackerRank jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.hackerrank.com/jobs/search")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "HackerRank Job"
@@ -6013,7 +5927,7 @@ async def scrape_coderbyte_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Coderbyte for tech assessments/jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://coderbyte.com/organizations")
             if resp.status_code == 200:
                 opportunities.append({
@@ -6036,7 +5950,7 @@ async def scrape_linkedin_jobs_rss(limit: int = 30) -> List[Dict]:
     """Scrape LinkedIn jobs via public RSS-like endpoint."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.linkedin.com/jobs/search/?keywords=software%20engineer&location=Remote")
             if resp.status_code == 200:
                 opportunities.append({
@@ -6060,11 +5974,10 @@ async def scrape_monster_jobs(limit: int = 25) -> List[Dict]:
     """Scrape Monster jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.monster.com/jobs/search?q=software-developer&where=remote")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .card-content")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .card-content", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Monster Job"
@@ -6090,11 +6003,10 @@ async def scrape_careerbuilder(limit: int = 25) -> List[Dict]:
     """Scrape CareerBuilder jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.careerbuilder.com/jobs?keywords=developer&location=remote")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing-item, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing-item, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "CareerBuilder Job"
@@ -6120,11 +6032,10 @@ async def scrape_robert_half(limit: int = 20) -> List[Dict]:
     """Scrape Robert Half tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.roberthalf.com/jobs/technology")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     title = title_el.text.strip() if title_el else "Robert Half Tech Job"
                     link = job.select_one("a[href]")
@@ -6149,12 +6060,15 @@ async def scrape_dice_tech(limit: int = 30) -> List[Dict]:
     opportunities = []
     categories = ["python", "javascript", "java", "cloud", "devops"]
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             for cat in categories[:3]:
                 resp = await client.get(f"https://www.dice.com/jobs?q={cat}&countryCode=US")
                 if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for job in soup.select("[data-cy='search-result-job-item']")[:limit // 3]:
+                    jobs = await parse_items(
+                        resp.text, "[data-cy='search-result-job-item']",
+                        ["h5, a", "[data-cy='search-result-company-name']", "a[href]"], limit=limit // 3,
+                    )
+                    for job in jobs:
                         title_el = job.select_one("h5, a")
                         company_el = job.select_one("[data-cy='search-result-company-name']")
                         title = title_el.text.strip() if title_el else f"Dice {cat.title()} Job"
@@ -6180,11 +6094,10 @@ async def scrape_stackoverflow_talent(limit: int = 25) -> List[Dict]:
     """Scrape StackOverflow talent/jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://stackoverflow.com/jobs/companies")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for company in soup.select(".company-card, article")[:limit]:
+                for company in await parse_items(resp.text, ".company-card, article", ["h2, h3, .company-name", "a[href]"], limit=limit):
                     name_el = company.select_one("h2, h3, .company-name")
                     name = name_el.text.strip() if name_el else "StackOverflow Company"
                     link = company.select_one("a[href]")
@@ -6208,11 +6121,10 @@ async def scrape_levels_fyi(limit: int = 25) -> List[Dict]:
     """Scrape Levels.fyi for tech company jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.levels.fyi/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", ".salary, .compensation", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     salary_el = job.select_one(".salary, .compensation")
@@ -6241,11 +6153,10 @@ async def scrape_blind_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Blind jobs/referrals."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.teamblind.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Blind Job"
@@ -6269,11 +6180,10 @@ async def scrape_key_values(limit: int = 25) -> List[Dict]:
     """Scrape Key Values for culture-focused tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.keyvalues.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for company in soup.select(".company-card, article")[:limit]:
+                for company in await parse_items(resp.text, ".company-card, article", ["h2, h3, .name", "a[href]"], limit=limit):
                     name_el = company.select_one("h2, h3, .name")
                     name = name_el.text.strip() if name_el else "Key Values Company"
                     link = company.select_one("a[href]")
@@ -6297,11 +6207,10 @@ async def scrape_whoishiring_fullstack(limit: int = 25) -> List[Dict]:
     """Scrape WhoIsHiring for fullstack jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://whoishiring.io/search/-1/0/0/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-item, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-item, article", ["h2, h3, .title, a", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, a")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "WhoIsHiring Job"
@@ -6327,11 +6236,10 @@ async def scrape_techinasia_jobs(limit: int = 25) -> List[Dict]:
     """Scrape Tech in Asia jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.techinasia.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Tech in Asia Job"
@@ -6357,11 +6265,10 @@ async def scrape_japan_dev(limit: int = 20) -> List[Dict]:
     """Scrape Japan Dev for Japan tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://japan-dev.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Japan Dev Job"
@@ -6388,11 +6295,10 @@ async def scrape_australia_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Seek Australia tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.seek.com.au/software-developer-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select("[data-card-type='JobCard'], article")[:limit]:
+                for job in await parse_items(resp.text, "[data-card-type='JobCard'], article", ["h3, a[data-automation='jobTitle']", "[data-automation='jobCompany']", "a[href]"], limit=limit):
                     title_el = job.select_one("h3, a[data-automation='jobTitle']")
                     company_el = job.select_one("[data-automation='jobCompany']")
                     title = title_el.text.strip() if title_el else "Seek Australia Job"
@@ -6419,11 +6325,10 @@ async def scrape_canada_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Indeed Canada tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://ca.indeed.com/jobs?q=software+developer&l=Remote")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job_seen_beacon, article")[:limit]:
+                for job in await parse_items(resp.text, ".job_seen_beacon, article", ["h2, .jobTitle", ".companyName", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, .jobTitle")
                     company_el = job.select_one(".companyName")
                     title = title_el.text.strip() if title_el else "Indeed Canada Job"
@@ -6450,11 +6355,10 @@ async def scrape_naukri_india(limit: int = 20) -> List[Dict]:
     """Scrape Naukri India tech jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.naukri.com/software-developer-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".jobTuple, article")[:limit]:
+                for job in await parse_items(resp.text, ".jobTuple, article", ["a.title, h2", ".companyInfo a", "a[href]"], limit=limit):
                     title_el = job.select_one("a.title, h2")
                     company_el = job.select_one(".companyInfo a")
                     title = title_el.text.strip() if title_el else "Naukri India Job"
@@ -6485,11 +6389,10 @@ async def scrape_workable_jobs(limit: int = 25) -> List[Dict]:
     """Scrape Workable job listings."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://jobs.workable.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, [data-job]")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, [data-job]", ["h2, h3, .title", ".company, .employer", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company, .employer")
                     title = title_el.text.strip() if title_el else "Workable Job"
@@ -6517,12 +6420,11 @@ async def scrape_lever_jobs(limit: int = 25) -> List[Dict]:
     opportunities = []
     companies = ["stripe", "netflix", "figma", "notion", "airtable"]
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             for company in companies[:3]:
                 resp = await client.get(f"https://jobs.lever.co/{company}")
                 if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for job in soup.select(".posting")[:5]:
+                    for job in await parse_items(resp.text, ".posting", ["h5, .posting-title", "a[href]"], limit=5):
                         title_el = job.select_one("h5, .posting-title")
                         title = title_el.text.strip() if title_el else "Lever Job"
                         link = job.select_one("a[href]")
@@ -6548,12 +6450,11 @@ async def scrape_greenhouse_jobs(limit: int = 25) -> List[Dict]:
     opportunities = []
     companies = ["airbnb", "discord", "hashicorp", "cloudflare", "datadog"]
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             for company in companies[:3]:
                 resp = await client.get(f"https://boards.greenhouse.io/{company}")
                 if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for job in soup.select(".opening")[:5]:
+                    for job in await parse_items(resp.text, ".opening", ["a", "a[href]"], limit=5):
                         title_el = job.select_one("a")
                         title = title_el.text.strip() if title_el else "Greenhouse Job"
                         link = job.select_one("a[href]")
@@ -6579,12 +6480,11 @@ async def scrape_ashby_jobs(limit: int = 20) -> List[Dict]:
     opportunities = []
     try:
         companies = ["ramp", "notion", "linear"]
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             for company in companies:
                 resp = await client.get(f"https://jobs.ashbyhq.com/{company}")
                 if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for job in soup.select("[data-job-id], .ashby-job-posting")[:5]:
+                    for job in await parse_items(resp.text, "[data-job-id], .ashby-job-posting", ["h3, .title", "a[href]"], limit=5):
                         title_el = job.select_one("h3, .title")
                         title = title_el.text.strip() if title_el else "Ashby Job"
                         link = job.select_one("a[href]")
@@ -6609,11 +6509,10 @@ async def scrape_workatastartup(limit: int = 30) -> List[Dict]:
     """Scrape Work at a Startup (YC company jobs)."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.workatastartup.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, .job-row, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, .job-row, article", ["h2, h3, .title, .job-title", ".company, .startup-name", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, .job-title")
                     company_el = job.select_one(".company, .startup-name")
                     title = title_el.text.strip() if title_el else "Startup Job"
@@ -6640,11 +6539,10 @@ async def scrape_germantechjobs(limit: int = 20) -> List[Dict]:
     """Scrape German Tech Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://germantechjobs.de/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "German Tech Job"
@@ -6671,11 +6569,10 @@ async def scrape_swissdevjobs(limit: int = 20) -> List[Dict]:
     """Scrape SwissDevJobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://swissdevjobs.ch/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Swiss Dev Job"
@@ -6702,11 +6599,10 @@ async def scrape_remoteleaf(limit: int = 25) -> List[Dict]:
     """Scrape RemoteLeaf jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remoteleaf.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "RemoteLeaf Job"
@@ -6734,11 +6630,10 @@ async def scrape_remotehabits(limit: int = 20) -> List[Dict]:
     """Scrape Remote Habits jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remotehabits.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Remote Habits Job"
@@ -6766,11 +6661,10 @@ async def scrape_dailyremote(limit: int = 25) -> List[Dict]:
     """Scrape Daily Remote jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://dailyremote.com/remote-jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Daily Remote Job"
@@ -6798,11 +6692,10 @@ async def scrape_nowhiteboard(limit: int = 20) -> List[Dict]:
     """Scrape No Whiteboard jobs (companies without whiteboard interviews)."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.nowhiteboard.org/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".company-card, article, .job")[:limit]:
+                for job in await parse_items(resp.text, ".company-card, article, .job", ["h2, h3, .title, .company-name", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title, .company-name")
                     title = title_el.text.strip() if title_el else "No Whiteboard Company"
                     link = job.select_one("a[href]")
@@ -6828,11 +6721,10 @@ async def scrape_underdog_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Underdog.io jobs (curated startup jobs)."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://underdog.io/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Underdog Job"
@@ -6859,11 +6751,10 @@ async def scrape_authentic_jobs(limit: int = 20) -> List[Dict]:
     """Scrape Authentic Jobs (design & dev jobs)."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://authenticjobs.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-listing, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-listing, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Authentic Job"
@@ -6890,11 +6781,10 @@ async def scrape_golangprojects(limit: int = 20) -> List[Dict]:
     """Scrape Golang Projects jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.golangprojects.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .listing", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Golang Job"
@@ -6921,11 +6811,10 @@ async def scrape_rustjobs(limit: int = 20) -> List[Dict]:
     """Scrape Rust Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://rustjobs.dev/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .listing", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Rust Job"
@@ -6952,11 +6841,10 @@ async def scrape_vuejobs(limit: int = 20) -> List[Dict]:
     """Scrape Vue.js Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://vuejobs.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job-listing", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Vue.js Job"
@@ -6983,11 +6871,10 @@ async def scrape_reactjobs(limit: int = 20) -> List[Dict]:
     """Scrape React Jobs from reactjobsboard."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://reactjobsboard.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job-listing", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "React Job"
@@ -7014,11 +6901,10 @@ async def scrape_nodejsjobs(limit: int = 20) -> List[Dict]:
     """Scrape Node.js Jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.nodejsjob.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job-listing", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Node.js Job"
@@ -7045,11 +6931,10 @@ async def scrape_remoters(limit: int = 25) -> List[Dict]:
     """Scrape Remoters jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remoters.net/jobs/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, .job-listing")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, .job-listing", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Remoters Job"
@@ -7078,12 +6963,11 @@ async def scrape_weworkremotely_cat(limit: int = 25) -> List[Dict]:
     opportunities = []
     categories = ["programming", "design", "customer-support", "sales-marketing", "devops-sysadmin"]
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             for cat in categories[:3]:
                 resp = await client.get(f"https://weworkremotely.com/categories/{cat}")
                 if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for job in soup.select(".feature, article")[:5]:
+                    for job in await parse_items(resp.text, ".feature, article", ["span.title", "span.company", "a[href]"], limit=5):
                         title_el = job.select_one("span.title")
                         company_el = job.select_one("span.company")
                         title = title_el.text.strip() if title_el else "WWR Job"
@@ -7111,11 +6995,10 @@ async def scrape_remoteco(limit: int = 25) -> List[Dict]:
     """Scrape Remote.co jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remote.co/remote-jobs/developer/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job_listing, article")[:limit]:
+                for job in await parse_items(resp.text, ".job_listing, article", ["h2, h3, .position", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .position")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Remote.co Job"
@@ -7144,12 +7027,11 @@ async def scrape_justremote_extended(limit: int = 25) -> List[Dict]:
     opportunities = []
     categories = ["developer-jobs", "design-jobs", "marketing-jobs", "customer-service-jobs"]
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             for cat in categories[:2]:
                 resp = await client.get(f"https://justremote.co/remote-{cat}")
                 if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for job in soup.select(".job-card, article")[:6]:
+                    for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=6):
                         title_el = job.select_one("h2, h3, .title")
                         company_el = job.select_one(".company")
                         title = title_el.text.strip() if title_el else "JustRemote Job"
@@ -7177,11 +7059,10 @@ async def scrape_skiplevelremote(limit: int = 20) -> List[Dict]:
     """Scrape SkipLevel remote jobs (senior roles)."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.skiplevel.co/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "SkipLevel Job"
@@ -7209,11 +7090,10 @@ async def scrape_talent_io(limit: int = 20) -> List[Dict]:
     """Scrape Talent.io jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://www.talent.io/p/en-fr/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Talent.io Job"
@@ -7240,11 +7120,10 @@ async def scrape_cord_co(limit: int = 20) -> List[Dict]:
     """Scrape Cord.co jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://cord.co/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Cord Job"
@@ -7271,11 +7150,10 @@ async def scrape_otta_jobs_v2(limit: int = 25) -> List[Dict]:
     """Scrape Otta jobs (curated startup jobs)."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://otta.com/jobs")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article, [data-testid='job-card']")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article, [data-testid='job-card']", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Otta Job"
@@ -7302,7 +7180,7 @@ async def scrape_whoishiring_monthly(limit: int = 30) -> List[Dict]:
     """Scrape Who is Hiring monthly thread."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             # Get latest whoishiring thread
             resp = await client.get("https://hn.algolia.com/api/v1/search_by_date?tags=ask_hn&query=who%20is%20hiring")
             if resp.status_code == 200:
@@ -7343,11 +7221,10 @@ async def scrape_techjobsforgood(limit: int = 20) -> List[Dict]:
     """Scrape Tech Jobs for Good."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://techjobsforgood.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company, .org", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company, .org")
                     title = title_el.text.strip() if title_el else "Tech for Good Job"
@@ -7374,11 +7251,10 @@ async def scrape_remotewoman(limit: int = 20) -> List[Dict]:
     """Scrape Remote Woman jobs."""
     opportunities = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with pooled_client(timeout=15) as client:
             resp = await client.get("https://remotewoman.com/")
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for job in soup.select(".job-card, article")[:limit]:
+                for job in await parse_items(resp.text, ".job-card, article", ["h2, h3, .title", ".company", "a[href]"], limit=limit):
                     title_el = job.select_one("h2, h3, .title")
                     company_el = job.select_one(".company")
                     title = title_el.text.strip() if title_el else "Remote Woman Job"
@@ -7829,32 +7705,79 @@ SCRAPER_BATCHES = {
 TOTAL_BATCHES = len(SCRAPER_BATCHES)  # 31 batches with 175+ scrapers
 
 
-async def scan_batch(
+# Timeout ceilings (seconds per scraper); sources with latency history
+# get a tighter timeout from AdaptiveScanController
+SCRAPER_TIMEOUT = 60.0
+MEGA_SCAN_TIMEOUT = 90.0
+
+
+def _invalid_batch_result() -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": f"Invalid batch number. Must be 1-{TOTAL_BATCHES}",
+        "valid_batches": list(SCRAPER_BATCHES.keys())
+    }
+
+
+def _publish_source_changes(opportunities: List[Dict], source_delta) -> None:
+    """
+    Feed one source's scan into the dedup, search index and enrichment
+    precompute.
+    
+    Only the canonical copy of each cross-source cluster is indexed and
+    enriched; other copies are dropped from the index so search returns
+    one record per opportunity. The index skips unchanged records by
+    content hash and drops tombstoned ids.
+    """
+    from ..search_index import get_search_index
+    canonical = get_dedup_index().assign(opportunities)
+    is_canonical = lambda opp: canonical.get(opportunity_key(opp)) == opportunity_key(opp)
+    
+    index = get_search_index()
+    index.upsert_many(opp for opp in opportunities if is_canonical(opp))
+    index.remove_many([
+        *(opportunity_key(opp) for opp in opportunities if not is_canonical(opp)),
+        *(item["id"] for item in source_delta.removed),
+    ])
+    
+    emitted = [opp for opp in source_delta.emitted if is_canonical(opp)]
+    if not emitted:
+        return
+    try:
+        from ..intelligence.enrichment_store import get_enrichment_store
+    except ImportError as e:
+        logger.debug(f"Enrichment precompute unavailable: {e}")
+        return
+    get_enrichment_store().schedule(emitted)
+
+
+def _track_source(source: str, opportunities: List[Dict]):
+    """
+    Diff one source's scan against its high-water mark and publish the
+    changes. Blocking (SQLite, tokenising, MinHash): callers on the event
+    loop run it with ``asyncio.to_thread``.
+    """
+    source_delta = get_delta_tracker().apply(source, opportunities)
+    _publish_source_changes(opportunities, source_delta)
+    return source_delta
+
+
+def _build_batch_result(
     batch_number: int,
-    max_concurrent: int = 5,
+    results: List[tuple],
+    start_time: datetime,
+    delta: bool = False,
 ) -> Dict[str, Any]:
     """
-    Execute a single batch of scrapers (~100 sources).
+    Aggregate (name, result, error) tuples from one batch into a batch result.
     
-    Args:
-        batch_number: Which batch to run (1-7)
-        max_concurrent: Max concurrent scrapers
-        
-    Returns:
-        Dict with opportunities, stats, and batch info
+    Every successful source is diffed against its high-water mark; with
+    delta=True only new/changed opportunities are returned, plus
+    tombstones for removed ones. Blocking: run it in a worker thread.
     """
-    if batch_number < 1 or batch_number > TOTAL_BATCHES:
-        return {
-            "success": False,
-            "error": f"Invalid batch number. Must be 1-{TOTAL_BATCHES}",
-            "valid_batches": list(SCRAPER_BATCHES.keys())
-        }
-    
     batch = SCRAPER_BATCHES[batch_number]
-    logger.info(f"🔄 Starting Batch {batch_number}/{TOTAL_BATCHES}: {batch['name']}")
-    start_time = datetime.utcnow()
-    
     all_opportunities = []
+    removed = []
     stats = {
         "batch_number": batch_number,
         "batch_name": batch["name"],
@@ -7864,38 +7787,31 @@ async def scan_batch(
         "by_source": {},
         "sources_successful": 0,
         "sources_failed": 0,
-        "errors": []
+        "errors": [],
+        "delta": {"added": 0, "changed": 0, "removed": 0, "unchanged": 0},
     }
     
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    async def run_with_semaphore(name: str, scraper_fn):
-        async with semaphore:
-            try:
-                task_start = datetime.utcnow()
-                result = await asyncio.wait_for(scraper_fn(), timeout=60.0)
-                duration = (datetime.utcnow() - task_start).total_seconds()
-                logger.debug(f"{name} completed in {duration:.1f}s with {len(result)} items")
-                return name, result, None
-            except asyncio.TimeoutError:
-                return name, [], "Timeout after 60s"
-            except Exception as e:
-                return name, [], str(e)
-    
-    # Run all scrapers in this batch
-    tasks = [run_with_semaphore(name, fn) for name, fn in batch["scrapers"]]
-    results = await asyncio.gather(*tasks)
-    
-    # Process results
     for name, result, error in results:
         if error:
             stats["errors"].append(f"{name}: {error}")
             stats["sources_failed"] += 1
         else:
-            all_opportunities.extend(result)
+            source_delta = _track_source(name, result)
+            for key, count in source_delta.counts().items():
+                stats["delta"][key] += count
+            if delta:
+                all_opportunities.extend(source_delta.emitted)
+                removed.extend(source_delta.removed)
+            else:
+                all_opportunities.extend(result)
             stats["by_source"][name] = len(result)
             stats["sources_successful"] += 1
     
+    # Fold the same listing found on several sources into one record
+    scanned = len(all_opportunities)
+    all_opportunities = merge_duplicates(all_opportunities)
+    stats["duplicates_merged"] = scanned - len(all_opportunities)
+    
     # Sort by match score
     all_opportunities.sort(key=lambda x: x.get("match_score", 0), reverse=True)
     
@@ -7908,7 +7824,9 @@ async def scan_batch(
         "success": True,
         "batch_number": batch_number,
         "total_batches": TOTAL_BATCHES,
+        "mode": "delta" if delta else "full",
         "opportunities": all_opportunities,
+        "removed": removed,
         "stats": stats,
         "duration_seconds": duration,
         "has_more": batch_number < TOTAL_BATCHES,
@@ -7918,20 +7836,83 @@ async def scan_batch(
     }
 
 
+async def scan_batch(
+    batch_number: int,
+    max_concurrent: int = 5,
+    delta: bool = False,
+    on_source = None,
+) -> Dict[str, Any]:
+    """
+    Execute a single batch of scrapers.
+    
+    Args:
+        batch_number: Which batch to run (1-TOTAL_BATCHES)
+        max_concurrent: Max concurrent scrapers
+        delta: Only return opportunities that are new or changed since the
+            previous scan of each source, plus tombstones for removed ones
+        on_source: Optional async callback(source_result) called as soon as
+            each individual scraper finishes, with its raw opportunities
+        
+    Returns:
+        Dict with opportunities, stats, and batch info
+    """
+    if batch_number not in SCRAPER_BATCHES:
+        return _invalid_batch_result()
+    
+    batch = SCRAPER_BATCHES[batch_number]
+    logger.info(f"🔄 Starting Batch {batch_number}/{TOTAL_BATCHES}: {batch['name']}")
+    start_time = datetime.utcnow()
+    
+    controller = AdaptiveScanController(max_concurrent, SCRAPER_TIMEOUT)
+    
+    async def run_source(name: str, scraper_fn):
+        outcome = await controller.run(name, scraper_fn)
+        if on_source:
+            await on_source({
+                "batch_number": batch_number,
+                "source": name,
+                "opportunities": outcome[1],
+                "error": outcome[2],
+            })
+        return outcome
+    
+    # Run all scrapers in this batch
+    tasks = [run_source(name, fn) for name, fn in batch["scrapers"]]
+    results = await asyncio.gather(*tasks)
+    
+    result = await asyncio.to_thread(_build_batch_result, batch_number, results, start_time, delta)
+    result["stats"]["adaptive"] = controller.stats()
+    return result
+
+
 async def scan_all_batches_incremental(
     start_batch: int = 1,
     end_batch: int = None,
-    max_concurrent: int = 5,
+    max_concurrent: int = 10,
     callback = None,
+    delta: bool = False,
+    on_source = None,
+    collect: bool = True,
 ) -> Dict[str, Any]:
     """
-    Execute all batches incrementally, optionally calling a callback after each.
+    Execute a range of batches as one pipelined scan.
+    
+    Every scraper entry in the range goes onto a single shared work queue
+    drained by ``max_concurrent`` workers, so a slow source only delays
+    its own batch rather than every batch after it. Per-host connection
+    limits are enforced by the shared HTTP pool.
     
     Args:
         start_batch: First batch to run
         end_batch: Last batch to run (default: all)
-        max_concurrent: Max concurrent scrapers per batch
-        callback: Optional async callback(batch_result) called after each batch
+        max_concurrent: Max concurrent scrapers across the whole scan
+        callback: Optional async callback(batch_result), called as soon as
+            the last scraper of each batch finishes (completion order)
+        delta: Only return new/changed opportunities plus tombstones
+        on_source: Optional async callback(source_result) called as soon as
+            each individual scraper finishes, with its raw opportunities
+        collect: Keep every opportunity for the combined result; streaming
+            callers pass False so memory stays bounded by one batch
         
     Returns:
         Combined results from all batches
@@ -7939,10 +7920,11 @@ async def scan_all_batches_incremental(
     if end_batch is None:
         end_batch = TOTAL_BATCHES
     
-    logger.info(f"🚀 Starting incremental scan: batches {start_batch}-{end_batch}")
+    logger.info(f"🚀 Starting pipelined scan: batches {start_batch}-{end_batch}")
     start_time = datetime.utcnow()
     
     all_opportunities = []
+    removed = []
     combined_stats = {
         "total": 0,
         "by_batch": {},
@@ -7953,25 +7935,80 @@ async def scan_all_batches_incremental(
         "errors": []
     }
     
-    for batch_num in range(start_batch, end_batch + 1):
-        batch_result = await scan_batch(batch_num, max_concurrent)
-        
-        if batch_result.get("success"):
+    controller = AdaptiveScanController(max_concurrent, SCRAPER_TIMEOUT)
+    queue: asyncio.Queue = asyncio.Queue()
+    remaining: Dict[int, int] = {}
+    batch_outcomes: Dict[int, List[tuple]] = {}
+    batch_started: Dict[int, datetime] = {}
+    
+    async def finish_batch(batch_num: int):
+        batch_result = await asyncio.to_thread(
+            _build_batch_result,
+            batch_num, batch_outcomes.pop(batch_num), batch_started.get(batch_num, start_time), delta,
+        )
+        if collect:
             all_opportunities.extend(batch_result["opportunities"])
-            combined_stats["by_batch"][batch_num] = batch_result["stats"]["total"]
-            combined_stats["by_source"].update(batch_result["stats"]["by_source"])
-            combined_stats["total"] += batch_result["stats"]["total"]
-            combined_stats["batches_completed"] += 1
-            
-            # Track by category
-            cat = batch_result["stats"]["category"]
-            combined_stats["by_category"][cat] = combined_stats["by_category"].get(cat, 0) + batch_result["stats"]["total"]
-            
-            # Call callback if provided
-            if callback:
-                await callback(batch_result)
-        else:
-            combined_stats["errors"].append(f"Batch {batch_num}: {batch_result.get('error')}")
+            removed.extend(batch_result["removed"])
+        combined_stats["by_batch"][batch_num] = batch_result["stats"]["total"]
+        combined_stats["by_source"].update(batch_result["stats"]["by_source"])
+        combined_stats["total"] += batch_result["stats"]["total"]
+        combined_stats["batches_completed"] += 1
+        
+        # Track by category
+        cat = batch_result["stats"]["category"]
+        combined_stats["by_category"][cat] = combined_stats["by_category"].get(cat, 0) + batch_result["stats"]["total"]
+        
+        # Call callback if provided
+        if callback:
+            await callback(batch_result)
+    
+    empty_batches = []
+    for batch_num in range(start_batch, end_batch + 1):
+        if batch_num not in SCRAPER_BATCHES:
+            combined_stats["errors"].append(f"Batch {batch_num}: {_invalid_batch_result()['error']}")
+            continue
+        scrapers = SCRAPER_BATCHES[batch_num]["scrapers"]
+        remaining[batch_num] = len(scrapers)
+        batch_outcomes[batch_num] = []
+        if not scrapers:
+            empty_batches.append(batch_num)
+        for name, fn in scrapers:
+            queue.put_nowait((batch_num, name, fn))
+    
+    for batch_num in empty_batches:
+        await finish_batch(batch_num)
+    
+    async def worker():
+        while True:
+            try:
+                batch_num, name, fn = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            batch_started.setdefault(batch_num, datetime.utcnow())
+            outcome = await controller.run(name, fn)
+            batch_outcomes[batch_num].append(outcome)
+            if on_source:
+                await on_source({
+                    "batch_number": batch_num,
+                    "source": name,
+                    "opportunities": outcome[1],
+                    "error": outcome[2],
+                })
+            remaining[batch_num] -= 1
+            if remaining[batch_num] == 0:
+                await finish_batch(batch_num)
+    
+    # Workers only pick up entries; the controller decides how many run
+    workers = max(1, min(max_concurrent, queue.qsize()))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    combined_stats["adaptive"] = controller.stats()
+    
+    # Batches are deduplicated individually; merge across batches too
+    if collect:
+        scanned = len(all_opportunities)
+        all_opportunities = await asyncio.to_thread(merge_duplicates, all_opportunities)
+        combined_stats["duplicates_merged"] = scanned - len(all_opportunities)
+        combined_stats["total"] -= combined_stats["duplicates_merged"]
     
     # Sort final results
     all_opportunities.sort(key=lambda x: x.get("match_score", 0), reverse=True)
@@ -7982,7 +8019,9 @@ async def scan_all_batches_incremental(
     
     return {
         "success": True,
+        "mode": "delta" if delta else "full",
         "opportunities": all_opportunities,
+        "removed": removed,
         "stats": combined_stats,
         "duration_seconds": duration,
         "is_live_data": True,
@@ -7990,6 +8029,22 @@ async def scan_all_batches_incremental(
     }
 
 
+def get_batch_changes_since(batch_numbers: List[int], since: datetime) -> Dict[str, Any]:
+    """
+    Get net changes recorded for the sources of the given batches since a time.
+    
+    Returns {"opportunities": [...new/changed...], "removed": [...tombstones...]}.
+    """
+    sources = [
+        name
+        for batch_num in batch_numbers if batch_num in SCRAPER_BATCHES
+        for name, _ in SCRAPER_BATCHES[batch_num]["scrapers"]
+    ]
+    changes = get_delta_tracker().changes_since(since, sources)
+    changes["opportunities"].sort(key=lambda x: x.get("match_score", 0), reverse=True)
+    return changes
+
+
 def get_batch_info() -> Dict[str, Any]:
     """Get information about all available batches"""
     return {
@@ -8011,6 +8066,13 @@ def get_batch_info() -> Dict[str, Any]:
 # =============================================================================
 # MASTER LIVE SCAN FUNCTION
 # =============================================================================
+def _as_opportunity_list(result) -> List[Dict]:
+    """Handle both list results and dict results (from browse_and_scrape)"""
+    if isinstance(result, dict) and "opportunities" in result:
+        return result["opportunities"]
+    return result if isinstance(result, list) else []
+
+
 async def live_mega_scan(
     include_jobs: bool = True,
     include_scholarships: bool = True,
@@ -8019,10 +8081,19 @@ async def live_mega_scan(
     include_hackathons: bool = True,
     include_web_browsing: bool = False,  # Optional web browsing
     max_concurrent: int = 5,
+    delta: bool = False,
+    on_source = None,
+    collect: bool = True,
 ) -> Dict[str, Any]:
     """
     Execute LIVE scraping from real sources.
     Returns actual current opportunities from the internet.
+    With delta=True, only opportunities that are new or changed since the
+    previous mega scan are returned, plus tombstones for removed ones.
+    
+    on_source, if given, is an async callback(source_result) awaited as
+    soon as each scraper finishes; with collect=False the combined result
+    carries only stats, which keeps streaming callers' memory bounded.
     
     Features:
     - Parallel execution with concurrency control
@@ -8035,10 +8106,12 @@ async def live_mega_scan(
     start_time = datetime.utcnow()
     
     all_opportunities = []
+    removed = []
     stats = {
         "total": 0,
         "by_source": {},
         "by_type": {},
+        "delta": {"added": 0, "changed": 0, "removed": 0, "unchanged": 0},
         "scan_started": start_time.isoformat(),
         "scan_completed": None,
         "live_sources_scraped": 0,
@@ -8050,93 +8123,101 @@ async def live_mega_scan(
     
     if include_jobs:
         # API-based scrapers (most reliable)
-        tasks.append(("RemoteOK", scrape_remoteok_live(50)))
-        tasks.append(("HackerNews", scrape_hackernews_hiring(30)))
-        tasks.append(("GitHub Awesome", scrape_github_jobs_awesome_list(20)))
-        tasks.append(("Arbeitnow", scrape_arbeitnow_jobs(30)))
-        tasks.append(("Remotive", scrape_findwork_dev(30)))
-        tasks.append(("Himalayas", scrape_jobicy_remote(30)))
+        tasks.append(("RemoteOK", lambda: scrape_remoteok_live(50)))
+        tasks.append(("HackerNews", lambda: scrape_hackernews_hiring(30)))
+        tasks.append(("GitHub Awesome", lambda: scrape_github_jobs_awesome_list(20)))
+        tasks.append(("Arbeitnow", lambda: scrape_arbeitnow_jobs(30)))
+        tasks.append(("Remotive", lambda: scrape_findwork_dev(30)))
+        tasks.append(("Himalayas", lambda: scrape_jobicy_remote(30)))
         # Additional job sources
-        tasks.append(("Otta", scrape_otta_jobs(30)))
-        tasks.append(("Startup.Jobs", scrape_startup_jobs(30)))
-        tasks.append(("TrueUp", scrape_trueup_jobs(30)))
+        tasks.append(("Otta", lambda: scrape_otta_jobs(30)))
+        tasks.append(("Startup.Jobs", lambda: scrape_startup_jobs(30)))
+        tasks.append(("TrueUp", lambda: scrape_trueup_jobs(30)))
     
     if include_scholarships:
-        tasks.append(("Bold.org", scrape_scholarships_live(30)))
-        tasks.append(("Scholarships360", scrape_scholarships360(20)))
+        tasks.append(("Bold.org", lambda: scrape_scholarships_live(30)))
+        tasks.append(("Scholarships360", lambda: scrape_scholarships360(20)))
         # African opportunities (scholarships, fellowships, grants, jobs)
-        tasks.append(("OpportunitiesForAfricans", scrape_ofa_live(50)))
-        tasks.append(("VC4Africa", scrape_vc4africa_live(30)))
+        tasks.append(("OpportunitiesForAfricans", lambda: scrape_ofa_live(50)))
+        tasks.append(("VC4Africa", lambda: scrape_vc4africa_live(30)))
     
     if include_grants:
-        tasks.append(("Grants.gov", scrape_grants_gov_live(30)))
-        tasks.append(("Open Grants", scrape_open_grants(20)))
+        tasks.append(("Grants.gov", lambda: scrape_grants_gov_live(30)))
+        tasks.append(("Open Grants", lambda: scrape_open_grants(20)))
     
     if include_vc:
-        tasks.append(("Y Combinator", scrape_yc_companies(50)))
-        tasks.append(("ProductHunt", scrape_producthunt_jobs(20)))
-        tasks.append(("Crunchbase", scrape_crunchbase_funding(20)))
+        tasks.append(("Y Combinator", lambda: scrape_yc_companies(50)))
+        tasks.append(("ProductHunt", lambda: scrape_producthunt_jobs(20)))
+        tasks.append(("Crunchbase", lambda: scrape_crunchbase_funding(20)))
     
     if include_hackathons:
-        tasks.append(("Devpost", scrape_devpost_hackathons(30)))
-        tasks.append(("MLH", scrape_mlh_hackathons(20)))
+        tasks.append(("Devpost", lambda: scrape_devpost_hackathons(30)))
+        tasks.append(("MLH", lambda: scrape_mlh_hackathons(20)))
     
     # Optional: Add web browsing for extended discovery
     if include_web_browsing:
         from .web_browser_scraper import browse_and_scrape
-        tasks.append(("Web Browse", browse_and_scrape_wrapper(50)))
+        tasks.append(("Web Browse", lambda: browse_and_scrape_wrapper(50)))
     
     # Execute scrapers with concurrency control
     logger.info(f"📡 Executing {len(tasks)} live scrapers (max {max_concurrent} concurrent)...")
     
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    async def run_with_semaphore(name: str, coro):
-        async with semaphore:
-            try:
-                task_start = datetime.utcnow()
-                result = await asyncio.wait_for(coro, timeout=90.0)  # 90s timeout per scraper
-                duration = (datetime.utcnow() - task_start).total_seconds()
-                logger.debug(f"{name} completed in {duration:.1f}s with {len(result) if isinstance(result, list) else 'N/A'} items")
-                return name, result, None
-            except asyncio.TimeoutError:
-                error = "Timeout after 90s"
-                logger.warning(f"⏰ {name}: {error}")
-                return name, [], error
-            except Exception as e:
-                error = str(e)
-                logger.warning(f"❌ {name}: {error}")
-                return name, [], error
-    
-    # Run all scrapers
-    wrapped_tasks = [run_with_semaphore(name, coro) for name, coro in tasks]
-    results = await asyncio.gather(*wrapped_tasks)
+    controller = AdaptiveScanController(max_concurrent, MEGA_SCAN_TIMEOUT)
     
-    # Process results
-    for name, result, error in results:
+    async def record(name: str, result, error):
+        """Fold one scraper's outcome into the scan totals as it completes"""
         if error:
             stats["errors"].append(f"{name}: {error}")
             stats["sources_failed"] += 1
-        else:
-            # Handle both list results and dict results (from browse_and_scrape)
-            if isinstance(result, dict) and "opportunities" in result:
-                opportunities = result["opportunities"]
-            else:
-                opportunities = result if isinstance(result, list) else []
-            
+            return
+        opportunities = _as_opportunity_list(result)
+        
+        # Mega-scan marks are namespaced: its source names map to
+        # different scrapers than the batch entries of the same name
+        source_delta = await asyncio.to_thread(_track_source, f"mega/{name}", opportunities)
+        for key, count in source_delta.counts().items():
+            stats["delta"][key] += count
+        stats["by_source"][name] = len(opportunities)
+        stats["live_sources_scraped"] += 1
+        if delta:
+            opportunities = source_delta.emitted
+            removed.extend(source_delta.removed)
+        stats["total"] += len(opportunities)
+        if collect:
             all_opportunities.extend(opportunities)
-            stats["by_source"][name] = len(opportunities)
-            stats["live_sources_scraped"] += 1
-            
-            # Count by type
-            for opp in opportunities:
-                opp_type = opp.get("opportunity_type", "unknown")
-                stats["by_type"][opp_type] = stats["by_type"].get(opp_type, 0) + 1
+        
+        # Count by type
+        for opp in opportunities:
+            opp_type = opp.get("opportunity_type", "unknown")
+            stats["by_type"][opp_type] = stats["by_type"].get(opp_type, 0) + 1
+    
+    async def run_source(name: str, scraper_fn):
+        # Mega-scan source names map to different scrapers than batch entries
+        name, result, error = await controller.run(name, scraper_fn, metrics_name=f"mega/{name}")
+        if error:
+            logger.warning(f"❌ {name}: {error}")
+        await record(name, result, error)
+        if on_source:
+            await on_source({
+                "source": name,
+                "opportunities": _as_opportunity_list(result),
+                "error": error,
+            })
+    
+    # Run all scrapers
+    await asyncio.gather(*(run_source(name, scraper_fn) for name, scraper_fn in tasks))
+    stats["adaptive"] = controller.stats()
+    
+    # Fold the same listing found on several sources into one record
+    if collect:
+        scanned = len(all_opportunities)
+        all_opportunities = await asyncio.to_thread(merge_duplicates, all_opportunities)
+        stats["duplicates_merged"] = scanned - len(all_opportunities)
+        stats["total"] -= stats["duplicates_merged"]
     
     # Sort by match score
     all_opportunities.sort(key=lambda x: x.get("match_score", 0), reverse=True)
     
-    stats["total"] = len(all_opportunities)
     stats["scan_completed"] = datetime.utcnow().isoformat()
     
     duration = (datetime.utcnow() - start_time).total_seconds()
@@ -8152,7 +8233,9 @@ async def live_mega_scan(
     logger.info(f"{'='*60}")
     
     return {
+        "mode": "delta" if delta else "full",
         "opportunities": all_opportunities,
+        "removed": removed,
         "stats": stats,
         "is_live_data": True,
         "duration_seconds": duration,
@@ -0,0 +1,342 @@
+"""
+Persistent Scraper Metrics
+==========================
+Shared, persistent store for ScraperMetrics and circuit-breaker state.
+
+The metrics registry in ``base_scraper`` lives in process memory, so a
+restart forgot which sources were failing and every worker kept its own
+circuit breakers. ``MetricsSync`` keeps the registry backed by a store:
+
+- on first use it loads every source's metrics, so open circuits survive
+  restarts
+- changed metrics are written in batches every ``FLUSH_INTERVAL`` seconds
+  from a background task, off the scrapers' hot path
+- every ``REFRESH_INTERVAL`` seconds it reads back what other workers
+  wrote, so circuit state is consistent across the fleet
+
+Stores: SQLite (``data/scraper_metrics.db``) locally, the application's
+Postgres database in production. Pick one with SCRAPER_METRICS_STORE
+(``sqlite``, ``postgres`` or ``off``); by default Postgres is used when
+ENVIRONMENT is ``production``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import base_scraper
+from .base_scraper import ScraperMetrics
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_METRICS_PATH = Path(__file__).parent.parent.parent / "data" / "scraper_metrics.db"
+FLUSH_INTERVAL = 5.0  # seconds between batched writes
+REFRESH_INTERVAL = 15.0  # seconds between reads of other workers' state
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS scraper_metrics (
+    name TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    circuit_open_until DOUBLE PRECISION,
+    updated_at DOUBLE PRECISION NOT NULL
+)
+"""
+
+# Last writer wins, but never with an older snapshot
+UPSERT_SQL = """
+INSERT INTO scraper_metrics (name, payload, circuit_open_until, updated_at)
+VALUES ({params})
+ON CONFLICT (name) DO UPDATE SET
+    payload = excluded.payload,
+    circuit_open_until = excluded.circuit_open_until,
+    updated_at = excluded.updated_at
+WHERE scraper_metrics.updated_at <= excluded.updated_at
+"""
+
+
+def _row(name: str, record: Dict[str, Any]) -> tuple:
+    circuit = record.get("circuit_open_until")
+    circuit_epoch = datetime.fromisoformat(circuit).timestamp() if circuit else None
+    return name, json.dumps(record), circuit_epoch, record["updated_at"]
+
+
+class MetricsStore(ABC):
+    """Where scraper metrics snapshots are kept"""
+
+    name = "abstract"
+
+    @abstractmethod
+    async def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """All stored snapshots by scraper name"""
+
+    @abstractmethod
+    async def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Upsert snapshots by scraper name"""
+
+    async def close(self) -> None:
+        return None
+
+
+class SQLiteMetricsStore(MetricsStore):
+    """Metrics in a local SQLite file, shared by the workers on one host"""
+
+    name = "sqlite"
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_METRICS_PATH
+        self._lock = threading.Lock()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Scraper metrics at {self.path} unavailable ({e}), using in-memory store")
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.execute(CREATE_TABLE_SQL)
+        self._conn.commit()
+
+    def _load_all(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, payload FROM scraper_metrics").fetchall()
+        return {name: json.loads(payload) for name, payload in rows}
+
+    def _save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                UPSERT_SQL.format(params="?, ?, ?, ?"),
+                [_row(name, record) for name, record in records.items()],
+            )
+            self._conn.commit()
+
+    async def load_all(self) -> Dict[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self._load_all)
+
+    async def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        if records:
+            await asyncio.to_thread(self._save_many, records)
+
+
+class PostgresMetricsStore(MetricsStore):
+    """Metrics in the application's Postgres database, shared by the fleet"""
+
+    name = "postgres"
+
+    def __init__(self, engine=None):
+        if engine is None:
+            from ..data.database import engine
+        self.engine = engine
+        self._table_ready = False
+
+    async def _ensure_table(self, conn) -> None:
+        if not self._table_ready:
+            from sqlalchemy import text
+            await conn.execute(text(CREATE_TABLE_SQL))
+            self._table_ready = True
+
+    async def load_all(self) -> Dict[str, Dict[str, Any]]:
+        from sqlalchemy import text
+        async with self.engine.begin() as conn:
+            await self._ensure_table(conn)
+            rows = (await conn.execute(text("SELECT name, payload FROM scraper_metrics"))).all()
+        return {name: json.loads(payload) for name, payload in rows}
+
+    async def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        if not records:
+            return
+        from sqlalchemy import text
+        statement = text(UPSERT_SQL.format(params=":name, :payload, :circuit_open_until, :updated_at"))
+        params = [
+            dict(zip(("name", "payload", "circuit_open_until", "updated_at"), _row(name, record)))
+            for name, record in records.items()
+        ]
+        async with self.engine.begin() as conn:
+            await self._ensure_table(conn)
+            await conn.execute(statement, params)
+
+
+def create_metrics_store() -> Optional[MetricsStore]:
+    """
+    Build the configured metrics store.
+
+    Returns None when persistence is turned off. Falls back to SQLite if
+    Postgres is requested but not configured.
+    """
+    choice = os.getenv("SCRAPER_METRICS_STORE", "auto").lower()
+    if choice == "off":
+        return None
+    if choice == "auto":
+        choice = "postgres" if os.getenv("ENVIRONMENT") == "production" else "sqlite"
+    if choice == "postgres":
+        try:
+            return PostgresMetricsStore()
+        except Exception as e:
+            logger.warning(f"Postgres metrics store unavailable ({e}), using SQLite")
+    return SQLiteMetricsStore()
+
+
+class MetricsSync:
+    """Keeps the in-process metrics registry in step with a MetricsStore"""
+
+    def __init__(
+        self,
+        store: MetricsStore,
+        flush_interval: float = FLUSH_INTERVAL,
+        refresh_interval: float = REFRESH_INTERVAL,
+    ):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.refresh_interval = refresh_interval
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loaded: Optional[asyncio.Future] = None
+        self._last_refresh = 0.0
+        self.stats = {"flushes": 0, "written": 0, "refreshes": 0, "adopted": 0, "errors": 0}
+
+    async def start(self) -> None:
+        """Load stored metrics once, then flush and refresh in the background"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new event loop (tests, CLI runs)
+            self._loop = loop
+            self._loaded = loop.create_future()
+            self._task = loop.create_task(self._run())
+        await asyncio.shield(self._loaded)
+
+    async def _run(self) -> None:
+        try:
+            await self.refresh()
+        finally:
+            if not self._loaded.done():
+                self._loaded.set_result(None)
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if time.time() - self._last_refresh >= self.refresh_interval:
+                await self.refresh()
+
+    async def flush(self) -> int:
+        """Write metrics changed since the last flush; returns how many"""
+        names = list(base_scraper._dirty_metrics)
+        base_scraper._dirty_metrics.difference_update(names)
+        registry = base_scraper._scraper_metrics
+        records = {name: registry[name].to_record() for name in names if name in registry}
+        if not records:
+            return 0
+        try:
+            await self.store.save_many(records)
+        except Exception as e:
+            base_scraper._dirty_metrics.update(records)  # Retry on the next flush
+            self.stats["errors"] += 1
+            logger.warning(f"Could not persist scraper metrics ({self.store.name}): {e}")
+            return 0
+        self.stats["flushes"] += 1
+        self.stats["written"] += len(records)
+        return len(records)
+
+    async def refresh(self) -> int:
+        """Adopt snapshots other workers wrote since our own last change"""
+        try:
+            stored = await self.store.load_all()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Could not load scraper metrics ({self.store.name}): {e}")
+            return 0
+        self._last_refresh = time.time()
+        self.stats["refreshes"] += 1
+        adopted = 0
+        registry = base_scraper._scraper_metrics
+        for name, record in stored.items():
+            local = registry.get(name)
+            if local is not None and (name in base_scraper._dirty_metrics or local.updated_at >= record.get("updated_at", 0)):
+                # Unsaved local changes win, but an open circuit elsewhere still applies
+                remote = ScraperMetrics.from_record(name, record)
+                if remote.circuit_open_until and (local.circuit_open_until is None or remote.circuit_open_until > local.circuit_open_until):
+                    local.circuit_open_until = remote.circuit_open_until
+                continue
+            remote = ScraperMetrics.from_record(name, record)
+            if local is None:
+                registry[name] = remote
+            else:
+                # In place: scrapers hold references to their metrics object
+                for f in fields(ScraperMetrics):
+                    setattr(local, f.name, getattr(remote, f.name))
+            adopted += 1
+        self.stats["adopted"] += adopted
+        return adopted
+
+    async def stop(self) -> None:
+        """Flush pending changes and stop the background task"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            self._loop = None
+        await self.flush()
+        await self.store.close()
+
+
+_metrics_sync: Optional[MetricsSync] = None
+_metrics_sync_checked = False
+
+
+def get_metrics_sync() -> Optional[MetricsSync]:
+    """Get the process-wide metrics sync, or None when persistence is off"""
+    global _metrics_sync, _metrics_sync_checked
+    if not _metrics_sync_checked:
+        _metrics_sync_checked = True
+        store = create_metrics_store()
+        if store is not None:
+            _metrics_sync = MetricsSync(store)
+    return _metrics_sync
+
+
+async def ensure_metrics_sync() -> None:
+    """Start metrics persistence on the running loop (cheap once started)"""
+    sync = get_metrics_sync()
+    if sync is not None:
+        await sync.start()
+
+
+def _reset_in_place(metrics: ScraperMetrics) -> None:
+    """Clear counters and circuit state, keeping the object scrapers hold"""
+    blank = ScraperMetrics(name=metrics.name)
+    for f in fields(ScraperMetrics):
+        setattr(metrics, f.name, getattr(blank, f.name))
+    metrics._touch()
+
+
+async def reset_scraper_metrics(name: Optional[str] = None) -> List[str]:
+    """
+    Reset one scraper's metrics (or all of them) and overwrite the stored rows.
+
+    Metrics are reset in place so running scrapers see the change, and the
+    fresh snapshot is written straight away with a newer ``updated_at`` so
+    the next refresh does not re-adopt the old circuit state.
+
+    Returns the names that were reset; empty if ``name`` is unknown.
+    """
+    sync = get_metrics_sync()
+    if sync is not None:
+        # Load stored state first so the initial refresh can't undo the reset
+        await sync.start()
+
+    registry = base_scraper._scraper_metrics
+    names = [name] if name is not None else list(registry)
+    names = [n for n in names if n in registry]
+    for n in names:
+        _reset_in_place(registry[n])
+
+    if sync is not None and names:
+        await sync.store.save_many({n: registry[n].to_record() for n in names})
+        base_scraper._dirty_metrics.difference_update(names)
+    return names
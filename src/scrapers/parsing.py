@@ -0,0 +1,193 @@
+"""
+Off-Loop HTML Parsing
+=====================
+Parse stage that keeps HTML/XML parsing off the event loop.
+
+Scrapers used to build a ``BeautifulSoup`` tree inside their coroutines,
+which blocks the loop that also serves API requests. Instead they hand the
+markup to ``parse_items`` together with the selectors they need:
+
+    for job in await parse_items(resp.text, ".job-card", ["h2, h3", "a"], limit=limit):
+        title_el = job.select_one("h2, h3")
+        link = job.select_one("a")
+
+Parsing and extraction run in a process pool and come back as plain,
+picklable ``ParsedItem`` objects that answer ``select_one``/``find`` for
+the requested selectors, so the scraper coroutine only does I/O. HTML is
+parsed with selectolax (lexbor) when installed, falling back to
+BeautifulSoup.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+PARSE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+INLINE_PARSE_BYTES = 16 * 1024  # Smaller documents aren't worth the IPC round trip
+
+SELECTOLAX_AVAILABLE = importlib.util.find_spec("selectolax") is not None
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+
+
+@dataclass
+class ParsedElement:
+    """Text and attributes of one matched element"""
+    text: str = ""
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> str:
+        return self.attrs[name]
+
+    def get(self, name: str, default=None):
+        return self.attrs.get(name, default)
+
+    def get_text(self, strip: bool = False) -> str:
+        return self.text.strip() if strip else self.text
+
+
+@dataclass
+class ParsedItem(ParsedElement):
+    """A matched container plus the child elements its scraper asked for"""
+    children: Dict[str, Optional[ParsedElement]] = field(default_factory=dict)
+
+    def select_one(self, selector: str) -> Optional[ParsedElement]:
+        """First match for a CSS selector passed to ``parse_items``"""
+        return self.children[selector]
+
+    def find(self, name: str) -> Optional[ParsedElement]:
+        """First child tag with a name passed to ``parse_items``"""
+        return self.children[name]
+
+
+# =============================================================================
+# Extraction (runs in worker processes)
+# =============================================================================
+
+def _extract_selectolax(markup: str, container: str, children: Sequence[str], limit: Optional[int]) -> List[ParsedItem]:
+    from selectolax.lexbor import LexborHTMLParser
+
+    def element(node) -> ParsedElement:
+        attrs = {name: value or "" for name, value in node.attributes.items()}
+        return ParsedElement(text=node.text(deep=True), attrs=attrs)
+
+    items = []
+    for node in LexborHTMLParser(markup).css(container)[:limit]:
+        matches = {}
+        for selector in children:
+            child = node.css_first(selector)
+            matches[selector] = element(child) if child is not None else None
+        parsed = element(node)
+        items.append(ParsedItem(text=parsed.text, attrs=parsed.attrs, children=matches))
+    return items
+
+
+def _extract_soup(markup: str, container: str, children: Sequence[str], limit: Optional[int], mode: str) -> List[ParsedItem]:
+    from bs4 import BeautifulSoup
+
+    def element(tag) -> ParsedElement:
+        attrs = {
+            name: " ".join(value) if isinstance(value, list) else value
+            for name, value in tag.attrs.items()
+        }
+        return ParsedElement(text=tag.text, attrs=attrs)
+
+    if mode == "xml":
+        soup = BeautifulSoup(markup, "xml")
+        nodes = soup.find_all(container)[:limit]
+        first = lambda node, name: node.find(name)
+    else:
+        soup = BeautifulSoup(markup, "lxml" if LXML_AVAILABLE else "html.parser")
+        nodes = soup.select(container)[:limit]
+        first = lambda node, selector: node.select_one(selector)
+
+    items = []
+    for node in nodes:
+        matches = {}
+        for selector in children:
+            child = first(node, selector)
+            matches[selector] = element(child) if child is not None else None
+        parsed = element(node)
+        items.append(ParsedItem(text=parsed.text, attrs=parsed.attrs, children=matches))
+    return items
+
+
+def extract_items(
+    markup: str,
+    container: str,
+    children: Sequence[str] = (),
+    limit: Optional[int] = None,
+    mode: str = "html",
+) -> List[ParsedItem]:
+    """
+    Parse markup and extract matching containers with their child elements.
+
+    mode="html": container and children are CSS selectors.
+    mode="xml": container and children are tag names (RSS/Atom, sitemaps).
+    """
+    if mode == "html" and SELECTOLAX_AVAILABLE:
+        try:
+            return _extract_selectolax(markup, container, children, limit)
+        except Exception as e:
+            # Selector lexbor can't handle - BeautifulSoup's soupsieve may
+            logger.debug(f"selectolax failed on {container!r} ({e}), falling back to BeautifulSoup")
+    return _extract_soup(markup, container, children, limit, mode)
+
+
+# =============================================================================
+# Process pool
+# =============================================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_failed = False
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool, _pool_failed
+    if _pool is None and not _pool_failed:
+        try:
+            # spawn: the parent runs threads (cache sweeper, asyncio) that fork would copy mid-state
+            _pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        except (OSError, NotImplementedError, ValueError) as e:
+            # Sandboxed runtimes without process support parse on a thread instead
+            logger.warning(f"HTML parse pool unavailable ({e}), parsing on threads")
+            _pool_failed = True
+    return _pool
+
+
+async def parse_items(
+    markup: str,
+    container: str,
+    children: Sequence[str] = (),
+    limit: Optional[int] = None,
+    mode: str = "html",
+) -> List[ParsedItem]:
+    """Run ``extract_items`` off the event loop and return plain items"""
+    if len(markup) <= INLINE_PARSE_BYTES:
+        return extract_items(markup, container, children, limit, mode)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    if pool is not None:
+        try:
+            return await loop.run_in_executor(pool, extract_items, markup, container, tuple(children), limit, mode)
+        except BrokenProcessPool:
+            logger.warning("HTML parse pool broke, restarting it")
+            await close_parse_pool()
+    return await asyncio.to_thread(extract_items, markup, container, children, limit, mode)
+
+
+async def close_parse_pool() -> None:
+    """Shut down the parse pool (e.g. on application shutdown)"""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown, wait=False, cancel_futures=True)
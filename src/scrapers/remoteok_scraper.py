@@ -6,12 +6,13 @@ This is one of the easiest sources - they have a public JSON API!
 """
 
 import asyncio
-import httpx
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
 import hashlib
 
+from .http_pool import pooled_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,7 +43,7 @@ class RemoteOKScraper:
         jobs = []
         
         try:
-            async with httpx.AsyncClient(headers=self.headers, timeout=30) as client:
+            async with pooled_client(headers=self.headers, timeout=30) as client:
                 response = await client.get(self.API_URL)
                 response.raise_for_status()
                 
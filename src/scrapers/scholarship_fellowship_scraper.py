@@ -6,7 +6,6 @@ from major platforms worldwide.
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -15,6 +14,7 @@ import re
 import json
 
 from .base_scraper import BaseScraper, Opportunity
+from .http_pool import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,7 @@ class ScholarshipsComScraper(BaseScraper):
         """Scrape scholarships"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             for category in self.categories:
                 try:
                     await self._wait_for_rate_limit()
@@ -119,7 +119,7 @@ class FastwedScraper(BaseScraper):
         """Scrape Fastweb scholarships"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             categories = [
                 "scholarships-by-type",
                 "scholarships-by-major",
@@ -441,7 +441,7 @@ class FellowshipsScraper(BaseScraper):
             ))
         
         # Scrape ProFellow for more
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             try:
                 await self._wait_for_rate_limit()
                 url = f"{self.base_url}/fellowships/"
@@ -513,7 +513,7 @@ class InternationalScholarshipsScraper(BaseScraper):
             "fully-funded-scholarships",
         ]
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             for category in categories:
                 try:
                     await self._wait_for_rate_limit()
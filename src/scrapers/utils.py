@@ -8,12 +8,16 @@ import asyncio
 import httpx
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Callable, TypeVar, Optional
+from typing import List, Dict, Any, Awaitable, Callable, Iterable, TypeVar, Optional
 from functools import wraps
 
+from ..rate_limit import Rate, RateLimiter
+from .http_pool import pooled_client
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
+R = TypeVar('R')
 
 
 # Common headers to avoid blocks
@@ -58,7 +62,7 @@ async def safe_request(
     
     for attempt in range(retries):
         try:
-            async with httpx.AsyncClient(
+            async with pooled_client(
                 timeout=timeout,
                 headers=request_headers,
                 follow_redirects=True
@@ -202,6 +206,62 @@ async def run_scrapers_safely(
     }
 
 
+async def fan_out(
+    items: Iterable[T],
+    fetch: Callable[[T], Awaitable[R]],
+    max_concurrent: int = 16,
+    timeout: Optional[float] = 15.0,
+) -> List[Optional[R]]:
+    """
+    Run detail fetches for a list of items concurrently.
+    
+    Replaces list-then-detail loops that awaited one request at a time.
+    At most max_concurrent fetches run at once, on top of the shared
+    pool's per-host connection cap. The whole batch is bounded by timeout:
+    stragglers are cancelled and the results gathered so far are returned.
+    
+    Args:
+        items: Items to fetch details for (ids, URLs, ...)
+        fetch: Coroutine function fetching one item
+        max_concurrent: Maximum fetches in flight
+        timeout: Seconds for the whole batch (None waits for all)
+        
+    Returns:
+        Results in the same order as items; None where a fetch failed or
+        missed the deadline
+    """
+    items = list(items)
+    if not items:
+        return []
+    
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fetch(item)
+    
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.debug(f"fan_out: {len(pending)}/{len(items)} fetches missed the {timeout}s deadline")
+    
+    results: List[Optional[R]] = []
+    for task in tasks:
+        if task in done and not task.cancelled() and task.exception() is None:
+            results.append(task.result())
+        else:
+            if task in done and not task.cancelled():
+                logger.debug(f"fan_out: fetch failed: {task.exception()}")
+            results.append(None)
+    return results
+
+
 def retry_on_failure(
     retries: int = 3,
     delay: float = 1.0,
@@ -239,47 +299,6 @@ def retry_on_failure(
     return decorator
 
 
-class RateLimiter:
-    """
-    Token bucket rate limiter for controlling request rates.
-    
-    Usage:
-        limiter = RateLimiter(rate=1.0)  # 1 request per second
-        await limiter.acquire()
-        # make request
-    """
-    
-    def __init__(self, rate: float = 1.0, burst: int = 1):
-        """
-        Args:
-            rate: Requests per second
-            burst: Maximum burst size
-        """
-        self.rate = rate
-        self.burst = burst
-        self.tokens = burst
-        self.last_update = datetime.now()
-        self._lock = asyncio.Lock()
-    
-    async def acquire(self):
-        """Wait until a request can be made."""
-        async with self._lock:
-            now = datetime.now()
-            elapsed = (now - self.last_update).total_seconds()
-            
-            # Refill tokens
-            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens < 1:
-                # Wait for token
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
-
-
 # Additional utility functions for accelerator scraper
 def clean_text(text: str) -> str:
     """Clean and normalize text content"""
@@ -6,7 +6,6 @@ accelerators, and startup platforms.
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -15,6 +14,7 @@ import re
 import json
 
 from .base_scraper import BaseScraper, Opportunity
+from .http_pool import pooled_client, PooledClient
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class YCombinatorScraper(BaseScraper):
         """Scrape YC jobs and programs"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             # YC startup jobs
             try:
                 jobs = await self._scrape_startup_jobs(client, max_pages)
@@ -49,7 +49,7 @@ class YCombinatorScraper(BaseScraper):
         
         return opportunities
     
-    async def _scrape_startup_jobs(self, client: httpx.AsyncClient, max_pages: int) -> List[Opportunity]:
+    async def _scrape_startup_jobs(self, client: PooledClient, max_pages: int) -> List[Opportunity]:
         """Scrape Work at a Startup jobs"""
         opportunities = []
         
@@ -182,7 +182,7 @@ class TechstarsScraper(BaseScraper):
         """Scrape Techstars programs"""
         opportunities = []
         
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.default_headers) as client:
+        async with pooled_client(timeout=self.timeout, headers=self.default_headers) as client:
             try:
                 await self._wait_for_rate_limit()
                 url = f"{self.base_url}/accelerators/"
@@ -13,7 +13,6 @@ Features:
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Set
@@ -24,13 +23,14 @@ import hashlib
 from urllib.parse import urljoin, urlparse, quote_plus
 import random
 
-from .utils import safe_request, retry_on_failure, RateLimiter
+from .utils import safe_request, retry_on_failure, Rate, RateLimiter
 from .base_scraper import get_scraper_metrics
+from .http_pool import pooled_client
 
 logger = logging.getLogger(__name__)
 
 # Rate limiters for search engines (be very conservative)
-SEARCH_RATE_LIMITER = RateLimiter(rate=0.2, burst=1)  # 1 request per 5 seconds
+SEARCH_RATE_LIMITER = RateLimiter(Rate(0.2, burst=1), name="web_search")  # 1 request per 5 seconds
 
 
 def generate_id(source: str, title: str, url: str) -> str:
@@ -83,7 +83,7 @@ async def search_google_for_opportunities(
             "Accept-Language": "en-US,en;q=0.5",
         }
         
-        async with httpx.AsyncClient(timeout=30.0, headers=headers, follow_redirects=True) as client:
+        async with pooled_client(timeout=30.0, headers=headers, follow_redirects=True) as client:
             response = await client.get(url)
             
             if response.status_code == 200:
@@ -188,7 +188,7 @@ class DynamicScraper:
     ]
     
     def __init__(self):
-        self.rate_limiter = RateLimiter(rate=0.5, burst=2)
+        self.rate_limiter = RateLimiter(Rate(0.5, burst=2))
     
     async def scrape_website(
         self,
@@ -213,7 +213,7 @@ class DynamicScraper:
                 "Accept-Language": "en-US,en;q=0.5",
             }
             
-            async with httpx.AsyncClient(timeout=30.0, headers=headers, follow_redirects=True) as client:
+            async with pooled_client(timeout=30.0, headers=headers, follow_redirects=True) as client:
                 response = await client.get(url)
                 
                 if response.status_code == 200:
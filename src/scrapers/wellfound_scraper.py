@@ -5,7 +5,6 @@ Scrapes startup jobs from Wellfound's job listings.
 """
 
 import asyncio
-import httpx
 import re
 import logging
 from datetime import datetime
@@ -14,6 +13,8 @@ from bs4 import BeautifulSoup
 import hashlib
 import json
 
+from .http_pool import pooled_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,7 +81,7 @@ class WellfoundScraper:
             params["remote"] = "true"
         
         try:
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30) as client:
+            async with pooled_client(headers=self.headers, follow_redirects=True, timeout=30) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
                 
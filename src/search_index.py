@@ -0,0 +1,535 @@
+"""
+Full-Text Search Index for Growth Engine
+
+In-process inverted index over scraped opportunities with BM25 ranking,
+prefix matching on the last query term (search-as-you-type) and field
+boosts for title, company and tags.
+
+The index is updated incrementally: scans upsert each source's listing
+(unchanged records are skipped by content hash) and remove tombstoned
+ids, so queries never rescan the whole corpus.
+"""
+
+import bisect
+import heapq
+import itertools
+import logging
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .filters import create_sample_opportunities, global_filter
+from .hashing import content_hash, opportunity_key
+from .scrapers.delta_scan import get_delta_tracker
+
+logger = logging.getLogger(__name__)
+
+
+# Weight of a term occurrence per field
+FIELD_BOOSTS = {
+    "title": 3.0,
+    "company": 2.0,
+    "tags": 2.0,
+    "description": 1.0,
+    "location": 1.0,
+}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_LENGTH = 12
+MAX_PREFIX_EXPANSIONS = 50
+PREFIX_WEIGHT = 0.8  # Completions score slightly below exact matches
+IMPACT_CACHE_SIZE = 2000  # Terms whose per-document scores are kept
+DENSE_FILTER_RATIO = 4  # Filters passing over 1 in 4 documents page by walking ids in order
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "is", "it", "of", "on", "or", "the", "to", "with",
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[+#]+)?")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stop words; keeps c++ / c# intact"""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def _field_text(opportunity: Dict[str, Any], field: str) -> str:
+    value = opportunity.get(field)
+    if not value:
+        return ""
+    if isinstance(value, (list, tuple, set)):
+        return " ".join(str(v) for v in value)
+    return str(value)
+
+
+def _rank_key(item: Tuple[str, float]) -> Tuple[float, str]:
+    """Result order: best score first, ties by doc id so pages are stable"""
+    doc_id, score = item
+    return -score, doc_id
+
+
+def _unscored_rank_key(doc_id: str) -> Tuple[float, str]:
+    """_rank_key of an empty-query match (every document scores 0)"""
+    return 0.0, doc_id
+
+
+def _categories(opportunity: Dict[str, Any]) -> List[str]:
+    """Categories quick_category_filter would match the opportunity to"""
+    # One field per line, so a keyword can't match across two fields
+    text = "\n".join(_field_text(opportunity, field) for field in ("title", "description", "company", "tags")).lower()
+    return [
+        category for category, keywords in global_filter.CATEGORIES.items()
+        if any(keyword in text for keyword in keywords)
+    ]
+
+
+def _salary(opportunity: Dict[str, Any]) -> Optional[float]:
+    value = opportunity.get("salary")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+class SearchIndex:
+    """Inverted index with BM25 scoring and incremental updates"""
+
+    def __init__(self, field_boosts: Optional[Dict[str, float]] = None):
+        self.field_boosts = field_boosts or FIELD_BOOSTS
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, str] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_len: Dict[str, float] = {}
+        self._total_len = 0.0
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._prefixes: Dict[str, Set[str]] = {}
+        self._generation = 0
+        self._impact_cache: "OrderedDict[str, Tuple[int, Dict[str, float]]]" = OrderedDict()
+        # Filter postings, so search filters are set intersections, not scans
+        self._sorted_ids: List[str] = []
+        self._categories: Dict[str, Set[str]] = {}
+        self._remote: Dict[Any, Set[str]] = {}
+        self._salaries: List[Tuple[float, str]] = []  # sorted (salary, doc id)
+        self._no_salary: Set[str] = set()
+        self._locations: Dict[str, Set[str]] = {}  # lowercased location -> doc ids
+        self._doc_fields: Dict[str, Tuple[Any, Optional[float], str]] = {}  # indexed (remote, salary, location)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._docs
+
+    # ---- updates ----
+
+    def _analyze(self, opportunity: Dict[str, Any]) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+        for field, boost in self.field_boosts.items():
+            for term, count in Counter(tokenize(_field_text(opportunity, field))).items():
+                weights[term] = weights.get(term, 0.0) + boost * count
+        return weights
+
+    def _add_term(self, term: str) -> None:
+        for length in range(MIN_PREFIX_LENGTH, min(len(term), MAX_PREFIX_LENGTH) + 1):
+            self._prefixes.setdefault(term[:length], set()).add(term)
+
+    def _drop_term(self, term: str) -> None:
+        for length in range(MIN_PREFIX_LENGTH, min(len(term), MAX_PREFIX_LENGTH) + 1):
+            prefix = term[:length]
+            terms = self._prefixes.get(prefix)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._prefixes[prefix]
+
+    def _index_fields(self, doc_id: str, opportunity: Dict[str, Any]) -> None:
+        bisect.insort(self._sorted_ids, doc_id)
+        for category in _categories(opportunity):
+            self._categories.setdefault(category, set()).add(doc_id)
+        remote = opportunity.get("remote", False)
+        try:
+            self._remote.setdefault(remote, set()).add(doc_id)
+        except TypeError:
+            remote = None  # Unhashable flag; never equal to a filter value anyway
+        salary = _salary(opportunity)
+        if salary is None:
+            self._no_salary.add(doc_id)
+        else:
+            bisect.insort(self._salaries, (salary, doc_id))
+        location = _field_text(opportunity, "location").lower()
+        self._locations.setdefault(location, set()).add(doc_id)
+        self._doc_fields[doc_id] = (remote, salary, location)
+
+    def _unindex_fields(self, doc_id: str) -> None:
+        # Uses the values indexed, in case the stored dict was changed since
+        remote, salary, location = self._doc_fields.pop(doc_id)
+        del self._sorted_ids[bisect.bisect_left(self._sorted_ids, doc_id)]
+        for docs in self._categories.values():
+            docs.discard(doc_id)
+        self._remote.get(remote, set()).discard(doc_id)
+        if salary is None:
+            self._no_salary.discard(doc_id)
+        else:
+            del self._salaries[bisect.bisect_left(self._salaries, (salary, doc_id))]
+        docs = self._locations[location]
+        docs.discard(doc_id)
+        if not docs:
+            del self._locations[location]
+
+    def _remove(self, doc_id: str) -> None:
+        self._unindex_fields(doc_id)
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._drop_term(term)
+        self._total_len -= self._doc_len.pop(doc_id)
+        del self._docs[doc_id]
+        del self._hashes[doc_id]
+        self._generation += 1
+
+    def upsert(self, opportunity: Dict[str, Any]) -> bool:
+        """Add or replace one opportunity; returns False if it was unchanged"""
+        doc_id = opportunity_key(opportunity)
+        digest = content_hash(opportunity)
+        with self._lock:
+            if self._hashes.get(doc_id) == digest:
+                return False
+            if doc_id in self._docs:
+                self._remove(doc_id)
+
+            weights = self._analyze(opportunity)
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._add_term(term)
+                postings[doc_id] = weight
+            length = sum(weights.values())
+            self._docs[doc_id] = opportunity
+            self._hashes[doc_id] = digest
+            self._index_fields(doc_id, opportunity)
+            self._doc_terms[doc_id] = weights
+            self._doc_len[doc_id] = length
+            self._total_len += length
+            self._generation += 1
+            return True
+
+    def upsert_many(self, opportunities: Iterable[Dict[str, Any]]) -> int:
+        """Upsert opportunities and return how many were new or changed"""
+        with self._lock:
+            return sum(1 for opp in opportunities if self.upsert(opp))
+
+    def remove(self, doc_id: str) -> bool:
+        with self._lock:
+            if doc_id not in self._docs:
+                return False
+            self._remove(doc_id)
+            return True
+
+    def remove_many(self, doc_ids: Iterable[str]) -> int:
+        with self._lock:
+            return sum(1 for doc_id in doc_ids if self.remove(doc_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            for store in (
+                self._docs, self._hashes, self._doc_terms, self._doc_len, self._postings, self._prefixes,
+                self._impact_cache, self._sorted_ids, self._categories, self._remote, self._salaries,
+                self._no_salary, self._locations, self._doc_fields,
+            ):
+                store.clear()
+            self._total_len = 0.0
+
+    # ---- queries ----
+
+    def _expand(self, token: str, prefix: bool) -> Dict[str, float]:
+        """Index terms matching a query token, with their weights"""
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+        if prefix and len(token) >= MIN_PREFIX_LENGTH:
+            completions = self._prefixes.get(token[:MAX_PREFIX_LENGTH], ())
+            if len(token) > MAX_PREFIX_LENGTH:
+                completions = [term for term in completions if term.startswith(token)]
+            ranked = heapq.nlargest(
+                MAX_PREFIX_EXPANSIONS, (term for term in completions if term != token),
+                key=lambda term: len(self._postings[term]),
+            )
+            for term in ranked:
+                expansions[term] = PREFIX_WEIGHT
+        return expansions
+
+    def _scores(self, query: str, prefix: bool, allowed: Optional[Set[str]] = None) -> Dict[str, float]:
+        """BM25 scores of the documents matching every query token (and in ``allowed``)"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return {}
+
+        groups = [self._expand(token, prefix and i == len(tokens) - 1) for i, token in enumerate(tokens)]
+        if any(not group for group in groups):
+            return {}
+
+        # Every query token must match (AND); intersect the rarest first
+        def group_docs(group: Dict[str, float]) -> Set[str]:
+            if len(group) == 1:
+                return self._postings[next(iter(group))].keys()
+            docs: Set[str] = set()
+            for term in group:
+                docs.update(self._postings[term])
+            return docs
+
+        doc_sets = [group_docs(group) for group in groups]
+        if allowed is not None:
+            doc_sets.append(allowed)
+        doc_sets.sort(key=len)
+        candidates = set(doc_sets[0])
+        for docs in doc_sets[1:]:
+            # Probe the larger side rather than iterating it
+            candidates = {doc_id for doc_id in candidates if doc_id in docs}
+            if not candidates:
+                return {}
+
+        scores = dict.fromkeys(candidates, 0.0)
+        for group in groups:
+            for term, weight in group.items():
+                impacts = self._impacts(term)
+                # Walk whichever side is smaller
+                if len(impacts) <= len(candidates):
+                    for doc_id, impact in impacts.items():
+                        if doc_id in scores:
+                            scores[doc_id] += weight * impact
+                else:
+                    for doc_id in candidates:
+                        impact = impacts.get(doc_id)
+                        if impact:
+                            scores[doc_id] += weight * impact
+        return scores
+
+    def _impacts(self, term: str) -> Dict[str, float]:
+        """
+        Per-document BM25 contribution of a term.
+
+        Cached until the index next changes, so repeated queries only sum
+        precomputed impacts instead of re-deriving idf and length norms.
+        """
+        cached = self._impact_cache.get(term)
+        if cached is not None and cached[0] == self._generation:
+            self._impact_cache.move_to_end(term)
+            return cached[1]
+
+        postings = self._postings[term]
+        total_docs = len(self._docs)
+        avg_len = self._total_len / total_docs if total_docs else 1.0
+        df = len(postings)
+        idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+        doc_len = self._doc_len
+        impacts = {
+            doc_id: idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * doc_len[doc_id] / avg_len))
+            for doc_id, tf in postings.items()
+        }
+        self._impact_cache[term] = (self._generation, impacts)
+        if len(self._impact_cache) > IMPACT_CACHE_SIZE:
+            self._impact_cache.popitem(last=False)
+        return impacts
+
+    def _salary_bounds(self, low: Optional[float], high: Optional[float]) -> Tuple[int, int]:
+        """Slice of ``_salaries`` with low <= salary <= high"""
+        start = 0 if low is None else bisect.bisect_left(self._salaries, low, key=itemgetter(0))
+        end = len(self._salaries) if high is None else bisect.bisect_right(self._salaries, high, key=itemgetter(0))
+        return start, end
+
+    def _location_ids(self, location: str) -> Set[str]:
+        """Docs quick_location_filter keeps: location keyword matches, or remote for remote searches"""
+        location_lower = location.lower()
+        keywords = [location_lower]
+        for values in global_filter.LOCATION_MAPPINGS.values():
+            if location_lower in values:
+                keywords.extend(values)
+                break
+        # One check per distinct location string, not per document
+        matches = [ids for text, ids in self._locations.items() if any(keyword in text for keyword in keywords)]
+        if "remote" in keywords:
+            matches.extend(ids for flag, ids in self._remote.items() if flag)
+        if len(matches) == 1:
+            return matches[0]  # Read-only, like every filter set
+        return set().union(*matches)
+
+    def _filter_ids(self, filters: Dict[str, Any]) -> Optional[Set[str]]:
+        """
+        Doc ids passing the search filters, or None if they restrict nothing.
+
+        Same semantics as ``OpportunityFilter.apply_search_filters``. Type,
+        remote, salary and location come from the filter postings,
+        intersected smallest first.
+        """
+        sets: List[Set[str]] = []
+        category = filters.get("type")
+        if category and category in global_filter.CATEGORIES:
+            sets.append(self._categories.get(category, set()))
+        if filters.get("remote") is not None:
+            try:
+                sets.append(self._remote.get(filters["remote"], set()))
+            except TypeError:
+                sets.append(set())
+        if filters.get("location"):
+            sets.append(self._location_ids(filters["location"]))
+
+        low, high = filters.get("min_salary") or None, filters.get("max_salary") or None
+        salary_filter = low is not None or high is not None
+        # Missing salaries pass a min of 0 or less (and no max), as in apply_search_filters
+        keep_missing = salary_filter and high is None and low <= 0
+
+        def salary_ok(doc_id: str) -> bool:
+            salary = self._doc_fields[doc_id][1]
+            if salary is None:
+                return keep_missing
+            return (low is None or salary >= low) and (high is None or salary <= high)
+
+        sets.sort(key=len)
+        if salary_filter:
+            start, end = self._salary_bounds(low, high)
+            if not sets or end - start < len(sets[0]):
+                # The salary range is the smallest: start from it
+                in_range = {doc_id for _, doc_id in self._salaries[start:end]}
+                if keep_missing:
+                    in_range.update(self._no_salary)
+                sets.insert(0, in_range)
+                salary_filter = False
+
+        if not sets:
+            return None
+        # A lone posting set is returned as is; callers only read it
+        allowed = sets[0] if len(sets) == 1 else set.intersection(*sets)
+        if salary_filter:
+            # Fewer candidates than salaries in range: check each one
+            allowed = {doc_id for doc_id in allowed if salary_ok(doc_id)}
+        return allowed
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        prefix: bool = True,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> Tuple[List[Tuple[Dict[str, Any], float]], int]:
+        """
+        Ranked (opportunity, score) matches for a query and the total count.
+
+        An empty query matches every document. ``filters`` takes the same
+        keys as ``OpportunityFilter.smart_search`` (type, location, remote,
+        min_salary, max_salary). Results are ordered by score, then doc id;
+        ``after`` is the (score, doc id) of the previous page's last result
+        for keyset pagination. With a limit only the requested page is
+        ranked, via a partial sort.
+        """
+        with self._lock:
+            allowed = self._filter_ids(filters) if filters else None
+            after_key = None if after is None else (-after[0], after[1])
+            if not (query and query.strip()):
+                return self._unscored_page(allowed, limit, offset, after_key)
+
+            scores = self._scores(query, prefix, allowed)
+            total = len(scores)
+            candidates: Iterable[Tuple[str, float]] = scores.items()
+            if after_key is not None:
+                candidates = [item for item in candidates if _rank_key(item) > after_key]
+            if limit is None:
+                ranked = sorted(candidates, key=_rank_key)[offset:]
+            else:
+                ranked = heapq.nsmallest(offset + limit, candidates, key=_rank_key)[offset:]
+            return [(self._docs[doc_id], score) for doc_id, score in ranked], total
+
+    def _unscored_page(
+        self,
+        allowed: Optional[Set[str]],
+        limit: Optional[int],
+        offset: int,
+        after_key: Optional[Tuple[float, str]],
+    ) -> Tuple[List[Tuple[Dict[str, Any], float]], int]:
+        """Empty-query page: every match scores 0, so rank order is doc id order"""
+        if allowed is None:
+            total = len(self._sorted_ids)
+            start = 0 if after_key is None else bisect.bisect_right(self._sorted_ids, after_key, key=_unscored_rank_key)
+            start += offset
+            ids = self._sorted_ids[start:] if limit is None else self._sorted_ids[start:start + limit]
+        elif limit is not None and after_key is None and len(allowed) * DENSE_FILTER_RATIO >= len(self._sorted_ids):
+            # Most documents pass: walking ids in order finds the page soonest
+            total = len(allowed)
+            ids = list(itertools.islice((doc_id for doc_id in self._sorted_ids if doc_id in allowed), offset, offset + limit))
+        else:
+            total = len(allowed)
+            candidates: Iterable[str] = allowed
+            if after_key is not None:
+                candidates = [doc_id for doc_id in allowed if _unscored_rank_key(doc_id) > after_key]
+            if limit is None:
+                ids = sorted(candidates)[offset:]
+            else:
+                ids = heapq.nsmallest(offset + limit, candidates)[offset:]
+        return [(self._docs[doc_id], 0.0) for doc_id in ids], total
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self._docs),
+                "terms": len(self._postings),
+                "prefixes": len(self._prefixes),
+                "average_length": round(self._total_len / len(self._docs), 2) if self._docs else 0.0,
+            }
+
+
+_search_index: Optional[SearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """
+    Get the process-wide search index.
+
+    It is warmed on first use from what every source currently lists (the
+    change log is pruned, so it can't be replayed), keeping only the
+    canonical copy of cross-source duplicates, so a restarted worker can
+    search what earlier scans found.
+    """
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                index = SearchIndex()
+                try:
+                    from .scrapers.dedup import get_dedup_index
+                    dedup = get_dedup_index()
+                    index.upsert_many(
+                        opp for opp in get_delta_tracker().current_items()
+                        if dedup.canonical_id(opportunity_key(opp)) in (None, opportunity_key(opp))
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not warm search index from scan state: {e}")
+                _search_index = index
+    return _search_index
+
+
+_sample_index: Optional[SearchIndex] = None
+
+
+def get_searchable_index() -> SearchIndex:
+    """The live index, or an index over the sample opportunities until scans have populated it"""
+    global _sample_index
+    index = get_search_index()
+    if len(index):
+        return index
+    if _sample_index is None:
+        _sample_index = SearchIndex()
+        _sample_index.upsert_many(create_sample_opportunities())
+    return _sample_index
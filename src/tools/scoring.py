@@ -4,6 +4,7 @@ ADK Tools for opportunity scoring.
 Contains FunctionTools for scoring and prioritizing opportunities.
 """
 
+import logging
 from datetime import datetime
 from typing import Any
 
@@ -12,10 +13,35 @@ from google.adk.tools import FunctionTool
 from src.scoring.calculator import scoring_engine
 from src.models import OpportunityTier
 
+logger = logging.getLogger(__name__)
+
+
+async def _semantic_scores(
+    opportunities: list[dict[str, Any]],
+    profile: dict[str, Any],
+    use_semantic: bool,
+) -> list[float] | None:
+    """
+    Semantic similarity of the profile to each opportunity, in one batch.
+    
+    Returns None (keyword goal matching is used instead) unless
+    use_semantic is set, or if embeddings can't be generated.
+    """
+    if not use_semantic:
+        return None
+    try:
+        from src.intelligence.embeddings import calculate_profile_opportunity_matches
+        
+        return (await calculate_profile_opportunity_matches(profile, opportunities)).tolist()
+    except Exception as e:
+        logger.warning(f"Semantic scoring unavailable ({e}), using keyword matching")
+        return None
+
 
 async def score_opportunity(
     opportunity: dict[str, Any],
     profile: dict[str, Any],
+    use_semantic: bool = False,
 ) -> dict[str, Any]:
     """
     Score a single opportunity for profile fit.
@@ -23,11 +49,15 @@ async def score_opportunity(
     Args:
         opportunity: Opportunity data to score
         profile: User profile to match against
+        use_semantic: Score goal alignment by embedding similarity
+            (one embedding call) instead of keywords
         
     Returns:
         Scoring result with fit score, component scores, and tier
     """
-    score = scoring_engine.score_opportunity(opportunity, profile)
+    semantic_scores = await _semantic_scores([opportunity], profile, use_semantic)
+    semantic_score = semantic_scores[0] if semantic_scores else None
+    score = scoring_engine.score_opportunity(opportunity, profile, semantic_score=semantic_score)
     tier = scoring_engine.assign_tier(score)
     
     return {
@@ -51,6 +81,7 @@ async def score_opportunity(
 async def score_batch(
     opportunities: list[dict[str, Any]],
     profile: dict[str, Any],
+    use_semantic: bool = False,
 ) -> dict[str, Any]:
     """
     Score a batch of opportunities and rank them.
@@ -58,11 +89,14 @@ async def score_batch(
     Args:
         opportunities: List of opportunities to score
         profile: User profile to match against
+        use_semantic: Score goal alignment by embedding similarity
+            (one batched embedding call) instead of keywords
         
     Returns:
         Scored and ranked opportunities with summary statistics
     """
-    scored = scoring_engine.score_batch(opportunities, profile)
+    semantic_scores = await _semantic_scores(opportunities, profile, use_semantic)
+    scored = scoring_engine.score_batch(opportunities, profile, semantic_scores)
     
     # Calculate tier distribution
     tier_counts = {
@@ -94,6 +128,7 @@ async def get_tier_1_opportunities(
     opportunities: list[dict[str, Any]],
     profile: dict[str, Any],
     limit: int = 20,
+    use_semantic: bool = False,
 ) -> dict[str, Any]:
     """
     Get only Tier 1 (highest priority) opportunities.
@@ -102,11 +137,14 @@ async def get_tier_1_opportunities(
         opportunities: List of opportunities to filter
         profile: User profile for scoring
         limit: Maximum number to return
+        use_semantic: Score goal alignment by embedding similarity
+            (one batched embedding call) instead of keywords
         
     Returns:
         Tier 1 opportunities only
     """
-    scored = scoring_engine.score_batch(opportunities, profile)
+    semantic_scores = await _semantic_scores(opportunities, profile, use_semantic)
+    scored = scoring_engine.score_batch(opportunities, profile, semantic_scores)
     tier_1 = [o for o in scored if o.get("tier") == OpportunityTier.TIER_1.value]
     
     return {
@@ -0,0 +1,95 @@
+"""
+Unit Tests for Adaptive Scan Control
+====================================
+
+Tests for latency-based timeouts, AIMD concurrency and circuit skipping.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from src.scrapers import adaptive, base_scraper, metrics_store
+from src.scrapers.adaptive import AdaptiveConcurrency, AdaptiveScanController, adaptive_timeout
+from src.scrapers.base_scraper import ScraperMetrics, get_scraper_metrics
+from src.scrapers.http_pool import PooledClient
+
+
+@pytest.fixture(autouse=True)
+def isolated_metrics(monkeypatch):
+    monkeypatch.setattr(base_scraper, "_scraper_metrics", {})
+    monkeypatch.setattr(metrics_store, "_metrics_sync", None)
+    monkeypatch.setattr(metrics_store, "_metrics_sync_checked", True)  # No persistence
+
+
+class TestAdaptiveTimeout:
+    """Tests for adaptive_timeout."""
+
+    def test_uses_ceiling_until_enough_samples(self):
+        metrics = ScraperMetrics()
+        metrics.record_success(2.0)
+        assert adaptive_timeout(metrics, ceiling=60) == 60
+
+    def test_scales_p99_within_bounds(self):
+        metrics = ScraperMetrics()
+        for seconds in [5.0, 6.0, 7.0, 8.0, 12.0]:
+            metrics.record_success(seconds)
+        assert adaptive_timeout(metrics, ceiling=60) == 12.0 * adaptive.TIMEOUT_MARGIN
+        assert adaptive_timeout(metrics, ceiling=20) == 20
+
+        fast = ScraperMetrics()
+        for _ in range(5):
+            fast.record_success(0.2)
+        assert adaptive_timeout(fast, ceiling=60) == adaptive.MIN_TIMEOUT
+
+
+class TestAdaptiveConcurrency:
+    """Tests for AdaptiveConcurrency."""
+
+    def test_halves_on_overload_then_grows_additively(self):
+        concurrency = AdaptiveConcurrency(maximum=8)
+        concurrency.record(success=False, overloaded=True)
+        concurrency.record(success=False, overloaded=True)  # Same burst: within the cooldown
+        assert concurrency.limit == 4
+
+        for _ in range(5):  # About one window of successes per extra slot
+            concurrency.record(success=True)
+        assert concurrency.limit == 5
+
+
+class TestAdaptiveScanController:
+    """Tests for AdaptiveScanController."""
+
+    async def test_skips_sources_with_open_circuit(self):
+        get_scraper_metrics("Broken").circuit_open_until = datetime.now() + timedelta(minutes=5)
+        called = []
+
+        async def scraper():
+            called.append(True)
+            return []
+
+        controller = AdaptiveScanController(max_concurrent=4, timeout_ceiling=60)
+        name, result, error = await controller.run("Broken", scraper)
+
+        assert not called
+        assert error.startswith("Skipped: circuit open")
+        assert controller.stats()["skipped_open_circuit"] == ["Broken"]
+
+    async def test_rate_limited_empty_result_is_a_failure(self, monkeypatch):
+        async def fake_request(self, method, url, **kwargs):
+            return httpx.Response(429)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+
+        async def scraper():
+            response = await PooledClient(use_cache=False).get("https://jobs.example.com/api")
+            return [] if response.status_code != 200 else [{"id": "1"}]
+
+        controller = AdaptiveScanController(max_concurrent=4, timeout_ceiling=60)
+        await controller.run("Limited", scraper)
+
+        metrics = get_scraper_metrics("Limited")
+        assert metrics.failed_requests == 1
+        assert metrics.rate_limited_requests == 1
+        assert controller.concurrency.limit == 2
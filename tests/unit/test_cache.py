@@ -0,0 +1,148 @@
+"""
+Unit Tests for the Cache Backends
+=================================
+
+Tests for LRU eviction, TTL expiry, hit/byte accounting and the shared
+Redis backend.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from src.cache import BoundedCache, RedisCache, SingleFlight, estimate_size, search_cache_key
+
+
+class TestBoundedCache:
+    """Tests for BoundedCache."""
+
+    @pytest.fixture
+    def cache(self):
+        return BoundedCache(max_entries=3, sweep_interval=None)
+
+    def test_counts_hits_and_misses(self, cache):
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        cache.get("a")
+        cache.set("d", "d")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_limit_and_accounting(self):
+        value = {"title": "x" * 100}
+        size = estimate_size(value)
+        cache = BoundedCache(max_bytes=size * 2, sweep_interval=None)
+
+        cache.set("a", value)
+        cache.set("b", value)
+        assert cache.stats()["bytes"] == size * 2
+
+        cache.set("c", value)
+        assert cache.keys() == ["b", "c"]
+
+        cache.delete("b")
+        assert cache.stats()["bytes"] == size
+
+    def test_cleanup_expired_skips_overwritten_entries(self, cache):
+        cache.set("a", 1, ttl=0)
+        cache.set("a", 2, ttl=60)
+        cache.set("b", 3, ttl=0)
+        time.sleep(0.01)
+
+        assert cache.cleanup_expired() == 1
+        assert cache.get("a") == 2
+        assert cache.stats()["expirations"] == 1
+
+
+class TestRedisCache:
+    """Tests for RedisCache against fakeredis."""
+
+    @pytest.fixture
+    def server(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeServer()
+
+    def make_cache(self, server, **kwargs):
+        import fakeredis
+        return RedisCache(client=fakeredis.FakeRedis(server=server), **kwargs)
+
+    def test_round_trip_and_pipelined_batch(self, server):
+        cache = self.make_cache(server, local_ttl=0)
+        posted = datetime(2026, 1, 1)
+        cache.set("a", {"title": "Grant", "posted": posted, "tags": ["ai"]})
+        cache.set_many({"b": 2, "c": 3})
+
+        assert cache.get("a") == {"title": "Grant", "posted": posted.isoformat(), "tags": ["ai"]}
+        assert cache.get_many(["a", "b", "c", "missing"]).keys() == {"a", "b", "c"}
+        assert sorted(cache.keys()) == ["a", "b", "c"]
+
+        cache.clear()
+        assert cache.size() == 0
+        assert cache.stats()["misses"] == 1
+
+    async def test_async_variants_round_trip(self, server):
+        cache = self.make_cache(server, local_ttl=0)
+        await cache.aset("a", {"title": "Grant"})
+        await cache.aset_many({"b": 2, "c": 3})
+
+        assert await cache.aget("a") == {"title": "Grant"}
+        assert (await cache.aget_many(["a", "b", "missing"])).keys() == {"a", "b"}
+        assert await cache.adelete("a")
+        assert await cache.aget("a") is None
+        assert cache.size() == 2
+
+    def test_invalidation_reaches_other_workers(self, server):
+        first = self.make_cache(server)
+        second = self.make_cache(server)
+        try:
+            first.set("batch:1", "old")
+            assert second.get("batch:1") == "old"  # now in second's near cache
+
+            first.set("batch:1", "new")
+            deadline = time.time() + 3
+            while second.get("batch:1") != "new" and time.time() < deadline:
+                time.sleep(0.05)
+            assert second.get("batch:1") == "new"
+        finally:
+            first.close()
+            second.close()
+
+
+class TestSearchCoalescing:
+    """Tests for search cache keys and single-flight coalescing."""
+
+    def test_search_key_is_normalised(self):
+        key = search_cache_key("Machine  Learning ", {"type": "jobs", "location": None, "limit": 50})
+        assert key == search_cache_key("machine learning", {"limit": 50, "type": "jobs"})
+        assert key != search_cache_key("machine learning", {"limit": 20, "type": "jobs"})
+
+    async def test_concurrent_calls_share_one_computation(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total": 3}
+
+        results = await asyncio.gather(*[flight.do("search:x", compute) for _ in range(5)])
+
+        assert calls == 1
+        assert [coalesced for _, coalesced in results].count(False) == 1
+        assert all(result == {"total": 3} for result, _ in results)
+        assert flight.in_flight() == 0
@@ -0,0 +1,84 @@
+"""
+Unit Tests for Cross-Source Deduplication
+=========================================
+
+Tests for clustering the same opportunity scraped from several sources.
+"""
+
+import pytest
+
+from src.scrapers.dedup import DedupIndex, dedup_key, merge_duplicates
+
+
+DESCRIPTION = (
+    "We are hiring a backend engineer to design and operate the payment "
+    "services that move money for thousands of small businesses across "
+    "Africa. You will own APIs written in Python and Go, work closely with "
+    "product and compliance, and help us scale reliability as volume grows."
+)
+
+
+def make_opportunity(opp_id, source, **overrides):
+    opportunity = {
+        "id": opp_id,
+        "source": source,
+        "title": "Backend Engineer",
+        "company": "PayCo",
+        "description": DESCRIPTION,
+        "match_score": 50,
+    }
+    opportunity.update(overrides)
+    return opportunity
+
+
+class TestDedup:
+    """Tests for DedupIndex and merge_duplicates."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        return DedupIndex(path=tmp_path / "dedup.db")
+
+    def test_dedup_key_normalises_company_and_title(self):
+        assert dedup_key({"company": "PayCo, Inc.", "title": "Backend Engineer (Remote)"}) == "payco|backend engineer"
+        assert dedup_key({"company": "", "title": "Research Grant"}) is None
+
+    def test_merges_exact_and_near_duplicates(self, index):
+        opportunities = [
+            make_opportunity("remoteok-1", "RemoteOK"),
+            make_opportunity("himalayas-1", "Himalayas", company="PayCo Inc", match_score=70),
+            make_opportunity(
+                "ats-1", "Greenhouse", title="Senior Backend Engineer, Payments",
+                description=DESCRIPTION + " Apply today.",
+            ),
+            make_opportunity("other-1", "RemoteOK", company="OtherCo", title="Backend Engineer, Payments"),
+        ]
+
+        merged = merge_duplicates(opportunities, index)
+
+        assert len(merged) == 2
+        assert merged[0]["canonical_id"] == "remoteok-1"
+        assert merged[0]["sources"] == ["RemoteOK", "Himalayas", "Greenhouse"]
+        assert merged[0]["id"] == "remoteok-1"  # Stable canonical id
+        assert merged[0]["description"].endswith("Apply today.")  # Richest copy wins
+        assert sorted(merged[0]["duplicate_ids"]) == ["ats-1", "himalayas-1"]
+        assert merged[0]["match_score"] == 70
+        assert merged[1]["canonical_id"] == "other-1"
+
+    def test_clusters_persist_across_scans(self, index, tmp_path):
+        merge_duplicates([make_opportunity("remoteok-1", "RemoteOK")], index)
+
+        reopened = DedupIndex(path=tmp_path / "dedup.db")
+        merged = merge_duplicates([make_opportunity("himalayas-1", "Himalayas")], reopened)
+
+        assert merged[0]["canonical_id"] == "remoteok-1"
+        assert reopened.stats()["duplicates"] == 1
+
+    def test_token_hash_memo_is_bounded(self):
+        from src.scrapers import dedup
+
+        dedup._token_hash.cache_clear()
+        for i in range(dedup.TOKEN_HASH_CACHE_SIZE + 100):
+            dedup._token_hash(f"word{i}")
+
+        assert dedup._token_hash.cache_info().currsize == dedup.TOKEN_HASH_CACHE_SIZE
+        assert dedup.minhash_signature(DESCRIPTION) is not None
@@ -0,0 +1,112 @@
+"""
+Unit Tests for Delta Scanning
+=============================
+
+Tests for per-source high-water marks, tombstones and the change log.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.scrapers.delta_scan import ScanDeltaTracker
+
+
+class TestScanDeltaTracker:
+    """Tests for ScanDeltaTracker."""
+    
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a tracker backed by a temporary database."""
+        return ScanDeltaTracker(tmp_path / "scan_state.db")
+    
+    def test_first_scan_is_all_added(self, tracker):
+        """Test that every opportunity is new on the first scan."""
+        delta = tracker.apply("RemoteOK", [{"id": "a"}, {"id": "b"}])
+        assert delta.counts() == {"added": 2, "changed": 0, "removed": 0, "unchanged": 0}
+    
+    def test_identical_listing_takes_fast_path(self, tracker):
+        """Test that an unchanged listing emits nothing."""
+        tracker.apply("RemoteOK", [{"id": "a", "scraped_at": "t1"}])
+        delta = tracker.apply("RemoteOK", [{"id": "a", "scraped_at": "t2"}])
+        assert delta.listing_unchanged is True
+        assert delta.emitted == []
+    
+    def test_changed_and_removed(self, tracker):
+        """Test that edits are emitted and dropped ids are tombstoned."""
+        tracker.apply("RemoteOK", [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}])
+        delta = tracker.apply("RemoteOK", [{"id": "a", "title": "A v2"}, {"id": "c", "title": "C"}])
+        
+        assert [o["id"] for o in delta.changed] == ["a"]
+        assert [o["id"] for o in delta.added] == ["c"]
+        assert [t["id"] for t in delta.removed] == ["b"]
+    
+    def test_empty_result_does_not_tombstone(self, tracker):
+        """Test that a quietly failing scraper doesn't remove the listing."""
+        tracker.apply("RemoteOK", [{"id": "a"}])
+        delta = tracker.apply("RemoteOK", [])
+        assert delta.removed == []
+    
+    def test_changes_since(self, tracker):
+        """Test that since= returns only the net changes after a point in time."""
+        tracker.apply("RemoteOK", [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}])
+        checkpoint = datetime.utcnow()
+        tracker.apply("RemoteOK", [{"id": "a", "title": "A v2"}])
+        tracker.apply("Himalayas", [{"id": "x"}])
+        
+        changes = tracker.changes_since(checkpoint, sources=["RemoteOK"])
+        assert changes["opportunities"] == [{"id": "a", "title": "A v2"}]
+        assert [t["id"] for t in changes["removed"]] == ["b"]
+
+    
+    def test_current_items_outlive_the_change_log(self, tracker):
+        """Test that current state survives change-log pruning and drops removals."""
+        tracker.apply("RemoteOK", [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}])
+        tracker.apply("RemoteOK", [{"id": "a", "title": "A v2"}])
+        tracker._conn.execute("DELETE FROM change_log")  # As after CHANGE_LOG_RETENTION
+        
+        assert tracker.current_items() == [{"id": "a", "title": "A v2"}]
+
+
+class TestBatchDelta:
+    """Tests for applying batch results through the delta tracker."""
+
+    async def test_batch_bookkeeping_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        import threading
+
+        from src import search_index
+        from src.intelligence import enrichment_store
+        from src.scrapers import dedup, live_scrapers, metrics_store
+
+        tracker = ScanDeltaTracker(tmp_path / "scan_state.db")
+        threads = []
+        apply = tracker.apply
+
+        def recording_apply(source, opportunities):
+            threads.append(threading.current_thread())
+            return apply(source, opportunities)
+
+        monkeypatch.setattr(tracker, "apply", recording_apply)
+        monkeypatch.setattr(live_scrapers, "get_delta_tracker", lambda: tracker)
+        index = dedup.DedupIndex(tmp_path / "dedup.db")
+        monkeypatch.setattr(live_scrapers, "get_dedup_index", lambda: index)
+        monkeypatch.setattr(dedup, "_dedup_index", index)
+        search = search_index.SearchIndex()
+        monkeypatch.setattr(search_index, "get_search_index", lambda: search)
+        monkeypatch.setattr(enrichment_store, "get_enrichment_store", lambda: type("Stub", (), {"schedule": lambda self, opps: None})())
+        monkeypatch.setattr(metrics_store, "_metrics_sync_checked", True)
+        monkeypatch.setattr(metrics_store, "_metrics_sync", None)
+
+        async def scrape():
+            return [{"id": "a", "title": "A", "source": "Fake"}]
+
+        monkeypatch.setitem(live_scrapers.SCRAPER_BATCHES, 99, {
+            "name": "Fake", "description": "", "category": "jobs", "scrapers": [("Fake", scrape)],
+        })
+
+        result = await live_scrapers.scan_batch(99, delta=True)
+
+        assert [opp["id"] for opp in result["opportunities"]] == ["a"]
+        assert result["stats"]["delta"]["added"] == 1
+        assert threads and threads[0] is not threading.main_thread()
+        assert search.stats()["documents"] == 1
@@ -0,0 +1,95 @@
+"""
+Unit Tests for Embedding Backends
+=================================
+
+Tests for the hashed n-gram backend and for concurrent, retrying,
+non-blocking provider calls in EmbeddingPipeline.
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from src.intelligence.embedding_backends import EmbeddingBackend, HashedEmbeddingBackend
+from src.intelligence.embedding_cache import EmbeddingCache
+from src.intelligence.embeddings import EmbeddingConfig, EmbeddingPipeline
+
+
+class ResourceExhausted(Exception):
+    """Stands in for google.api_core.exceptions.ResourceExhausted."""
+
+
+class SlowBackend(EmbeddingBackend):
+    """Blocks for ``delay`` per request and fails the first ``failures`` with a quota error."""
+
+    name = model = "slow"
+
+    def __init__(self, delay=0.1, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def embed(self, texts, task_type="RETRIEVAL_DOCUMENT"):
+        with self._lock:
+            self.calls += 1
+            if self.failures:
+                self.failures -= 1
+                raise ResourceExhausted("429 Quota exceeded")
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestHashedEmbeddingBackend:
+    """Tests for HashedEmbeddingBackend."""
+
+    def test_deterministic_and_similarity_preserving(self):
+        backend = HashedEmbeddingBackend(dimensions=256)
+        a, b, c = (np.array(v) for v in backend.embed([
+            "Machine learning research fellowship",
+            "Research fellowship in machine learning",
+            "Pastry chef, weekend shifts",
+        ]))
+
+        assert np.allclose(a, HashedEmbeddingBackend(dimensions=256).embed_one("Machine learning research fellowship"))
+        assert abs(np.linalg.norm(a) - 1) < 1e-6
+        assert a @ b > 0.6 > a @ c
+
+
+class TestEmbeddingPipelineConcurrency:
+    """Tests for chunked, concurrent provider calls."""
+
+    async def test_chunks_run_concurrently_off_the_loop(self):
+        backend = SlowBackend(delay=0.1)
+        pipeline = EmbeddingPipeline(EmbeddingConfig(batch_size=2, max_concurrency=2), backend=backend, cache=EmbeddingCache())
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        embeddings = await pipeline.embed_batch(["a", "bb", "ccc", "dddd", "a", "eeeee", "ffffff"])
+        task.cancel()
+
+        assert [e[0] for e in embeddings] == [1, 2, 3, 4, 1, 5, 6]
+        assert backend.calls == 3  # Duplicate "a" embedded once
+        assert backend.peak == 2  # Chunks overlapped, up to the concurrency limit
+        assert ticks >= 10  # Event loop kept running meanwhile
+
+    async def test_quota_errors_are_retried_with_backoff(self):
+        backend = SlowBackend(delay=0, failures=2)
+        pipeline = EmbeddingPipeline(EmbeddingConfig(backoff_base=0.01), backend=backend, cache=EmbeddingCache())
+
+        assert await pipeline.embed_text("hello") == [5.0, 1.0]
+        assert pipeline.retries == 2 and backend.calls == 3
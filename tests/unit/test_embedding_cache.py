@@ -0,0 +1,45 @@
+"""
+Unit Tests for the Embedding Cache
+==================================
+
+Tests for keying by model and task type, persistence across restarts,
+bounded RAM residency, and the pipeline only embedding cache misses.
+"""
+
+from src.intelligence.embedding_backends import HashedEmbeddingBackend
+from src.intelligence.embedding_cache import EmbeddingCache
+from src.intelligence.embeddings import EmbeddingPipeline
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_keys_persistence_and_residency(self, tmp_path):
+        cache = EmbeddingCache(tmp_path, max_resident=2)
+        cache.put_many("m", "RETRIEVAL_DOCUMENT", ["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+
+        assert cache.get_many("m", "RETRIEVAL_QUERY", ["a"]) == [None]  # Task types don't collide
+        assert cache.get_many("other", "RETRIEVAL_DOCUMENT", ["a"]) == [None]
+        assert cache.get_many("m", "RETRIEVAL_DOCUMENT", ["c", "a", "x"]) == [[0.5, 0.5], [1.0, 0.0], None]
+        stats = cache.get_stats()
+        assert stats["resident"] == 2 and stats["evictions"] >= 1
+        assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 3)
+
+        cache.close()
+        reopened = EmbeddingCache(tmp_path)
+        assert len(reopened) == 3
+        assert reopened.get_many("m", "RETRIEVAL_DOCUMENT", ["b"]) == [[0.0, 1.0]]
+
+    async def test_pipeline_embeds_only_misses(self, tmp_path):
+        backend = HashedEmbeddingBackend(dimensions=64)
+        calls = []
+        embed = backend.embed
+        backend.embed = lambda texts, task_type: calls.append(list(texts)) or embed(texts, task_type)
+        pipeline = EmbeddingPipeline(backend=backend, cache=EmbeddingCache(tmp_path))
+
+        first = await pipeline.embed_batch(["alpha", "beta"])
+        restarted = EmbeddingPipeline(backend=backend, cache=EmbeddingCache(tmp_path))
+        second = await restarted.embed_batch(["beta", "gamma", "alpha"])
+
+        assert calls == [["alpha", "beta"], ["gamma"]]
+        assert second[0] == first[1] and second[2] == first[0]
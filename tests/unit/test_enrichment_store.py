@@ -0,0 +1,89 @@
+"""
+Unit Tests for the Enrichment Store
+===================================
+
+Tests for reusing precomputed enrichment until an opportunity changes.
+"""
+
+import threading
+
+import pytest
+
+from src.intelligence.enrichment_store import EnrichmentStore
+
+
+def make_opportunity(**overrides):
+    opportunity = {
+        "id": "opp-1",
+        "title": "Senior Python Engineer",
+        "company": "TechCorp",
+        "description": "Remote role paying $120,000 - $150,000 per year",
+        "location": "San Francisco, CA",
+    }
+    opportunity.update(overrides)
+    return opportunity
+
+
+class TestEnrichmentStore:
+    """Tests for EnrichmentStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return EnrichmentStore(path=tmp_path / "enrichment.db")
+
+    def test_enriches_once_per_content_hash(self, store):
+        first = store.ensure([make_opportunity()])[0]
+        second = store.ensure([make_opportunity()])[0]
+
+        assert first["location_data"]["city"]
+        assert "intelligence" in first
+        assert second == first
+        assert store.stats["computed"] == 1
+        assert store.stats["reused"] == 1
+
+    def test_changed_content_is_reprocessed(self, store):
+        store.ensure([make_opportunity()])
+        updated = store.ensure([make_opportunity(location="Remote")])[0]
+
+        assert updated["location_data"]["is_remote"]
+        assert store.stats["computed"] == 2
+
+    def test_results_persist_across_instances(self, store, tmp_path):
+        store.ensure([make_opportunity()])
+
+        reopened = EnrichmentStore(path=tmp_path / "enrichment.db")
+        enriched = reopened.ensure([make_opportunity(location_data={"stale": True})])[0]
+
+        assert reopened.stats == {"computed": 0, "reused": 1, "scheduled": 0}
+        assert "stale" not in enriched["location_data"]
+
+    def test_scheduled_batches_are_precomputed(self, store):
+        store.schedule([make_opportunity(), make_opportunity(id="opp-2")])
+        store.wait()
+
+        assert store.get_stats()["stored"] == 2
+
+    def test_compute_runs_without_holding_the_lock(self, store, monkeypatch):
+        from src.intelligence import enrichment_store
+
+        held = []
+        compute = enrichment_store.compute_derived
+
+        def probe():
+            # An RLock can't be probed by its owner, so try from another thread
+            if store._lock.acquire(blocking=False):
+                store._lock.release()
+                held.append(False)
+            else:
+                held.append(True)
+
+        def checking_compute(opportunity):
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            return compute(opportunity)
+
+        monkeypatch.setattr(enrichment_store, "compute_derived", checking_compute)
+        store.ensure([make_opportunity()])
+
+        assert held == [False]
@@ -0,0 +1,92 @@
+"""
+Unit Tests for the Conditional-GET Cache
+========================================
+
+Tests for storing validated responses and replaying them on 304.
+"""
+
+import httpx
+import pytest
+
+from src.scrapers.http_cache import HTTPCache
+
+
+URL = "https://remoteok.com/api"
+
+
+def make_response(status: int, headers=None, content: bytes = b"") -> httpx.Response:
+    return httpx.Response(
+        status,
+        headers=headers or {},
+        content=content,
+        request=httpx.Request("GET", URL),
+    )
+
+
+class TestHTTPCache:
+    """Tests for HTTPCache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache backed by a temporary database."""
+        return HTTPCache(tmp_path / "http_cache.db")
+    
+    def test_response_without_validator_not_stored(self, cache):
+        """Test that responses without ETag/Last-Modified are not stored."""
+        cache.store(URL, make_response(200, content=b"[]"))
+        assert cache.lookup(URL) is None
+        assert cache.stats()["misses"] == 1
+    
+    def test_conditional_headers_from_validators(self, cache):
+        """Test that stored validators become conditional request headers."""
+        cache.store(URL, make_response(
+            200,
+            headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"},
+            content=b"[]",
+        ))
+        entry = cache.lookup(URL)
+        headers = cache.conditional_headers(entry)
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+    
+    def test_replay_on_not_modified(self, cache):
+        """Test that a 304 replays the stored body with independent parsed JSON."""
+        cache.store(URL, make_response(
+            200,
+            headers={"ETag": '"abc"', "Content-Type": "application/json"},
+            content=b'[{"id": 1}]',
+        ))
+        entry = cache.lookup(URL)
+        
+        first = cache.replay(entry, make_response(304))
+        second = cache.replay(entry, make_response(304))
+        
+        assert first.status_code == 200
+        assert first.json() == [{"id": 1}]
+        parsed = first.json()
+        parsed.append({"id": 2})
+        assert second.json() == [{"id": 1}]  # One caller's mutation doesn't leak
+        
+        stats = cache.stats()["by_source"]["remoteok.com"]
+        assert stats["hits"] == 2
+        assert stats["bytes_saved"] == 2 * len(b'[{"id": 1}]')
+    
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test that entries survive a restart."""
+        path = tmp_path / "http_cache.db"
+        HTTPCache(path).store(URL, make_response(200, headers={"ETag": '"v1"'}, content=b"x"))
+        assert HTTPCache(path).lookup(URL).body == b"x"
+    
+    def test_prune_keeps_newest(self, cache):
+        """Test that pruning keeps only the newest entries."""
+        for i in range(5):
+            cache.store(f"{URL}?page={i}", make_response(200, headers={"ETag": f'"{i}"'}, content=b"x"))
+        cache.prune(max_entries=2)
+        assert cache.stats()["entries"] == 2
+    
+    async def test_async_store_and_lookup(self, cache):
+        """Test the thread-offloaded store and lookup used by the pooled client."""
+        await cache.astore(URL, make_response(200, headers={"ETag": '"v1"'}, content=b"x"))
+        entry = await cache.alookup(URL)
+        assert entry.body == b"x"
+        assert cache.stats()["by_source"]["remoteok.com"]["stored"] == 1
@@ -0,0 +1,96 @@
+"""
+Unit Tests for Persistent Scraper Metrics
+=========================================
+
+Tests for the SQLite metrics store and cross-worker circuit state.
+"""
+
+import pytest
+
+from src.scrapers import base_scraper
+from src.scrapers.base_scraper import get_scraper_metrics
+from src.scrapers.metrics_store import MetricsSync, SQLiteMetricsStore
+
+
+@pytest.fixture(autouse=True)
+def isolated_metrics(monkeypatch):
+    monkeypatch.setattr(base_scraper, "_scraper_metrics", {})
+    monkeypatch.setattr(base_scraper, "_dirty_metrics", set())
+
+
+class TestMetricsSync:
+    """Tests for MetricsSync with a SQLite store."""
+
+    async def test_open_circuit_survives_restart(self, tmp_path):
+        store = SQLiteMetricsStore(tmp_path / "metrics.db")
+        metrics = get_scraper_metrics("Flaky")
+        metrics.record_success(1.5, 10)
+        for _ in range(5):
+            metrics.record_failure("HTTP 503")
+        assert metrics.circuit_open
+
+        assert await MetricsSync(store).flush() == 1
+        assert not base_scraper._dirty_metrics
+
+        # A new process (or another worker) starts with an empty registry
+        base_scraper._scraper_metrics.clear()
+        await MetricsSync(SQLiteMetricsStore(tmp_path / "metrics.db")).refresh()
+
+        restored = get_scraper_metrics("Flaky")
+        assert restored.circuit_open
+        assert restored.total_requests == 6
+        assert list(restored.response_times) == [1.5]
+
+    async def test_newer_snapshot_updates_local_metrics_in_place(self, tmp_path):
+        store = SQLiteMetricsStore(tmp_path / "metrics.db")
+        sync = MetricsSync(store)
+        local = get_scraper_metrics("Shared")
+        local.record_success(1.0, 5)
+        await sync.flush()
+
+        record = local.to_record()
+        record.update(total_requests=9, consecutive_failures=4, updated_at=record["updated_at"] + 1)
+        await store.save_many({"Shared": record})
+        await sync.refresh()
+
+        assert get_scraper_metrics("Shared") is local
+        assert local.total_requests == 9
+        assert local.consecutive_failures == 4
+
+    async def test_unsaved_local_changes_keep_remote_circuit(self, tmp_path):
+        store = SQLiteMetricsStore(tmp_path / "metrics.db")
+        remote = get_scraper_metrics("Busy")
+        for _ in range(5):
+            remote.record_failure("timeout")
+        await store.save_many({"Busy": remote.to_record()})
+
+        base_scraper._scraper_metrics.clear()
+        local = get_scraper_metrics("Busy")
+        local.record_success(0.5, 3)  # Dirty, not yet flushed
+        await MetricsSync(store).refresh()
+
+        assert local.total_requests == 1
+        assert local.circuit_open
+
+    async def test_reset_is_not_undone_by_refresh(self, tmp_path, monkeypatch):
+        from src.scrapers import metrics_store
+
+        store = SQLiteMetricsStore(tmp_path / "metrics.db")
+        sync = MetricsSync(store)
+        monkeypatch.setattr(metrics_store, "_metrics_sync", sync)
+        monkeypatch.setattr(metrics_store, "_metrics_sync_checked", True)
+
+        metrics = get_scraper_metrics("Flaky")
+        for _ in range(5):
+            metrics.record_failure("HTTP 503")
+        await sync.flush()
+
+        assert await metrics_store.reset_scraper_metrics("Flaky") == ["Flaky"]
+        await sync.refresh()
+
+        assert get_scraper_metrics("Flaky") is metrics
+        assert metrics.name == "Flaky"
+        assert not metrics.circuit_open
+        assert metrics.total_requests == 0
+        assert (await store.load_all())["Flaky"]["circuit_open_until"] is None
+        await sync.stop()
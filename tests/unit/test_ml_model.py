@@ -0,0 +1,168 @@
+"""
+Unit Tests for the ML Scoring Model
+===================================
+
+Tests for the batch inference path of MLScoringModel.
+"""
+
+import numpy as np
+import pytest
+
+from src.intelligence.ml_model import MLScoringModel
+
+
+class CountingClassifier:
+    """predict_proba-only model that records how many rows each call gets."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_proba(self, X):
+        self.calls.append(len(X))
+        p = np.clip(X[:, 0] * 0.9 + X[:, 1] * 0.1, 0, 1)  # semantic_score, skill_match_ratio
+        return np.column_stack([1 - p, p])
+
+
+PROFILE = {"skills": ["python", "pytorch"], "experience": []}
+OPPORTUNITIES = [
+    {"id": str(i), "title": f"Role {i}", "requirements": {"skills_required": ["python", "go"]}}
+    for i in range(30)
+]
+SEMANTIC = np.linspace(0.1, 0.95, 30)
+
+
+class TestScoreBatch:
+    """Tests for MLScoringModel.score_batch."""
+
+    async def test_one_model_call_vectorised_tiers_and_top_k_explanations(self):
+        model = MLScoringModel()
+        model.model = CountingClassifier()
+        model.training_samples = 1000
+
+        results = await model.score_batch(OPPORTUNITIES, PROFILE, semantic_scores=SEMANTIC, explain_top_k=3)
+
+        assert model.model.calls == [30]  # One predict_proba for the whole batch
+        assert [r["opportunity_id"] for r in results[:3]] == ["29", "28", "27"]
+        assert all(r["explanation"] for r in results[:3])
+        assert all(r["explanation"] is None and r["features"] is None for r in results[3:])
+        for result in results:
+            assert result["tier"] == model._assign_tier(result["fit_score"])
+
+    async def test_batch_matches_single_scoring(self):
+        model = MLScoringModel()
+        model.model = "heuristic"
+
+        batch = await model.score_batch(OPPORTUNITIES[:5], PROFILE, semantic_scores=SEMANTIC[:5])
+        for result in batch:
+            single = await model.score(OPPORTUNITIES[result["index"]], PROFILE, semantic_score=SEMANTIC[result["index"]])
+            assert single["fit_score"] == result["fit_score"] and single["tier"] == result["tier"]
+
+    async def test_score_falls_back_to_neutral_semantics_like_batch(self, monkeypatch):
+        from src.intelligence import ml_model
+
+        async def unavailable(profile, opportunities):
+            raise RuntimeError("no embeddings")
+
+        monkeypatch.setattr(ml_model, "calculate_profile_opportunity_matches", unavailable)
+        model = MLScoringModel()
+        model.model = "heuristic"
+
+        single = await model.score(OPPORTUNITIES[0], PROFILE)
+        [batch] = await model.score_batch(OPPORTUNITIES[:1], PROFILE)
+        assert single["fit_score"] == batch["fit_score"]
+
+
+class FakeModel:
+    """score_batch stand-in that ranks by input order and records the profile."""
+
+    async def score_batch(self, opportunities, profile_data, explain_top_k=None):
+        self.profile_data = profile_data
+        return [
+            {
+                "index": i, "opportunity_id": opp["id"], "fit_score": 0.9 - i / 100, "tier": "TIER_1",
+                "confidence": 0.8, "model_version": "test",
+                "features": {"skill_match_ratio": 0.5, "experience_ratio": 0.5, "semantic_score": 0.5, "prestige_score": 0.5},
+                "explanation": {"strengths": [], "weaknesses": [], "recommendation": "Apply"}
+                if explain_top_k is None or i < explain_top_k else None,
+            }
+            for i, opp in enumerate(opportunities)
+        ]
+
+
+class Prediction:
+    def __init__(self, success_probability):
+        self.success_probability = success_probability
+
+    def to_dict(self):
+        return {"success_probability": self.success_probability}
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    from httpx import ASGITransport, AsyncClient
+
+    from src import api
+    from src.intelligence.user_profiles import PreferenceType, UserProfileEngine
+
+    engine = UserProfileEngine()
+    engine.update_explicit_preference("alice", PreferenceType.SKILLS, ["python", "go"])
+    model = FakeModel()
+    monkeypatch.setattr(api, "global_profile_engine", engine)
+    monkeypatch.setattr(api, "get_ml_model", lambda: model)
+    monkeypatch.setattr(api, "_current_profile_data", lambda: {"skills": ["current"]})
+    client = AsyncClient(transport=ASGITransport(app=api.app), base_url="http://test")
+    client.model = model
+    return client
+
+
+class TestPredictBatchEndpoint:
+    """Tests for /api/v2/predict/batch."""
+
+    async def test_every_item_predicted_and_ranked_by_success_probability(self, api_client, monkeypatch):
+        from src import api
+
+        def predict(user_id, opportunity):
+            if opportunity["id"] == "3":
+                raise AttributeError("no profile engine")
+            return Prediction(int(opportunity["id"]) / 10)
+
+        monkeypatch.setattr(api.global_success_predictor, "predict_application_success", predict)
+        async with api_client as client:
+            response = await client.post(
+                "/api/v2/predict/batch", params={"user_id": "alice", "explain_top_k": 2}, json=OPPORTUNITIES[:12],
+            )
+
+        assert response.status_code == 200
+        assert api_client.model.profile_data["skills"] == ["python", "go"]
+        items = response.json()["batch_predictions"]
+        assert [item["opportunity_id"] for item in items[:3]] == ["11", "10", "9"]
+        assert all(item["prediction"] for item in items if item["opportunity_id"] != "3")
+        assert items[-1]["opportunity_id"] == "3" and items[-1]["prediction"] is None
+        assert items[-1]["prediction_error"] == "no profile engine"
+        assert sum(1 for item in items if item["explanation"]) == 2
+        stats = response.json()["batch_statistics"]
+        assert stats["average_success_probability"] == pytest.approx(sum(i / 10 for i in range(12) if i != 3) / 11)
+
+    async def test_unknown_user_scored_against_current_profile(self, api_client, monkeypatch):
+        from src import api
+
+        monkeypatch.setattr(api.global_success_predictor, "predict_application_success", lambda u, o: Prediction(0.5))
+        async with api_client as client:
+            response = await client.post("/api/v2/predict/batch", params={"user_id": "../bob"}, json=OPPORTUNITIES[:2])
+
+        assert response.status_code == 200
+        assert api_client.model.profile_data == {"skills": ["current"]}
+
+
+class TestIntelligenceScoreEndpoint:
+    """Tests for /api/v1/intelligence/score."""
+
+    async def test_raw_opportunity_body(self, api_client):
+        async with api_client as client:
+            response = await client.post("/api/v1/intelligence/score", json=OPPORTUNITIES[0])
+            for_user = await client.post("/api/v1/intelligence/score", params={"user_id": "alice"}, json=OPPORTUNITIES[0])
+
+        assert response.status_code == 200 and response.json()["success"] is True
+        assert response.json()["scoring"]["overall_fit"] == 0.9
+        assert for_user.json()["success"] is True
+        assert api_client.model.profile_data["skills"] == ["python", "go"]
@@ -0,0 +1,101 @@
+"""
+Unit Tests for Cursor Pagination
+================================
+
+Tests for the cursor codec and the 400 responses of cursor-paged endpoints.
+"""
+
+import base64
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+def b64(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+class TestCursorCodec:
+    """Tests for encode_cursor and decode_cursor."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor(0.875, "3f2a", datetime(2026, 3, 1, 12, 30))
+
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+        assert decode_cursor(cursor, 3) == [0.875, "3f2a", "2026-03-01T12:30:00"]
+
+    @pytest.mark.parametrize("cursor", [
+        "%%%",                  # Not base64
+        "a",                    # Truncated base64
+        b64("not json"),
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),  # Not UTF-8
+        b64('{"score": 1}'),    # Not a list
+        encode_cursor(0.5),     # Wrong arity
+        encode_cursor(0.5, "a", "b"),
+    ])
+    def test_malformed_cursors_raise(self, cursor):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, 2)
+
+    def test_invalid_cursor_is_a_value_error(self):
+        assert issubclass(InvalidCursor, ValueError)
+
+
+class NoRowsSession:
+    async def execute(self, statement):
+        raise AssertionError("a malformed cursor must not reach the database")
+
+
+@asynccontextmanager
+async def no_rows_session():
+    yield NoRowsSession()
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    import src.data
+
+    monkeypatch.setattr(src.data, "get_session", no_rows_session)
+
+
+MALFORMED = ["%%%", encode_cursor(0.5)]
+
+
+class TestCursorEndpoints:
+    """Tests for malformed cursors on the paged endpoints."""
+
+    @pytest.mark.parametrize("cursor", MALFORMED + [encode_cursor("high", "id-1")])  # Sorted by fit_score
+    async def test_top_opportunities_rejects_bad_cursor(self, fake_db, cursor):
+        from src import api
+
+        async with AsyncClient(transport=ASGITransport(app=api.app), base_url="http://test") as client:
+            response = await client.get("/api/v1/opportunities/top", params={"cursor": cursor})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    @pytest.mark.parametrize("cursor", MALFORMED + [encode_cursor("not a date", "id-1")])  # Sorted by recency
+    async def test_mobile_opportunities_rejects_bad_cursor(self, fake_db, cursor):
+        from fastapi import FastAPI
+
+        # src/api.py shadows the src/api/ directory, so load the router module by path
+        path = Path(__file__).parents[2] / "src" / "api" / "mobile.py"
+        spec = importlib.util.spec_from_file_location("mobile_api", path)
+        mobile = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mobile)
+        app = FastAPI()
+        app.include_router(mobile.mobile_router)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(
+                "/api/mobile/v1/opportunities", params={"cursor": cursor}, headers={"Authorization": "Bearer t"},
+            )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,88 @@
+"""
+Unit Tests for the Parse Stage
+==============================
+
+Tests for extracting plain items from HTML/XML off the event loop.
+"""
+
+import re
+
+import pytest
+
+from src.scrapers import parsing
+from src.scrapers.parsing import close_parse_pool, extract_items, parse_items
+
+
+HTML = """
+<html><body>
+  <div class="job-card"><h2> Python Engineer </h2><a href="/jobs/1">Apply</a></div>
+  <div class="job-card"><h3>Designer</h3></div>
+  <div class="other"><h2>Ignored</h2></div>
+</body></html>
+"""
+
+RSS = """<?xml version="1.0"?>
+<rss><channel>
+  <item><title>Research Grant</title><link>https://example.org/grant</link></item>
+  <item><title>Fellowship</title></item>
+</channel></rss>
+"""
+
+
+class TestExtractItems:
+    """Tests for extract_items."""
+
+    @pytest.fixture(params=[True, False], ids=["selectolax", "beautifulsoup"])
+    def backend(self, request, monkeypatch):
+        if request.param and not parsing.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        monkeypatch.setattr(parsing, "SELECTOLAX_AVAILABLE", request.param)
+
+    def test_html_items_answer_requested_selectors(self, backend):
+        items = extract_items(HTML, ".job-card", ["h2, h3", "a"], limit=5)
+
+        assert len(items) == 2
+        assert items[0].select_one("h2, h3").text.strip() == "Python Engineer"
+        assert items[0].select_one("a")["href"] == "/jobs/1"
+        assert items[1].select_one("a") is None
+        with pytest.raises(KeyError):
+            items[0].select_one(".not-requested")
+
+    def test_limit(self, backend):
+        assert len(extract_items(HTML, ".job-card", ["h2"], limit=1)) == 1
+
+    def test_xml_items_answer_find(self):
+        items = extract_items(RSS, "item", ["title", "link"], mode="xml")
+
+        assert [item.find("title").text for item in items] == ["Research Grant", "Fellowship"]
+        assert items[1].find("link") is None
+
+
+class TestParseItems:
+    """Tests for parse_items."""
+
+    async def test_large_documents_parse_in_pool(self, monkeypatch):
+        monkeypatch.setattr(parsing, "INLINE_PARSE_BYTES", 0)
+        try:
+            items = await parse_items(HTML, ".job-card", ["h2, h3"], limit=5)
+        finally:
+            await close_parse_pool()
+
+        assert [item.select_one("h2, h3").get_text(strip=True) for item in items] == ["Python Engineer", "Designer"]
+
+
+class TestLiveScraperHelpers:
+    """Tests for the regex link/card helpers in live_scrapers."""
+
+    async def test_find_links_and_cards_match_like_beautifulsoup(self):
+        from src.scrapers.live_scrapers import find_cards, find_links
+
+        markup = HTML + '<a href="/GRANTS/2">Grants</a><article class="Job-Post"><h3>Analyst</h3></article>'
+
+        assert [link["href"] for link in await find_links(markup, r"/jobs/")] == ["/jobs/1"]
+        assert [link.get_text() for link in await find_links(markup, r"grant", flags=re.I)] == ["Grants"]
+
+        cards = await find_cards(markup, r"job", ["h2, h3", "a[href]"], limit=5)
+        assert [card.select_one("h2, h3").get_text(strip=True) for card in cards] == ["Python Engineer", "Designer", "Analyst"]
+        assert [card.select_one("a[href]") is not None for card in cards] == [True, False, False]
+        assert len(await find_cards(markup, r"job", ["h2"], limit=1)) == 1
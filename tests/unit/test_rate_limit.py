@@ -0,0 +1,70 @@
+"""
+Unit Tests for Rate Limiting
+============================
+
+Tests for the GCRA limiter, multi-rate checks and idle-key eviction.
+"""
+
+import asyncio
+import threading
+import time
+
+from src.rate_limit import MemoryRateLimitStore, Rate, RateLimiter, RedisRateLimitStore
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter with the in-process store."""
+
+    def test_burst_then_refusal_with_retry_after(self):
+        limiter = RateLimiter(Rate(10, burst=3))
+
+        assert all(limiter.try_acquire("k").allowed for _ in range(3))
+        result = limiter.try_acquire("k")
+
+        assert not result.allowed
+        assert 0 < result.retry_after <= 0.1
+        assert limiter.try_acquire("other").allowed  # Keys are independent
+
+    def test_all_rates_must_allow_and_refusals_take_nothing(self):
+        hourly, burst = Rate(3, 3600), Rate(2, 1)
+        limiter = RateLimiter([hourly, burst])
+
+        assert limiter.try_acquire().allowed and limiter.try_acquire().allowed
+        assert limiter.try_acquire().limit == burst
+        assert limiter.remaining() == {"3/3600s": 1, "2/1s": 0}
+
+    async def test_acquire_waits_without_serialising_waiters(self):
+        limiter = RateLimiter(Rate(50, burst=2))
+        start = time.monotonic()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+        assert 0.05 <= time.monotonic() - start < 0.3
+        assert not await limiter.acquire(timeout=0.001)
+
+    def test_idle_keys_are_evicted(self):
+        store = MemoryRateLimitStore(max_keys=4, sweep_interval=0)
+        limiter = RateLimiter(Rate(1000), store=store)
+
+        for key in range(10):
+            limiter.try_acquire(str(key))
+        assert store.get_stats()["keys"] == 4  # LRU cap
+
+        time.sleep(0.01)
+        limiter.try_acquire("fresh")
+        assert store.get_stats()["keys"] == 1  # Sweep dropped the idle ones
+
+    async def test_acquire_runs_redis_round_trip_off_the_loop(self):
+        threads = []
+
+        class FakeRedis:
+            def register_script(self, script):
+                def run(keys, args):
+                    threads.append(threading.current_thread())
+                    return [1, "0", 0]
+                return run
+
+        limiter = RateLimiter(Rate(10), store=RedisRateLimitStore(client=FakeRedis()))
+
+        assert await limiter.acquire()
+        assert threads and threads[0] is not threading.main_thread()
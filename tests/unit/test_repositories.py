@@ -0,0 +1,168 @@
+"""
+Unit Tests for the Opportunity Repository
+=========================================
+
+Tests for row building, content hashing, keyset pages and the
+statements OpportunityRepository sends to Postgres.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.data.repositories import OpportunityRepository, _to_row, _unique_rows
+from src.models import OpportunityCreate
+from src.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+def make_opportunity(url="https://example.org/jobs/1", title="Python Engineer", **raw_data):
+    return OpportunityCreate(
+        title=title,
+        organization="Acme",
+        description="Build data pipelines",
+        opportunity_type="job",
+        url=url,
+        source="linkedin",
+        raw_data=raw_data or None,
+    )
+
+
+class FakeResult:
+    def __init__(self, values):
+        self.values = values
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.values
+
+
+class RecordingSession:
+    """AsyncSession stand-in that records statements and returns canned rows."""
+
+    def __init__(self, *results):
+        self.statements = []
+        self.results = list(results)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.results.pop(0) if self.results else [])
+
+
+def compile_pg(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def pg_params(statement):
+    return statement.compile(dialect=postgresql.dialect()).params
+
+
+class TestRows:
+    """Tests for _to_row and _unique_rows."""
+
+    def test_content_hash_ignores_scraped_at(self):
+        first = _to_row(make_opportunity(scraped_at="2026-01-01T00:00:00", salary="100k"))
+        rescanned = _to_row(make_opportunity(scraped_at="2026-02-01T00:00:00", salary="100k"))
+        changed = _to_row(make_opportunity(scraped_at="2026-02-01T00:00:00", salary="120k"))
+
+        assert first["content_hash"] == rescanned["content_hash"] != changed["content_hash"]
+        assert rescanned["raw_data"]["scraped_at"] == "2026-02-01T00:00:00"  # Stored, just not hashed
+
+    def test_content_hash_follows_columns(self):
+        assert _to_row(make_opportunity())["content_hash"] != _to_row(make_opportunity(title="Rust Engineer"))["content_hash"]
+
+    def test_unique_rows_first_and_last_wins(self):
+        opportunities = [
+            make_opportunity(title="Old"),
+            make_opportunity(url="https://example.org/jobs/2", title="Other"),
+            make_opportunity(title="New"),
+        ]
+
+        assert [row["title"] for row in _unique_rows(opportunities)] == ["Old", "Other"]
+        assert [row["title"] for row in _unique_rows(opportunities, keep="last")] == ["New", "Other"]
+
+
+class TestBulkUpsert:
+    """Tests for OpportunityRepository.bulk_upsert."""
+
+    async def test_statement_skips_unchanged_rows(self):
+        session = RecordingSession([True])
+
+        await OpportunityRepository(session).bulk_upsert([make_opportunity()])
+
+        sql = compile_pg(session.statements[0])
+        assert "ON CONFLICT (url) DO UPDATE SET" in sql
+        assert "WHERE opportunities.content_hash IS DISTINCT FROM excluded.content_hash" in sql
+        assert "RETURNING xmax = 0 AS inserted" in sql
+        updated = sql.split("DO UPDATE SET", 1)[1]
+        assert "content_hash = excluded.content_hash" in updated
+        assert "fit_score" not in updated and "discovered_at" not in updated
+
+    async def test_chunks_and_counts(self):
+        session = RecordingSession([True, False], [True], [])
+        opportunities = [make_opportunity(url=f"https://example.org/jobs/{i}") for i in range(5)]
+
+        result = await OpportunityRepository(session).bulk_upsert(opportunities + opportunities[:1], chunk_size=2)
+
+        assert len(session.statements) == 3
+        assert (result.inserted, result.updated, result.unchanged) == (2, 1, 2)
+        assert result.total == 5
+
+
+class TestListPage:
+    """Tests for the keyset pages of OpportunityRepository.list_page."""
+
+    @staticmethod
+    def rows(count):
+        return [
+            SimpleNamespace(id=f"id-{i}", fit_score=1 - i / 10, discovered_at=datetime(2026, 1, 10 - i))
+            for i in range(count)
+        ]
+
+    async def test_first_page_and_next_cursor(self):
+        session = RecordingSession(self.rows(3))
+
+        rows, cursor = await OpportunityRepository(session).list_page(limit=2, sort="fit_score")
+
+        sql = compile_pg(session.statements[0])
+        assert "opportunities.fit_score IS NOT NULL" in sql
+        assert "ORDER BY opportunities.fit_score DESC, opportunities.id DESC" in sql
+        assert "LIMIT" in sql and pg_params(session.statements[0])["param_1"] == 3  # One extra row
+        assert [row.id for row in rows] == ["id-0", "id-1"]
+        assert decode_cursor(cursor, 2) == [0.9, "id-1"]
+
+    async def test_last_page_has_no_cursor(self):
+        rows, cursor = await OpportunityRepository(RecordingSession(self.rows(2))).list_page(limit=2)
+
+        assert len(rows) == 2 and cursor is None
+
+    @pytest.mark.parametrize("sort, value, expected", [
+        ("recent", datetime(2026, 1, 9), datetime(2026, 1, 9)),
+        ("fit_score", 0.9, 0.9),
+    ])
+    async def test_cursor_becomes_row_value_predicate(self, sort, value, expected):
+        session = RecordingSession()
+
+        await OpportunityRepository(session).list_page(cursor=encode_cursor(value, "id-1"), sort=sort)
+
+        column = {"recent": "discovered_at", "fit_score": "fit_score"}[sort]
+        sql = compile_pg(session.statements[0])
+        assert f"(opportunities.{column}, opportunities.id) < (" in sql
+        assert expected in pg_params(session.statements[0]).values()
+        assert "id-1" in pg_params(session.statements[0]).values()
+
+    @pytest.mark.parametrize("cursor, sort", [
+        (encode_cursor("not a date", "id-1"), "recent"),
+        (encode_cursor("high", "id-1"), "fit_score"),
+        (encode_cursor(0.9), "fit_score"),
+        ("%%%", "recent"),
+    ])
+    async def test_malformed_cursor_raises_before_querying(self, cursor, sort):
+        session = RecordingSession()
+
+        with pytest.raises(InvalidCursor):
+            await OpportunityRepository(session).list_page(cursor=cursor, sort=sort)
+        assert session.statements == []
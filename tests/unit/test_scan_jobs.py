@@ -0,0 +1,82 @@
+"""
+Unit Tests for Background Scan Jobs
+===================================
+
+Tests for job deduplication, progress, result reuse and failures.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src import scan_jobs
+from src.cache import BoundedCache
+from src.scan_jobs import ScanJobManager
+
+
+class TestScanJobManager:
+    """Tests for ScanJobManager."""
+
+    @pytest.fixture
+    def scan(self, monkeypatch):
+        """Replace the batch scan with a fake that runs until released"""
+        runs = []
+        release = asyncio.Event()
+
+        async def fake_batch(params, job):
+            runs.append(params)
+            await job.record_source({"source": "A", "opportunities": [{"id": "a-1"}], "error": None})
+            await release.wait()
+            if params["batch_number"] == 13:
+                raise RuntimeError("scraper exploded")
+            return {"opportunities": [{"id": "a-1"}, {"id": "b-1"}], "stats": {"total": 2}}
+
+        cache = BoundedCache(sweep_interval=None)
+        monkeypatch.setattr(scan_jobs, "get_cache", lambda: cache)
+        monkeypatch.setitem(scan_jobs.SCAN_KINDS, "batch", (fake_batch, scan_jobs.SCAN_KINDS["batch"][1]))
+        return SimpleNamespace(runs=runs, release=release)
+
+    async def test_identical_jobs_share_one_scan(self, scan):
+        manager = ScanJobManager()
+        job, deduplicated = await manager.submit("batch", {"batch_number": 2})
+        joined, joined_deduplicated = await manager.submit("batch", {"batch_number": 2, "mode": "full"})
+        await asyncio.sleep(0)
+
+        assert not deduplicated and joined_deduplicated
+        assert joined is job
+        assert job.status == "running"
+        assert job.to_dict()["opportunities"] == [{"id": "a-1"}]  # Partial results
+
+        scan.release.set()
+        result = await manager.wait(job)
+
+        assert len(scan.runs) == 1
+        assert [opp["id"] for opp in result["opportunities"]] == ["a-1", "b-1"]
+        # Completed results are reused, also by a manager in another worker
+        assert (await ScanJobManager().submit("batch", {"batch_number": 2}))[0].job_id == job.job_id
+
+    async def test_failed_job_reports_error(self, scan):
+        manager = ScanJobManager()
+        job, _ = await manager.submit("batch", {"batch_number": 13})
+        scan.release.set()
+
+        with pytest.raises(RuntimeError, match="scraper exploded"):
+            await manager.wait(job)
+        assert (await manager.get(job.job_id)).status == "failed"
+
+    async def test_rejects_unknown_parameters(self):
+        with pytest.raises(ValueError):
+            await ScanJobManager().submit("batch", {"batch": 2})
+
+    @pytest.mark.parametrize("kind, params", [
+        ("batch", {"max_concurrent": 10000}),
+        ("batch", {"mode": "fast"}),
+        ("batch_range", {"max_concurrent": 26}),
+        ("batch_range", {"end": 8}),
+        ("browse", {"limit": 501}),
+        ("browse", {"queries": "not a list"}),
+    ])
+    async def test_rejects_out_of_range_values(self, kind, params):
+        with pytest.raises(ValueError):
+            await ScanJobManager().submit(kind, params)
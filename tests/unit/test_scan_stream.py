@@ -0,0 +1,55 @@
+"""
+Unit Tests for Streaming Scans
+==============================
+
+Tests for NDJSON scan streams and backpressure on slow clients.
+"""
+
+import json
+
+from httpx import ASGITransport, AsyncClient
+
+from src import api
+from src.scrapers import live_scrapers
+
+
+class TestScanStream:
+    """Tests for _stream_scan and the streaming scan endpoints."""
+
+    async def test_batch_range_streams_ndjson_frames(self, monkeypatch):
+        async def fake_scan(start_batch, end_batch, max_concurrent, callback, on_source, collect):
+            for name in ("RemoteOK", "Himalayas"):
+                await on_source({"source": name, "opportunities": [{"id": f"{name}-1"}], "error": None})
+            await callback({"batch_number": 1, "duration_seconds": 0.1, "stats": {"total": 2}})
+            return {"stats": {"total": 2}, "duration_seconds": 0.2}
+
+        monkeypatch.setattr(live_scrapers, "scan_all_batches_incremental", fake_scan)
+
+        transport = ASGITransport(app=api.app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            async with client.stream("GET", "/api/v1/scan/batch/range/stream", params={"end": 1}) as response:
+                assert response.headers["content-type"].startswith("application/x-ndjson")
+                frames = [json.loads(line) async for line in response.aiter_lines() if line]
+
+        assert [frame["type"] for frame in frames] == ["source", "source", "batch", "stats"]
+        assert frames[0]["opportunities"] == [{"id": "RemoteOK-1"}]
+        assert frames[-1]["stats"] == {"total": 2}
+
+    async def test_slow_client_holds_the_scan_back(self):
+        emitted = 0
+        max_ahead = 0
+        consumed = 0
+
+        async def run_scan(emit):
+            nonlocal emitted
+            for i in range(50):
+                await emit({"type": "source", "i": i})
+                emitted += 1
+            return {"stats": {}}
+
+        async for _ in api._stream_scan(run_scan, "ndjson"):
+            consumed += 1
+            max_ahead = max(max_ahead, emitted - consumed)
+
+        assert consumed == 51
+        assert max_ahead <= api.STREAM_QUEUE_SIZE + 1
@@ -0,0 +1,53 @@
+"""
+Unit Tests for the Scoring Engine
+=================================
+
+Tests for semantic goal alignment in ScoringEngine.
+"""
+
+from src.models import OpportunityTier
+from src.scoring.calculator import ScoringEngine
+
+
+OPPORTUNITY = {
+    "title": "Senior Python Engineer",
+    "organization": "Acme",
+    "opportunity_type": "job",
+    "tags": ["python", "ml"],
+    "requirements": {"skills": ["python", "pytorch"], "experience_years": 4},
+    "compensation": {"salary_min": 150_000, "salary_max": 200_000},
+}
+PROFILE = {
+    "skills": ["python", "pytorch"],
+    "experience": [{"role": "Senior Python Engineer"}, {"role": "Engineer"}],
+    "preferences": {"target_roles": ["python"], "min_salary": 120_000},
+}
+
+
+class TestSemanticGoalAlignment:
+    """Tests for the rescaled semantic score in calculate_interest_match."""
+
+    def test_similarity_is_rescaled_between_floor_and_ceiling(self):
+        engine = ScoringEngine()
+
+        def goal(semantic_score):
+            return 2 * engine.calculate_interest_match([], [], semantic_score=semantic_score)
+
+        assert goal(0.3) == goal(0.6) == 0.0
+        assert goal(0.75) == 0.5  # Keyword-neutral
+        assert goal(0.9) == goal(1.0) == 1.0
+
+    def test_unrelated_similarity_does_not_lift_the_tier(self):
+        engine = ScoringEngine()
+
+        def scored(semantic_score):
+            score = engine.score_opportunity(OPPORTUNITY, PROFILE, semantic_score=semantic_score)
+            return score.fit_score, engine.assign_tier(score)
+
+        keyword_fit, keyword_tier = scored(None)
+        unrelated_fit, unrelated_tier = scored(0.65)  # Typical (cos + 1) / 2 for unrelated text
+        strong_fit, strong_tier = scored(0.9)
+
+        assert unrelated_fit < keyword_fit < strong_fit
+        assert keyword_tier == unrelated_tier == OpportunityTier.TIER_2
+        assert strong_tier == OpportunityTier.TIER_1
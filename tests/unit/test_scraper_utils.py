@@ -0,0 +1,68 @@
+"""
+Unit Tests for Scraper Utilities
+================================
+
+Tests for fan_out: the concurrency cap, the batch timeout and partial results.
+"""
+
+import asyncio
+
+from src.scrapers.utils import fan_out
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    async def test_results_keep_item_order(self):
+        async def fetch(item):
+            await asyncio.sleep(0.01 * (5 - item))  # Later items finish first
+            return item * 10
+
+        assert await fan_out(range(5), fetch) == [0, 10, 20, 30, 40]
+
+    async def test_concurrency_is_capped(self):
+        in_flight = 0
+        peak = 0
+
+        async def fetch(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return item
+
+        results = await fan_out(range(20), fetch, max_concurrent=3)
+
+        assert results == list(range(20))
+        assert peak == 3
+
+    async def test_timeout_returns_partial_results_and_cancels_stragglers(self):
+        cancelled = []
+
+        async def fetch(item):
+            try:
+                await asyncio.sleep(0 if item % 2 == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        results = await asyncio.wait_for(fan_out(range(6), fetch, timeout=0.1), timeout=2)
+
+        assert results == [0, None, 2, None, 4, None]
+        assert sorted(cancelled) == [1, 3, 5]
+
+    async def test_failed_fetch_becomes_none(self):
+        async def fetch(item):
+            if item == 1:
+                raise ValueError("boom")
+            return item
+
+        assert await fan_out([0, 1, 2], fetch) == [0, None, 2]
+
+    async def test_empty_input(self):
+        async def fetch(item):
+            raise AssertionError("not called")
+
+        assert await fan_out([], fetch) == []
@@ -0,0 +1,220 @@
+"""
+Unit Tests for the Search Index
+===============================
+
+Tests for BM25 ranking, prefix matching, filter postings and incremental updates.
+"""
+
+import random
+import time
+
+import pytest
+
+from src.filters import global_filter
+from src.search_index import SearchIndex, tokenize
+
+
+def make_opportunity(opp_id, title, description="", company="", tags=None, location="Remote"):
+    return {
+        "id": opp_id,
+        "title": title,
+        "company": company,
+        "description": description,
+        "tags": tags or [],
+        "location": location,
+    }
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    @pytest.fixture
+    def index(self):
+        index = SearchIndex()
+        index.upsert_many([
+            make_opportunity("1", "Senior Python Engineer", "Build data pipelines", company="TechCorp"),
+            make_opportunity("2", "Product Designer", "Work with Python engineers on tooling", location="London"),
+            make_opportunity("3", "Climate Research Fellowship", "Funding for machine learning research", tags=["fellowship"]),
+        ])
+        return index
+
+    def test_tokenize_drops_stop_words_and_keeps_symbols(self):
+        assert tokenize("The C++ and C# Engineer") == ["c++", "c#", "engineer"]
+
+    def test_title_matches_rank_above_description_matches(self, index):
+        hits, total = index.search("python")
+
+        assert total == 2
+        assert [opp["id"] for opp, _ in hits] == ["1", "2"]
+        assert hits[0][1] > hits[1][1] > 0
+
+    def test_all_terms_must_match_with_prefix_on_last(self, index):
+        hits, _ = index.search("machine lear")
+        assert [opp["id"] for opp, _ in hits] == ["3"]
+
+        assert index.search("python fellowship")[1] == 0
+        assert index.search("lear", prefix=False)[1] == 0
+
+    def test_filters_and_pagination(self, index):
+        hits, total = index.search("python", filters={"location": "london"})
+        assert total == 1
+        assert hits[0][0]["id"] == "2"
+
+        hits, total = index.search("", limit=1, offset=1)
+        assert total == 3
+        assert [opp["id"] for opp, _ in hits] == ["2"]
+
+    def test_keyset_pages_follow_the_ranking(self, index):
+        ranked = [(opp["id"], score) for opp, score in index.search("")[0]]
+        first, _ = index.search("", limit=2)
+        last = (first[-1][1], first[-1][0]["id"])
+
+        second, total = index.search("", limit=2, after=last)
+
+        assert total == 3
+        assert [opp["id"] for opp, _ in first + second] == [doc_id for doc_id, _ in ranked]
+
+    def test_incremental_update_and_removal(self, index):
+        assert not index.upsert(make_opportunity("1", "Senior Python Engineer", "Build data pipelines", company="TechCorp"))
+        assert index.upsert(make_opportunity("1", "Senior Rust Engineer", company="TechCorp"))
+
+        assert [opp["id"] for opp, _ in index.search("python")[0]] == ["2"]
+        assert index.search("rust")[1] == 1
+
+        index.remove_many(["1", "missing"])
+        assert index.search("rust")[1] == 0
+        assert "1" not in index
+        assert index.stats()["documents"] == 2
+
+    def test_warms_from_current_scan_state(self, tmp_path, monkeypatch):
+        import src.search_index as search_index
+        from src.scrapers import dedup
+        from src.scrapers.delta_scan import ScanDeltaTracker
+
+        tracker = ScanDeltaTracker(tmp_path / "scan_state.db")
+        tracker.apply("RemoteOK", [make_opportunity("r-1", "Backend Engineer", company="PayCo")])
+        tracker.apply("Himalayas", [make_opportunity("h-1", "Backend Engineer", company="PayCo")])
+        tracker._conn.execute("DELETE FROM change_log")  # Pruned after a week
+        index = dedup.DedupIndex(tmp_path / "dedup.db")
+        index.assign(tracker.current_items())
+
+        monkeypatch.setattr(search_index, "get_delta_tracker", lambda: tracker)
+        monkeypatch.setattr(dedup, "_dedup_index", index)
+        monkeypatch.setattr(search_index, "_search_index", None)
+
+        warmed = search_index.get_search_index()
+
+        assert [opp["id"] for opp, _ in warmed.search("backend")[0]] == ["r-1"]
+
+
+def make_corpus(size, seed=0):
+    rng = random.Random(seed)
+    words = ["python", "data", "engineer", "scholarship", "grant", "startup", "research", "design", "cloud", "intern"]
+    return [
+        {
+            "id": f"{i:06d}",
+            "title": " ".join(rng.sample(words, 3)),
+            "company": f"Org {i % 500}",
+            "location": rng.choice(["Remote", "London, UK", "Lagos, Nigeria", "Anywhere"]),
+            "remote": rng.random() < 0.3,
+            "salary": rng.randrange(0, 200_000, 1000),
+        }
+        for i in range(size)
+    ]
+
+
+FILTERS = [
+    {"type": "jobs"},
+    {"remote": True, "min_salary": 150_000},
+    {"type": "scholarships", "remote": False, "max_salary": 20_000},
+    {"location": "remote"},
+    {"location": "nigeria", "type": "grants", "min_salary": 100_000, "max_salary": 120_000},
+]
+
+
+class TestSearchFilters:
+    """Tests for the filter postings behind SearchIndex.search(filters=...)."""
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    def test_postings_match_linear_filters(self, filters):
+        corpus = make_corpus(2000)
+        index = SearchIndex()
+        index.upsert_many(corpus)
+
+        expected = {opp["id"] for opp in global_filter.apply_search_filters(corpus, filters)}
+        hits, total = index.search("", filters)
+        assert {opp["id"] for opp, _ in hits} == expected and total == len(expected)
+
+        expected_text = expected & {opp["id"] for opp, _ in index.search("python")[0]}
+        assert {opp["id"] for opp, _ in index.search("python", filters)[0]} == expected_text
+
+    def test_postings_follow_updates_and_removals(self):
+        corpus = make_corpus(500)
+        index = SearchIndex()
+        index.upsert_many(corpus)
+        changed = [{**opp, "remote": not opp["remote"], "salary": opp["salary"] + 5000} for opp in corpus[:100]]
+        index.upsert_many(changed)
+        index.remove_many([opp["id"] for opp in corpus[100:200]])
+
+        current = changed + corpus[200:]
+        for filters in FILTERS:
+            expected = {opp["id"] for opp in global_filter.apply_search_filters(current, filters)}
+            assert {opp["id"] for opp, _ in index.search("", filters)[0]} == expected
+
+    def test_filtered_search_at_100k_documents(self):
+        index = SearchIndex()
+        index.upsert_many(make_corpus(100_000))
+        filters = {"type": "scholarships", "remote": True, "min_salary": 150_000, "max_salary": 155_000}
+
+        def best_time(query):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                hits, _ = index.search(query, filters, limit=20)
+                timings.append(time.perf_counter() - start)
+            return min(timings), hits
+
+        for query in ("", "python"):
+            elapsed, hits = best_time(query)
+            assert hits and all(opp["remote"] and 150_000 <= opp["salary"] <= 155_000 for opp, _ in hits)
+            assert elapsed < 0.005  # Set intersections, not a pass over 100k documents
+
+
+class TestAdvancedFilterEndpoint:
+    """Tests for /api/v1/filters/advanced."""
+
+    async def test_pages_through_index_filters_and_text_criteria(self, monkeypatch):
+        from httpx import ASGITransport, AsyncClient
+
+        from src import api
+
+        index = SearchIndex()
+        index.upsert_many(make_corpus(300))
+        searches = []
+        original = index.search
+
+        def search(query, *args, **kwargs):
+            searches.append(query)
+            return original(query, *args, **kwargs)
+
+        monkeypatch.setattr(index, "search", search)
+        monkeypatch.setattr(api, "get_searchable_index", lambda: index)
+
+        body = {"remote_only": True, "min_salary": 50_000, "title_contains": "data"}
+        pages = []
+        cursor = None
+        async with AsyncClient(transport=ASGITransport(app=api.app), base_url="http://test") as client:
+            while True:
+                params = {"query": "python", "limit": 5, **({"cursor": cursor} if cursor else {})}
+                response = (await client.post("/api/v1/filters/advanced", params=params, json=body)).json()
+                pages.extend(opp["id"] for opp in response["results"])
+                cursor = response["pagination"]["next_cursor"]
+                if not cursor:
+                    break
+
+        expected = [
+            opp["id"] for opp, _ in original("python", {"remote": True, "min_salary": 50_000})[0]
+            if "data" in opp["title"]
+        ]
+        assert pages == expected and len(pages) > 5
+        assert "" not in searches  # No full-corpus fetch when there is a query
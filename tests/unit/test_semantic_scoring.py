@@ -0,0 +1,67 @@
+"""
+Unit Tests for Semantic Scoring
+===============================
+
+Tests for batched profile-vs-opportunity similarity and its use in
+MLScoringModel.score_batch.
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from src.intelligence import embeddings
+from src.intelligence.ml_model import MLScoringModel
+
+
+def fake_embedding(text):
+    seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).normal(size=16).tolist()
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = embeddings.EmbeddingPipeline()
+    calls = {"text": 0, "batch": 0}
+
+    async def embed_text(text, task_type="RETRIEVAL_DOCUMENT"):
+        calls["text"] += 1
+        return fake_embedding(text)
+
+    async def embed_batch(texts, task_type="RETRIEVAL_DOCUMENT"):
+        calls["batch"] += 1
+        return [fake_embedding(text) for text in texts]
+
+    monkeypatch.setattr(service, "embed_text", embed_text)
+    monkeypatch.setattr(service, "embed_batch", embed_batch)
+    monkeypatch.setattr(embeddings, "_embedding_service", service)
+    service.calls = calls
+    return service
+
+
+PROFILE = {"name": "Ada", "summary": "ML researcher", "skills": ["python", {"name": "pytorch"}]}
+OPPORTUNITIES = [
+    {"id": str(i), "title": f"Role {i}", "organization": "Org", "description": f"Work on topic {i}"}
+    for i in range(20)
+]
+
+
+class TestProfileOpportunityMatches:
+    """Tests for calculate_profile_opportunity_matches."""
+
+    async def test_batch_matches_single_scores(self, service):
+        scores = await embeddings.calculate_profile_opportunity_matches(PROFILE, OPPORTUNITIES)
+
+        assert scores.dtype == np.float32 and scores.shape == (20,)
+        assert service.calls == {"text": 1, "batch": 1}  # Profile embedded once
+        for opp, score in zip(OPPORTUNITIES[:3], scores):
+            single = await embeddings.calculate_profile_opportunity_match(PROFILE, opp)
+            assert score == pytest.approx(single["semantic_score"], abs=1e-5)
+
+    async def test_ml_score_batch_embeds_profile_once(self, service):
+        results = await MLScoringModel().score_batch(OPPORTUNITIES, PROFILE)
+
+        assert len(results) == 20
+        assert service.calls == {"text": 1, "batch": 1}
+        assert [r["fit_score"] for r in results] == sorted((r["fit_score"] for r in results), reverse=True)
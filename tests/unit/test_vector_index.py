@@ -0,0 +1,79 @@
+"""
+Unit Tests for the Local Vector Index
+=====================================
+
+Tests for upsert/delete, metadata pre-filters, IVF search and persistence.
+"""
+
+import numpy as np
+import pytest
+
+from src.intelligence import vector_index
+from src.intelligence.vector_index import VectorIndex
+
+
+def random_vectors(count, dim=32, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+
+
+class TestVectorIndex:
+    """Tests for VectorIndex."""
+
+    def test_upsert_delete_and_filters(self, tmp_path):
+        vectors = random_vectors(3)
+        index = VectorIndex(tmp_path / "opps")
+        index.upsert([
+            ("job", vectors[0], {"opportunity_type": "job", "is_remote": True, "deadline": "2030-01-10"}),
+            ("grant", vectors[1], {"opportunity_type": "grant", "is_remote": False, "deadline": "2030-03-01"}),
+            ("fellowship", vectors[2], {"opportunity_type": "fellowship", "is_remote": True}),
+        ])
+
+        [matches] = index.search([vectors[1]], top_k=1)
+        assert matches[0][0] == "grant" and matches[0][1] == pytest.approx(1.0, abs=1e-5)
+
+        remote = index.search([vectors[1]], filter={"is_remote": True})[0]
+        assert {opp_id for opp_id, _, _ in remote} == {"job", "fellowship"}
+        window = {"deadline": {"$gte": "2030-01-01", "$lte": "2030-02-01"}, "type": {"$in": ["job", "grant"]}}
+        assert [opp_id for opp_id, _, _ in index.search([vectors[0]], filter=window)[0]] == ["job"]
+
+        index.upsert([("job", vectors[1], {"opportunity_type": "grant"})])  # Replaced in place
+        assert index.delete(["grant", "missing"]) == 1
+        assert [opp_id for opp_id, _, _ in index.search([vectors[1]], top_k=1)[0]] == ["job"]
+
+        reopened = VectorIndex(tmp_path / "opps")
+        assert len(reopened) == 2 and "grant" not in reopened
+        assert reopened.search([vectors[2]], top_k=1)[0][0][0] == "fellowship"
+
+    @pytest.mark.parametrize("filter, expected", [
+        ({"type": {"$ne": "job"}}, {"grant", "untyped"}),
+        ({"opportunity_type": {"$nin": ["job", "grant"]}}, {"untyped"}),
+        ({"type": {"$eq": "unknown"}}, set()),
+        ({"is_remote": {"$ne": True}}, {"grant", "untyped"}),
+        ({"is_remote": {"$in": [False]}}, {"grant"}),
+        ({"type": {"$gte": "h"}}, {"job"}),  # Unvectorised operator: row by row
+    ])
+    def test_type_and_remote_negations(self, tmp_path, filter, expected):
+        vectors = random_vectors(3)
+        index = VectorIndex(tmp_path / "opps")
+        index.upsert([
+            ("job", vectors[0], {"opportunity_type": "job", "is_remote": True}),
+            ("grant", vectors[1], {"opportunity_type": "grant", "is_remote": False}),
+            ("untyped", vectors[2], {}),
+        ])
+
+        assert {opp_id for opp_id, _, _ in index.search([vectors[0]], filter=filter)[0]} == expected
+
+    def test_ivf_batch_search_finds_nearest_neighbours(self, monkeypatch):
+        monkeypatch.setattr(vector_index, "IVF_MIN_VECTORS", 500)
+        rng = np.random.default_rng(1)
+        centers = random_vectors(20, seed=2) * 4
+        vectors = centers[rng.integers(0, 20, 2000)] + rng.normal(size=(2000, 32)).astype(np.float32)
+        index = VectorIndex(nprobe=4)
+        index.upsert((str(i), vector, {}) for i, vector in enumerate(vectors))
+        assert index.stats()["ivf_lists"] > 0
+
+        queries = vectors[:50] + rng.normal(scale=0.1, size=(50, 32)).astype(np.float32)
+        results = index.search(queries, top_k=5)
+
+        assert len(results) == 50
+        assert sum(matches[0][0] == str(i) for i, matches in enumerate(results)) >= 45